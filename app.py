@@ -1,45 +1,72 @@
-import csv
 from pathlib import Path
 
 # Mengimpor kelas/fungsi dari paket tracker.
 # Gunakan try/except supaya fleksibel jika dijalankan sebagai paket atau file tunggal.
+# Modul lain (CSV, laporan, jurnal, snapshot) diimpor di dalam fungsi yang memakainya,
+# supaya `import app` ringan dan tidak memuat pembuat laporan sebelum dibutuhkan.
 try:
     from tracker import RekapKelas, Mahasiswa, Penilaian
-    from tracker import build_markdown_report, save_text, letter_grade, build_html_report
 except Exception:
     # fallback: impor langsung dari submodule (jika modul belum diinstall sebagai package)
     from tracker.rekap_kelas import RekapKelas
     from tracker.mahasiswa import Mahasiswa
     from tracker.penilaian import Penilaian
-    from tracker.report import build_markdown_report, save_text, letter_grade, build_html_report
 
-# Direktori data dan output
+# Direktori data dan output (folder out dibuat saat laporan pertama disimpan)
 DATA_DIR = Path("data")
 OUT_DIR = Path("out")
-# Pastikan folder out ada supaya bisa menyimpan report
-if not OUT_DIR.exists():
-    OUT_DIR.mkdir(parents=True)
-
-# header yang akan dipakai untuk CSV attendance dan grades
-ATT_HEADERS = ["student_id", "name", "week1", "week2", "week3", "week4", "week5"]
-GRD_HEADERS = ["student_id", "name", "quiz", "assignment", "mid", "final"]
+# konfigurasi skema penilaian (opsional); tanpa file ini dipakai bobot/batas standar
+SKEMA_PATH = DATA_DIR / "skema_penilaian.json"
+
+# nama yang dulu didefinisikan/diimpor langsung di modul ini (app.build_markdown_report,
+# app.ATT_HEADERS, dst.); sekarang tinggal di modul tracker dan diambil saat pertama dipakai
+_DARI_REPORT = ("build_markdown_report", "save_text", "letter_grade", "build_html_report", "simpan_report")
+_DARI_SKEMA_CSV = ("ATT_HEADERS", "GRD_HEADERS")
+_DARI_INGEST = ("calculate_attendance_percent_from_row",)
+
+
+def __getattr__(nama):
+    if nama in _DARI_REPORT:
+        from tracker import report
+        return getattr(report, nama)
+    if nama in _DARI_SKEMA_CSV:
+        from tracker import skema_csv
+        return getattr(skema_csv, nama)
+    if nama in _DARI_INGEST:
+        from tracker import ingest
+        return getattr(ingest, nama)
+    raise AttributeError(f"module 'app' has no attribute {nama!r}")
 
 # ---------- Helper CSV  -----------
 def read_csv(path):
-    """Baca CSV ke list of dict. Jika file tidak ada, kembalikan list kosong."""
+    """
+    Baca CSV ke list of dict. Jika file tidak ada, kembalikan list kosong.
+    Baris yang diubah lewat CSVPatcher tapi belum dikompaksi diambil dari change log
+    (<file>.log), dan padding spasi di sel angka dibuang (lihat tracker/patch_csv.py).
+    """
+    import csv
+    from tracker.patch_csv import baca_log
     p = Path(path)
     rows = []
     if not p.exists():
         return rows
+    overlay = baca_log(p)
     # baca menggunakan csv.DictReader supaya kolom menjadi key
     with p.open(encoding="utf-8") as f:
         reader = csv.DictReader(f)
         for r in reader:
-            rows.append(dict(r))
+            nim = (r.get("student_id") or "").strip()
+            if nim in overlay:
+                # versi terbaru baris ini ada di change log
+                baru = overlay[nim]
+                rows.append({h: str(baru.get(h, "")) for h in reader.fieldnames})
+            else:
+                rows.append({k: v.strip() if isinstance(v, str) else v for k, v in r.items()})
     return rows
 
 def write_csv(path, fieldnames, rows):
     """Tulis list of dict ke CSV, tulis header manual lalu baris per baris."""
+    import csv
     p = Path(path)
     if not p.parent.exists():
         p.parent.mkdir(parents=True)
@@ -55,341 +82,176 @@ def write_csv(path, fieldnames, rows):
                 out[key] = r.get(key, "")
             writer.writerow(out)
 
-# ---------- Kalkulasi attendance -------------
-def calculate_attendance_percent_from_row(row):
-    """Hitung persen hadir dari kolom week1..week5 secara manual."""
-    # kumpulkan key week yang ditemukan (urut dari 1..5)
-    weeks = []
-    for i in range(1, 6):
-        k = f"week{i}"
-        if k in row:
-            weeks.append(k)
-    if len(weeks) == 0:
-        return 0.0
-    total = 0
-    present = 0
-    for w in weeks:
-        total += 1
-        raw = row.get(w, "")
-        raw = (raw or "").strip()
-        # terima "1", "0", atau angka lain -> coba konversi ke int
-        if raw == "":
-            # kosong dianggap tidak hadir (0)
-            val = 0
-        else:
-            try:
-                # beberapa orang menulis '1.0' atau '1', kita gunakan int(float())
-                val = int(float(raw))
-            except Exception:
-                # kalau gagal konversi, anggap 0 dan lanjut
-                val = 0
-        if val != 0:
-            present += 1
-    try:
-        percent = round(present / total * 100.0, 2)
-    except Exception:
-        percent = 0.0
-    return percent
-
-# ---------- Tambah mahasiswa ke CSV (manual) ----------
+# ---------- Penyimpanan (CSV atau SQLite, lihat tracker.penyimpanan) ----------
+_PENYIMPANAN = {}
+
+def buka_penyimpanan(jenis=None):
+    """
+    Penyimpanan data di DATA_DIR, dibuka sekali per jenis dan folder.
+    jenis None -> env TRACKER_PENYIMPANAN ("csv" atau "sqlite"), default "csv".
+    """
+    import os
+    from tracker.penyimpanan import buka_penyimpanan as buka
+    jenis = jenis or os.environ.get("TRACKER_PENYIMPANAN", "csv")
+    key = (jenis, str(DATA_DIR))
+    if key not in _PENYIMPANAN:
+        _PENYIMPANAN[key] = buka(DATA_DIR, jenis)
+    return _PENYIMPANAN[key]
+
+def csv_patcher(path, headers):
+    """Ambil CSVPatcher untuk path (dibuat sekali, indeks NIM -> offset disimpan di <file>.idx)."""
+    return buka_penyimpanan("csv").patcher(path, headers)
+
+# ---------- Tambah mahasiswa ke CSV ----------
 def add_student_to_csvs(nim, nama):
     """Tambahkan mahasiswa ke kedua CSV (attendance + grades) jika belum ada."""
-    att_path = DATA_DIR / "attendance.csv"
-    grd_path = DATA_DIR / "grades.csv"
-
-    # attendance
-    att_rows = read_csv(att_path)
-    exists = False
-    for r in att_rows:
-        if r.get("student_id") == nim:
-            exists = True
-            break
-    if not exists:
-        # buat baris attendance default manual
-        new = {"student_id": nim, "name": nama, "week1": "0", "week2": "0", "week3": "0", "week4": "0", "week5": "0"}
-        att_rows.append(new)
-        write_csv(att_path, ATT_HEADERS, att_rows)
-
-    # grades
-    grd_rows = read_csv(grd_path)
-    exists = False
-    for r in grd_rows:
-        if r.get("student_id") == nim:
-            exists = True
-            break
-    if not exists:
-        new = {"student_id": nim, "name": nama, "quiz": "0", "assignment": "0", "mid": "0", "final": "0"}
-        grd_rows.append(new)
-        write_csv(grd_path, GRD_HEADERS, grd_rows)
+    buka_penyimpanan("csv").tambah_mahasiswa(nim, nama)
 
-# ---------- Update attendance CSV (manual) ----------
+# ---------- Update attendance CSV ----------
 def update_attendance_csv(nim, weeks_update):
     """
     weeks_update adalah dict sederhana, misal {'week1': '1', 'week2': '0', ...}
-    Jika nilai None artinya tidak diubah.
+    Jika nilai None artinya tidak diubah. Baris diubah di tempat; kembalikan baris terbaru.
     """
-    att_path = DATA_DIR / "attendance.csv"
-    if not att_path.exists():
-        raise FileNotFoundError("attendance.csv tidak ditemukan.")
-    rows = read_csv(att_path)
-    found = False
-    for r in rows:
-        if r.get("student_id") == nim:
-            found = True
-            # per week, lakukan update manual
-            for i in range(1, 6):
-                k = f"week{i}"
-                if k in weeks_update:
-                    v = weeks_update[k]
-                    # hanya terima '1' atau '0' (string)
-                    if v is None:
-                        # berarti tidak diubah
-                        continue
-                    val = str(v).strip()
-                    if val == "1":
-                        r[k] = "1"
-                    elif val == "0":
-                        r[k] = "0"
-                    else:
-                        # jika bukan 1/0, kita abaikan dan tidak ubah
-                        pass
-            break
-    if not found:
-        raise KeyError("NIM tidak ditemukan di attendance.csv.")
-    write_csv(att_path, ATT_HEADERS, rows)
-    return rows
+    return buka_penyimpanan("csv").ubah_presensi(nim, weeks_update)
 
-# ---------- Update grades CSV (manual) ----------
+# ---------- Update grades CSV ----------
 def update_grades_csv(nim, quiz=None, assignment=None, mid=None, final=None, fallback_name=""):
     """
-    Update atau tambahkan baris di grades.csv.
+    Update atau tambahkan baris di grades.csv, kembalikan baris terbaru.
     Jika argument None maka tidak diubah (kecuali jika baris baru dibuat -> default 0).
     """
-    grd_path = DATA_DIR / "grades.csv"
-    rows = read_csv(grd_path)
-    found = False
-    for r in rows:
-        if r.get("student_id") == nim:
-            found = True
-            if quiz is not None:
-                try:
-                    r["quiz"] = str(float(quiz))
-                except Exception:
-                    r["quiz"] = "0"
-            if assignment is not None:
-                try:
-                    r["assignment"] = str(float(assignment))
-                except Exception:
-                    r["assignment"] = "0"
-            if mid is not None:
-                try:
-                    r["mid"] = str(float(mid))
-                except Exception:
-                    r["mid"] = "0"
-            if final is not None:
-                try:
-                    r["final"] = str(float(final))
-                except Exception:
-                    r["final"] = "0"
-            if not r.get("name"):
-                r["name"] = fallback_name
-            break
-    if not found:
-        # buat baris baru, nilai None -> 0
-        new = {
-            "student_id": nim,
-            "name": fallback_name,
-            "quiz": str(float(quiz or 0)),
-            "assignment": str(float(assignment or 0)),
-            "mid": str(float(mid or 0)),
-            "final": str(float(final or 0))
-        }
-        rows.append(new)
-    write_csv(grd_path, GRD_HEADERS, rows)
-    return rows
+    return buka_penyimpanan("csv").ubah_nilai(nim, quiz, assignment, mid, final, fallback_name)
+
+# ---------- Muat data CSV ke object RekapKelas (streaming) ----------
+def load_attendance_into_rekap(rekap, att_path, on_row=None):
+    """Muat attendance.csv ke objek RekapKelas (sekali baca, baris per baris)."""
+    from tracker.ingest import muat_attendance
+    return muat_attendance(rekap, att_path, on_row)
 
-# ---------- Muat data CSV ke object RekapKelas (manual) ----------
-def load_attendance_into_rekap(rekap, att_path):
-    """Muat attendance.csv ke objek RekapKelas satu per satu (manual loop)."""
-    rows = read_csv(att_path)
-    for row in rows:
-        nim = row.get("student_id")
-        nama = row.get("name")
-        if not nim or not nama:
-            continue
-        # jika belum ada di rekap, tambahkan Mahasiswa
-        if nim not in rekap._data_by_nim:
-            # pakai Mahasiswa class
-            m = Mahasiswa(nim, nama)
-            rekap.tambah_mahasiswa(m)
-        # hitung persen hadir dan set
-        persen = calculate_attendance_percent_from_row(row)
-        rekap.ubah_hadir(nim, persen)
-
-def load_grades_into_rekap(rekap, grd_path):
-    """Muat grades.csv ke RekapKelas (manual)."""
-    rows = read_csv(grd_path)
-    for r in rows:
-        nim = r.get("student_id")
-        nama = r.get("name")
-        if not nim:
-            continue
-        if nim not in rekap._data_by_nim:
-            rekap.tambah_mahasiswa(Mahasiswa(nim, nama or nim))
-        # ambil nilai, coba konversi manual
-        try:
-            q = float(r.get("quiz", 0) or 0)
-        except Exception:
-            q = 0.0
-        try:
-            a = float(r.get("assignment", 0) or 0)
-        except Exception:
-            a = 0.0
-        try:
-            m = float(r.get("mid", 0) or 0)
-        except Exception:
-            m = 0.0
-        try:
-            f = float(r.get("final", 0) or 0)
-        except Exception:
-            f = 0.0
-        # gunakan method ubah_penilaian pada rekap
-        rekap.ubah_penilaian(nim, quiz=q, tugas=a, uts=m, uas=f)
+def load_grades_into_rekap(rekap, grd_path, on_row=None):
+    """Muat grades.csv ke RekapKelas (sekali baca, baris per baris)."""
+    from tracker.ingest import muat_grades
+    return muat_grades(rekap, grd_path, on_row)
 
 # ---------- Generate report helper ----------
 def generate_and_save_report(rekap):
     """Ambil data dari rekap dan buat file report.md di folder out."""
-    records = rekap.export_for_report()
-    md = build_markdown_report(records)
+    from tracker.report import simpan_report
     out_path = OUT_DIR / "report.md"
-    save_text(out_path, md)
+    # tulis langsung ke file per potongan, tanpa string laporan utuh di memori
+    simpan_report(out_path, rekap.iter_export(), skema=rekap.skema)
     return out_path
 
 # ---------- Bootstrap helper (gunakan CSV jika ada) ----------
 def bootstrap_from_csv(rekap, att_path, grd_path):
-    """Isi rekap dari CSV (dipanggil saat program mulai jika file ada)."""
-    # load attendance dulu kalau ada
-    if att_path.exists():
-        rows = read_csv(att_path)
-        for r in rows:
-            nim = r.get("student_id"); nama = r.get("name")
-            if not nim or not nama:
-                continue
-            m = Mahasiswa(nim, nama)
-            rekap.tambah_mahasiswa(m)
-            persen = calculate_attendance_percent_from_row(r)
-            rekap.ubah_hadir(nim, persen)
-    # load grades lalu match ke nim yang sudah ada
-    if grd_path.exists():
-        grd = read_csv(grd_path)
-        # buat dict by nim manual
-        by_nim = {}
-        for g in grd:
-            sid = g.get("student_id")
-            if sid:
-                by_nim[sid] = g
-        # update nilai mahasiswa yang sudah ada
-        for nim in list(rekap._data_by_nim.keys()):
-            g = by_nim.get(nim)
-            if not g:
-                continue
-            try:
-                q = float(g.get("quiz", 0) or 0)
-            except Exception:
-                q = 0.0
-            try:
-                a = float(g.get("assignment", 0) or 0)
-            except Exception:
-                a = 0.0
-            try:
-                m = float(g.get("mid", 0) or 0)
-            except Exception:
-                m = 0.0
-            try:
-                f = float(g.get("final", 0) or 0)
-            except Exception:
-                f = 0.0
-            rekap.ubah_penilaian(nim, quiz=q, tugas=a, uts=m, uas=f)
+    """
+    Isi rekap dari CSV (dipanggil saat program mulai jika file ada).
+    Kembalikan LaporanGalat: baris yang dilewati (NIM kosong/ganda) dan sel yang
+    dianggap 0 (bukan angka / di luar 0..100), lihat tracker.validasi.
+    """
+    from tracker.ingest import bootstrap
+    from tracker.skema_csv import LaporanGalat
+    laporan = LaporanGalat()
+    # kedua file di-stream sekali; grades digabung langsung ke NIM yang ada di rekap
+    bootstrap(rekap, att_path, grd_path, laporan)
+    return laporan
+
+# ---------- Snapshot biner (start cepat) ----------
+def snapshot_path():
+    """Lokasi snapshot biner rekap (dibuat dari attendance.csv + grades.csv)."""
+    return DATA_DIR / "rekap.snap"
+
+def load_rekap(rekap_cls, att_path, grd_path):
+    """
+    Pakai snapshot biner jika CSV belum berubah sejak snapshot dibuat;
+    jika tidak, bootstrap dari CSV lalu tulis snapshot baru.
+    Kembalikan (rekap, laporan); laporan None jika dari snapshot.
+    """
+    from tracker import snapshot_biner
+    return snapshot_biner.muat_atau_bootstrap(att_path, grd_path, snapshot_path(), rekap_cls)
+
+def snapshot_sumber(att_path, grd_path):
+    """File yang menentukan validitas snapshot: kedua CSV beserta change log-nya."""
+    from tracker import snapshot_biner
+    return snapshot_biner.sumber_csv(att_path, grd_path)
+
+# ---------- Tampilan tabel (per halaman, lihat tracker/tabel.py) ----------
+def _sel_csv(h):
+    # nilai sel CSV mentah sebagai teks rapi (None/kosong -> "")
+    return lambda r: str(r.get(h, "") or "").strip()
 
-# ---------- Tampilan tabel sederhana (manual formatting) ----------
 def print_table(headers, rows):
-    """Cetak tabel sederhana, manual hitung lebar kolom."""
-    # filter kosong
-    filtered = []
-    for r in rows:
-        values = [str(r.get(h, "") or "").strip() for h in headers]
-        ok = False
-        for v in values:
-            if v != "":
-                ok = True
-                break
-        if ok:
-            # zip headers->values manual
-            mapped = {}
-            for i, h in enumerate(headers):
-                mapped[h] = values[i]
-            filtered.append(mapped)
-    if not filtered:
-        print("(tidak ada data untuk ditampilkan)")
-        return
-    widths = []
-    for h in headers:
-        widths.append(len(h))
-    for r in filtered:
-        for i, h in enumerate(headers):
-            if len(str(r.get(h, ""))) > widths[i]:
-                widths[i] = len(str(r.get(h, "")))
-    # buat fungsi format baris manual
-    def fmt_row(values):
-        parts = []
-        for i, v in enumerate(values):
-            parts.append(str(v).ljust(widths[i]))
-        return " | ".join(parts)
-    # print header
+    """Cetak baris CSV mentah per halaman; baris yang semua selnya kosong dilewati."""
+    from tracker.tabel import Kolom, TabelHalaman, tampilkan
+    kolom = [Kolom(h, _sel_csv(h)) for h in headers]
+    # baris kosong disaring saat halaman dibangun, list rows tidak disalin
+    isi = lambda r: any(k.teks(r) for k in kolom)
     print()
-    print(fmt_row(headers))
-    # print separator
-    sep_parts = []
-    for w in widths:
-        sep_parts.append("-" * w)
-    print("-+-".join(sep_parts))
-    # print rows
-    for r in filtered:
-        vals = [r.get(h, "") for h in headers]
-        print(fmt_row(vals))
+    tampilkan(TabelHalaman(rows, kolom, saring=isi))
     print()
 
 def show_summary_rows(rows):
-    """Tampilkan rekap singkat (fixed format) seperti contoh di tugas."""
-    if not rows:
-        print("\n(tidak ada data untuk ditampilkan)\n")
-        return
-
-    # hitung lebar kolom nama paling panjang
-    lebar_nama = max(len(str(r["nama"])) for r in rows)
-    if lebar_nama < 10:
-        lebar_nama = 10  # jaga minimal
-
-    print("\nNIM        | {:<{w}} | Hadir% | Akhir | Pred".format("Nama", w=lebar_nama))
-    print("-" * (12 + lebar_nama + 24))  # garis pemisah proporsional
-
-    for r in rows:
-        print("{:<10} | {:<{w}} | {:>6.2f} | {:>6.2f} | {:<3}".format(
-            r["nim"], r["nama"], float(r["hadir"]), float(r["akhir"]), r["predikat"], w=lebar_nama
-        ))
-
+    """Tampilkan rekap singkat (NIM, nama, hadir, akhir, predikat) per halaman."""
+    from operator import itemgetter
+    from tracker.tabel import Kolom, TabelHalaman, angka, tampilkan
+    kolom = [
+        Kolom("NIM", itemgetter("nim"), min_lebar=10),
+        Kolom("Nama", itemgetter("nama"), min_lebar=10),  # jaga minimal
+        Kolom("Hadir%", itemgetter("hadir"), angka, kanan=True),
+        Kolom("Akhir", itemgetter("akhir"), angka, kanan=True),
+        Kolom("Pred", itemgetter("predikat")),
+    ]
+    print()
+    tampilkan(TabelHalaman(rows, kolom))
     print()
 
 # ---------- MAIN CLI ---------
-def main(auto_bootstrap=True):
-    # buat objek rekap
-    rekap = RekapKelas()
-    # jika ada CSV, isi data awal
-    if auto_bootstrap:
-        att_path = DATA_DIR / "attendance.csv"
-        grd_path = DATA_DIR / "grades.csv"
-        if att_path.exists() and grd_path.exists():
-            bootstrap_from_csv(rekap, att_path, grd_path)
+def main(auto_bootstrap=True, rekap_cls=RekapKelas, jurnal_dir=None, skema=None, penyimpanan=None):
+    # instrumentasi opsional (env TRACKER_INSTRUMEN / TRACKER_PROFIL), ditulis saat program keluar
+    from tracker import instrumen
+    instrumen.dari_env()
+    # buat objek rekap (rekap_cls bisa diganti RekapKelasKolom untuk data besar)
+    rekap = rekap_cls()
+    # penyimpanan: objek Penyimpanan, "csv", "sqlite", atau None (env TRACKER_PENYIMPANAN / csv)
+    if penyimpanan is None or isinstance(penyimpanan, str):
+        penyimpanan = buka_penyimpanan(penyimpanan)
+    from tracker.ingest import calculate_attendance_percent_from_row
+    from tracker.presensi import kolom_sesi
+    from tracker.skema_csv import ATT_HEADERS, GRD_HEADERS
+    # jurnal opsional (argumen, `python -m tracker --jurnal DIR`, atau env TRACKER_JURNAL):
+    # setiap perubahan dicatat, dan jika folder jurnal sudah berisi data, pulihkan dari sana
+    if jurnal_dir is None:
+        import os
+        jurnal_dir = os.environ.get("TRACKER_JURNAL") or None
+    jurnal = None
+    if jurnal_dir is not None:
+        from tracker.jurnal import Jurnal
+        jurnal = Jurnal(jurnal_dir)
+    if jurnal is not None and jurnal.ada_data():
+        n = jurnal.pulihkan(rekap)
+        print(f"Data dipulihkan dari jurnal ({n} perubahan diputar ulang).")
+    # jika ada data, isi data awal (CSV: lewat snapshot biner jika CSV belum berubah)
+    elif auto_bootstrap:
+        if penyimpanan.ada_data():
+            rekap, laporan = penyimpanan.muat(rekap_cls)
+            if laporan is not None and len(laporan) > 0:
+                print(f"! {len(laporan)} masalah di CSV (baris dilewati / sel dianggap 0):")
+                print(laporan.tabel())
+    # skema penilaian: dari argumen, atau skema default di data/skema_penilaian.json
+    if skema is None and SKEMA_PATH.exists():
+        from tracker.skema_nilai import pilih_skema
+        skema = pilih_skema(SKEMA_PATH)
+    if skema is not None:
+        from tracker.skema_nilai import SKEMA_STANDAR
+        # tanpa hitung ulang jika skemanya sama dengan yang sudah dipakai (lihat pakai_skema)
+        rekap.pakai_skema(skema)
+        if not skema.sama(SKEMA_STANDAR):
+            print(f"Skema penilaian: {skema.nama}")
+    if jurnal is not None and jurnal.rekap is None:
+        # jurnal baru: mulai dari snapshot isi CSV
+        jurnal.pasang(rekap)
+        jurnal.snapshot()
 
     # loop menu sederhana
     while True:
@@ -411,18 +273,20 @@ def main(auto_bootstrap=True):
                 if not p.exists():
                     print("! File attendance.csv tidak ditemukan.")
                 else:
-                    load_attendance_into_rekap(rekap, p)
+                    # baris mentah dikumpulkan sambil dimuat, supaya file tidak dibaca dua kali
+                    rows = []
+                    load_attendance_into_rekap(rekap, p, rows.append)
                     print("Attendance berhasil dimuat ke memori.")
-                    rows = read_csv(p)
-                    print_table(ATT_HEADERS, rows)
+                    # kolom sesi mengikuti header file (week1..weekN)
+                    print_table(ATT_HEADERS[:2] + kolom_sesi(rows[0] if rows else ATT_HEADERS), rows)
             elif sub == "2":
                 p = DATA_DIR / "grades.csv"
                 if not p.exists():
                     print("! File grades.csv tidak ditemukan.")
                 else:
-                    load_grades_into_rekap(rekap, p)
+                    rows = []
+                    load_grades_into_rekap(rekap, p, rows.append)
                     print("Grades berhasil dimuat ke memori.")
-                    rows = read_csv(p)
                     print_table(GRD_HEADERS, rows)
             else:
                 print("Pilihan tidak valid.")
@@ -434,9 +298,9 @@ def main(auto_bootstrap=True):
                 print("NIM dan Nama wajib diisi.")
             else:
                 try:
-                    # tambahkan ke rekap dan CSV
+                    # tambahkan ke rekap dan penyimpanan
                     rekap.tambah_mahasiswa(Mahasiswa(nim, nama))
-                    add_student_to_csvs(nim, nama)
+                    penyimpanan.tambah_mahasiswa(nim, nama)
                     outp = generate_and_save_report(rekap)
                     print(f"Mahasiswa ditambahkan. Laporan dibuat: {outp}")
                 except Exception as e:
@@ -444,27 +308,23 @@ def main(auto_bootstrap=True):
 
         elif pilihan == "3":
             nim = input("Masukkan NIM mahasiswa yang akan diubah presensinya: ").strip()
-            # untuk pemula: input tiap week satu per satu, kosong = biarkan
+            # untuk pemula: input tiap sesi satu per satu, kosong = biarkan
+            # (sesi diambil dari penyimpanan: week1..weekN, bisa juga week3_2 untuk sesi kedua)
             w_updates = {}
-            for i in range(1, 6):
-                val = input(f"week {i} (masukkan 1 untuk hadir, 0 untuk tidak hadir, kosong = tidak ubah): ").strip()
+            for label in penyimpanan.sesi():
+                val = input(f"{label} (masukkan 1 untuk hadir, 0 untuk tidak hadir, kosong = tidak ubah): ").strip()
                 if val == "":
-                    w_updates[f"week{i}"] = None
+                    w_updates[label] = None
                 elif val == "1":
-                    w_updates[f"week{i}"] = "1"
+                    w_updates[label] = "1"
                 elif val == "0":
-                    w_updates[f"week{i}"] = "0"
+                    w_updates[label] = "0"
                 else:
                     # input lain kita anggap tidak ubah
-                    w_updates[f"week{i}"] = None
+                    w_updates[label] = None
             try:
-                rows = update_attendance_csv(nim, w_updates)
-                # cari baris terbaru dan update memori rekap
-                found_row = None
-                for r in rows:
-                    if r.get("student_id") == nim:
-                        found_row = r
-                        break
+                # baris terbaru dipakai untuk update memori rekap
+                found_row = penyimpanan.ubah_presensi(nim, w_updates)
                 if found_row:
                     perc = calculate_attendance_percent_from_row(found_row)
                     rekap.ubah_hadir(nim, perc)
@@ -491,47 +351,59 @@ def main(auto_bootstrap=True):
             f = ask_number("Nilai UAS (kosong = tidak ubah): ")
             try:
                 rekap.ubah_penilaian(nim, quiz=q, tugas=a, uts=m, uas=f)
-                # simpan juga ke CSV
+                # simpan juga ke penyimpanan (CSV / SQLite)
                 fallback_name = ""
-                if nim in rekap._data_by_nim:
-                    fallback_name = rekap._data_by_nim[nim]['mhs'].nama
-                update_grades_csv(nim, q, a, m, f, fallback_name)
+                if nim in rekap:
+                    fallback_name = rekap.nama_mahasiswa(nim)
+                penyimpanan.ubah_nilai(nim, q, a, m, f, fallback_name)
                 outp = generate_and_save_report(rekap)
                 print(f"Nilai diperbarui. Laporan: {outp}")
             except Exception as e:
                 print("!Gagal ubah nilai:", e)
 
         elif pilihan == "5":
-            print("1) Semua mahasiswa  2) Hanya nilai akhir < 70")
-            sub = input("Pilih (1/2): ").strip()
-            rows = rekap.rekap()
+            print("1) Semua mahasiswa  2) Hanya nilai akhir < 70  3) Berisiko (nilai < 70 dan hadir < 75%)")
+            print("4) Tidak hadir beberapa sesi berturut-turut")
+            sub = input("Pilih (1/2/3/4): ").strip()
+            if sub == "4":
+                try:
+                    n = int(input("Berapa sesi berturut-turut? ").strip())
+                    # dihitung dari bitset presensi per sesi, bukan dari persen hadir
+                    presensi = penyimpanan.muat_presensi()
+                    nims = presensi.absen_beruntun(n)
+                    print(f"{len(nims)} mahasiswa tidak hadir {n} sesi berturut-turut:")
+                    for nim in nims:
+                        print(f"- {nim}  {presensi.nama_mahasiswa(nim)}")
+                except Exception as e:
+                    print("!Gagal membaca presensi:", e)
+                continue
             if sub == "2":
-                # filter manual
-                low = []
-                for rr in rows:
-                    try:
-                        val = float(rr.get('akhir', 0))
-                    except Exception:
-                        val = 0.0
-                    if val < 70.0:
-                        low.append(rr)
-                rows = low
+                # lewat indeks terurut, urut dari nilai terendah
+                rows = rekap.rentang_akhir(hi=70.0)
+            elif sub == "3":
+                rows = rekap.berisiko(batas_akhir=70.0, batas_hadir=75.0)
+            else:
+                rows = rekap.rekap()
             show_summary_rows(rows)
 
         elif pilihan == "6":
             try:
-                records = rekap.export_for_report()
-                md = build_markdown_report(records)
+                from tracker.report import simpan_report
                 out_md = OUT_DIR / "report.md"
-                save_text(out_md, md)
-                html = build_html_report(records)
+                simpan_report(out_md, rekap.iter_export(), skema=rekap.skema)
                 out_html = OUT_DIR / "report.html"
-                save_text(out_html, html)
+                simpan_report(out_html, rekap.iter_export(), skema=rekap.skema)
                 print(f"Laporan disimpan ke {out_md} dan {out_html}")
             except Exception as e:
                 print("!Gagal menyimpan laporan:", e)
 
         elif pilihan == "7":
+            if jurnal is not None:
+                jurnal.tutup()
+            if auto_bootstrap and penyimpanan.ada_data():
+                # CSV: simpan snapshot supaya start berikutnya cepat (SQLite tidak perlu)
+                penyimpanan.simpan_cache(rekap)
+            penyimpanan.tutup()
             print("Keluar. Terimakasih dan Sampai Jumpa!")
             break
 
@@ -0,0 +1,66 @@
+"""Pembuat data CSV sintetis untuk benchmark (deterministik berdasarkan seed)."""
+import csv
+import random
+from pathlib import Path
+
+# header sama persis dengan file yang dibuat app (skrip bench sudah menambah root proyek ke sys.path)
+from tracker.skema_csv import ATT_HEADERS, GRD_HEADERS
+
+
+# isi sel kotor yang masih diterima loader (dicatat di LaporanGalat / dianggap 0 / dilewati)
+SEL_KOTOR_HADIR = ("", "x", " 1 ", "1.0", "2", "hadir")
+SEL_KOTOR_NILAI = ("", "n/a", " 85 ", "72.50", "1e1", "-", "150", "-5")
+
+
+def tulis_csv_sintetis(folder, n, seed=42, minggu=5, kotor=0.0):
+    """
+    Tulis attendance.csv dan grades.csv berisi n mahasiswa (minggu = jumlah kolom sesi) ke folder.
+    kotor: bagian baris (0..1) yang diberi satu kerusakan: sel kosong / bukan angka /
+    berspasi / di luar 0..100, baris attendance tanpa NIM atau nama, NIM ganda di
+    attendance, atau baris grades dengan NIM asing / nama yang beda.
+    Kerusakan memakai Random terpisah, jadi kotor=0 menghasilkan file yang sama seperti dulu.
+    File ditulis baris per baris, jadi n = 10 juta pun tidak ditampung di memori.
+    """
+    folder = Path(folder)
+    folder.mkdir(parents=True, exist_ok=True)
+    rnd = random.Random(seed)
+    rnd_kotor = random.Random(seed + 1) if kotor > 0 else None
+    att_path = folder / "attendance.csv"
+    grd_path = folder / "grades.csv"
+    with att_path.open("w", encoding="utf-8", newline="") as fa, \
+            grd_path.open("w", encoding="utf-8", newline="") as fg:
+        wa = csv.writer(fa)
+        wg = csv.writer(fg)
+        wa.writerow(ATT_HEADERS[:2] + [f"week{i}" for i in range(1, minggu + 1)])
+        wg.writerow(GRD_HEADERS)
+        for i in range(n):
+            nim = str(230000000 + i)
+            nama = "Mahasiswa " + str(i)
+            att = [nim, nama] + [rnd.randint(0, 1) for _ in range(minggu)]
+            grd = [nim, nama] + [rnd.randint(0, 100) for _ in range(4)]
+            if rnd_kotor is not None and rnd_kotor.random() < kotor:
+                _rusak(rnd_kotor, att, grd)
+            wa.writerow(att)
+            wg.writerow(grd)
+    return att_path, grd_path
+
+
+def _rusak(rnd, att, grd):
+    """Beri satu kerusakan ke baris att atau grd (di tempat)."""
+    jenis = rnd.random()
+    if jenis < 0.35:
+        att[rnd.randrange(2, len(att))] = rnd.choice(SEL_KOTOR_HADIR)
+    elif jenis < 0.7:
+        grd[rnd.randrange(2, len(grd))] = rnd.choice(SEL_KOTOR_NILAI)
+    elif jenis < 0.8:
+        # baris tanpa NIM atau nama: dilewati saat bootstrap
+        att[rnd.randrange(2)] = ""
+    elif jenis < 0.9:
+        # NIM yang tidak ada di attendance: diabaikan saat bootstrap
+        grd[0] = "9" + grd[0]
+    elif jenis < 0.95:
+        # nama di grades.csv beda dengan attendance.csv (dicatat, nama attendance dipakai)
+        grd[1] = grd[1].upper()
+    else:
+        # NIM baris sebelumnya dipakai lagi: NIM ganda di attendance (baris pertama dipakai)
+        att[0] = str(int(att[0]) - 1)
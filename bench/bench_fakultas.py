@@ -0,0 +1,51 @@
+"""
+Muat banyak kelas sekaligus dengan RekapFakultas: berurutan vs ProcessPoolExecutor.
+
+Jalankan dari root proyek:
+    python bench/bench_fakultas.py --kelas 200 --n 2000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from _data import tulis_csv_sintetis
+from tracker.fakultas import RekapFakultas
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--kelas", type=int, default=200, help="jumlah kelas")
+    ap.add_argument("--n", type=int, default=2000, help="mahasiswa per kelas")
+    ap.add_argument("--workers", type=int, nargs="+", default=None,
+                    help="jumlah worker yang dicoba (default 1, 2, 4, ... sampai jumlah core)")
+    args = ap.parse_args()
+
+    workers = args.workers
+    if workers is None:
+        workers = [1]
+        while workers[-1] * 2 <= (os.cpu_count() or 1):
+            workers.append(workers[-1] * 2)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for k in range(args.kelas):
+            tulis_csv_sintetis(Path(tmp) / "2024-ganjil" / f"kelas-{k:04d}", args.n, seed=k)
+        print(f"{args.kelas} kelas x {args.n} mahasiswa, {os.cpu_count()} core")
+        print(f"{'workers':>8} {'waktu (s)':>10} {'speedup':>8}")
+        dasar = None
+        for w in workers:
+            t0 = time.perf_counter()
+            fak = RekapFakultas()
+            fak.muat(tmp, max_workers=w)
+            fak.rekap()
+            dt = time.perf_counter() - t0
+            dasar = dasar or dt
+            print(f"{w:>8} {dt:>10.2f} {dasar / dt:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Query "nilai akhir < 70" / berisiko: filter linear rekap() dibanding indeks terurut.
+
+Jalankan dari root proyek:
+    python bench/bench_indeks.py --n 100000 --ubah 1000
+"""
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from _data import tulis_csv_sintetis
+from tracker import RekapKelas, RekapKelasKolom
+from tracker.ingest import bootstrap
+
+
+def waktu(fungsi, ulang=1):
+    t0 = time.perf_counter()
+    for _ in range(ulang):
+        hasil = fungsi()
+    return hasil, (time.perf_counter() - t0) / ulang
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--n", type=int, default=100000, help="jumlah mahasiswa")
+    ap.add_argument("--ubah", type=int, default=1000, help="jumlah ubah nilai di antara query")
+    ap.add_argument("--batas", type=float, default=40.0, help="batas nilai akhir untuk query")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        att_path, grd_path = tulis_csv_sintetis(tmp, args.n)
+        for cls in (RekapKelas, RekapKelasKolom):
+            rekap = cls()
+            bootstrap(rekap, att_path, grd_path)
+            nims = [row['nim'] for row in rekap.rekap()]
+
+            linear, t_linear = waktu(lambda: [r for r in rekap.rekap() if r['akhir'] < args.batas], 5)
+            _, t_bangun = waktu(lambda: rekap.rentang_akhir(hi=args.batas))
+            hasil, t_indeks = waktu(lambda: rekap.rentang_akhir(hi=args.batas), 5)
+            assert len(hasil) == len(linear)
+            _, t_risiko = waktu(lambda: rekap.berisiko(args.batas, 75.0), 5)
+            _, t_top = waktu(lambda: rekap.teratas(10), 5)
+
+            rnd = random.Random(7)
+            for nim in rnd.sample(nims, min(args.ubah, len(nims))):
+                rekap.ubah_penilaian(nim, uas=rnd.uniform(0, 100))
+            _, t_setelah = waktu(lambda: rekap.rentang_akhir(hi=args.batas))
+
+            print(f"{cls.__name__} (n = {args.n}, hasil {len(hasil)} baris)")
+            print(f"  {'filter linear rekap()':<30} {t_linear * 1000:>10.3f} ms")
+            print(f"  {'bangun indeks + query':<30} {t_bangun * 1000:>10.3f} ms")
+            print(f"  {'query indeks':<30} {t_indeks * 1000:>10.3f} ms")
+            print(f"  {'berisiko':<30} {t_risiko * 1000:>10.3f} ms")
+            print(f"  {'top 10':<30} {t_top * 1000:>10.3f} ms")
+            print(f"  {'query setelah ' + str(args.ubah) + ' ubah':<30} {t_setelah * 1000:>10.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Bandingkan bootstrap lama (baca CSV ke list + dict by_nim) dengan ingest streaming.
+
+Jalankan dari root proyek:
+    python bench/bench_ingest.py --n 1000000
+"""
+import argparse
+import gc
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from _data import tulis_csv_sintetis
+from tracker import Mahasiswa, RekapKelasKolom
+from tracker.ingest import bootstrap, calculate_attendance_percent_from_row, iter_csv
+
+
+def bootstrap_lama(rekap, att_path, grd_path):
+    """Alur lama: seluruh file dibaca ke list lalu digabung lewat dict."""
+    att = list(iter_csv(att_path))
+    for r in att:
+        rekap.tambah_mahasiswa(Mahasiswa(r["student_id"], r["name"]))
+        rekap.ubah_hadir(r["student_id"], calculate_attendance_percent_from_row(r))
+    by_nim = {g["student_id"]: g for g in iter_csv(grd_path)}
+    for nim, g in by_nim.items():
+        if nim in rekap:
+            rekap.ubah_penilaian(nim, quiz=float(g["quiz"]), tugas=float(g["assignment"]),
+                                 uts=float(g["mid"]), uas=float(g["final"]))
+
+
+def ukur(fungsi, att_path, grd_path):
+    """Kembalikan (detik, puncak memori byte) satu kali muat ke RekapKelasKolom."""
+    gc.collect()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    fungsi(RekapKelasKolom(), att_path, grd_path)
+    dt = time.perf_counter() - t0
+    _, puncak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return dt, puncak
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--n", type=int, default=1000000, help="jumlah baris per CSV")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        att_path, grd_path = tulis_csv_sintetis(tmp, args.n)
+        print(f"n = {args.n}")
+        print(f"{'alur':<12} {'waktu (s)':>10} {'puncak (MB)':>12} {'baris/s':>10}")
+        for nama, fungsi in (("lama", bootstrap_lama), ("streaming", bootstrap)):
+            dt, puncak = ukur(fungsi, att_path, grd_path)
+            print(f"{nama:<12} {dt:>10.2f} {puncak / 1e6:>12.1f} {args.n / dt:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
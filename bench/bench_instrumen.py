@@ -0,0 +1,67 @@
+"""
+Biaya instrumentasi (tracker.instrumen): bootstrap + skor + render laporan, mati vs nyala.
+
+Jalankan dari root proyek:
+    python bench/bench_instrumen.py
+    python bench/bench_instrumen.py --n 200000 --ulang 5
+
+Saat mati, kode panas hanya membaca `instrumen.AKTIF` sekali per file / blok / tahap,
+jadi selisihnya harus di bawah derau pengukuran. Laporan tahap dari putaran
+terakhir yang menyala ikut dicetak.
+"""
+import argparse
+import io
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from _data import tulis_csv_sintetis
+
+from tracker import RekapKelasKolom, instrumen
+from tracker.ingest import bootstrap
+from tracker.render import render
+from tracker.skema_csv import LaporanGalat
+
+
+def satu_putaran(att, grd):
+    t0 = time.perf_counter()
+    rekap = RekapKelasKolom()
+    bootstrap(rekap, att, grd, LaporanGalat())
+    rekap.rekap()
+    render(rekap.iter_export(), io.StringIO(), "md")
+    return time.perf_counter() - t0
+
+
+def terbaik(att, grd, ulang):
+    return min(satu_putaran(att, grd) for _ in range(ulang))
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--n", type=int, default=100000, help="jumlah mahasiswa")
+    ap.add_argument("--ulang", type=int, default=5, help="putaran per mode (diambil yang tercepat)")
+    ap.add_argument("--seed", type=int, default=42)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        att, grd = tulis_csv_sintetis(tmp, args.n, args.seed)
+        mati = terbaik(att, grd, args.ulang)
+        instrumen.aktifkan()
+        nyala = terbaik(att, grd, args.ulang)
+        instrumen.reset()
+        satu_putaran(att, grd)
+        hasil = instrumen.laporan()
+        instrumen.selesai()
+
+    print(f"Python {sys.version.split()[0]}, n = {args.n:,}, terbaik dari {args.ulang} putaran")
+    print(f"  mati   {mati:.3f} s")
+    print(f"  nyala  {nyala:.3f} s  ({(nyala / mati - 1) * 100:+.1f}%)")
+    print(json.dumps(hasil["tahap"], indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+"""
+Banyak thread mengubah rekap sekaligus: uji stres RekapKelasAman dan throughput per jumlah thread.
+
+Jalankan dari root proyek:
+    python bench/bench_konkuren.py --stres --n 5000 --detik 5
+    python bench/bench_konkuren.py --n 20000 --ubah 200000 --thread 1 2 4 8
+
+--stres menjalankan penulis, penambah (baca-ubah-tulis), dan pembaca bersamaan lalu
+memeriksa: tidak ada baris setengah jadi, tidak ada update yang hilang, dan indeks
+cocok dengan isi rekap. Exit code 1 jika ada pelanggaran.
+Tanpa --stres: throughput ubah_penilaian untuk RekapKelasAman dibanding RekapKelas
+yang dijaga satu kunci global, tanpa dan dengan satu thread pembaca rekap().
+"""
+import argparse
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tracker import Mahasiswa, RekapKelas, RekapKelasAman
+
+# satu kenaikan quiz per ubah_dengan; jumlah kenaikan per NIM panas dibatasi supaya quiz <= 100
+MAKS_KENAIKAN = 100
+
+
+def isi(rekap, n, seed=42):
+    rnd = random.Random(seed)
+    nims = [str(230000000 + i) for i in range(n)]
+    for nim in nims:
+        rekap.tambah_mahasiswa(Mahasiswa(nim, "Mahasiswa " + nim))
+        v = rnd.randint(0, 100)
+        rekap.ubah_penilaian(nim, quiz=v, tugas=v, uts=v, uas=v)
+        rekap.ubah_hadir(nim, rnd.randint(0, 100))
+    return nims
+
+
+def stres(args):
+    # ganti thread sesering mungkin supaya interleaving yang jarang ikut teruji
+    sys.setswitchinterval(1e-6)
+    rekap = RekapKelasAman()
+    nims = isi(rekap, args.n)
+    panas = nims[:8]
+    dingin = nims[8:]
+    for nim in panas:
+        rekap.ubah_penilaian(nim, quiz=0)
+    pelanggaran = []
+    berhenti = threading.Event()
+    hitung = {"tulis": 0, "naik": 0, "baca": 0, "query": 0}
+    kunci_hitung = threading.Lock()
+
+    def tambah_hitung(nama, k):
+        with kunci_hitung:
+            hitung[nama] += k
+
+    def penulis(no):
+        # keempat komponen selalu diisi nilai yang sama; pembaca tidak boleh melihat campuran
+        rnd = random.Random(no)
+        k = 0
+        while not berhenti.is_set():
+            v = rnd.randint(0, 100)
+            rekap.ubah(rnd.choice(dingin), hadir=v, quiz=v, tugas=v, uts=v, uas=v)
+            k += 1
+        tambah_hitung("tulis", k)
+
+    def penambah(no, jumlah):
+        for _ in range(jumlah):
+            for nim in panas:
+                rekap.ubah_dengan(nim, lambda kom: {'quiz': kom['quiz'] + 1})
+        tambah_hitung("naik", jumlah * len(panas))
+
+    def pembaca():
+        k = 0
+        while not berhenti.is_set():
+            for nim, nama, hadir, q, t, u, a in rekap.iter_komponen():
+                if nim not in panas and not (q == t == u == a):
+                    pelanggaran.append(f"baris setengah jadi {nim}: {q} {t} {u} {a}")
+            for row in rekap.rekap():
+                if row['predikat'] != rekap.skema.predikat(row['akhir']):
+                    pelanggaran.append(f"predikat tidak cocok {row}")
+            k += 1
+        tambah_hitung("baca", k)
+
+    def penanya():
+        k = 0
+        while not berhenti.is_set():
+            rekap.rentang_akhir(hi=50)
+            rekap.berisiko(70, 75)
+            rekap.teratas(10)
+            k += 1
+        tambah_hitung("query", k)
+
+    per_penambah = MAKS_KENAIKAN // args.penambah
+    thread = [threading.Thread(target=penulis, args=(i,)) for i in range(args.penulis)]
+    thread += [threading.Thread(target=penambah, args=(i, per_penambah)) for i in range(args.penambah)]
+    thread += [threading.Thread(target=pembaca) for _ in range(args.pembaca)]
+    thread += [threading.Thread(target=penanya)]
+    t0 = time.perf_counter()
+    for t in thread:
+        t.start()
+    time.sleep(args.detik)
+    berhenti.set()
+    for t in thread:
+        t.join()
+    durasi = time.perf_counter() - t0
+
+    harapan = per_penambah * args.penambah
+    for nim in panas:
+        q = next(k[3] for k in rekap.iter_komponen() if k[0] == nim)
+        if q != harapan:
+            pelanggaran.append(f"update hilang {nim}: quiz {q}, seharusnya {harapan}")
+    # setelah semua thread berhenti, indeks harus sama persis dengan isi rekap
+    urut = sorted((r['akhir'], r['nim']) for r in rekap.rekap())
+    dari_indeks = [(r['akhir'], r['nim']) for r in rekap.rentang_akhir()]
+    if urut != dari_indeks:
+        pelanggaran.append("indeks nilai akhir tidak cocok dengan rekap()")
+
+    print(f"stres {durasi:.1f} s, n = {args.n}: {hitung['tulis']:,} ubah, {hitung['naik']:,} ubah_dengan, "
+          f"{hitung['baca']:,} salinan penuh, {hitung['query']:,} putaran query")
+    if pelanggaran:
+        print(f"GAGAL: {len(pelanggaran)} pelanggaran")
+        for p in pelanggaran[:10]:
+            print("  " + p)
+        return 1
+    print("OK: tidak ada baris setengah jadi, update hilang, atau indeks basi")
+    return 0
+
+
+def ukur(rekap, nims, n_thread, n_ubah, pembaca, ubah):
+    """Jalankan n_ubah perubahan dibagi ke n_thread; kembalikan (ubah/s, salinan rekap()/s)."""
+    per_thread = n_ubah // n_thread
+    berhenti = threading.Event()
+    baca = [0]
+
+    def penulis(no):
+        rnd = random.Random(no)
+        for _ in range(per_thread):
+            ubah(rnd.choice(nims), rnd.randint(0, 100))
+
+    def pembaca_loop():
+        while not berhenti.is_set():
+            rekap.rekap()
+            baca[0] += 1
+
+    thread = [threading.Thread(target=penulis, args=(i,)) for i in range(n_thread)]
+    latar = threading.Thread(target=pembaca_loop) if pembaca else None
+    t0 = time.perf_counter()
+    if latar is not None:
+        latar.start()
+    for t in thread:
+        t.start()
+    for t in thread:
+        t.join()
+    durasi = time.perf_counter() - t0
+    berhenti.set()
+    if latar is not None:
+        latar.join()
+    return per_thread * n_thread / durasi, baca[0] / durasi
+
+
+def throughput(args):
+    aman = RekapKelasAman()
+    nims = isi(aman, args.n)
+    biasa = RekapKelas()
+    isi(biasa, args.n)
+    kunci_global = threading.Lock()
+
+    def ubah_aman(nim, v):
+        aman.ubah_penilaian(nim, quiz=v, uas=v)
+
+    def ubah_global(nim, v):
+        with kunci_global:
+            biasa.ubah_penilaian(nim, quiz=v, uas=v)
+
+    def rekap_global():
+        with kunci_global:
+            return RekapKelas.rekap(biasa)
+
+    # pembaca RekapKelas juga harus memegang kunci global supaya tidak melihat data setengah jadi
+    biasa.rekap = rekap_global
+    print(f"n = {args.n}, {args.ubah:,} ubah_penilaian per percobaan (Python {sys.version.split()[0]})")
+    print(f"{'thread':>6} {'pembaca':>8} {'RekapKelas+kunci (ubah/s)':>26} {'RekapKelasAman (ubah/s)':>24}"
+          f" {'rekap()/s biasa':>16} {'rekap()/s aman':>15}")
+    for pembaca in (False, True):
+        for n_thread in args.thread:
+            g, gb = ukur(biasa, nims, n_thread, args.ubah, pembaca, ubah_global)
+            a, ab = ukur(aman, nims, n_thread, args.ubah, pembaca, ubah_aman)
+            baca = f"{gb:>16.1f} {ab:>15.1f}" if pembaca else f"{'-':>16} {'-':>15}"
+            print(f"{n_thread:>6} {('ya' if pembaca else 'tidak'):>8} {g:>26,.0f} {a:>24,.0f} {baca}")
+    return 0
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--n", type=int, default=20000, help="jumlah mahasiswa")
+    ap.add_argument("--stres", action="store_true", help="uji stres (cek invarian) alih-alih throughput")
+    ap.add_argument("--detik", type=float, default=5.0, help="lama uji stres")
+    ap.add_argument("--penulis", type=int, default=4, help="thread penulis (uji stres)")
+    ap.add_argument("--penambah", type=int, default=4, help="thread baca-ubah-tulis (uji stres)")
+    ap.add_argument("--pembaca", type=int, default=2, help="thread pembaca salinan (uji stres)")
+    ap.add_argument("--ubah", type=int, default=200000, help="jumlah ubah per percobaan throughput")
+    ap.add_argument("--thread", type=int, nargs="+", default=[1, 2, 4, 8], help="jumlah thread penulis")
+    args = ap.parse_args()
+    sys.exit(stres(args) if args.stres else throughput(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Bandingkan pemakaian memori RekapKelas (dict of objects) dan RekapKelasKolom.
+
+Jalankan dari root proyek:
+    python bench/bench_memori.py --n 200000
+"""
+import argparse
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tracker import Mahasiswa, RekapKelas, RekapKelasKolom
+
+
+def isi(rekap, n, seed=42):
+    """Isi rekap dengan n mahasiswa sintetis."""
+    rnd = random.Random(seed)
+    for i in range(n):
+        nim = str(230000000 + i)
+        rekap.tambah_mahasiswa(Mahasiswa(nim, "Mahasiswa " + str(i)))
+        rekap.ubah_hadir(nim, rnd.choice((0, 20, 40, 60, 80, 100)))
+        rekap.ubah_penilaian(nim, quiz=rnd.randint(0, 100), tugas=rnd.randint(0, 100),
+                             uts=rnd.randint(0, 100), uas=rnd.randint(0, 100))
+
+
+def ukur(cls, n):
+    """Kembalikan (byte terpakai, detik isi, detik rekap) untuk satu backend."""
+    gc.collect()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    rekap = cls()
+    isi(rekap, n)
+    t1 = time.perf_counter()
+    terpakai, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    t2 = time.perf_counter()
+    rekap.rekap()
+    t3 = time.perf_counter()
+    return terpakai, t1 - t0, t3 - t2
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--n", type=int, default=100000, help="jumlah mahasiswa")
+    args = ap.parse_args()
+
+    print(f"n = {args.n}")
+    print(f"{'backend':<18} {'memori (MB)':>12} {'byte/mhs':>10} {'isi (s)':>9} {'rekap (s)':>10}")
+    for cls in (RekapKelas, RekapKelasKolom):
+        terpakai, t_isi, t_rekap = ukur(cls, args.n)
+        print(f"{cls.__name__:<18} {terpakai / 1e6:>12.1f} {terpakai / args.n:>10.0f} {t_isi:>9.2f} {t_rekap:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
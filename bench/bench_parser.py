@@ -0,0 +1,77 @@
+"""
+Bandingkan parsing grades/attendance lewat csv.DictReader + try/float per sel
+dengan pembaca bertipe tracker.skema_csv (tuple + konversi per kolom).
+
+Jalankan dari root proyek:
+    python bench/bench_parser.py --n 500000
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from _data import tulis_csv_sintetis
+from tracker.ingest import iter_csv
+from tracker.skema_csv import ATT_HEADERS, GRD_HEADERS, LaporanGalat, baca_blok, persen_hadir_kolom
+
+
+def parse_dictreader(att_path, grd_path):
+    """Alur lama: satu dict per baris, satu try/except per sel."""
+    n = 0
+    for r in iter_csv(att_path):
+        present = 0
+        for k in ATT_HEADERS[2:]:
+            try:
+                val = int(float((r.get(k) or "").strip() or 0))
+            except Exception:
+                val = 0
+            if val != 0:
+                present += 1
+        n += 1
+    for r in iter_csv(grd_path):
+        for k in GRD_HEADERS[2:]:
+            try:
+                float(r.get(k, 0) or 0)
+            except Exception:
+                pass
+        n += 1
+    return n
+
+
+def parse_bertipe(att_path, grd_path):
+    """Alur baru: tuple per baris, konversi per kolom, sel rusak masuk laporan."""
+    laporan = LaporanGalat()
+    n = 0
+    for blok in baca_blok(att_path, ATT_HEADERS, laporan):
+        persen_hadir_kolom(blok)
+        n += len(blok)
+    for blok in baca_blok(grd_path, GRD_HEADERS, laporan):
+        n += len(blok)
+    return n
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--n", type=int, default=500000, help="jumlah baris per CSV")
+    ap.add_argument("--ulang", type=int, default=3, help="jumlah pengulangan (ambil tercepat)")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        att_path, grd_path = tulis_csv_sintetis(tmp, args.n)
+        print(f"n = {args.n} baris per file")
+        print(f"{'parser':<12} {'waktu (s)':>10} {'baris/s':>12}")
+        for nama, fungsi in (("DictReader", parse_dictreader), ("bertipe", parse_bertipe)):
+            terbaik = None
+            for _ in range(args.ulang):
+                t0 = time.perf_counter()
+                baris = fungsi(att_path, grd_path)
+                dt = time.perf_counter() - t0
+                terbaik = dt if terbaik is None else min(terbaik, dt)
+            print(f"{nama:<12} {terbaik:>10.2f} {baris / terbaik:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Latensi satu kali ubah nilai di grades.csv: tulis ulang seluruh file (cara lama)
+dibanding CSVPatcher (ubah baris di tempat lewat indeks NIM -> offset).
+
+Jalankan dari root proyek:
+    python bench/bench_patch.py --sizes 10000 100000 1000000
+"""
+import argparse
+import csv
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from _data import tulis_csv_sintetis
+from tracker.ingest import iter_csv
+from tracker.patch_csv import CSVPatcher
+from tracker.skema_csv import GRD_HEADERS
+
+
+def ubah_lama(path, nim, quiz):
+    """Cara lama: baca semua baris, cari NIM, tulis ulang seluruh file."""
+    rows = list(iter_csv(path))
+    for r in rows:
+        if r["student_id"] == nim:
+            r["quiz"] = str(float(quiz))
+            break
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        w = csv.DictWriter(f, fieldnames=GRD_HEADERS)
+        w.writeheader()
+        w.writerows(rows)
+
+
+def median_ms(fungsi, n, nims, ulang):
+    rnd = random.Random(1)
+    hasil = []
+    for _ in range(ulang):
+        nim = rnd.choice(nims)
+        t0 = time.perf_counter()
+        fungsi(nim, rnd.randint(0, 100))
+        hasil.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(hasil)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000])
+    ap.add_argument("--ulang", type=int, default=20, help="jumlah edit per ukuran")
+    args = ap.parse_args()
+
+    print(f"{'baris':>10} {'tulis ulang (ms)':>17} {'patch (ms)':>11} {'buka indeks (ms)':>17}")
+    for n in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            _, grd_path = tulis_csv_sintetis(tmp, n)
+            nims = [str(230000000 + i) for i in range(n)]
+            # cara lama cukup sedikit pengulangan karena lambat untuk file besar
+            lama = median_ms(lambda nim, q: ubah_lama(grd_path, nim, q), n, nims, max(1, min(args.ulang, 3)))
+
+            patcher = CSVPatcher(grd_path, GRD_HEADERS)
+            # kompaksi sekali supaya semua sel angka sudah dipadding
+            patcher.kompaksi()
+            t0 = time.perf_counter()
+            patcher = CSVPatcher(grd_path, GRD_HEADERS)
+            buka = (time.perf_counter() - t0) * 1000
+            baru = median_ms(lambda nim, q: patcher.perbarui(nim, {"quiz": str(float(q))}), n, nims, args.ulang)
+            print(f"{n:>10} {lama:>17.1f} {baru:>11.3f} {buka:>17.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Penyimpanan CSV vs SQLite: muat, ubah satu NIM, dan ubah banyak NIM sekaligus.
+
+Jalankan dari root proyek:
+    python bench/bench_penyimpanan.py
+    python bench/bench_penyimpanan.py --n 10000 100000 1000000 --json out/bench_penyimpanan.json
+
+Untuk setiap n: CSV sintetis ditulis, lalu dimigrasi ke SQLite (import). Yang diukur:
+muat penuh ke RekapKelasKolom (CSV tanpa snapshot = bootstrap), --satu perubahan nilai
+satu per satu (CSV: patch di tempat, SQLite: satu upsert + commit per perubahan), dan
+satu perubahan massal untuk --massal bagian dari mahasiswa (CSV: grades.csv ditulis
+ulang sekali, SQLite: executemany dalam satu transaksi).
+"""
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from _data import tulis_csv_sintetis
+
+from tracker import RekapKelasKolom
+from tracker.penyimpanan import buka_penyimpanan
+from tracker.skema_csv import LaporanGalat
+
+
+def ukur(fungsi):
+    t0 = time.perf_counter()
+    hasil = fungsi()
+    return time.perf_counter() - t0, hasil
+
+
+def satu_per_satu(penyimpanan, nims, k, seed):
+    rnd = random.Random(seed)
+    for _ in range(k):
+        penyimpanan.ubah_nilai(rnd.choice(nims), quiz=rnd.randint(0, 100), final=rnd.randint(0, 100))
+
+
+def massal(penyimpanan, nims, bagian, seed):
+    rnd = random.Random(seed)
+    dipilih = rnd.sample(nims, max(1, int(len(nims) * bagian)))
+    perubahan = {nim: {"quiz": float(rnd.randint(0, 100)), "final": float(rnd.randint(0, 100))} for nim in dipilih}
+    penyimpanan.ubah_nilai_banyak(perubahan)
+    return len(perubahan)
+
+
+def ukuran(*paths):
+    return sum(p.stat().st_size for p in paths if p.exists())
+
+
+def satu_n(n, args):
+    with tempfile.TemporaryDirectory() as tmp:
+        tulis_csv_sintetis(tmp, n, args.seed)
+        csv = buka_penyimpanan(tmp, "csv")
+        db = buka_penyimpanan(tmp, "sqlite")
+        nims = [str(230000000 + i) for i in range(n)]
+        hasil = {"n": n}
+
+        t, _ = ukur(lambda: db.migrasi_dari_csv(csv.att_path, csv.grd_path, LaporanGalat()))
+        hasil["migrasi_s"] = t
+        hasil["ukuran_csv_mb"] = ukuran(csv.att_path, csv.grd_path) / 1e6
+        hasil["ukuran_sqlite_mb"] = ukuran(db.path, *db.sumber()[1:]) / 1e6
+
+        # CSV dimuat tanpa snapshot (snapshot dihapus setiap kali) supaya yang diukur benar-benar CSV
+        def muat_csv():
+            csv.snap_path.unlink(missing_ok=True)
+            return csv.muat(RekapKelasKolom)[0]
+        hasil["muat_csv_s"], rekap_csv = ukur(muat_csv)
+        hasil["muat_sqlite_s"], rekap_db = ukur(lambda: db.muat(RekapKelasKolom)[0])
+        if rekap_csv.rekap() != rekap_db.rekap():
+            raise SystemExit(f"n = {n}: isi rekap CSV dan SQLite berbeda")
+
+        # indeks NIM -> offset CSVPatcher dibangun sekali, di luar pengukuran
+        csv.ubah_nilai(nims[0], quiz=1)
+        hasil["satu_csv_s"], _ = ukur(lambda: satu_per_satu(csv, nims, args.satu, args.seed))
+        hasil["satu_sqlite_s"], _ = ukur(lambda: satu_per_satu(db, nims, args.satu, args.seed))
+        hasil["massal_csv_s"], jumlah = ukur(lambda: massal(csv, nims, args.massal, args.seed))
+        hasil["massal_sqlite_s"], _ = ukur(lambda: massal(db, nims, args.massal, args.seed))
+        hasil["massal_jumlah"] = jumlah
+        db.tutup()
+    return hasil
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--n", type=int, nargs="+", default=[10000, 100000], help="jumlah mahasiswa")
+    ap.add_argument("--satu", type=int, default=1000, help="jumlah perubahan satu per satu")
+    ap.add_argument("--massal", type=float, default=0.1, help="bagian mahasiswa di perubahan massal")
+    ap.add_argument("--seed", type=int, default=42)
+    ap.add_argument("--json", help="simpan hasil ke file JSON")
+    args = ap.parse_args()
+
+    print(f"Python {sys.version.split()[0]}, {args.satu} ubah satu per satu, "
+          f"massal {args.massal:.0%} mahasiswa")
+    print(f"{'n':>9} {'ukuran MB csv/db':>17} {'migrasi s':>10} {'muat s csv/db':>15} "
+          f"{'ubah/s csv/db':>17} {'massal s csv/db':>16}")
+    semua = []
+    for n in args.n:
+        h = satu_n(n, args)
+        semua.append(h)
+        print(f"{n:>9,} {h['ukuran_csv_mb']:>8.1f}/{h['ukuran_sqlite_mb']:<8.1f} {h['migrasi_s']:>10.2f} "
+              f"{h['muat_csv_s']:>7.2f}/{h['muat_sqlite_s']:<7.2f} "
+              f"{args.satu / h['satu_csv_s']:>8,.0f}/{args.satu / h['satu_sqlite_s']:<8,.0f} "
+              f"{h['massal_csv_s']:>7.2f}/{h['massal_sqlite_s']:<7.2f}")
+    if args.json:
+        p = Path(args.json)
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text(json.dumps({"satu": args.satu, "massal": args.massal, "hasil": semua}, indent=2),
+                     encoding="utf-8")
+        print(f"Hasil disimpan ke {p}")
+
+
+if __name__ == "__main__":
+    main()
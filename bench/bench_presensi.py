@@ -0,0 +1,112 @@
+"""
+Presensi bitset (MatriksPresensi) vs baris dict teks: memori, persen hadir, dan absen berturut-turut.
+
+Jalankan dari root proyek:
+    python bench/bench_presensi.py
+    python bench/bench_presensi.py --n 50000 --sesi 16 48 --json out/bench_presensi.json
+
+Untuk setiap jumlah sesi: attendance.csv sintetis ditulis (week1..weekN), lalu dibaca
+dua cara. Cara lama menyimpan baris dict teks per mahasiswa (seperti csv.DictReader) dan
+menghitung per sel; MatriksPresensi menyimpan satu int per mahasiswa, persen hadir lewat
+popcount (int.bit_count) dan absen berturut-turut lewat geser-AND untuk seluruh kelas.
+"""
+import argparse
+import csv
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from _data import tulis_csv_sintetis
+
+from tracker.presensi import MatriksPresensi, kolom_sesi
+
+
+def ukur(fungsi, ulang=1):
+    t0 = time.perf_counter()
+    for _ in range(ulang):
+        hasil = fungsi()
+    return (time.perf_counter() - t0) / ulang, hasil
+
+
+def ukuran_baris(rows):
+    """Memori list baris dict (dict + string sel; string pendek '0'/'1' dibagi Python, dihitung sekali)."""
+    total = sys.getsizeof(rows)
+    for r in rows:
+        total += sys.getsizeof(r)
+    return total
+
+
+def persen_baris(rows, sesi):
+    return [sum(1 for h in sesi if r[h] == "1") / len(sesi) * 100.0 for r in rows]
+
+
+def absen_baris(rows, sesi, n):
+    hasil = []
+    for r in rows:
+        run = 0
+        for h in sesi:
+            run = run + 1 if r[h] != "1" else 0
+            if run >= n:
+                hasil.append(r["student_id"])
+                break
+    return hasil
+
+
+def satu_sesi(jumlah, args):
+    with tempfile.TemporaryDirectory() as tmp:
+        att, _ = tulis_csv_sintetis(tmp, args.n, args.seed, minggu=jumlah)
+        h = {"n": args.n, "sesi": jumlah}
+        with att.open(encoding="utf-8", newline="") as f:
+            h["baca_baris_s"], rows = ukur(lambda: list(csv.DictReader(f)))
+        h["baca_bitset_s"], m = ukur(lambda: MatriksPresensi.dari_csv(att))
+    sesi = kolom_sesi(rows[0])
+    h["memori_baris_mb"] = ukuran_baris(rows) / 1e6
+    h["memori_bitset_mb"] = m.ukuran_byte() / 1e6
+
+    h["persen_baris_s"], lama = ukur(lambda: persen_baris(rows, sesi), args.ulang)
+    h["persen_bitset_s"], baru = ukur(m.persen_kolom, args.ulang)
+    if [round(x, 2) for x in lama] != list(baru):
+        raise SystemExit(f"sesi = {jumlah}: persen hadir berbeda")
+
+    h["absen_baris_s"], lama = ukur(lambda: absen_baris(rows, sesi, args.beruntun), args.ulang)
+    h["absen_bitset_s"], baru = ukur(lambda: m.absen_beruntun(args.beruntun), args.ulang)
+    if lama != baru:
+        raise SystemExit(f"sesi = {jumlah}: hasil absen berturut-turut berbeda")
+    h["absen_jumlah"] = len(baru)
+    return h
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--n", type=int, default=50000, help="jumlah mahasiswa")
+    ap.add_argument("--sesi", type=int, nargs="+", default=[5, 16, 48], help="jumlah sesi")
+    ap.add_argument("--beruntun", type=int, default=3, help="N untuk absen N sesi berturut-turut")
+    ap.add_argument("--ulang", type=int, default=3, help="ulangan query (rata-rata)")
+    ap.add_argument("--seed", type=int, default=42)
+    ap.add_argument("--json", help="simpan hasil ke file JSON")
+    args = ap.parse_args()
+
+    print(f"Python {sys.version.split()[0]}, n = {args.n:,}, absen {args.beruntun} sesi berturut-turut")
+    print(f"{'sesi':>5} {'baca s dict/bit':>16} {'memori MB dict/bit':>19} "
+          f"{'persen s dict/bit':>18} {'absen s dict/bit':>17} {'absen':>7}")
+    semua = []
+    for jumlah in args.sesi:
+        h = satu_sesi(jumlah, args)
+        semua.append(h)
+        print(f"{jumlah:>5} {h['baca_baris_s']:>7.3f}/{h['baca_bitset_s']:<8.3f} "
+              f"{h['memori_baris_mb']:>8.1f}/{h['memori_bitset_mb']:<10.1f} "
+              f"{h['persen_baris_s']:>8.4f}/{h['persen_bitset_s']:<9.4f} "
+              f"{h['absen_baris_s']:>8.4f}/{h['absen_bitset_s']:<8.4f} {h['absen_jumlah']:>7,}")
+    if args.json:
+        p = Path(args.json)
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text(json.dumps({"beruntun": args.beruntun, "hasil": semua}, indent=2), encoding="utf-8")
+        print(f"Hasil disimpan ke {p}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Kecepatan render laporan (baris per detik) untuk setiap format: md, html, txt.
+
+Jalankan dari root proyek:
+    python bench/bench_render.py --n 200000
+"""
+import argparse
+import io
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tracker.render import FORMAT, render
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--n", type=int, default=200000, help="jumlah baris")
+    ap.add_argument("--ulang", type=int, default=3, help="jumlah pengulangan (ambil tercepat)")
+    args = ap.parse_args()
+
+    records = [{"student_id": str(230000000 + i), "name": "Mahasiswa " + str(i),
+                "attendance_rate": (i % 6) * 20.0, "final_score": (i * 7919) % 10001 / 100}
+               for i in range(args.n)]
+    print(f"n = {args.n}")
+    print(f"{'format':<8} {'waktu (s)':>10} {'baris/s':>12} {'ukuran (MB)':>12}")
+    for nama in FORMAT:
+        terbaik = None
+        for _ in range(args.ulang):
+            buf = io.StringIO()
+            t0 = time.perf_counter()
+            render(records, buf, nama)
+            dt = time.perf_counter() - t0
+            terbaik = dt if terbaik is None else min(terbaik, dt)
+        print(f"{nama:<8} {terbaik:>10.3f} {args.n / terbaik:>12.0f} {len(buf.getvalue()) / 1e6:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
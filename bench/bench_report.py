@@ -0,0 +1,54 @@
+"""
+Puncak memori dan waktu menulis laporan: build_*_report + save_text (string utuh)
+dibanding simpan_report (streaming per potongan).
+
+Jalankan dari root proyek:
+    python bench/bench_report.py --sizes 10000 100000 1000000
+"""
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tracker.report import build_html_report, build_markdown_report, save_text, simpan_report
+
+
+def records(n):
+    """Generator record sintetis (tidak ditampung di memori)."""
+    for i in range(n):
+        yield {"student_id": str(230000000 + i), "name": "Mahasiswa " + str(i),
+               "attendance_rate": (i % 6) * 20.0, "final_score": (i * 7919) % 10001 / 100}
+
+
+def ukur(fungsi):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    fungsi()
+    dt = time.perf_counter() - t0
+    _, puncak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return dt, puncak
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000])
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        out = Path(tmp)
+        print(f"{'baris':>10} {'format':<8} {'string (MB)':>12} {'stream (MB)':>12} {'string (s)':>11} {'stream (s)':>11}")
+        for n in args.sizes:
+            for fmt, build in (("md", build_markdown_report), ("html", build_html_report)):
+                path = out / ("report." + fmt)
+                t_lama, m_lama = ukur(lambda: save_text(path, build(records(n))))
+                t_baru, m_baru = ukur(lambda: simpan_report(path, records(n)))
+                print(f"{n:>10} {fmt:<8} {m_lama / 1e6:>12.1f} {m_baru / 1e6:>12.1f} {t_lama:>11.2f} {t_baru:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""
+Beban ke layanan HTTP/JSON (python -m tracker serve): throughput dan latensi p50/p99 per endpoint.
+
+Jalankan dari root proyek:
+    python bench/bench_server.py --n 100000 --koneksi 32 --permintaan 20000
+    python bench/bench_server.py --url http://127.0.0.1:8080     # server yang sudah jalan
+
+Tanpa --url, server dijalankan sebagai proses terpisah di atas data sintetis.
+--muat-ulang N mengirim POST /muat-ulang setiap N permintaan (cache jadi dingin lagi).
+"""
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from _data import tulis_csv_sintetis
+
+
+def persentil(xs, p):
+    """Persentil p (0..100) dari list yang sudah urut (nearest-rank)."""
+    if not xs:
+        return 0.0
+    k = max(0, min(len(xs) - 1, int(round(p / 100 * len(xs) + 0.5)) - 1))
+    return xs[k]
+
+
+def campuran(nims):
+    """Daftar (bobot, label endpoint, fungsi pembuat path) yang mirip pola polling portal."""
+    return [
+        (50, "/mahasiswa/<nim>", lambda rnd: "/mahasiswa/" + rnd.choice(nims)),
+        (15, "/rekap?offset&limit", lambda rnd: f"/rekap?offset={rnd.randrange(0, len(nims), 100)}&limit=100"),
+        (10, "/rekap/rentang", lambda rnd: "/rekap/rentang?hi=70&limit=50"),
+        (10, "/rekap/berisiko", lambda rnd: "/rekap/berisiko?limit=50"),
+        (5, "/rekap/predikat/<h>", lambda rnd: "/rekap/predikat/" + rnd.choice("ABCDE") + "?limit=50"),
+        (5, "/rekap/teratas", lambda rnd: "/rekap/teratas?k=10"),
+        (5, "/statistik", lambda rnd: "/statistik"),
+    ]
+
+
+async def kirim(reader, writer, metode, path):
+    """Satu permintaan keep-alive; kembalikan (status, body)."""
+    writer.write(f"{metode} {path} HTTP/1.1\r\nHost: bench\r\nContent-Length: 0\r\n\r\n".encode("latin-1"))
+    await writer.drain()
+    kepala = await reader.readuntil(b"\r\n\r\n")
+    baris = kepala.decode("latin-1").split("\r\n")
+    status = int(baris[0].split(" ")[1])
+    panjang = 0
+    for b in baris[1:]:
+        k, _, v = b.partition(":")
+        if k.lower() == "content-length":
+            panjang = int(v)
+    body = await reader.readexactly(panjang) if panjang else b""
+    return status, body
+
+
+async def beban(host, port, nims, args):
+    mix = campuran(nims)
+    bobot = [m[0] for m in mix]
+    latensi = {label: [] for _, label, _ in mix}
+    gagal = [0]
+    sisa = [args.permintaan]
+    dikirim = [0]
+    muat_ulang = []
+
+    async def pekerja(no):
+        rnd = random.Random(args.seed + no)
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            while sisa[0] > 0:
+                sisa[0] -= 1
+                dikirim[0] += 1
+                if args.muat_ulang and dikirim[0] % args.muat_ulang == 0:
+                    t0 = time.perf_counter()
+                    await kirim(reader, writer, "POST", "/muat-ulang")
+                    muat_ulang.append(time.perf_counter() - t0)
+                    continue
+                _, label, buat = rnd.choices(mix, bobot)[0]
+                t0 = time.perf_counter()
+                status, _ = await kirim(reader, writer, "GET", buat(rnd))
+                latensi[label].append(time.perf_counter() - t0)
+                if status != 200:
+                    gagal[0] += 1
+        finally:
+            writer.close()
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(pekerja(i) for i in range(args.koneksi)))
+    durasi = time.perf_counter() - t0
+
+    reader, writer = await asyncio.open_connection(host, port)
+    _, body = await kirim(reader, writer, "GET", "/versi")
+    writer.close()
+    return latensi, durasi, gagal[0], muat_ulang, json.loads(body)
+
+
+def jalankan_server(tmp, n):
+    """Tulis data sintetis, jalankan `python -m tracker serve --port 0`, kembalikan (proses, host, port)."""
+    tulis_csv_sintetis(tmp, n)
+    proses = subprocess.Popen(
+        [sys.executable, "-m", "tracker", "--data", tmp, "serve", "--port", "0", "--pantau", "0"],
+        cwd=ROOT, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+    )
+    baris = proses.stdout.readline()
+    if not baris.startswith("Melayani di http://"):
+        proses.kill()
+        raise RuntimeError("server gagal start: " + baris)
+    url = urlsplit(baris.split()[-1])
+    return proses, url.hostname, url.port
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--n", type=int, default=100000, help="jumlah mahasiswa (data sintetis)")
+    ap.add_argument("--url", help="pakai server yang sudah jalan, misal http://127.0.0.1:8080")
+    ap.add_argument("--koneksi", type=int, default=32, help="jumlah koneksi keep-alive bersamaan")
+    ap.add_argument("--permintaan", type=int, default=20000, help="total permintaan")
+    ap.add_argument("--muat-ulang", type=int, default=0, help="POST /muat-ulang setiap N permintaan (0 = tidak)")
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--json", help="simpan hasil ke file JSON")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        proses = None
+        if args.url:
+            url = urlsplit(args.url)
+            host, port = url.hostname, url.port or 80
+        else:
+            t0 = time.perf_counter()
+            proses, host, port = jalankan_server(tmp, args.n)
+            print(f"server siap dalam {time.perf_counter() - t0:.2f} s (n = {args.n})")
+        try:
+            # daftar NIM diambil dari server sendiri supaya --url juga bisa dipakai
+            async def ambil_nim():
+                reader, writer = await asyncio.open_connection(host, port)
+                _, body = await kirim(reader, writer, "GET", "/rekap?limit=1000000000")
+                writer.close()
+                return [r["nim"] for r in json.loads(body)["data"]]
+            nims = asyncio.run(ambil_nim())
+            latensi, durasi, gagal, muat_ulang, versi = asyncio.run(beban(host, port, nims, args))
+        finally:
+            if proses is not None:
+                proses.terminate()
+                proses.wait()
+
+    semua = sorted(x for xs in latensi.values() for x in xs)
+    print(f"{len(semua)} permintaan, {args.koneksi} koneksi, {durasi:.2f} s -> {len(semua) / durasi:,.0f} req/s"
+          f", non-200: {gagal}")
+    print(f"cache: {versi['cache']['hit']} hit, {versi['cache']['miss']} miss")
+    print(f"{'endpoint':<22} {'jumlah':>7} {'p50 (ms)':>9} {'p90 (ms)':>9} {'p99 (ms)':>9} {'maks (ms)':>10}")
+    hasil = {}
+    for label, xs in list(latensi.items()) + [("semua", semua)]:
+        xs = sorted(xs)
+        if not xs:
+            continue
+        r = {"jumlah": len(xs), "p50_ms": persentil(xs, 50) * 1000, "p90_ms": persentil(xs, 90) * 1000,
+             "p99_ms": persentil(xs, 99) * 1000, "maks_ms": xs[-1] * 1000}
+        hasil[label] = r
+        print(f"{label:<22} {r['jumlah']:>7} {r['p50_ms']:>9.2f} {r['p90_ms']:>9.2f} {r['p99_ms']:>9.2f} {r['maks_ms']:>10.2f}")
+    if muat_ulang:
+        print(f"muat ulang: {len(muat_ulang)} kali, median {sorted(muat_ulang)[len(muat_ulang) // 2] * 1000:.1f} ms")
+    if args.json:
+        p = Path(args.json)
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text(json.dumps({"n": args.n, "koneksi": args.koneksi, "durasi_s": durasi,
+                                 "req_per_s": len(semua) / durasi, "non_200": gagal,
+                                 "cache": versi["cache"], "endpoint": hasil}, indent=2), encoding="utf-8")
+        print(f"Hasil disimpan ke {p}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""
+Benchmark skala: setiap tahap alur app.py diukur terpisah untuk 1 ribu s.d. 10 juta mahasiswa.
+
+Jalankan dari root proyek:
+    python bench/bench_skala.py
+    python bench/bench_skala.py --n 1000 10000 100000 1000000 --json out/bench_skala.json
+    python bench/bench_skala.py --n 10000000 --tahap bootstrap_from_csv rekap --kolom
+    python bench/bench_skala.py --json out/baru.json --banding out/lama.json
+
+Data dibuat oleh _data.tulis_csv_sintetis (deterministik dari --seed) dengan --kotor
+bagian baris yang rusak (sel kosong / bukan angka, baris tanpa NIM, NIM asing).
+Setiap tahap dijalankan di proses anak sendiri, jadi puncak RSS (ru_maxrss) milik
+tahap itu beserta persiapannya, tidak tercampur tahap lain:
+
+    read_csv             app.read_csv attendance.csv + grades.csv (list of dict)
+    bootstrap_from_csv   app.bootstrap_from_csv ke rekap kosong
+    rekap                rekap.rekap() (nilai akhir dihitung di persiapan)
+    export_for_report    rekap.export_for_report()
+    build_markdown_report / build_html_report   dari hasil export_for_report
+    update_grades_csv    --ubah kali app.update_grades_csv untuk NIM acak (indeks dibangun di persiapan)
+
+Hasil JSON berisi detik, baris/detik, dan RSS (MB) per tahap; --banding mencetak
+rasio waktu terhadap file JSON lama untuk melihat regresi antar run.
+"""
+import argparse
+import json
+import platform
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from _data import tulis_csv_sintetis
+
+TAHAP = ("read_csv", "bootstrap_from_csv", "rekap", "export_for_report",
+         "build_markdown_report", "build_html_report", "update_grades_csv")
+
+
+def rss_mb():
+    """Puncak RSS proses ini sejauh ini (ru_maxrss: KB di Linux, byte di macOS)."""
+    maks = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maks / (1 << 20) if sys.platform == "darwin" else maks / 1024
+
+
+# ---------- proses anak: satu tahap ----------
+def _bootstrap(app, folder, kolom):
+    from tracker import RekapKelasKolom
+    rekap = RekapKelasKolom() if kolom else app.RekapKelas()
+    app.bootstrap_from_csv(rekap, folder / "attendance.csv", folder / "grades.csv")
+    return rekap
+
+
+def siapkan(tahap, folder, args):
+    """Persiapan (tidak diukur); kembalikan (fungsi yang diukur, jumlah item)."""
+    import app
+    if tahap == "read_csv":
+        def jalan():
+            return app.read_csv(folder / "attendance.csv"), app.read_csv(folder / "grades.csv")
+        return jalan, args.n
+    if tahap == "bootstrap_from_csv":
+        return lambda: _bootstrap(app, folder, args.kolom), args.n
+    rekap = _bootstrap(app, folder, args.kolom)
+    if len(rekap):
+        # nilai akhir dihitung sekarang supaya tahap berikut tidak ikut membayar skor
+        rekap.nilai_akhir(next(iter(rekap.iter_komponen()))[0])
+    if tahap == "rekap":
+        return rekap.rekap, len(rekap)
+    if tahap == "export_for_report":
+        return rekap.export_for_report, len(rekap)
+    if tahap in ("build_markdown_report", "build_html_report"):
+        from tracker import report
+        records = rekap.export_for_report()
+        build = getattr(report, tahap)
+        return lambda: build(records, rekap.skema), len(records)
+    if tahap == "update_grades_csv":
+        app.DATA_DIR = folder
+        rnd = random.Random(args.seed)
+        nims = [nim for nim, *_ in rekap.iter_komponen()]
+        del rekap
+        # panggilan pertama membangun indeks NIM -> offset (sekali per file)
+        app.update_grades_csv(nims[0], quiz=1)
+
+        def jalan():
+            for _ in range(args.ubah):
+                app.update_grades_csv(rnd.choice(nims), quiz=rnd.randint(0, 100), final=rnd.randint(0, 100))
+        return jalan, args.ubah
+    raise ValueError("tahap tidak dikenal: " + tahap)
+
+
+def anak(args):
+    folder = Path(args.folder)
+    fungsi, n = siapkan(args.anak, folder, args)
+    rss_awal = rss_mb()
+    t0 = time.perf_counter()
+    fungsi()
+    detik = time.perf_counter() - t0
+    print(json.dumps({
+        "detik": detik,
+        "item": n,
+        "item_per_detik": n / detik if detik > 0 else None,
+        "rss_awal_mb": round(rss_awal, 1),
+        "rss_puncak_mb": round(rss_mb(), 1),
+    }))
+
+
+# ---------- proses induk ----------
+def jalankan_tahap(tahap, folder, n, args):
+    cmd = [sys.executable, __file__, "--anak", tahap, "--folder", str(folder), "--n", str(n),
+           "--ubah", str(args.ubah), "--seed", str(args.seed)]
+    if args.kolom:
+        cmd.append("--kolom")
+    # cwd = root proyek supaya `import app` dan paket tracker ditemukan
+    hasil = subprocess.run(cmd, cwd=Path(__file__).resolve().parent.parent, capture_output=True, text=True)
+    if hasil.returncode != 0:
+        raise SystemExit(f"tahap {tahap} (n = {n}) gagal:\n{hasil.stderr[-2000:]}")
+    return json.loads(hasil.stdout.strip().splitlines()[-1])
+
+
+def satu_n(n, args):
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = Path(tmp)
+        t0 = time.perf_counter()
+        att, grd = tulis_csv_sintetis(folder, n, args.seed, kotor=args.kotor)
+        h = {"n": n, "buat_data_s": time.perf_counter() - t0,
+             "ukuran_csv_mb": (att.stat().st_size + grd.stat().st_size) / 1e6, "tahap": {}}
+        # update_grades_csv mengubah file, jadi selalu dijalankan terakhir
+        for tahap in sorted(args.tahap, key=TAHAP.index):
+            h["tahap"][tahap] = jalankan_tahap(tahap, folder, n, args)
+    return h
+
+
+def cetak_banding(semua, path):
+    lama = {h["n"]: h for h in json.loads(Path(path).read_text(encoding="utf-8"))["hasil"]}
+    print(f"\nBanding dengan {path} (waktu baru / lama, > 1 = lebih lambat):")
+    for h in semua:
+        dulu = lama.get(h["n"])
+        if dulu is None:
+            continue
+        for tahap, t in h["tahap"].items():
+            d = dulu["tahap"].get(tahap)
+            if d and d["detik"] > 0:
+                print(f"  n = {h['n']:>10,} {tahap:<22} {t['detik'] / d['detik']:>6.2f}x  "
+                      f"RSS {t['rss_puncak_mb']:.0f} / {d['rss_puncak_mb']:.0f} MB")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--n", type=int, nargs="+", default=[1000, 10000, 100000], help="jumlah mahasiswa")
+    ap.add_argument("--tahap", nargs="+", choices=TAHAP, default=list(TAHAP), help="tahap yang diukur")
+    ap.add_argument("--kotor", type=float, default=0.01, help="bagian baris yang rusak (default 0.01)")
+    ap.add_argument("--ubah", type=int, default=1000, help="jumlah update_grades_csv (default 1000)")
+    ap.add_argument("--kolom", action="store_true", help="pakai RekapKelasKolom (default RekapKelas)")
+    ap.add_argument("--seed", type=int, default=42)
+    ap.add_argument("--json", help="simpan hasil ke file JSON")
+    ap.add_argument("--banding", help="file JSON hasil run sebelumnya untuk dibandingkan")
+    # dipakai proses induk saat memanggil dirinya sendiri
+    ap.add_argument("--anak", help=argparse.SUPPRESS)
+    ap.add_argument("--folder", help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    if args.anak:
+        args.n = args.n[0]
+        anak(args)
+        return
+
+    rekap_cls = "RekapKelasKolom" if args.kolom else "RekapKelas"
+    print(f"Python {sys.version.split()[0]}, {rekap_cls}, kotor {args.kotor:.1%}, seed {args.seed}")
+    print(f"{'n':>10} {'tahap':<22} {'detik':>9} {'baris/s':>12} {'RSS MB':>9}")
+    semua = []
+    for n in args.n:
+        h = satu_n(n, args)
+        semua.append(h)
+        for tahap, t in h["tahap"].items():
+            laju = f"{t['item_per_detik']:>12,.0f}" if t["item_per_detik"] else f"{'-':>12}"
+            print(f"{n:>10,} {tahap:<22} {t['detik']:>9.3f} {laju} {t['rss_puncak_mb']:>9.1f}")
+    if args.json:
+        p = Path(args.json)
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text(json.dumps({
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "rekap": rekap_cls,
+            "kotor": args.kotor,
+            "seed": args.seed,
+            "ubah": args.ubah,
+            "hasil": semua,
+        }, indent=2), encoding="utf-8")
+        print(f"Hasil disimpan ke {p}")
+    if args.banding:
+        cetak_banding(semua, args.banding)
+
+
+if __name__ == "__main__":
+    main()
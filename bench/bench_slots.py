@@ -0,0 +1,98 @@
+"""
+Mahasiswa/Penilaian ber-__slots__: memori per objek dan konstruktor tervalidasi vs lewat setter.
+
+Jalankan dari root proyek:
+    python bench/bench_slots.py
+    python bench/bench_slots.py --n 500000
+
+Yang diukur untuk n objek: membuat Mahasiswa + Penilaian lewat konstruktor biasa
+(setiap nilai lewat setter + validasi) vs banyak_dari_kolom (tanpa setter), memori
+per pasangan objek (tracemalloc), dan memuat RekapKelas dari snapshot biner lewat
+API biasa (SnapshotBiner.isi_rekap) vs RekapKelas.dari_kolom (SnapshotBiner.ke_rekap).
+"""
+import argparse
+import gc
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tracker import Mahasiswa, Penilaian, RekapKelas, RekapKelasKolom
+from tracker import snapshot_biner
+
+
+def kolom_sintetis(n, seed):
+    rnd = random.Random(seed)
+    nim = [str(230000000 + i) for i in range(n)]
+    nama = ["Mahasiswa " + str(i) for i in range(n)]
+    hadir = [float(rnd.choice((0, 20, 40, 60, 80, 100))) for _ in range(n)]
+    nilai = [[round(rnd.uniform(0, 100), 2) for _ in range(n)] for _ in range(4)]
+    return nim, nama, hadir, nilai
+
+
+def lewat_setter(nim, nama, hadir, nilai):
+    mhs = []
+    for n_, nm, h in zip(nim, nama, hadir):
+        m = Mahasiswa(n_, nm)
+        m.hadir_persen = h
+        mhs.append(m)
+    return mhs, [Penilaian(q, t, u, a) for q, t, u, a in zip(*nilai)]
+
+
+def tervalidasi(nim, nama, hadir, nilai):
+    return Mahasiswa.banyak_dari_kolom(nim, nama, hadir), Penilaian.banyak_dari_kolom(*nilai)
+
+
+def ukur(fungsi, *args):
+    gc.collect()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    hasil = fungsi(*args)
+    detik = time.perf_counter() - t0
+    terpakai, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return detik, terpakai, hasil
+
+
+def waktu(fungsi):
+    t0 = time.perf_counter()
+    fungsi()
+    return time.perf_counter() - t0
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--n", type=int, default=200000, help="jumlah mahasiswa")
+    ap.add_argument("--seed", type=int, default=42)
+    args = ap.parse_args()
+
+    nim, nama, hadir, nilai = kolom_sintetis(args.n, args.seed)
+    print(f"Python {sys.version.split()[0]}, n = {args.n:,}")
+    print(f"{'cara':<22} {'detik':>8} {'byte/pasang':>12}  (waktu tanpa tracemalloc)")
+    for label, fungsi in (("setter + validasi", lewat_setter), ("banyak_dari_kolom", tervalidasi)):
+        _, terpakai, hasil = ukur(fungsi, nim, nama, hadir, nilai)
+        # list hasil + string NIM/nama ikut terhitung di kedua cara, jadi selisihnya = objek
+        del hasil
+        detik = min(waktu(lambda: fungsi(nim, nama, hadir, nilai)) for _ in range(3))
+        print(f"{label:<22} {detik:>8.3f} {terpakai / args.n:>12.0f}")
+    print(f"sys.getsizeof: Mahasiswa {sys.getsizeof(Mahasiswa('1', 'a'))} B, "
+          f"Penilaian {sys.getsizeof(Penilaian())} B (tanpa __dict__)")
+
+    rekap = RekapKelasKolom.dari_kolom(nim, nama, hadir, *nilai)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "rekap.snap"
+        snapshot_biner.simpan(rekap, path)
+        with snapshot_biner.SnapshotBiner(path) as snap:
+            lama = min(waktu(lambda: snap.isi_rekap(RekapKelas())) for _ in range(3))
+            baru = min(waktu(lambda: snap.ke_rekap(RekapKelas)) for _ in range(3))
+            if snap.isi_rekap(RekapKelas()).rekap() != snap.ke_rekap(RekapKelas).rekap():
+                raise SystemExit("isi rekap dari snapshot berbeda")
+    print(f"snapshot -> RekapKelas: isi_rekap {lama:.3f} s, dari_kolom {baru:.3f} s ({lama / baru:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Waktu start: bootstrap dari CSV dibanding snapshot biner (mmap).
+
+Jalankan dari root proyek:
+    python bench/bench_snapshot.py --n 1000000
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from _data import tulis_csv_sintetis
+from tracker import RekapKelasKolom
+from tracker.ingest import bootstrap
+from tracker.snapshot_biner import SnapshotBiner, simpan
+
+
+def waktu(fungsi):
+    t0 = time.perf_counter()
+    hasil = fungsi()
+    return hasil, time.perf_counter() - t0
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--n", type=int, default=1000000, help="jumlah mahasiswa")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        att_path, grd_path = tulis_csv_sintetis(tmp, args.n)
+        snap_path = Path(tmp) / "rekap.snap"
+
+        rekap = RekapKelasKolom()
+        _, t_csv = waktu(lambda: bootstrap(rekap, att_path, grd_path))
+        _, t_simpan = waktu(lambda: simpan(rekap, snap_path, (att_path, grd_path)))
+        snap, t_buka = waktu(lambda: SnapshotBiner(snap_path))
+        _, t_cocok = waktu(lambda: snap.cocok((att_path, grd_path)))
+        _, t_cari = waktu(lambda: snap.cari(str(230000000 + args.n // 2)))
+        dimuat, t_rekap = waktu(snap.ke_rekap)
+        snap.tutup()
+        # nilai akhir dari snapshot dipakai apa adanya; tanpa skor tersimpan ini menghitung ulang semua
+        _, t_pertama = waktu(dimuat.rekap)
+
+        print(f"n = {args.n}, snapshot {snap_path.stat().st_size / 1e6:.1f} MB")
+        print(f"{'bootstrap CSV':<24} {t_csv:>10.3f} s")
+        print(f"{'tulis snapshot':<24} {t_simpan:>10.3f} s")
+        print(f"{'buka snapshot (mmap)':<24} {t_buka * 1000:>10.3f} ms")
+        print(f"{'cek sidik sumber':<24} {t_cocok * 1000:>10.3f} ms")
+        print(f"{'cari 1 NIM':<24} {t_cari * 1000:>10.3f} ms")
+        print(f"{'snapshot -> rekap':<24} {t_rekap:>10.3f} s")
+        print(f"{'rekap() pertama':<24} {t_pertama:>10.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Waktu start program: total waktu impor (python -X importtime) dan waktu dinding per skenario.
+
+Jalankan dari root proyek:
+    python bench/bench_startup.py --ulang 10 --json out/startup.json
+
+Hasil --json bisa disimpan per rilis untuk membandingkan waktu start dari waktu ke waktu.
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# nama skenario -> argumen python (dijalankan dengan cwd = folder sementara berisi salinan data/)
+SKENARIO = {
+    "import tracker": ["-c", "import tracker"],
+    "from tracker import RekapKelas": ["-c", "from tracker import RekapKelas"],
+    "import app": ["-c", "import app"],
+    "python -m tracker --help": ["-m", "tracker", "--help"],
+    "python -m tracker stats": ["-m", "tracker", "stats"],
+    "python -m tracker report": ["-m", "tracker", "report"],
+}
+
+
+def parse_importtime(stderr):
+    """
+    Ubah keluaran -X importtime jadi list (modul, self_us, kumulatif_us, kedalaman).
+    Baris formatnya: 'import time:  self | cumulative | <spasi kedalaman>nama'.
+    """
+    out = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        bagian = line[len("import time:"):].split("|", 2)
+        if len(bagian) != 3 or not bagian[0].strip().isdigit():
+            continue  # baris judul
+        self_us, kum, nama = bagian
+        kedalaman = (len(nama) - len(nama.lstrip()) - 1) // 2
+        out.append((nama.strip(), int(self_us), int(kum), kedalaman))
+    return out
+
+
+def jalankan(args, cwd, env):
+    """Jalankan satu kali; kembalikan (detik dinding, list importtime)."""
+    t0 = time.perf_counter()
+    hasil = subprocess.run([sys.executable, "-X", "importtime", *args], cwd=cwd, env=env,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    detik = time.perf_counter() - t0
+    if hasil.returncode != 0:
+        raise RuntimeError(f"{' '.join(args)} gagal:\n{hasil.stderr[-2000:]}")
+    return detik, parse_importtime(hasil.stderr)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--ulang", type=int, default=10, help="jumlah pengulangan per skenario (diambil median)")
+    ap.add_argument("--top", type=int, default=5, help="jumlah modul proyek terberat yang ditampilkan")
+    ap.add_argument("--json", help="simpan hasil ke file JSON")
+    args = ap.parse_args()
+
+    env = dict(os.environ)
+    env["PYTHONPATH"] = str(ROOT) + os.pathsep + env.get("PYTHONPATH", "")
+    hasil = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        shutil.copytree(ROOT / "data", Path(tmp) / "data",
+                        ignore=shutil.ignore_patterns("*.snap", "*.idx", "*.log", "*.tmp", "jurnal"))
+        # satu kali pemanasan (membuat snapshot dan .pyc) supaya semua skenario diukur dalam keadaan sama
+        for argv in SKENARIO.values():
+            jalankan(argv, tmp, env)
+        for nama, argv in SKENARIO.items():
+            dinding, impor, modul = [], [], []
+            for _ in range(args.ulang):
+                detik, rows = jalankan(argv, tmp, env)
+                dinding.append(detik)
+                impor.append(sum(r[1] for r in rows))
+                modul = rows
+            proyek = sorted((r for r in modul if r[0] == "app" or r[0].split(".")[0] == "tracker"),
+                            key=lambda r: -r[2])
+            hasil[nama] = {
+                "dinding_ms": statistics.median(dinding) * 1000,
+                "impor_ms": statistics.median(impor) / 1000,
+                "jumlah_modul": len(modul),
+                "modul_proyek": [r[0] for r in proyek],
+                "terberat": [(r[0], r[2] / 1000) for r in proyek[:args.top]],
+            }
+
+    print(f"python {sys.version.split()[0]}, median dari {args.ulang} kali")
+    print(f"{'skenario':<34} {'dinding (ms)':>13} {'impor (ms)':>11} {'modul':>6}")
+    for nama, h in hasil.items():
+        print(f"{nama:<34} {h['dinding_ms']:>13.1f} {h['impor_ms']:>11.1f} {h['jumlah_modul']:>6}")
+    for nama, h in hasil.items():
+        if h["terberat"]:
+            teks = ", ".join(f"{m} {ms:.1f}" for m, ms in h["terberat"])
+            print(f"  {nama}: {teks}")
+    if args.json:
+        p = Path(args.json)
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text(json.dumps({"python": sys.version.split()[0], "ulang": args.ulang, "skenario": hasil},
+                                indent=2), encoding="utf-8")
+        print(f"Hasil disimpan ke {p}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Tabel per halaman (tracker.tabel): waktu sampai halaman pertama tampil vs render seluruh tabel.
+
+Jalankan dari root proyek:
+    python bench/bench_tabel.py
+    python bench/bench_tabel.py --n 1000000 --per-halaman 50
+
+Baris rekap sintetis (dict seperti rekap.rekap()) dirender ke io.StringIO dengan:
+tabel lama (lebar dihitung dari semua baris, semua baris dicetak), halaman pertama,
+seluruh halaman berurutan (mode tanpa terminal), urut Akhir turun + halaman pertama,
+dan cari teks + halaman pertama. Puncak memori tambahan diukur dengan tracemalloc.
+"""
+import argparse
+import io
+import random
+import sys
+import time
+import tracemalloc
+from operator import itemgetter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tracker.tabel import Kolom, TabelHalaman, angka, tampilkan
+
+
+def baris_sintetis(n, seed):
+    rnd = random.Random(seed)
+    return [{"nim": str(230000000 + i), "nama": "Mahasiswa " + str(i),
+             "hadir": float(rnd.choice((0, 20, 40, 60, 80, 100))),
+             "akhir": round(rnd.uniform(0, 100), 2), "predikat": rnd.choice("ABCDE")}
+            for i in range(n)]
+
+
+def kolom_rekap():
+    return [Kolom("NIM", itemgetter("nim"), min_lebar=10),
+            Kolom("Nama", itemgetter("nama"), min_lebar=10),
+            Kolom("Hadir%", itemgetter("hadir"), angka, kanan=True),
+            Kolom("Akhir", itemgetter("akhir"), angka, kanan=True),
+            Kolom("Pred", itemgetter("predikat"))]
+
+
+def tabel_lama(rows, out):
+    """show_summary_rows sebelum tracker.tabel: lebar dari semua baris, semua baris dicetak."""
+    lebar_nama = max(10, max(len(str(r["nama"])) for r in rows))
+    print("\nNIM        | {:<{w}} | Hadir% | Akhir | Pred".format("Nama", w=lebar_nama), file=out)
+    print("-" * (12 + lebar_nama + 24), file=out)
+    for r in rows:
+        print("{:<10} | {:<{w}} | {:>6.2f} | {:>6.2f} | {:<3}".format(
+            r["nim"], r["nama"], float(r["hadir"]), float(r["akhir"]), r["predikat"], w=lebar_nama), file=out)
+
+
+def halaman_pertama(rows, per, out):
+    tabel = TabelHalaman(rows, kolom_rekap(), per_halaman=per)
+    out.write("\n".join(tabel.teks_halaman(0)))
+
+
+def semua_halaman(rows, per, out):
+    tampilkan(TabelHalaman(rows, kolom_rekap(), per_halaman=per),
+              keluar=lambda s: print(s, file=out), interaktif=False)
+
+
+def urut_halaman_pertama(rows, per, out):
+    tabel = TabelHalaman(rows, kolom_rekap(), per_halaman=per)
+    tabel.urutkan(itemgetter("akhir"), turun=True)
+    out.write("\n".join(tabel.teks_halaman(0)))
+
+
+def cari_halaman_pertama(rows, per, out):
+    tabel = TabelHalaman(rows, kolom_rekap(), per_halaman=per)
+    # teks yang jarang: halaman pertama baru penuh setelah memindai hampir seluruh data
+    tabel.cari("mahasiswa " + str(len(rows) // 10 - 1))
+    out.write("\n".join(tabel.teks_halaman(0)))
+
+
+def ukur(fungsi, rows, per, ulang):
+    detik = []
+    for _ in range(ulang):
+        t0 = time.perf_counter()
+        fungsi(rows, per, io.StringIO())
+        detik.append(time.perf_counter() - t0)
+    tracemalloc.start()
+    fungsi(rows, per, io.StringIO())
+    _, puncak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return min(detik), puncak
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--n", type=int, default=200000, help="jumlah baris rekap")
+    ap.add_argument("--per-halaman", type=int, default=20, help="baris per halaman")
+    ap.add_argument("--ulang", type=int, default=3, help="putaran per cara (diambil yang tercepat)")
+    ap.add_argument("--seed", type=int, default=42)
+    args = ap.parse_args()
+
+    rows = baris_sintetis(args.n, args.seed)
+    print(f"Python {sys.version.split()[0]}, n = {args.n:,}, {args.per_halaman} baris per halaman")
+    print(f"{'cara':<26} {'detik':>9} {'puncak MB':>10}")
+    for label, fungsi in (("tabel lama (semua baris)", lambda r, p, o: tabel_lama(r, o)),
+                          ("halaman pertama", halaman_pertama),
+                          ("semua halaman", semua_halaman),
+                          ("urut Akhir + halaman 1", urut_halaman_pertama),
+                          ("cari teks + halaman 1", cari_halaman_pertama)):
+        detik, puncak = ukur(fungsi, rows, args.per_halaman, args.ulang)
+        print(f"{label:<26} {detik:>9.4f} {puncak / 1e6:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
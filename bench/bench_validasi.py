@@ -0,0 +1,89 @@
+"""
+Validasi impor per kolom (tracker.validasi): biaya di atas parse CSV, data bersih vs kotor.
+
+Jalankan dari root proyek:
+    python bench/bench_validasi.py
+    python bench/bench_validasi.py --n 1000000 --kotor 0 0.01 0.1
+
+Untuk setiap --kotor diukur: parse attendance.csv + grades.csv saja (skema_csv.baca_blok),
+parse + ValidasiImpor (validasi_csv), isi RekapKelasKolom per baris (muat_attendance +
+muat_grades, setter per nilai) dan bootstrap per kolom (kolom tervalidasi -> isi_kolom).
+Selisih dua baris pertama = biaya validasi; tabel ringkas galat ikut dicetak.
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from _data import tulis_csv_sintetis
+
+from tracker import RekapKelasKolom
+from tracker.ingest import bootstrap, muat_attendance, muat_grades
+from tracker.presensi import kolom_sesi
+from tracker.skema_csv import ATT_HEADERS, GRD_HEADERS, LaporanGalat, baca_blok
+from tracker.validasi import ValidasiImpor, validasi_csv
+
+
+def parse_saja(att, grd):
+    n = 0
+    for blok in baca_blok(att, ATT_HEADERS, LaporanGalat(), tambahan=kolom_sesi):
+        n += len(blok)
+    for blok in baca_blok(grd, GRD_HEADERS, LaporanGalat()):
+        n += len(blok)
+    return n
+
+
+def per_baris(att, grd):
+    rekap = RekapKelasKolom()
+    validasi = ValidasiImpor()
+    muat_attendance(rekap, att, hanya_baru=True, validasi=validasi)
+    muat_grades(rekap, grd, tambah_baru=False, validasi=validasi)
+
+
+def per_kolom(att, grd):
+    bootstrap(RekapKelasKolom(), att, grd, LaporanGalat())
+
+
+def terbaik(fungsi, ulang):
+    hasil = []
+    for _ in range(ulang):
+        t0 = time.perf_counter()
+        fungsi()
+        hasil.append(time.perf_counter() - t0)
+    return min(hasil)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--n", type=int, default=200000, help="jumlah mahasiswa")
+    ap.add_argument("--kotor", type=float, nargs="+", default=[0.0, 0.01], help="bagian baris yang rusak")
+    ap.add_argument("--ulang", type=int, default=3, help="putaran per cara (diambil yang tercepat)")
+    ap.add_argument("--seed", type=int, default=42)
+    args = ap.parse_args()
+
+    print(f"Python {sys.version.split()[0]}, n = {args.n:,}, terbaik dari {args.ulang} putaran")
+    print(f"{'kotor':>6} {'cara':<20} {'detik':>8} {'baris/s':>12} {'galat':>8}")
+    for kotor in args.kotor:
+        with tempfile.TemporaryDirectory() as tmp:
+            att, grd = tulis_csv_sintetis(tmp, args.n, args.seed, kotor=kotor)
+            parse = terbaik(lambda: parse_saja(att, grd), args.ulang)
+            validasi = terbaik(lambda: validasi_csv(att, grd), args.ulang)
+            baris_demi_baris = terbaik(lambda: per_baris(att, grd), args.ulang)
+            kolom = terbaik(lambda: per_kolom(att, grd), args.ulang)
+            laporan, n_att, n_grd = validasi_csv(att, grd)
+        baris = n_att + n_grd
+        for label, detik, galat in (("parse", parse, ""), ("parse + validasi", validasi, len(laporan)),
+                                    ("isi per baris", baris_demi_baris, len(laporan)),
+                                    ("bootstrap per kolom", kolom, len(laporan))):
+            print(f"{kotor:>6.1%} {label:<20} {detik:>8.3f} {baris / detik:>12,.0f} {galat:>8}")
+        print(f"       biaya validasi {(validasi / parse - 1) * 100:+.1f}% di atas parse")
+        if len(laporan):
+            print(laporan.tabel(contoh=3))
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+# Nama lama di modul app (sebelum dipindah ke tracker) masih bisa diimpor
+
+import pytest
+
+import app
+from tracker import ingest, report, skema_csv
+
+
+@pytest.mark.parametrize("nama, modul", [
+    ("ATT_HEADERS", skema_csv),
+    ("GRD_HEADERS", skema_csv),
+    ("calculate_attendance_percent_from_row", ingest),
+    ("build_markdown_report", report),
+])
+def test_nama_lama_tetap_ada(nama, modul):
+    assert getattr(app, nama) is getattr(modul, nama)
+
+
+def test_persen_hadir_dari_app():
+    assert app.calculate_attendance_percent_from_row({"week1": "1", "week2": "0"}) == 50.0
+
+
+def test_nama_tidak_dikenal():
+    with pytest.raises(AttributeError):
+        app.tidak_ada
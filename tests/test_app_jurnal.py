@@ -0,0 +1,47 @@
+# Menu interaktif dengan jurnal (env TRACKER_JURNAL): perubahan dicatat dan diputar ulang saat start
+
+import shutil
+
+import pytest
+
+import app
+
+
+@pytest.fixture
+def folder(tmp_path, monkeypatch):
+    data = tmp_path / "data"
+    data.mkdir()
+    (data / "attendance.csv").write_text("student_id,name,week1,week2\n1,Ani,1,1\n", encoding="utf-8")
+    (data / "grades.csv").write_text("student_id,name,quiz,assignment,mid,final\n1,Ani,80,70,60,90\n",
+                                     encoding="utf-8")
+    monkeypatch.setattr(app, "DATA_DIR", data)
+    monkeypatch.setattr(app, "OUT_DIR", tmp_path / "out")
+    monkeypatch.setattr(app, "SKEMA_PATH", data / "skema_penilaian.json")
+    monkeypatch.setattr(app, "_PENYIMPANAN", {})
+    monkeypatch.setenv("TRACKER_JURNAL", str(tmp_path / "jurnal"))
+    monkeypatch.delenv("TRACKER_PENYIMPANAN", raising=False)
+    return tmp_path
+
+
+def _menu(monkeypatch, *masukan):
+    it = iter(masukan)
+    monkeypatch.setattr("builtins.input", lambda _="": next(it))
+    # tabel tidak bertanya per halaman
+    monkeypatch.setattr("sys.stdin.isatty", lambda: False, raising=False)
+    app.main()
+
+
+def test_perubahan_menu_masuk_jurnal(folder, monkeypatch, capsys):
+    # 2) tambah mahasiswa, 4) ubah nilai: keduanya tercatat di jurnal
+    _menu(monkeypatch, "2", "2", "Budi", "4", "2", "50", "", "", "", "7")
+    assert list((folder / "jurnal").glob("jurnal-*.log"))
+    # CSV dan snapshot dihapus: data hanya bisa kembali lewat jurnal
+    shutil.rmtree(folder / "data")
+    (folder / "data").mkdir()
+    monkeypatch.setattr(app, "_PENYIMPANAN", {})
+    capsys.readouterr()
+    # 5) lihat rekap: Budi (ditambah lewat menu) ada lagi
+    _menu(monkeypatch, "5", "1", "7")
+    out = capsys.readouterr().out
+    assert "Data dipulihkan dari jurnal" in out
+    assert "Budi" in out and "Ani" in out
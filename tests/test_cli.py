@@ -0,0 +1,81 @@
+# Mode batch `python -m tracker <perintah>`: kode keluar, dry run, dan galat tanpa traceback
+
+import json
+
+import pytest
+
+from tracker.cli import main
+
+ATT = "student_id,name,week1,week2\n1,Ani,1,1\n2,Budi,1,0\n"
+GRD = "student_id,name,quiz,assignment,mid,final\n1,Ani,80,70,60,90\n2,Budi,50,50,50,50\n"
+
+
+@pytest.fixture
+def data(tmp_path):
+    d = tmp_path / "data"
+    d.mkdir()
+    (d / "attendance.csv").write_text(ATT, encoding="utf-8")
+    (d / "grades.csv").write_text(GRD, encoding="utf-8")
+    return d
+
+
+def _cli(data, *argv):
+    return main(["--data", str(data), "--out", str(data.parent / "out"), *argv])
+
+
+@pytest.mark.parametrize("lebar", ["0", "-5", "nan"])
+def test_stats_lebar_tidak_valid(data, capsys, lebar):
+    assert _cli(data, "stats", "--lebar", lebar) == 2
+    assert "--lebar harus > 0" in capsys.readouterr().err
+
+
+def test_stats_json(data, capsys):
+    assert _cli(data, "stats", "--json", "--lebar", "50") == 0
+    hasil = json.loads(capsys.readouterr().out)
+    assert hasil["akhir"]["n"] == hasil["hadir"]["n"] == 2
+    assert hasil["hadir"]["min"] == 50.0 and hasil["hadir"]["max"] == 100.0
+    assert sum(c for _, _, c in hasil["histogram_akhir"]) == 2
+
+
+def test_update_grades_dry_run_tidak_menulis(data, capsys):
+    delta = data.parent / "delta.csv"
+    delta.write_text("student_id,quiz\n1,100\n", encoding="utf-8")
+    lama = (data / "grades.csv").read_bytes()
+    assert _cli(data, "update-grades", "--from", str(delta), "--dry-run") == 0
+    assert "1 NIM akan diubah" in capsys.readouterr().out
+    assert (data / "grades.csv").read_bytes() == lama
+    assert not (data.parent / "out" / "report.md").exists()
+
+
+def test_update_grades_delta_salah_tidak_menulis(data, capsys):
+    delta = data.parent / "delta.csv"
+    delta.write_text("student_id,quiz\n1,100\n9,50\n2,abc\n", encoding="utf-8")
+    lama = (data / "grades.csv").read_bytes()
+    assert _cli(data, "update-grades", "--from", str(delta)) == 1
+    err = capsys.readouterr().err
+    assert "2 galat" in err
+    assert (data / "grades.csv").read_bytes() == lama
+
+
+def test_update_grades_menulis(data):
+    delta = data.parent / "delta.jsonl"
+    delta.write_text('{"student_id": "2", "final": 95}\n', encoding="utf-8")
+    assert _cli(data, "update-grades", "--from", str(delta), "--tanpa-laporan") == 0
+    baris = (data / "grades.csv").read_text(encoding="utf-8").splitlines()
+    assert baris[2].split(",")[5].strip() == "95.0"
+
+
+def test_validasi_kode_keluar(data, capsys):
+    assert _cli(data, "validasi") == 0
+    (data / "grades.csv").write_text(GRD.replace("2,Budi,50", "2,Budi,x"), encoding="utf-8")
+    capsys.readouterr()
+    assert _cli(data, "validasi", "--json") == 1
+    hasil = json.loads(capsys.readouterr().out)
+    assert hasil["galat"] == 1
+    assert hasil["jenis"][0]["kolom"] == "quiz"
+
+
+def test_database_rusak_tanpa_traceback(data, capsys):
+    (data / "tracker.db").write_bytes(b"bukan database sqlite" * 100)
+    assert _cli(data, "--penyimpanan", "sqlite", "stats") == 2
+    assert capsys.readouterr().err.startswith("! ")
@@ -0,0 +1,52 @@
+# Bootstrap rekap dari kolom: NIM ganda ditolak tanpa mengisi rekap setengah jalan
+
+import pytest
+
+from tracker import RekapKelas, RekapKelasAman
+from tracker.rekap_kolom import RekapKelasKolom
+
+KELAS_REKAP = [RekapKelas, RekapKelasKolom, RekapKelasAman]
+
+
+def _kolom(nim):
+    n = len(nim)
+    return (nim, ["Mhs " + x for x in nim], [100.0] * n,
+            [80.0] * n, [70.0] * n, [60.0] * n, [90.0] * n)
+
+
+@pytest.mark.parametrize("kelas", KELAS_REKAP)
+def test_nim_ganda_rekap_tetap_kosong(kelas):
+    rekap = kelas()
+    versi = rekap.versi
+    with pytest.raises(KeyError):
+        rekap.isi_kolom(*_kolom(["1", "2", "1"]))
+    assert len(rekap) == 0
+    assert "1" not in rekap
+    assert rekap.rekap() == []
+    assert rekap.versi == versi
+    # setelah gagal, rekap masih bisa diisi dengan data yang benar
+    rekap.isi_kolom(*_kolom(["1", "2"]))
+    assert [r["nim"] for r in rekap.rekap()] == ["1", "2"]
+
+
+@pytest.mark.parametrize("kelas", KELAS_REKAP)
+def test_dari_kolom_hitung_nilai_akhir(kelas):
+    rekap = kelas.dari_kolom(*_kolom(["1", "2"]))
+    baris = {r["nim"]: r for r in rekap.rekap()}
+    assert baris["1"]["akhir"] == rekap.nilai_akhir("1")
+    assert baris["2"]["predikat"] == rekap.predikat(baris["2"]["akhir"])
+
+
+@pytest.mark.parametrize("kelas", KELAS_REKAP)
+def test_isi_kolom_kedua_kali_ditolak(kelas):
+    rekap = kelas.dari_kolom(*_kolom(["1", "2"]))
+    rekap.ubah_penilaian("2", quiz=10)
+    lama = rekap.rekap()
+    versi = rekap.versi
+    with pytest.raises(ValueError):
+        rekap.isi_kolom(*_kolom(["2", "3"]))
+    assert rekap.rekap() == lama
+    assert rekap.versi == versi
+    assert "3" not in rekap
+    # indeks tetap sesuai isi lama (NIM 2 nilainya lebih kecil setelah quiz=10)
+    assert [r["nim"] for r in rekap.rentang_akhir(0, 100)] == ["2", "1"]
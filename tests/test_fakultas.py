@@ -0,0 +1,64 @@
+# Rekap banyak kelas: muat berurutan = paralel, skema dicek di depan, galat menyebut file
+
+import pytest
+
+from tracker.fakultas import RekapFakultas
+from tracker.skema_nilai import SkemaPenilaian
+from tracker.statistik import hitung_statistik
+
+ATT = "student_id,name,week1,week2\n"
+GRD = "student_id,name,quiz,assignment,mid,final\n"
+
+
+@pytest.fixture
+def root(tmp_path):
+    kelas = {
+        "2024/IF-A": ("1,Ani,1,1\n2,Budi,1,0\n", "1,Ani,80,70,60,90\n2,Budi,50,50,50,50\n"),
+        "2024/IF-B": ("3,Citra,0,1\n4,Dedi,1,1\n", "3,Citra,90,90,90,90\n4,Dedi,x,40,40,40\n"),
+    }
+    for nama, (att, grd) in kelas.items():
+        d = tmp_path / nama
+        d.mkdir(parents=True)
+        (d / "attendance.csv").write_text(ATT + att, encoding="utf-8")
+        (d / "grades.csv").write_text(GRD + grd, encoding="utf-8")
+    return tmp_path
+
+
+def test_paralel_sama_dengan_berurutan(root):
+    satu = RekapFakultas()
+    dua = RekapFakultas()
+    assert satu.muat(root, max_workers=1) == 2
+    assert dua.muat(root, max_workers=2) == 2
+    assert list(satu.kelas) == list(dua.kelas) == ["2024/IF-A", "2024/IF-B"]
+    assert satu.rekap() == dua.rekap()
+    assert len(satu) == 4
+    # memuat lagi tidak menggandakan kelas yang sudah ada
+    assert satu.muat(root, max_workers=1) == 0
+
+
+def test_galat_menyebut_file(root):
+    fak = RekapFakultas()
+    fak.muat(root, max_workers=1)
+    assert fak.galat["2024/IF-A"] == []
+    [(berkas, baris, kolom, nilai, _)] = fak.galat["2024/IF-B"]
+    assert berkas.endswith("grades.csv")
+    assert (baris, kolom, nilai) == (3, "quiz", "x")
+
+
+def test_skema_tidak_standar_ditolak():
+    skema = SkemaPenilaian("praktikum", {"quiz": 0.1, "tugas": 0.2, "uts": 0.2, "uas": 0.3,
+                                         "praktikum": 0.2}, {"D": 50, "C": 65, "B": 75, "A": 85})
+    with pytest.raises(ValueError):
+        RekapFakultas(skema)
+
+
+def test_statistik_gabungan_sama_dengan_per_kelas(root):
+    fak = RekapFakultas()
+    fak.muat(root, max_workers=1)
+    total, per_kelas = fak.statistik()
+    assert len(total) == 4
+    assert {k: len(s) for k, s in per_kelas.items()} == {"2024/IF-A": 2, "2024/IF-B": 2}
+    assert total.ringkasan()["predikat"] == {
+        h: sum(hitung_statistik(r).predikat[h] for r in fak.kelas.values())
+        for h in total.predikat
+    }
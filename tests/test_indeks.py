@@ -0,0 +1,71 @@
+# Query lewat indeks bisect tetap benar setelah perubahan (diperbarui per NIM, bukan dibangun ulang)
+
+import random
+
+import pytest
+
+import tracker
+from tracker import Mahasiswa
+from tracker.indeks import IndeksTerurut
+
+KELAS = ["RekapKelas", "RekapKelasKolom", "RekapKelasAman"]
+
+
+def _rekap(nama_kelas, n=80):
+    rnd = random.Random(7)
+    rekap = getattr(tracker, nama_kelas)()
+    for i in range(n):
+        nim = str(1000 + i)
+        rekap.tambah_mahasiswa(Mahasiswa(nim, "Mhs " + nim))
+        rekap.ubah_hadir(nim, rnd.randrange(0, 101, 5))
+        rekap.ubah_penilaian(nim, **{k: rnd.randint(30, 100) for k in ("quiz", "tugas", "uts", "uas")})
+    return rekap
+
+
+def _cocok(rekap):
+    """Bandingkan semua query berindeks dengan saringan langsung atas rekap()."""
+    semua = rekap.rekap()
+    urut_akhir = sorted(semua, key=lambda r: (r["akhir"], r["nim"]))
+    assert rekap.rentang_akhir(60, 80) == [r for r in urut_akhir if 60 <= r["akhir"] < 80]
+    assert rekap.rentang_akhir(60, 80, inklusif_hi=True) == [r for r in urut_akhir if 60 <= r["akhir"] <= 80]
+    assert rekap.rentang_hadir(None, 50) == sorted((r for r in semua if r["hadir"] < 50),
+                                                   key=lambda r: (r["hadir"], r["nim"]))
+    for huruf in "ABCDE":
+        assert rekap.per_predikat(huruf) == [r for r in urut_akhir if r["predikat"] == huruf]
+    assert rekap.distribusi_predikat() == {h: sum(r["predikat"] == h for r in semua) for h in "ABCDE"}
+    assert rekap.teratas(5) == urut_akhir[::-1][:5]
+    assert rekap.terbawah(5) == urut_akhir[:5]
+    assert rekap.berisiko(70, 75) == [r for r in urut_akhir if r["akhir"] < 70 and r["hadir"] < 75]
+    assert rekap.berisiko(90, 20) == [r for r in urut_akhir if r["akhir"] < 90 and r["hadir"] < 20]
+
+
+@pytest.mark.parametrize("nama_kelas", KELAS)
+def test_query_setelah_ubah(nama_kelas):
+    rekap = _rekap(nama_kelas)
+    _cocok(rekap)
+    # sedikit perubahan (< 1/8 data): indeks diperbarui per NIM
+    rekap.ubah_penilaian("1003", quiz=100, tugas=100, uts=100, uas=100)
+    rekap.ubah_penilaian("1010", uas=0)
+    rekap.ubah_hadir("1011", 0)
+    rekap.tambah_mahasiswa(Mahasiswa("2000", "Baru"))
+    assert rekap.teratas(1)[0]["nim"] == "1003"
+    assert rekap.terbawah(1)[0]["nim"] == "2000"
+    _cocok(rekap)
+    # banyak perubahan sekaligus: indeks dibangun ulang
+    for i in range(0, 80, 2):
+        rekap.ubah_penilaian(str(1000 + i), quiz=50)
+    _cocok(rekap)
+
+
+def test_indeks_terurut_set_hapus():
+    idx = IndeksTerurut()
+    idx.bangun([("a", 10.0), ("b", 20.0), ("c", 20.0)])
+    idx.set("a", 30.0)
+    idx.set("d", 5.0)
+    idx.hapus("b")
+    idx.hapus("tidak-ada")
+    assert idx.rentang() == [(5.0, "d"), (20.0, "c"), (30.0, "a")]
+    assert idx.hitung(20.0, 30.0) == 1
+    assert idx.hitung(20.0, 30.0, inklusif_hi=True) == 2
+    assert idx.terbesar(2) == [(30.0, "a"), (20.0, "c")]
+    assert idx.terkecil(0) == [] and idx.terbesar(0) == []
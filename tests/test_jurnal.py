@@ -0,0 +1,89 @@
+# Jurnal tulis-dulu: pemulihan setelah record terpotong oleh crash
+
+import pytest
+
+from tracker import Mahasiswa, RekapKelas
+from tracker.jurnal import Jurnal
+
+
+def _isi(rekap):
+    return {row[0]: row[1:] for row in rekap.iter_komponen()}
+
+
+def _pulihkan(folder):
+    rekap = RekapKelas()
+    jurnal = Jurnal(folder)
+    n = jurnal.pulihkan(rekap)
+    return rekap, jurnal, n
+
+
+def _segmen_terakhir(folder):
+    return sorted(folder.glob("jurnal-*.log"))[-1]
+
+
+def test_record_terpotong_lalu_lanjut_tidak_hilang(tmp_path):
+    rekap = RekapKelas()
+    jurnal = Jurnal(tmp_path)
+    jurnal.pasang(rekap)
+    rekap.tambah_mahasiswa(Mahasiswa("1", "Ani"))
+    jurnal.snapshot()
+    # record pertama segmen baru terpotong di tengah (crash saat menulis)
+    rekap.ubah_penilaian("1", quiz=80)
+    jurnal.tutup()
+    seg = _segmen_terakhir(tmp_path)
+    seg.write_bytes(seg.read_bytes()[:-10])
+
+    rekap, jurnal, n = _pulihkan(tmp_path)
+    assert n == 0
+    rekap.ubah_penilaian("1", quiz=70, tugas=60)
+    rekap.ubah_hadir("1", 90)
+    jurnal.tutup()
+
+    # restart kedua: kedua perubahan sesudah pemulihan harus diputar ulang
+    rekap, jurnal, n = _pulihkan(tmp_path)
+    jurnal.tutup()
+    assert n == 2
+    assert _isi(rekap)["1"] == ("Ani", 90.0, 70.0, 60.0, 0.0, 0.0)
+
+    # restart ketiga: tetap sama
+    rekap, jurnal, n = _pulihkan(tmp_path)
+    jurnal.tutup()
+    assert _isi(rekap)["1"] == ("Ani", 90.0, 70.0, 60.0, 0.0, 0.0)
+
+
+def test_baris_rusak_di_tengah_segmen_dilewati(tmp_path):
+    # segmen yang dilanjutkan setelah crash oleh versi lama: baris rusak di tengah
+    (tmp_path / "jurnal-000000000001.log").write_text(
+        '{"seq": 1, "op": "tambah", "nim": "1", "nama": "Ani", "hadir": 0.0}\n'
+        '{"seq": 2, "op": "nilai", "nim": "1", "qu\n'
+        '{"seq": 2, "op": "nilai", "nim": "1", "quiz": 55.0}\n'
+        '{"seq": 3, "op": "hadir", "nim": "1", "persen": 80.0}\n', encoding="utf-8")
+    rekap, jurnal, n = _pulihkan(tmp_path)
+    jurnal.tutup()
+    assert n == 3
+    assert _isi(rekap)["1"] == ("Ani", 80.0, 55.0, 0.0, 0.0, 0.0)
+
+
+def test_ekor_terpotong_dipangkas(tmp_path):
+    seg = tmp_path / "jurnal-000000000001.log"
+    utuh = '{"seq": 1, "op": "tambah", "nim": "1", "nama": "Ani", "hadir": 0.0}\n'
+    seg.write_text(utuh + '{"seq": 2, "op": "hadir", "ni', encoding="utf-8")
+    rekap, jurnal, n = _pulihkan(tmp_path)
+    jurnal.tutup()
+    assert n == 1
+    assert seg.read_text(encoding="utf-8") == utuh
+
+
+def test_ubah_penilaian_gagal_tidak_mengubah_apa_pun(tmp_path):
+    rekap = RekapKelas()
+    jurnal = Jurnal(tmp_path)
+    jurnal.pasang(rekap)
+    rekap.tambah_mahasiswa(Mahasiswa("1", "Ani"))
+    with pytest.raises(ValueError):
+        rekap.ubah_penilaian("1", quiz=80, tugas=150)
+    jurnal.tutup()
+    assert _isi(rekap)["1"] == ("Ani", 0.0, 0.0, 0.0, 0.0, 0.0)
+    rekap, jurnal, n = _pulihkan(tmp_path)
+    jurnal.tutup()
+    assert n == 1
+    assert _isi(rekap)["1"] == ("Ani", 0.0, 0.0, 0.0, 0.0, 0.0)
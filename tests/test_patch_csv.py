@@ -0,0 +1,100 @@
+# CSVPatcher: ubah baris di tempat, change log, kompaksi, dan kolom NIM dari header
+
+import pytest
+
+import app
+from tracker.patch_csv import CSVPatcher, path_indeks, path_log
+from tracker.skema_csv import GRD_HEADERS, baca_blok
+
+GRD = "student_id,name,quiz,assignment,mid,final\n1,Ani,80,70,60,90\n2,Budi,50,50,50,50\n"
+
+
+def _grades(tmp_path, isi=GRD):
+    p = tmp_path / "grades.csv"
+    p.write_text(isi, encoding="utf-8")
+    return p
+
+
+def _nilai_blok(path):
+    """dict nim -> quiz lewat baca_blok (jalur bootstrap)."""
+    hasil = {}
+    for blok in baca_blok(path, GRD_HEADERS):
+        hasil.update(zip(blok["student_id"], blok["quiz"]))
+    return hasil
+
+
+def test_ubah_di_tempat(tmp_path):
+    p = _grades(tmp_path)
+    patcher = CSVPatcher(p, GRD_HEADERS, lebar_nilai=1)
+    lama = p.read_bytes().splitlines(keepends=True)
+    row = patcher.perbarui("1", {"quiz": "75"})
+    assert row["quiz"] == "75"
+    baru = p.read_bytes().splitlines(keepends=True)
+    # panjang baris tetap, baris lain tidak tersentuh, tidak ada change log
+    assert [len(b) for b in baru] == [len(b) for b in lama]
+    assert baru[2] == lama[2]
+    assert not path_log(p).exists()
+    assert patcher.baris("1")["quiz"] == "75"
+    assert _nilai_blok(p) == {"1": 75.0, "2": 50.0}
+
+
+def test_baris_tumbuh_masuk_log_lalu_kompaksi(tmp_path):
+    p = _grades(tmp_path)
+    patcher = CSVPatcher(p, GRD_HEADERS, lebar_nilai=1)
+    patcher.perbarui("2", {"quiz": "72.25"})
+    assert path_log(p).exists()
+    assert "72.25" not in p.read_text(encoding="utf-8")
+    # semua pembaca melihat versi di change log
+    assert patcher.baris("2")["quiz"] == "72.25"
+    assert _nilai_blok(p)["2"] == 72.25
+    assert [r["quiz"] for r in app.read_csv(p)] == ["80", "72.25"]
+
+    patcher.kompaksi()
+    assert not path_log(p).exists()
+    assert [r["quiz"] for r in app.read_csv(p)] == ["80", "72.25"]
+    assert CSVPatcher(p, GRD_HEADERS).baris("2")["quiz"] == "72.25"
+
+
+def test_padding_dibuang_pembaca(tmp_path):
+    p = _grades(tmp_path)
+    patcher = CSVPatcher(p, GRD_HEADERS)
+    patcher.tambah({"student_id": "3", "name": "Cici", "quiz": "1", "assignment": "2", "mid": "3", "final": "4"})
+    # sel angka baris baru dipadding (lihat docstring CSVPatcher)
+    assert p.read_text(encoding="utf-8").splitlines()[-1] == "3,Cici,1     ,2     ,3     ,4     "
+    assert app.read_csv(p)[-1] == {"student_id": "3", "name": "Cici", "quiz": "1",
+                                   "assignment": "2", "mid": "3", "final": "4"}
+    assert _nilai_blok(p)["3"] == 1.0
+    # nilai yang lebih panjang tetap muat di tempat berkat padding
+    patcher.perbarui("3", {"quiz": "99.5"})
+    assert not path_log(p).exists()
+    assert patcher.baris("3")["quiz"] == "99.5"
+
+
+def test_kolom_nim_bukan_kolom_pertama(tmp_path):
+    p = _grades(tmp_path, "name,student_id,quiz,assignment,mid,final\nAni,1,80,70,60,90\n\"Budi, S.\",2,50,50,50,50\n")
+    patcher = CSVPatcher(p, GRD_HEADERS, lebar_nilai=1)
+    assert "1" in patcher and "2" in patcher
+    assert "Ani" not in patcher
+    patcher.perbarui("2", {"quiz": "55"})
+    # indeks di disk (.idx) dipakai ulang oleh patcher baru
+    assert path_indeks(p).exists()
+    lagi = CSVPatcher(p, GRD_HEADERS, lebar_nilai=1)
+    assert lagi.baris("2") == {"name": "Budi, S.", "student_id": "2", "quiz": "55",
+                               "assignment": "50", "mid": "50", "final": "50"}
+
+
+def test_header_tanpa_student_id(tmp_path):
+    p = _grades(tmp_path, "nim,name,quiz\n1,Ani,80\n")
+    with pytest.raises(ValueError):
+        CSVPatcher(p, GRD_HEADERS)
+
+
+def test_perbarui_banyak_nim_asing_tidak_menulis(tmp_path):
+    p = _grades(tmp_path)
+    patcher = CSVPatcher(p, GRD_HEADERS, lebar_nilai=1)
+    lama = p.read_bytes()
+    with pytest.raises(KeyError):
+        patcher.perbarui_banyak({"1": {"quiz": "10"}, "9": {"quiz": "20"}})
+    assert p.read_bytes() == lama
+    assert patcher.perbarui_banyak({"1": {"quiz": "10"}}) == 2
+    assert patcher.baris("1")["quiz"] == "10"
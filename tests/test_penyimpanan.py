@@ -0,0 +1,94 @@
+# Penyimpanan: kontrak abstrak, migrasi CSV -> SQLite, upsert nilai, naik skema 1 -> 2
+
+import sqlite3
+
+import pytest
+
+from tracker import RekapKelas
+from tracker.penyimpanan import Penyimpanan, buka_penyimpanan
+from tracker.penyimpanan_sqlite import PenyimpananSQLite
+from tracker.skema_csv import LaporanGalat
+
+ATT = ("student_id,name,week1,week2,week3\n"
+       "1,Ani,1,1,0\n"
+       ",Tanpa NIM,1,1,1\n"
+       "1,Ani Lagi,0,0,0\n"
+       "2,Budi,1,0,1\n")
+GRD = ("student_id,name,quiz,assignment,mid,final\n"
+       "1,Ani,80,70,60,90\n"
+       "2,Budi,abc,50,150,50\n")
+
+
+def test_subkelas_tidak_lengkap_ditolak():
+    class Setengah(Penyimpanan):
+        def ada_data(self):
+            return False
+
+    with pytest.raises(TypeError):
+        Setengah()
+
+
+def test_migrasi_baris_kotor_sama_dengan_csv(tmp_path):
+    (tmp_path / "attendance.csv").write_text(ATT, encoding="utf-8")
+    (tmp_path / "grades.csv").write_text(GRD, encoding="utf-8")
+    db = PenyimpananSQLite(tmp_path / "tracker.db")
+    laporan = LaporanGalat()
+    try:
+        assert db.migrasi_dari_csv(tmp_path / "attendance.csv", tmp_path / "grades.csv", laporan) == (2, 2)
+        assert db.sesi() == ["week1", "week2", "week3"]
+        rekap, _ = db.muat(RekapKelas)
+    finally:
+        db.tutup()
+    # NIM kosong, NIM ganda, quiz bukan angka, mid di luar 0..100
+    assert len(laporan) == 4
+    dari_csv, laporan_csv = buka_penyimpanan(tmp_path, "csv").muat(RekapKelas)
+    assert len(laporan_csv) == len(laporan)
+    assert rekap.rekap() == dari_csv.rekap()
+
+
+def test_ubah_nilai_banyak_upsert(tmp_path):
+    db = PenyimpananSQLite(tmp_path / "tracker.db")
+    try:
+        db.tambah_mahasiswa("1", "Ani")
+        db.ubah_nilai("1", quiz=80, final=90)
+        baru = db.ubah_nilai_banyak({"1": {"quiz": 85.555}, "9": {"mid": 70}}, nama=lambda nim: "Mhs " + nim)
+        assert baru == 1
+        assert db.ubah_nilai("1") == {"student_id": "1", "name": "Ani", "quiz": "85.56",
+                                      "assignment": "0.0", "mid": "0.0", "final": "90.0"}
+        assert db.ubah_nilai("9")["name"] == "Mhs 9"
+        # satu nilai salah -> tidak ada yang berubah
+        with pytest.raises(ValueError):
+            db.ubah_nilai_banyak({"1": {"quiz": 10}, "9": {"mid": 101}})
+        assert db.ubah_nilai("1")["quiz"] == "85.56"
+    finally:
+        db.tutup()
+
+
+def test_naik_skema_1_ke_2(tmp_path):
+    path = tmp_path / "tracker.db"
+    conn = sqlite3.connect(path)
+    minggu = [f"week{i}" for i in range(1, 6)]
+    conn.executescript(f"""
+        CREATE TABLE mahasiswa (student_id TEXT PRIMARY KEY, name TEXT NOT NULL DEFAULT '');
+        CREATE TABLE presensi (student_id TEXT PRIMARY KEY,
+            {', '.join(f"{w} INTEGER NOT NULL DEFAULT 0" for w in minggu)}) WITHOUT ROWID;
+        CREATE TABLE nilai (student_id TEXT PRIMARY KEY, quiz REAL NOT NULL DEFAULT 0,
+            assignment REAL NOT NULL DEFAULT 0, mid REAL NOT NULL DEFAULT 0,
+            final REAL NOT NULL DEFAULT 0) WITHOUT ROWID;
+        INSERT INTO mahasiswa VALUES ('1', 'Ani'), ('2', 'Budi');
+        INSERT INTO presensi VALUES ('1', 1, 0, 1, 1, 0), ('2', 0, 0, 0, 0, 1);
+        INSERT INTO nilai VALUES ('1', 80, 70, 60, 90);
+        PRAGMA user_version = 1;
+    """)
+    conn.close()
+    db = PenyimpananSQLite(path)
+    try:
+        assert db.sesi() == minggu
+        presensi = db.muat_presensi()
+        assert presensi.persen("1") == 60.0
+        assert presensi.persen("2") == 20.0
+        rekap, _ = db.muat(RekapKelas)
+        assert [r["nim"] for r in rekap.rekap()] == ["1", "2"]
+        assert db._db().execute("PRAGMA user_version").fetchone()[0] == 2
+    finally:
+        db.tutup()
@@ -0,0 +1,52 @@
+# Presensi bitset dari attendance.csv: aturan baris sama dengan bootstrap
+
+import pytest
+
+from tracker import RekapKelas
+from tracker.penyimpanan import buka_penyimpanan
+from tracker.presensi import MatriksPresensi
+from tracker.skema_csv import LaporanGalat
+
+ATT = "student_id,name,week1,week2,week3\n"
+
+
+def _att(tmp_path, isi):
+    p = tmp_path / "attendance.csv"
+    p.write_text(ATT + isi, encoding="utf-8")
+    (tmp_path / "grades.csv").write_text("student_id,name,quiz,assignment,mid,final\n", encoding="utf-8")
+    return p
+
+
+def test_nim_ganda_baris_pertama_dipakai(tmp_path):
+    p = _att(tmp_path, "1,A,1,0,1\n1,A2,0,0,0\n2,B,1,1,1\n")
+    laporan = LaporanGalat()
+    m = MatriksPresensi.dari_csv(p, laporan)
+    assert len(m) == 2
+    assert m.baris("1") == {"week1": "1", "week2": "0", "week3": "1"}
+    assert m.persen("2") == 100.0
+    assert [(b, k, pesan) for b, k, _, pesan in laporan] == [(3, "student_id", "NIM ganda, baris pertama yang dipakai")]
+
+
+def test_sama_dengan_muat_rekap(tmp_path):
+    # menu 5 -> 4 dan `absen` memakai muat_presensi; hasilnya harus cocok dengan muat()
+    _att(tmp_path, "1,A,1,0,1\n1,A2,0,0,0\n,Tanpa NIM,1,1,1\n2,B,1,1,1\n")
+    penyimpanan = buka_penyimpanan(tmp_path, "csv")
+    rekap, laporan = penyimpanan.muat(RekapKelas)
+    presensi = penyimpanan.muat_presensi()
+    assert len(laporan) == 2
+    assert len(presensi) == len(rekap) == 2
+    for r in rekap.rekap():
+        assert presensi.persen(r["nim"]) == r["hadir"]
+
+
+def test_tambah_banyak_ganda_tidak_merusak_indeks():
+    m = MatriksPresensi(["week1"])
+    m._tambah_banyak(["1", "2"], ["A", "B"], [1, 0])
+    with pytest.raises(KeyError):
+        m._tambah_banyak(["3", "2"], ["C", "B2"], [0, 1])
+    with pytest.raises(KeyError):
+        m._tambah_banyak(["4", "4"], ["D", "D2"], [0, 1])
+    assert len(m) == 2
+    assert "3" not in m and "4" not in m
+    m.tambah_mahasiswa("3", "C")
+    assert m.bitset("3") == 0
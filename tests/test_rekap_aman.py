@@ -0,0 +1,156 @@
+# RekapKelasAman dengan banyak thread: tidak ada update hilang, baris setengah jadi, atau indeks basi
+# (versi pendek dari `python bench/bench_konkuren.py --stres`)
+
+import random
+import sys
+import threading
+
+import pytest
+
+from tracker import Mahasiswa, RekapKelasAman
+
+
+@pytest.fixture(autouse=True)
+def sering_ganti_thread():
+    # ganti thread sesering mungkin supaya interleaving yang jarang ikut teruji
+    lama = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(lama)
+
+
+def _rekap(n, seed=1):
+    rnd = random.Random(seed)
+    rekap = RekapKelasAman()
+    nims = [str(230000000 + i) for i in range(n)]
+    for nim in nims:
+        rekap.tambah_mahasiswa(Mahasiswa(nim, "Mahasiswa " + nim))
+        v = rnd.randint(0, 100)
+        rekap.ubah(nim, hadir=rnd.randint(0, 100), quiz=v, tugas=v, uts=v, uas=v)
+    return rekap, nims
+
+
+def _jalankan(*target):
+    """Jalankan semua target di thread terpisah; exception di thread dikembalikan sebagai list."""
+    galat = []
+
+    def bungkus(f):
+        try:
+            f()
+        except Exception as e:
+            galat.append(e)
+    thread = [threading.Thread(target=bungkus, args=(f,)) for f in target]
+    for t in thread:
+        t.start()
+    for t in thread:
+        t.join()
+    return galat
+
+
+def _komponen(rekap, nim):
+    return next(k for k in rekap.iter_komponen() if k[0] == nim)
+
+
+def test_ubah_dengan_tidak_ada_update_hilang():
+    rekap, nims = _rekap(50)
+    panas = nims[:4]
+    for nim in panas:
+        rekap.ubah(nim, quiz=0)
+
+    def penambah():
+        for _ in range(10):
+            for nim in panas:
+                rekap.ubah_dengan(nim, lambda k: {'quiz': k['quiz'] + 1})
+    assert _jalankan(*[penambah] * 8) == []
+    for nim in panas:
+        assert _komponen(rekap, nim)[3] == 80
+
+
+def test_tidak_ada_baris_setengah_jadi():
+    rekap, nims = _rekap(200)
+    selesai = threading.Event()
+    rusak = []
+
+    def penulis(seed):
+        rnd = random.Random(seed)
+        for _ in range(2000):
+            v = rnd.randint(0, 100)
+            rekap.ubah(rnd.choice(nims), quiz=v, tugas=v, uts=v, uas=v)
+
+    def pembaca():
+        while not selesai.is_set():
+            for nim, _, _, q, t, u, a in rekap.iter_komponen():
+                if not q == t == u == a:
+                    rusak.append((nim, q, t, u, a))
+            for row in rekap.rekap():
+                if row['predikat'] != rekap.skema.predikat(row['akhir']):
+                    rusak.append(row)
+
+    def semua_penulis():
+        try:
+            assert _jalankan(*[lambda s=s: penulis(s) for s in range(4)]) == []
+        finally:
+            selesai.set()
+    assert _jalankan(semua_penulis, pembaca, pembaca) == []
+    assert rusak == []
+
+
+def test_indeks_tidak_basi_setelah_penulis_selesai():
+    rekap, nims = _rekap(300)
+    selesai = threading.Event()
+
+    def penulis(seed):
+        rnd = random.Random(seed)
+        for _ in range(1500):
+            rekap.ubah(rnd.choice(nims), hadir=rnd.randint(0, 100), quiz=rnd.randint(0, 100),
+                       uas=rnd.randint(0, 100))
+
+    def penanya():
+        # query jalan selama penulis aktif, jadi indeks dibangun lalu diperbarui lewat antrean
+        while not selesai.is_set():
+            rekap.rentang_akhir(hi=50)
+            rekap.berisiko(70, 75)
+            rekap.teratas(10)
+
+    def semua_penulis():
+        try:
+            assert _jalankan(*[lambda s=s: penulis(s) for s in range(4)]) == []
+        finally:
+            selesai.set()
+    assert _jalankan(semua_penulis, penanya) == []
+
+    baris = rekap.rekap()
+    akhir = {r['nim']: r['akhir'] for r in baris}
+    hadir = {r['nim']: r['hadir'] for r in baris}
+    assert sorted((r['akhir'], r['nim']) for r in rekap.rentang_akhir()) == sorted((a, n) for n, a in akhir.items())
+    assert sorted(r['nim'] for r in rekap.rentang_akhir(hi=50)) == sorted(n for n, a in akhir.items() if a < 50)
+    assert sorted(r['nim'] for r in rekap.berisiko(70, 75)) == \
+        sorted(n for n in akhir if akhir[n] < 70 and hadir[n] < 75)
+    assert [r['akhir'] for r in rekap.teratas(10)] == sorted(akhir.values(), reverse=True)[:10]
+    assert sum(rekap.distribusi_predikat().values()) == len(baris)
+
+
+def test_tambah_banyak_thread():
+    rekap = RekapKelasAman()
+    versi = rekap.versi
+
+    def penambah(no):
+        for i in range(100):
+            rekap.tambah_mahasiswa(Mahasiswa(f"{no}{i:04d}", "Mhs"))
+    assert _jalankan(*[lambda no=no: penambah(no) for no in range(1, 5)]) == []
+    assert len(rekap) == 400
+    assert len(rekap.rekap()) == 400
+    assert rekap.versi > versi
+    with pytest.raises(KeyError):
+        rekap.tambah_mahasiswa(Mahasiswa("10000", "Lagi"))
+
+
+def test_ubah_tidak_valid_tidak_mengubah_apa_pun():
+    rekap, nims = _rekap(3)
+    nim = nims[0]
+    lama = _komponen(rekap, nim)
+    versi = rekap.versi
+    with pytest.raises(ValueError):
+        rekap.ubah(nim, hadir=50, quiz=60, tugas=200)
+    assert _komponen(rekap, nim) == lama
+    assert rekap.versi == versi
@@ -0,0 +1,52 @@
+# Mesin render laporan: struktur HTML dan bagian ringkasan
+
+import io
+from html.parser import HTMLParser
+
+from tracker.render import render
+
+RECORDS = [
+    {"student_id": "1", "name": "Ani", "attendance_rate": 100.0, "final_score": 90.0},
+    {"student_id": "2", "name": "Budi", "attendance_rate": 50.0, "final_score": 40.0},
+]
+
+
+class _CekSarang(HTMLParser):
+    """Catat tag pembuka yang masih terbuka saat <h2> muncul; gagal jika tag penutup tidak cocok."""
+    KOSONG = {"meta", "br", "hr", "img", "input", "link"}
+
+    def __init__(self):
+        super().__init__()
+        self.tumpukan = []
+        self.di_h2 = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "h2" and self.di_h2 is None:
+            self.di_h2 = list(self.tumpukan)
+        if tag not in self.KOSONG:
+            self.tumpukan.append(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        # <meta ... /> tidak membuka apa pun
+        pass
+
+    def handle_endtag(self, tag):
+        assert self.tumpukan and self.tumpukan[-1] == tag, (tag, self.tumpukan)
+        self.tumpukan.pop()
+
+
+def test_ringkasan_html_di_luar_tabel_baris():
+    fp = io.StringIO()
+    render(RECORDS, fp, "html")
+    cek = _CekSarang()
+    cek.feed(fp.getvalue())
+    assert cek.tumpukan == []
+    assert cek.di_h2 == ["html", "body"]
+
+
+def test_ringkasan_md_setelah_baris():
+    fp = io.StringIO()
+    stat = render(RECORDS, fp, "md")
+    teks = fp.getvalue()
+    assert teks.index("| 2 | Budi |") < teks.index("## Ringkasan")
+    assert stat is not None
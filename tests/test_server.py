@@ -0,0 +1,90 @@
+# Layanan HTTP/JSON: ETag/304, cache dibuang saat versi data berubah, memo kueri dibatasi
+
+import asyncio
+import json
+
+from tracker import Mahasiswa, RekapKelas
+from tracker.server import KUERI_AWAL, Layanan, hangatkan
+
+
+def _rekap(n=20):
+    rekap = RekapKelas()
+    for i in range(n):
+        nim = str(100 + i)
+        rekap.tambah_mahasiswa(Mahasiswa(nim, "Mhs " + nim))
+        rekap.ubah_penilaian(nim, quiz=i * 5, tugas=i * 5, uts=i * 5, uas=i * 5)
+        rekap.ubah_hadir(nim, 50 + i)
+    return rekap
+
+
+def _json(body):
+    return json.loads(body.decode("utf-8"))
+
+
+async def _minta(port, target, *kepala):
+    """Satu GET lewat socket sungguhan; kembalikan (status, header dict, body bytes)."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    baris = [f"GET {target} HTTP/1.1", "Host: x", "Connection: close", *kepala]
+    writer.write(("\r\n".join(baris) + "\r\n\r\n").encode("latin-1"))
+    await writer.drain()
+    data = await reader.read()
+    writer.close()
+    kepala_resp, _, body = data.partition(b"\r\n\r\n")
+    baris = kepala_resp.decode("latin-1").split("\r\n")
+    header = dict(b.split(": ", 1) for b in baris[1:])
+    return int(baris[0].split(" ")[1]), header, body
+
+
+def test_etag_dan_304():
+    layanan = Layanan(_rekap())
+
+    async def jalan():
+        server = await asyncio.start_server(layanan.tangani, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            status, header, body = await _minta(port, "/mahasiswa/105")
+            assert status == 200
+            assert _json(body)["nama"] == "Mhs 105"
+            etag = header["ETag"]
+            status, _, body = await _minta(port, "/mahasiswa/105", f"If-None-Match: {etag}")
+            assert (status, body) == (304, b"")
+            # data berubah -> ETag baru, jawaban baru
+            layanan.rekap.ubah_penilaian("105", quiz=100)
+            status, header, _ = await _minta(port, "/mahasiswa/105", f"If-None-Match: {etag}")
+            assert status == 200 and header["ETag"] != etag
+            status, _, body = await _minta(port, "/tidak-ada")
+            assert status == 404
+    asyncio.run(jalan())
+
+
+def test_cache_dibuang_saat_versi_berubah():
+    rekap = _rekap()
+    layanan = Layanan(rekap)
+    _, body, versi = layanan.jawab_get("/rekap/rentang?hi=30")
+    lama = _json(body)["jumlah"]
+    assert layanan.jawab_get("/rekap/rentang?hi=30")[1] == body
+    assert layanan.hit == 1
+    rekap.ubah_penilaian("119", quiz=0, tugas=0, uts=0, uas=0)
+    status, body, versi_baru = layanan.jawab_get("/rekap/rentang?hi=30")
+    assert versi_baru != versi
+    assert _json(body)["jumlah"] == lama + 1
+
+
+def test_memo_dibatasi_kueri_awal_tetap():
+    rekap = _rekap()
+    layanan = Layanan(rekap, maks_cache=8, maks_memo=6)
+    layanan.pasang(rekap, hangatkan(rekap))
+    for lo in range(50):
+        assert layanan.jawab_get(f"/rekap/rentang?lo={lo}&hi=100")[0] == 200
+    assert len(layanan._memo) == 6
+    assert len(layanan._cache) == 8
+    assert all(k in layanan._memo for k in KUERI_AWAL)
+    # kueri terbaru masih ada di memo
+    assert ("rentang_akhir", 49.0, 100.0) in layanan._memo
+
+
+def test_parameter_salah():
+    layanan = Layanan(_rekap())
+    assert layanan.jawab_get("/statistik?lebar=0")[0] == 400
+    assert layanan.jawab_get("/rekap?limit=-1")[0] == 400
+    assert layanan.jawab_get("/rekap/predikat/Z")[0] == 404
@@ -0,0 +1,52 @@
+# Skema penilaian: validasi bobot/batas dan hasil skor
+
+import pytest
+
+from tracker.skema_nilai import SKEMA_STANDAR, SkemaPenilaian, muat_skema
+
+BATAS = {"D": 50, "C": 65, "B": 75, "A": 85}
+
+
+@pytest.mark.parametrize("nilai", [float("nan"), float("inf"), float("-inf")])
+def test_bobot_tidak_terhingga_ditolak(nilai):
+    with pytest.raises(ValueError):
+        SkemaPenilaian("x", {"quiz": nilai, "tugas": 0.25, "uts": 0.25, "uas": 0.35}, BATAS)
+
+
+def test_batas_nan_ditolak():
+    with pytest.raises(ValueError):
+        SkemaPenilaian("x", {"uas": 1.0}, {"A": float("nan")})
+
+
+def test_nan_dari_file_konfigurasi_ditolak(tmp_path):
+    p = tmp_path / "skema.json"
+    p.write_text('{"skema": {"x": {"bobot": {"quiz": NaN, "uas": 1.0}}}}', encoding="utf-8")
+    with pytest.raises(ValueError):
+        muat_skema(p)
+
+
+def test_skema_standar():
+    assert SKEMA_STANDAR.hitung_satu(80, 80, 80, 80) == (80.0, "B")
+    akhir, pred = SKEMA_STANDAR.hitung_kelas([100, 0], [100, 0], [100, 0], [100, 0])
+    assert list(akhir) == [100.0, 0.0]
+    assert pred == ["A", "E"]
+
+
+@pytest.mark.parametrize("nama_kelas", ["RekapKelas", "RekapKelasKolom", "RekapKelasAman"])
+def test_pakai_skema_sama_tidak_hitung_ulang(nama_kelas):
+    import tracker
+    rekap = getattr(tracker, nama_kelas)()
+    rekap.tambah_mahasiswa(tracker.Mahasiswa("1", "Ani"))
+    rekap.ubah_penilaian("1", quiz=80, tugas=80, uts=80, uas=80)
+    rekap.rekap()
+    versi = rekap.versi
+    salinan = SkemaPenilaian("standar", dict(zip(SKEMA_STANDAR.komponen, SKEMA_STANDAR.bobot)),
+                             dict(zip(SKEMA_STANDAR.huruf[1:], SKEMA_STANDAR.batas)))
+    rekap.pakai_skema(salinan)
+    assert rekap.versi == versi
+    assert rekap.skema is salinan
+
+    lain = SkemaPenilaian("uas", {"uas": 1.0}, BATAS)
+    rekap.pakai_skema(lain)
+    assert rekap.versi != versi
+    assert rekap.rekap()[0]["akhir"] == 80.0
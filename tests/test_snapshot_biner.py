@@ -0,0 +1,106 @@
+# Snapshot biner: simpan -> buka lewat mmap -> rekap yang sama
+
+import pytest
+
+import tracker
+from tracker import Mahasiswa, RekapKelasKolom
+from tracker import snapshot_biner
+from tracker.skema_nilai import SkemaPenilaian
+
+KELAS = ["RekapKelas", "RekapKelasKolom", "RekapKelasAman"]
+
+
+def _rekap_contoh(cls=RekapKelasKolom):
+    rekap = cls()
+    for i, nama in enumerate(["Ani", "Bñdi Śantoso", "", "Dewi"]):
+        nim = str(230000 + (7 * i) % 5)
+        rekap.tambah_mahasiswa(Mahasiswa(nim, nama))
+        rekap.ubah_hadir(nim, 20.0 * i)
+        rekap.ubah_penilaian(nim, quiz=10.5 * i, tugas=90 - i, uts=33.33, uas=50 + i)
+    return rekap
+
+
+@pytest.mark.parametrize("nama_kelas", KELAS)
+def test_simpan_lalu_ke_rekap_sama(tmp_path, nama_kelas):
+    asli = _rekap_contoh()
+    path = tmp_path / "rekap.snap"
+    snapshot_biner.simpan(asli, path)
+    with snapshot_biner.SnapshotBiner(path) as snap:
+        assert snap.ada_skor
+        assert len(snap) == len(asli)
+        rekap = snap.ke_rekap(getattr(tracker, nama_kelas))
+    assert list(rekap.iter_komponen()) == list(asli.iter_komponen())
+    assert rekap.rekap() == asli.rekap()
+
+
+def test_ke_rekap_memakai_skor_tersimpan(tmp_path):
+    path = tmp_path / "rekap.snap"
+    snapshot_biner.simpan(_rekap_contoh(), path)
+    with snapshot_biner.SnapshotBiner(path) as snap:
+        rekap = snap.ke_rekap(RekapKelasKolom)
+    # tidak ada baris yang perlu dihitung ulang
+    assert not rekap._kotor
+
+
+def test_skema_lain_skor_tidak_disimpan(tmp_path):
+    asli = _rekap_contoh()
+    asli.pakai_skema(SkemaPenilaian("uas", {"uas": 1.0}, {"A": 50}))
+    path = tmp_path / "rekap.snap"
+    snapshot_biner.simpan(asli, path)
+    with snapshot_biner.SnapshotBiner(path) as snap:
+        assert not snap.ada_skor
+        rekap = snap.ke_rekap(RekapKelasKolom)
+    assert rekap.rekap() == _rekap_contoh().rekap()
+
+
+def test_cari_dan_indeks(tmp_path):
+    asli = _rekap_contoh()
+    path = tmp_path / "rekap.snap"
+    snapshot_biner.simpan(asli, path)
+    komponen = list(asli.iter_komponen())
+    with snapshot_biner.SnapshotBiner(path) as snap:
+        assert [snap[i] for i in range(len(snap))] == komponen
+        assert snap[-1] == komponen[-1]
+        for row in komponen:
+            assert snap.cari(row[0]) == row
+        assert snap.cari("999") is None
+        assert list(snap.kolom("hadir")) == [row[2] for row in komponen]
+
+
+def test_rekap_kosong(tmp_path):
+    path = tmp_path / "rekap.snap"
+    snapshot_biner.simpan(RekapKelasKolom(), path)
+    with snapshot_biner.SnapshotBiner(path) as snap:
+        assert len(snap.ke_rekap()) == 0
+        assert snap.cari("1") is None
+
+
+def test_sumber_berubah_atau_versi_lama(tmp_path):
+    sumber = tmp_path / "grades.csv"
+    sumber.write_text("a\n", encoding="utf-8")
+    path = tmp_path / "rekap.snap"
+    snapshot_biner.simpan(_rekap_contoh(), path, (sumber,))
+    assert snapshot_biner.muat_jika_valid(path, (sumber,)) is not None
+    sumber.write_text("ab\n", encoding="utf-8")
+    assert snapshot_biner.muat_jika_valid(path, (sumber,)) is None
+    # header versi lain (misal format lama) ditolak, bukan dibaca salah
+    data = bytearray(path.read_bytes())
+    data[8:12] = (1).to_bytes(4, "little")
+    path.write_bytes(bytes(data))
+    with pytest.raises(ValueError):
+        snapshot_biner.SnapshotBiner(path)
+
+
+def test_snapshot_terpotong_ditolak(tmp_path):
+    sumber = tmp_path / "grades.csv"
+    sumber.write_text("a\n", encoding="utf-8")
+    path = tmp_path / "rekap.snap"
+    snapshot_biner.simpan(_rekap_contoh(), path, (sumber,))
+    assert not path.with_name("rekap.snap.tmp").exists()
+    utuh = path.read_bytes()
+    for panjang in range(len(utuh)):
+        path.write_bytes(utuh[:panjang])
+        with pytest.raises(ValueError):
+            with snapshot_biner.SnapshotBiner(path) as snap:
+                snap.ke_rekap()
+        assert snapshot_biner.muat_jika_valid(path, (sumber,)) is None
@@ -0,0 +1,77 @@
+# Statistik streaming: gabungan Welford/Chan dan sketsa kuantil sama dengan hitung langsung
+
+import random
+import statistics
+
+import pytest
+
+from tracker import RekapKelasKolom
+from tracker.statistik import StatistikKelas, SketsaKuantil, Welford, hitung_statistik
+
+
+def _data(n, seed):
+    rnd = random.Random(seed)
+    return [round(rnd.uniform(0, 100), 2) for _ in range(n)]
+
+
+def test_welford_gabung_sama_dengan_sekaligus():
+    xs = _data(1000, 1)
+    sekaligus = Welford()
+    sekaligus.tambah_banyak(xs)
+    # potongan tidak sama besar, satu per satu dan satu kosong
+    a, b, c, d = Welford(), Welford(), Welford(), Welford()
+    a.tambah_banyak(xs[:7])
+    for x in xs[7:400]:
+        b.tambah(x)
+    c.tambah_banyak(xs[400:])
+    gabung = a.gabung(d).gabung(b).gabung(c)
+    for w in (sekaligus, gabung):
+        assert w.n == len(xs)
+        assert w.rata == pytest.approx(statistics.fmean(xs), rel=1e-12)
+        assert w.simpangan_baku == pytest.approx(statistics.stdev(xs), rel=1e-9)
+        assert (w.minimum, w.maksimum) == (min(xs), max(xs))
+
+
+def test_welford_data_sedikit():
+    w = Welford()
+    assert w.varians == 0.0
+    w.tambah(42.0)
+    assert (w.n, w.rata, w.varians) == (1, 42.0, 0.0)
+
+
+def test_kuantil_sama_dengan_statistics():
+    xs = _data(501, 2)
+    sketsa = SketsaKuantil()
+    sketsa.tambah_banyak(xs[:100])
+    lain = SketsaKuantil()
+    lain.tambah_banyak(xs[100:])
+    sketsa.gabung(lain)
+    qs = [k / 20 for k in range(1, 20)]
+    harapan = statistics.quantiles(xs, n=20, method="inclusive")
+    assert sketsa.kuantil(*qs) == [round(h, 2) for h in harapan]
+    assert sketsa.kuantil(0, 0.5, 1) == [min(xs), statistics.median(xs), max(xs)]
+
+
+def test_kuantil_interpolasi_dan_kosong():
+    sketsa = SketsaKuantil()
+    assert sketsa.kuantil(0.5) == [None]
+    sketsa.tambah_banyak([10.0, 20.0, 20.0, 40.0])
+    # median di antara peringkat 1 dan 2 (20, 20); P25 di antara 10 dan 20
+    assert sketsa.kuantil(0.25, 0.5, 0.9) == [17.5, 20.0, 34.0]
+    assert sketsa.histogram(50) == [(0, 50, 4), (50, 100, 0)]
+
+
+def test_statistik_kelas_gabung_sama_dengan_satu_rekap():
+    xs = _data(300, 3)
+    n = len(xs)
+    nim = [str(i) for i in range(n)]
+    rekap = RekapKelasKolom.dari_kolom(nim, nim, xs[::-1], xs, xs, xs, xs)
+    utuh = hitung_statistik(rekap).ringkasan()
+    kiri = RekapKelasKolom.dari_kolom(nim[:120], nim[:120], xs[::-1][:120], *[xs[:120]] * 4)
+    kanan = RekapKelasKolom.dari_kolom(nim[120:], nim[120:], xs[::-1][120:], *[xs[120:]] * 4)
+    gabung = StatistikKelas().gabung(hitung_statistik(kiri)).gabung(hitung_statistik(kanan)).ringkasan()
+    assert gabung["predikat"] == utuh["predikat"]
+    assert sum(gabung["predikat"].values()) == n
+    for kolom in ("akhir", "hadir"):
+        for k, v in utuh[kolom].items():
+            assert gabung[kolom][k] == pytest.approx(v, rel=1e-9), (kolom, k)
@@ -0,0 +1,101 @@
+# Tabel per halaman: pindah halaman, urut, cari/saring, dan cetak tanpa terminal
+
+from operator import itemgetter
+
+import pytest
+
+from tracker.tabel import Kolom, TabelHalaman, angka, tampilkan
+
+
+def _rows(n):
+    return [{"nim": str(100 + i), "nama": "Mhs " + str(i), "akhir": float(i % 7)} for i in range(n)]
+
+
+def _tabel(rows, per_halaman=3, **kw):
+    kolom = [Kolom("NIM", itemgetter("nim")), Kolom("Nama", itemgetter("nama")),
+             Kolom("Akhir", itemgetter("akhir"), angka, kanan=True)]
+    return TabelHalaman(rows, kolom, per_halaman=per_halaman, **kw)
+
+
+def _nim(rows):
+    return [r["nim"] for r in rows]
+
+
+@pytest.mark.parametrize("n, halaman", [(0, 1), (1, 1), (3, 1), (4, 2), (10, 4)])
+def test_jumlah_halaman(n, halaman):
+    tabel = _tabel(_rows(n))
+    assert tabel.jumlah_halaman() == halaman
+    semua = [r for no in range(halaman) for r in tabel.halaman(no)]
+    assert semua == _rows(n)
+    assert tabel.halaman(halaman) == []
+    assert tabel.halaman(-1) == []
+
+
+def test_halaman_acak_dan_baris_asli():
+    rows = _rows(10)
+    tabel = _tabel(rows)
+    # lompat ke halaman terakhir dulu, lalu kembali ke halaman awal
+    assert _nim(tabel.halaman(3)) == ["109"]
+    assert _nim(tabel.halaman(1)) == ["103", "104", "105"]
+    # baris yang dikembalikan adalah objek asli, bukan salinan
+    assert tabel.halaman(0)[0] is rows[0]
+
+
+def test_urutkan():
+    tabel = _tabel(_rows(10))
+    tabel.urutkan(itemgetter("akhir"), turun=True)
+    urut = [r for no in range(4) for r in tabel.halaman(no)]
+    assert [r["akhir"] for r in urut] == sorted((r["akhir"] for r in _rows(10)), reverse=True)
+    # sort stabil: nilai sama tetap urut seperti aslinya
+    assert _nim(urut[:2]) == ["106", "105"]
+
+
+def test_cari_dan_saring():
+    tabel = _tabel(_rows(30))
+    tabel.cari("MHS 1")
+    assert tabel.jumlah_halaman() is None
+    cocok = [r for no in range(10) for r in tabel.halaman(no)]
+    assert _nim(cocok) == ["101"] + [str(100 + i) for i in range(10, 20)]
+    assert tabel.jumlah_halaman() == 4
+    tabel.saring(lambda r: r["akhir"] == 6.0)
+    assert _nim(tabel.halaman(0)) == ["106", "113", "120"]
+    assert _nim(tabel.halaman(1)) == ["127"]
+    assert tabel.halaman(2) == []
+    assert tabel.jumlah_halaman() == 2
+    tabel.cari("")
+    assert tabel.jumlah_halaman() == 10
+
+
+def test_lebar_kolom_tidak_menyempit():
+    rows = _rows(5) + [{"nim": "999", "nama": "Nama yang jauh lebih panjang", "akhir": 1.0}]
+    tabel = _tabel(rows, per_halaman=5, lebar=[3, 4, 5])
+    kepala = tabel.teks_halaman(0)[0]
+    panjang = tabel.teks_halaman(1)
+    assert len(panjang[0]) > len(kepala)
+    # kembali ke halaman pertama: kolom tetap selebar halaman terpanjang
+    assert tabel.teks_halaman(0)[0] == panjang[0]
+
+
+def test_tampilkan_tanpa_terminal_cetak_semua():
+    keluar = []
+    tampilkan(_tabel(_rows(10)), masuk=None, keluar=keluar.append, interaktif=False)
+    # satu kepala (judul + garis) lalu semua baris
+    assert len(keluar) == 2 + 10
+    assert keluar[0].split(" | ")[0].strip() == "NIM"
+    assert keluar[-1].startswith("109")
+
+
+def test_tampilkan_interaktif():
+    perintah = iter(["", "u akhir -", "c mhs 9", "q"])
+    keluar = []
+    tampilkan(_tabel(_rows(10)), masuk=lambda _: next(perintah), keluar=keluar.append, interaktif=True)
+    isi = [s for s in keluar if s[:1].isdigit()]
+    # halaman 1, halaman 2, halaman 1 setelah urut turun, lalu hasil cari
+    assert [s.split()[0] for s in isi] == ["100", "101", "102", "103", "104", "105",
+                                           "106", "105", "104", "109"]
+
+
+def test_tampilkan_data_kosong():
+    keluar = []
+    tampilkan(_tabel([]), keluar=keluar.append, interaktif=False)
+    assert keluar == ["(tidak ada data untuk ditampilkan)"]
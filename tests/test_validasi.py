@@ -0,0 +1,74 @@
+# Validasi impor CSV: nomor baris galat harus sesuai file, sel kosong ikut dicatat
+
+import pytest
+
+from tracker.skema_csv import ATT_HEADERS, baca_blok
+from tracker.validasi import ValidasiImpor, validasi_csv
+
+ATT = "student_id,name,week1,week2,week3,week4,week5\n"
+GRD = "student_id,name,quiz,assignment,mid,final\n"
+
+
+def _tulis(tmp_path, att, grd):
+    att_path = tmp_path / "attendance.csv"
+    grd_path = tmp_path / "grades.csv"
+    att_path.write_text(ATT + att, encoding="utf-8")
+    grd_path.write_text(GRD + grd, encoding="utf-8")
+    return att_path, grd_path
+
+
+def _galat(laporan):
+    return [(nama, baris, kolom, pesan) for nama, baris, kolom, _, pesan in laporan.iter_berkas()]
+
+
+def test_data_bersih_tanpa_galat(tmp_path):
+    laporan, n_att, n_grd = validasi_csv(*_tulis(tmp_path, "1,Ani,1,1,1,1,1\n", "1,Ani,80,70,60,90\n"))
+    assert len(laporan) == 0
+    assert (n_att, n_grd) == (1, 1)
+
+
+def test_nomor_baris_setelah_baris_kosong(tmp_path):
+    # baris 3 dan 5 kosong; galat di baris 4 dan 6 (baris 1 = header)
+    att = "1,Ani,1,1,1,1,1\n\n2,Budi,1,x,1,1,1\n\n,Cici,1,1,1,1,1\n"
+    grd = "1,Ani,80,70,60,90\n\n\n2,Budi,80,70,160,90\n"
+    laporan, n_att, n_grd = validasi_csv(*_tulis(tmp_path, att, grd))
+    assert (n_att, n_grd) == (3, 2)
+    assert _galat(laporan) == [
+        ("attendance.csv", 4, "week2", "bukan angka"),
+        ("attendance.csv", 6, "student_id", "NIM kosong"),
+        ("grades.csv", 5, "mid", "di luar 0..100"),
+    ]
+
+
+def test_nomor_baris_antar_blok(tmp_path):
+    # blok kecil: baris kosong di blok pertama tidak boleh menggeser nomor baris blok berikutnya
+    att = "1,Ani,1,1,1,1,1\n\n2,Budi,1,1,1,1,1\n1,Ani lagi,1,1,1,1,1\n"
+    att_path, _ = _tulis(tmp_path, att, "")
+    validasi = ValidasiImpor()
+    for blok in baca_blok(att_path, ATT_HEADERS, validasi.laporan, ukuran_blok=2):
+        validasi.attendance(blok)
+    assert _galat(validasi.laporan) == [("attendance.csv", 5, "student_id", "NIM ganda, baris pertama yang dipakai")]
+
+
+@pytest.mark.parametrize("sel", ["", " "])
+def test_sel_angka_kosong_dicatat(tmp_path, sel):
+    grd = f"1,Ani,80,{sel},60,90\n"
+    laporan, _, _ = validasi_csv(*_tulis(tmp_path, "1,Ani,1,1,1,1,1\n", grd))
+    assert _galat(laporan) == [("grades.csv", 2, "assignment", "kosong, dianggap 0")]
+
+
+def test_baris_pendek_dilengkapi_dan_dicatat(tmp_path):
+    laporan, _, _ = validasi_csv(*_tulis(tmp_path, "1,Ani,1,1,1,1,1\n", "1,Ani,80,70\n"))
+    assert _galat(laporan) == [
+        ("grades.csv", 2, "mid", "kosong, dianggap 0"),
+        ("grades.csv", 2, "final", "kosong, dianggap 0"),
+    ]
+
+
+def test_nama_beda_dan_nim_asing(tmp_path):
+    grd = "1,Ana,80,70,60,90\n9,Zed,80,70,60,90\n2,,80,70,60,90\n"
+    laporan, _, _ = validasi_csv(*_tulis(tmp_path, "1,Ani,1,1,1,1,1\n2,Budi,1,1,1,1,1\n", grd))
+    assert _galat(laporan) == [
+        ("grades.csv", 2, "name", "nama beda dengan attendance.csv (Ani)"),
+        ("grades.csv", 3, "student_id", "NIM tidak ada di attendance.csv"),
+    ]
@@ -1,4 +1,39 @@
-from .mahasiswa import Mahasiswa
-from .penilaian import Penilaian
-from .rekap_kelas import RekapKelas
-from .report import build_markdown_report, save_text, letter_grade, build_html_report
+# Paket tracker. Submodul baru dimuat saat namanya pertama kali dipakai (lihat __getattr__),
+# jadi `import tracker` murah dan tidak menyentuh filesystem.
+
+from importlib import import_module
+
+# nama publik -> submodul asalnya
+_LOKASI = {
+    "Mahasiswa": "mahasiswa",
+    "Penilaian": "penilaian",
+    "RekapKelas": "rekap_kelas",
+    "RekapKelasKolom": "rekap_kolom",
+    "RekapKelasAman": "rekap_aman",
+    "MatriksPresensi": "presensi",
+    "build_markdown_report": "report",
+    "save_text": "report",
+    "letter_grade": "report",
+    "build_html_report": "report",
+    "tulis_markdown_report": "report",
+    "tulis_html_report": "report",
+    "tulis_teks_report": "report",
+    "build_text_report": "report",
+    "simpan_report": "report",
+}
+
+__all__ = list(_LOKASI)
+
+
+def __getattr__(nama):
+    modul = _LOKASI.get(nama)
+    if modul is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nama!r}")
+    nilai = getattr(import_module("." + modul, __name__), nama)
+    # simpan di namespace paket supaya akses berikutnya tidak lewat __getattr__ lagi
+    globals()[nama] = nilai
+    return nilai
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,5 +1,15 @@
-from app import main
+import sys
 
 if __name__ == "__main__":
-    # jalankan main dari app.py
-    main()
+    argv = sys.argv[1:]
+    jurnal_dir = None
+    if len(argv) == 2 and argv[0] == "--jurnal":
+        # menu interaktif dengan jurnal tulis-dulu di folder ini (sama dengan env TRACKER_JURNAL)
+        jurnal_dir, argv = argv[1], []
+    if argv:
+        # ada perintah (import / update-grades / report / stats) -> mode batch
+        from tracker.cli import main as cli_main
+        sys.exit(cli_main(argv))
+    # tanpa argumen: jalankan menu interaktif dari app.py
+    from app import main
+    main(jurnal_dir=jurnal_dir)
@@ -0,0 +1,469 @@
+# Mode batch (non-interaktif) untuk `python -m tracker <perintah>`
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from . import instrumen
+
+# modul lain diimpor di dalam perintah yang memakainya: `stats` dari snapshot
+# tidak perlu memuat parser CSV, dan hanya `report`/`update-grades` yang memuat laporan
+
+# kolom file delta -> argumen ubah_penilaian (nama kolom grades.csv maupun nama komponen)
+KOLOM_DELTA = {
+    "quiz": "quiz",
+    "assignment": "tugas",
+    "mid": "uts",
+    "final": "uas",
+    "tugas": "tugas",
+    "uts": "uts",
+    "uas": "uas",
+}
+# komponen -> kolom di grades.csv
+KOLOM_GRADES = {"quiz": "quiz", "tugas": "assignment", "uts": "mid", "uas": "final"}
+# kolom delta yang boleh ada tetapi tidak mengubah nilai
+KOLOM_DIABAIKAN = ("student_id", "name")
+
+
+class WaktuTahap:
+    """Catat lama setiap tahap (detik) untuk ringkasan throughput di akhir perintah."""
+    def __init__(self):
+        self.tahap = []
+        self._mulai = time.perf_counter()
+        self._awal = self._mulai
+
+    def selesai(self, nama, n=None):
+        """Tutup tahap yang sedang berjalan; n = jumlah baris yang diproses (opsional)."""
+        t = time.perf_counter()
+        self.tahap.append((nama, t - self._mulai, n))
+        if instrumen.AKTIF:
+            instrumen.catat("cli." + nama, t - self._mulai, n)
+        self._mulai = t
+
+    def cetak(self, n_total=None):
+        for nama, detik, n in self.tahap:
+            laju = f"  ({n / detik:,.0f} baris/s)" if n and detik > 0 else ""
+            print(f"  {nama:<16} {detik:>9.3f} s{laju}")
+        total = time.perf_counter() - self._awal
+        laju = f"  ({n_total / total:,.0f} baris/s)" if n_total and total > 0 else ""
+        print(f"  {'total':<16} {total:>9.3f} s{laju}")
+
+
+def _path_data(args):
+    data = Path(args.data)
+    return data / "attendance.csv", data / "grades.csv", data / "rekap.snap"
+
+
+def _penyimpanan(args):
+    """Penyimpanan baru untuk --data / --penyimpanan (satu objek per thread, lihat PenyimpananSQLite)."""
+    from .penyimpanan import buka_penyimpanan
+    return buka_penyimpanan(args.data, args.penyimpanan)
+
+
+def _cetak_galat(laporan, path=None):
+    """Tabel ringkas galat validasi CSV ke stderr; path (opsional): semua galat ke file CSV."""
+    if path:
+        laporan.tulis_csv(path)
+    if len(laporan) == 0:
+        return
+    print(f"! {len(laporan)} masalah di CSV (baris dilewati / sel dianggap 0):", file=sys.stderr)
+    print(laporan.tabel(), file=sys.stderr)
+    if path:
+        print(f"  daftar lengkap: {path}", file=sys.stderr)
+
+
+def _muat(args, waktu, penyimpanan=None):
+    """Muat rekap (CSV: snapshot jika masih valid, jika tidak dari CSV; atau SQLite) dan pasang skema."""
+    tutup = penyimpanan is None
+    if penyimpanan is None:
+        penyimpanan = _penyimpanan(args)
+    if not penyimpanan.ada_data():
+        if args.penyimpanan == "sqlite":
+            raise FileNotFoundError(f"{penyimpanan.path} belum ada, jalankan perintah import dulu")
+        raise FileNotFoundError(f"attendance.csv / grades.csv tidak ada di {args.data}")
+    if args.objek:
+        from .rekap_kelas import RekapKelas as rekap_cls
+    else:
+        from .rekap_kolom import RekapKelasKolom as rekap_cls
+    try:
+        rekap, laporan = penyimpanan.muat(rekap_cls)
+    finally:
+        if tutup:
+            penyimpanan.tutup()
+    if args.penyimpanan == "sqlite":
+        waktu.selesai("muat database", len(rekap))
+    else:
+        waktu.selesai("muat data" if laporan is not None else "muat snapshot", len(rekap))
+    if laporan is not None:
+        _cetak_galat(laporan, getattr(args, "galat", None))
+    skema_path = Path(args.data) / "skema_penilaian.json"
+    if args.skema or skema_path.exists():
+        from .skema_nilai import pilih_skema
+        rekap.pakai_skema(pilih_skema(skema_path, args.skema))
+    return rekap
+
+
+def _nilai(v):
+    """Nilai komponen dari file delta: None jika kosong, ValueError jika tidak valid."""
+    if v is None or (isinstance(v, str) and not v.strip()):
+        return None
+    if isinstance(v, bool):
+        raise ValueError("harus angka")
+    try:
+        x = float(v)
+    except (TypeError, ValueError):
+        raise ValueError("harus angka")
+    if x < 0 or x > 100:
+        raise ValueError("harus antara 0 dan 100")
+    return round(x, 2)
+
+
+def baca_delta(path):
+    """
+    Generator (nomor baris, dict) dari file delta CSV (dengan header) atau JSONL
+    (.jsonl / .ndjson, satu objek per baris). Nomor baris dihitung dari 1 untuk data.
+    """
+    import csv
+    import json
+    p = Path(path)
+    with p.open(encoding="utf-8", newline="") as f:
+        if p.suffix.lower() in (".jsonl", ".ndjson"):
+            for no, line in enumerate(f, start=1):
+                if line.strip():
+                    try:
+                        row = json.loads(line)
+                    except ValueError:
+                        row = None
+                    yield no, row
+        else:
+            for no, row in enumerate(csv.DictReader(f), start=1):
+                yield no, row
+
+
+def kumpulkan_delta(path, rekap, laporan):
+    """
+    Baca dan validasi seluruh file delta sebelum ada yang diubah.
+    Kembalikan (jumlah baris, dict nim -> dict komponen -> nilai); baris untuk NIM
+    yang sama digabung (yang belakangan menang). Galat dicatat di laporan.
+    """
+    perubahan = {}
+    n = 0
+    for no, row in baca_delta(path):
+        n += 1
+        if not isinstance(row, dict):
+            laporan.tambah(no, "", "", "baris bukan objek JSON")
+            continue
+        nim = str(row.get("student_id") or "").strip()
+        if not nim:
+            laporan.tambah(no, "student_id", "", "NIM kosong")
+            continue
+        if nim not in rekap:
+            laporan.tambah(no, "student_id", nim, "NIM tidak ditemukan")
+            continue
+        ubah = {}
+        for kolom, v in row.items():
+            komponen = KOLOM_DELTA.get(kolom)
+            if komponen is None:
+                if kolom not in KOLOM_DIABAIKAN:
+                    laporan.tambah(no, kolom, v, "kolom tidak dikenal")
+                continue
+            try:
+                x = _nilai(v)
+            except ValueError as e:
+                laporan.tambah(no, kolom, v, str(e))
+                continue
+            if x is not None:
+                ubah[komponen] = x
+        if ubah:
+            perubahan.setdefault(nim, {}).update(ubah)
+    return n, perubahan
+
+
+# ---------- perintah ----------
+def cmd_import(args):
+    """
+    Bangun ulang dari CSV. csv: abaikan snapshot lama dan tulis snapshot baru.
+    sqlite: migrasi attendance.csv + grades.csv ke <data>/tracker.db (isi lama diganti).
+    """
+    waktu = WaktuTahap()
+    att_path, grd_path, snap_path = _path_data(args)
+    if args.penyimpanan == "sqlite":
+        from .skema_csv import LaporanGalat
+        if not att_path.exists() or not grd_path.exists():
+            raise FileNotFoundError(f"attendance.csv / grades.csv tidak ada di {args.data}")
+        penyimpanan = _penyimpanan(args)
+        laporan = LaporanGalat()
+        try:
+            n_att, n_grd = penyimpanan.migrasi_dari_csv(att_path, grd_path, laporan)
+            waktu.selesai("migrasi CSV", n_att + n_grd)
+            n = penyimpanan.jumlah()
+        finally:
+            penyimpanan.tutup()
+        _cetak_galat(laporan, args.galat)
+        print(f"import: {n} mahasiswa dari {args.data} ke {penyimpanan.path} "
+              f"({n_att} baris presensi, {n_grd} baris nilai)")
+        waktu.cetak(n_att + n_grd)
+        return 0
+    if snap_path.exists():
+        snap_path.unlink()
+    rekap = _muat(args, waktu)
+    print(f"import: {len(rekap)} mahasiswa dari {args.data}, snapshot {snap_path}")
+    waktu.cetak(len(rekap))
+    return 0
+
+
+def cmd_validasi(args):
+    """Validasi attendance.csv + grades.csv tanpa memuat apa pun; kode keluar 1 jika ada galat."""
+    from .validasi import validasi_csv
+    waktu = WaktuTahap()
+    att_path, grd_path, _ = _path_data(args)
+    if not att_path.exists() or not grd_path.exists():
+        raise FileNotFoundError(f"attendance.csv / grades.csv tidak ada di {args.data}")
+    laporan, n_att, n_grd = validasi_csv(att_path, grd_path)
+    waktu.selesai("validasi", n_att + n_grd)
+    if args.galat:
+        laporan.tulis_csv(args.galat)
+    if args.json:
+        import json
+        print(json.dumps({
+            "baris_attendance": n_att,
+            "baris_grades": n_grd,
+            "galat": len(laporan),
+            "jenis": laporan.per_jenis(),
+        }, indent=2))
+        return 1 if len(laporan) else 0
+    print(f"validasi: {n_att} baris attendance, {n_grd} baris grades, {len(laporan)} galat")
+    if len(laporan):
+        print(laporan.tabel())
+    waktu.cetak(n_att + n_grd)
+    return 1 if len(laporan) else 0
+
+
+def cmd_update_grades(args):
+    """Terapkan file delta nilai dalam satu transaksi: validasi semua, lalu tulis sekali."""
+    penyimpanan = _penyimpanan(args)
+    try:
+        return _update_grades(args, penyimpanan)
+    finally:
+        penyimpanan.tutup()
+
+
+def _update_grades(args, penyimpanan):
+    from .report import simpan_report
+    from .skema_csv import LaporanGalat
+    waktu = WaktuTahap()
+    rekap = _muat(args, waktu, penyimpanan)
+    laporan = LaporanGalat()
+    n, perubahan = kumpulkan_delta(args.dari, rekap, laporan)
+    waktu.selesai("baca delta", n)
+    if len(laporan) > 0:
+        print(f"! {len(laporan)} galat di {args.dari}, tidak ada yang diubah:", file=sys.stderr)
+        print(laporan.ringkas(), file=sys.stderr)
+        return 1
+    if args.dry_run:
+        print(f"update-grades (dry run): {n} baris delta valid, {len(perubahan)} NIM akan diubah")
+        waktu.cetak(n)
+        return 0
+
+    for nim, ubah in perubahan.items():
+        rekap.ubah_penilaian(nim, **ubah)
+    waktu.selesai("terapkan", len(perubahan))
+
+    # csv: grades.csv ditulis ulang satu kali; sqlite: satu transaksi executemany.
+    # NIM yang belum punya baris nilai ditambahkan
+    kolom = {nim: {KOLOM_GRADES[k]: v for k, v in ubah.items()} for nim, ubah in perubahan.items()}
+    baru = penyimpanan.ubah_nilai_banyak(kolom, rekap.nama_mahasiswa)
+    waktu.selesai("tulis " + ("database" if args.penyimpanan == "sqlite" else "grades.csv"), len(perubahan))
+
+    if args.penyimpanan != "sqlite":
+        penyimpanan.simpan_cache(rekap)
+        waktu.selesai("tulis snapshot", len(rekap))
+    if not args.tanpa_laporan:
+        out = simpan_report(Path(args.out) / "report.md", rekap.iter_export(), skema=rekap.skema)
+        waktu.selesai("tulis laporan", len(rekap))
+        print(f"Laporan: {out}")
+    print(f"update-grades: {n} baris delta, {len(perubahan)} NIM diubah ({baru} baris nilai baru)")
+    waktu.cetak(n)
+    return 0
+
+
+def cmd_report(args):
+    """Tulis laporan sekali ke file (format dari --format atau ekstensi --output)."""
+    from .report import simpan_report
+    waktu = WaktuTahap()
+    rekap = _muat(args, waktu)
+    out = args.output
+    if out is None:
+        out = Path(args.out) / ("report." + (args.format or "md") + (".gz" if args.gz else ""))
+    p = simpan_report(out, rekap.iter_export(), fmt=args.format, gz=args.gz or None, skema=rekap.skema)
+    waktu.selesai("tulis laporan", len(rekap))
+    print(f"report: {len(rekap)} mahasiswa -> {p}")
+    waktu.cetak(len(rekap))
+    return 0
+
+
+def cmd_stats(args):
+    """Cetak statistik kelas (teks atau JSON)."""
+    from .statistik import baris_distribusi, baris_ringkasan, hitung_statistik
+    # dicek sebelum memuat data (sama seperti parameter lebar di server)
+    if not args.lebar > 0:
+        raise ValueError("--lebar harus > 0")
+    waktu = WaktuTahap()
+    rekap = _muat(args, waktu)
+    stat = hitung_statistik(rekap)
+    waktu.selesai("statistik", len(rekap))
+    if args.json:
+        hasil = stat.ringkasan()
+        import json
+        hasil["histogram_akhir"] = stat.akhir.sketsa.histogram(args.lebar)
+        print(json.dumps(hasil, indent=2))
+        return 0
+    print(f"{'Statistik':<16} {'Nilai Akhir':>12} {'Hadir (%)':>12}")
+    for label, akhir, hadir in baris_ringkasan(stat):
+        print(f"{label:<16} {akhir:>12} {hadir:>12}")
+    print()
+    print(f"{'Predikat':<16} {'Jumlah':>12} {'Persen':>12}")
+    for huruf, c, persen in baris_distribusi(stat):
+        print(f"{huruf:<16} {c:>12} {persen:>12}")
+    print()
+    print("Histogram nilai akhir:")
+    for lo, hi, c in stat.akhir.sketsa.histogram(args.lebar):
+        print(f"  {lo:>5g}-{hi:<5g} {c:>8}")
+    print()
+    waktu.cetak(len(rekap))
+    return 0
+
+
+def cmd_absen(args):
+    """Daftar mahasiswa yang tidak hadir beberapa sesi berturut-turut (dari bitset presensi)."""
+    waktu = WaktuTahap()
+    penyimpanan = _penyimpanan(args)
+    try:
+        presensi = penyimpanan.muat_presensi()
+    finally:
+        penyimpanan.tutup()
+    waktu.selesai("muat presensi", len(presensi))
+    if args.terakhir:
+        nims = presensi.absen_terakhir(args.beruntun)
+    else:
+        nims = presensi.absen_beruntun(args.beruntun)
+    waktu.selesai("cari absen", len(presensi))
+    if args.json:
+        import json
+        print(json.dumps({
+            "sesi": presensi.sesi,
+            "beruntun": args.beruntun,
+            "terakhir": args.terakhir,
+            "mahasiswa": [{"nim": nim, "nama": presensi.nama_mahasiswa(nim)} for nim in nims],
+        }, indent=2))
+        return 0
+    kapan = "di sesi terakhir" if args.terakhir else "berturut-turut"
+    print(f"absen: {len(nims)} dari {len(presensi)} mahasiswa tidak hadir {args.beruntun} sesi {kapan} "
+          f"({presensi.jumlah_sesi} sesi)")
+    for nim in nims:
+        print(f"  {nim:<14} {presensi.nama_mahasiswa(nim)}")
+    waktu.cetak(len(presensi))
+    return 0
+
+
+def cmd_serve(args):
+    """Layani rekap lewat HTTP/JSON lokal (lihat tracker.server) sampai Ctrl+C."""
+    import asyncio
+    from . import snapshot_biner
+    from .server import Layanan, hangatkan, layani
+    waktu = WaktuTahap()
+    rekap = _muat(args, waktu)
+    # muat ulang berjalan di thread lain, jadi _muat membuka penyimpanan baru setiap kali
+    sumber = tuple(_penyimpanan(args).sumber()) + (Path(args.data) / "skema_penilaian.json",)
+    layanan = Layanan(
+        rekap,
+        muat=lambda: _muat(args, WaktuTahap()),
+        sidik=lambda: snapshot_biner.sidik_sumber(sumber),
+    )
+    # indeks + kueri berat dihitung sekarang supaya permintaan pertama tidak menanggungnya
+    layanan.pasang(rekap, hangatkan(rekap))
+    waktu.selesai("hangatkan", len(rekap))
+    try:
+        asyncio.run(layani(layanan, args.host, args.port, args.pantau or None))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def buat_parser():
+    ap = argparse.ArgumentParser(
+        prog="python -m tracker",
+        description="Student Performance Tracker, mode batch. Tanpa perintah: menu interaktif.",
+    )
+    ap.add_argument("--data", default="data", help="folder attendance.csv / grades.csv (default: data)")
+    ap.add_argument("--out", default="out", help="folder laporan (default: out)")
+    ap.add_argument("--skema", help="nama skema di <data>/skema_penilaian.json")
+    ap.add_argument("--objek", action="store_true", help="pakai RekapKelas (default: RekapKelasKolom)")
+    ap.add_argument("--penyimpanan", choices=("csv", "sqlite"), default="csv",
+                    help="csv (attendance.csv + grades.csv, default) atau sqlite (<data>/tracker.db)")
+    ap.add_argument("--instrumen", metavar="JSON",
+                    help="tulis laporan waktu per tahap + penghitung ke file JSON ('-' = stderr); "
+                         "juga lewat env TRACKER_INSTRUMEN")
+    ap.add_argument("--profil", metavar="PROF",
+                    help="dump cProfile ke file (lihat dengan python -m pstats); juga lewat env TRACKER_PROFIL")
+    sub = ap.add_subparsers(dest="perintah", metavar="PERINTAH")
+    sub.required = True
+
+    p = sub.add_parser("import", help="muat ulang CSV dan tulis snapshot baru (sqlite: migrasi CSV ke database)")
+    p.add_argument("--galat", metavar="CSV", help="tulis semua galat validasi (file, baris, kolom, nilai, pesan) ke CSV")
+    p.set_defaults(fungsi=cmd_import)
+
+    p = sub.add_parser("validasi", help="cek attendance.csv + grades.csv (NIM kosong/ganda, nama beda, "
+                                        "bukan angka, di luar 0..100) tanpa memuat")
+    p.add_argument("--json", action="store_true", help="keluaran JSON (tabel ringkas per jenis galat)")
+    p.add_argument("--galat", metavar="CSV", help="tulis semua galat ke CSV")
+    p.set_defaults(fungsi=cmd_validasi)
+
+    p = sub.add_parser("update-grades", help="terapkan file delta nilai (CSV/JSONL) dalam satu transaksi")
+    p.add_argument("--from", dest="dari", required=True, help="file delta .csv atau .jsonl")
+    p.add_argument("--dry-run", action="store_true", help="hanya validasi, tidak menulis apa pun")
+    p.add_argument("--tanpa-laporan", action="store_true", help="jangan tulis out/report.md")
+    p.set_defaults(fungsi=cmd_update_grades)
+
+    p = sub.add_parser("report", help="tulis laporan md/html/txt")
+    p.add_argument("--format", choices=("md", "html", "txt"), help="default dari ekstensi --output (md)")
+    p.add_argument("--output", help="path laporan (default: <out>/report.<format>)")
+    p.add_argument("--gz", action="store_true", help="kompres gzip")
+    p.set_defaults(fungsi=cmd_report)
+
+    p = sub.add_parser("stats", help="statistik kelas dan distribusi predikat")
+    p.add_argument("--json", action="store_true", help="keluaran JSON")
+    p.add_argument("--lebar", type=float, default=10, help="lebar kelompok histogram (default 10)")
+    p.set_defaults(fungsi=cmd_stats)
+
+    p = sub.add_parser("absen", help="mahasiswa yang tidak hadir N sesi berturut-turut")
+    p.add_argument("--beruntun", type=int, default=3, help="jumlah sesi berturut-turut (default 3)")
+    p.add_argument("--terakhir", action="store_true", help="hanya hitung N sesi terakhir (peringatan dini)")
+    p.add_argument("--json", action="store_true", help="keluaran JSON")
+    p.set_defaults(fungsi=cmd_absen)
+
+    p = sub.add_parser("serve", help="layanan HTTP/JSON lokal (per NIM, rekap, filter, statistik)")
+    p.add_argument("--host", default="127.0.0.1", help="alamat (default 127.0.0.1)")
+    p.add_argument("--port", type=int, default=8080, help="port (default 8080, 0 = port bebas)")
+    p.add_argument("--pantau", type=float, default=2.0,
+                   help="detik antar cek perubahan CSV untuk muat ulang otomatis (0 = mati, default 2)")
+    p.set_defaults(fungsi=cmd_serve)
+    return ap
+
+
+def main(argv=None):
+    import sqlite3
+    args = buat_parser().parse_args(argv)
+    # instrumentasi mati kecuali diminta lewat argumen atau env
+    instrumen.dari_env()
+    if args.instrumen or args.profil:
+        instrumen.aktifkan(args.instrumen, args.profil)
+    try:
+        return args.fungsi(args)
+    except (OSError, KeyError, ValueError, sqlite3.Error) as e:
+        # FileNotFoundError termasuk OSError; sqlite3.Error dari --penyimpanan sqlite
+        print(f"! {e}", file=sys.stderr)
+        return 2
+    finally:
+        instrumen.selesai()
@@ -0,0 +1,148 @@
+# Banyak kelas/semester sekaligus: satu RekapKelasKolom per folder, dimuat paralel
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+
+from .ingest import bootstrap
+from .rekap_kolom import RekapKelasKolom
+from .report import simpan_report
+from .skema_csv import LaporanGalat
+from .skema_nilai import SKEMA_STANDAR
+from .statistik import StatistikKelas, hitung_statistik
+
+
+def cari_kelas(root):
+    """
+    Cari semua folder kelas di bawah root (misal root/2024-ganjil/IF-A/).
+    Folder dianggap kelas jika berisi attendance.csv dan grades.csv.
+    Kembalikan list (nama_kelas, path_folder) urut berdasarkan nama.
+    """
+    root = Path(root)
+    out = []
+    for att in root.rglob("attendance.csv"):
+        folder = att.parent
+        if (folder / "grades.csv").exists():
+            nama = folder.relative_to(root).as_posix()
+            out.append((nama if nama != "." else folder.name, folder))
+    out.sort()
+    return out
+
+
+def _muat_shard(folder, skema=SKEMA_STANDAR):
+    """
+    Dijalankan di proses worker: muat satu kelas dan hitung skornya.
+    Hasilnya hanya kolom (list/array) supaya murah di-pickle balik ke proses utama.
+    """
+    folder = Path(folder)
+    rekap = RekapKelasKolom()
+    laporan = LaporanGalat()
+    try:
+        bootstrap(rekap, folder / "attendance.csv", folder / "grades.csv", laporan)
+    except Exception as e:
+        # exception dari worker tidak membawa nama kelas; tambahkan folder-nya di pesan
+        raise ValueError(f"kelas {folder}: {type(e).__name__}: {e}") from e
+    kolom = [list(k) for k in zip(*rekap.iter_komponen())] or [[] for _ in range(7)]
+    nim, nama, hadir, quiz, tugas, uts, uas = kolom
+    akhir, pred = skema.hitung_kelas(quiz, tugas, uts, uas)
+    return {
+        "kolom": (nim, nama, hadir, quiz, tugas, uts, uas),
+        "akhir": akhir,
+        "pred": pred,
+        "galat": list(laporan.iter_berkas()),
+    }
+
+
+class RekapFakultas:
+    """
+    Wadah banyak RekapKelasKolom, satu per kelas (shard).
+    muat() memuat dan menskor setiap shard di ProcessPoolExecutor, lalu
+    rekap()/iter_export() menggabungkan hasilnya dengan kolom 'kelas'.
+    """
+    def __init__(self, skema=SKEMA_STANDAR):
+        # skema penilaian untuk semua kelas (lihat tracker.skema_nilai); dicek di sini
+        # seperti pakai_skema, bukan baru gagal di worker saat memuat
+        if not skema.standar:
+            raise ValueError(f"skema {skema.nama}: RekapFakultas hanya menyimpan quiz, tugas, uts, uas")
+        self.skema = skema
+        # nama kelas -> RekapKelasKolom
+        self.kelas = {}
+        # nama kelas -> list galat (file, baris, kolom, nilai, pesan) saat memuat CSV
+        self.galat = {}
+
+    def __len__(self):
+        return sum(len(r) for r in self.kelas.values())
+
+    def tambah_kelas(self, nama, rekap):
+        """Daftarkan rekap satu kelas secara manual."""
+        if nama in self.kelas:
+            raise KeyError("kelas sudah terdaftar: " + str(nama))
+        self.kelas[nama] = rekap
+
+    def muat(self, root, max_workers=None):
+        """
+        Muat semua folder kelas di bawah root secara paralel.
+        max_workers=1 memuat berurutan di proses ini (tanpa pool).
+        Kembalikan jumlah kelas yang dimuat.
+        """
+        daftar = [(nama, folder) for nama, folder in cari_kelas(root) if nama not in self.kelas]
+        if not daftar:
+            return 0
+        if max_workers is None:
+            max_workers = min(len(daftar), os.cpu_count() or 1)
+        folders = [str(folder) for _, folder in daftar]
+        if max_workers <= 1 or len(daftar) == 1:
+            hasil = map(_muat_shard, folders, repeat(self.skema))
+            self._terima(daftar, hasil)
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                # chunksize > 1 supaya ratusan kelas kecil tidak jadi ratusan round-trip
+                chunk = max(1, len(folders) // (max_workers * 4))
+                self._terima(daftar, pool.map(_muat_shard, folders, repeat(self.skema, len(folders)),
+                                              chunksize=chunk))
+        return len(daftar)
+
+    def _terima(self, daftar, hasil):
+        for (nama, _), h in zip(daftar, hasil):
+            rekap = RekapKelasKolom.dari_kolom(*h["kolom"], akhir=h["akhir"], pred=h["pred"])
+            # skor sudah dihitung worker dengan skema ini (sudah dicek di __init__),
+            # jadi cukup dipasang tanpa pakai_skema yang menghitung ulang
+            rekap.skema = self.skema
+            self.kelas[nama] = rekap
+            self.galat[nama] = h["galat"]
+
+    def rekap(self):
+        """Gabungan rekap semua kelas; setiap baris punya kunci tambahan 'kelas'."""
+        out = []
+        for nama, r in self.kelas.items():
+            for row in r.rekap():
+                row['kelas'] = nama
+                out.append(row)
+        return out
+
+    def iter_export(self):
+        """Generator record report dari semua kelas (dengan kunci tambahan 'kelas')."""
+        for nama, r in self.kelas.items():
+            for rec in r.iter_export():
+                rec['kelas'] = nama
+                yield rec
+
+    def export_for_report(self):
+        """Bentuk data gabungan yang cocok untuk report builder (markdown/html)."""
+        return list(self.iter_export())
+
+    def statistik(self):
+        """
+        Statistik gabungan semua kelas + dict nama kelas -> StatistikKelas.
+        Statistik per kelas dihitung sekali lalu digabung, tanpa mengurutkan ulang data gabungan.
+        """
+        per_kelas = {nama: hitung_statistik(r) for nama, r in self.kelas.items()}
+        total = StatistikKelas(self.skema.huruf)
+        for stat in per_kelas.values():
+            total.gabung(stat)
+        return total, per_kelas
+
+    def simpan_laporan(self, path):
+        """Tulis laporan gabungan semua kelas (format dari ekstensi path)."""
+        return simpan_report(path, self.iter_export(), skema=self.skema)
@@ -0,0 +1,162 @@
+# Indeks sekunder terurut (bisect) untuk query rentang nilai akhir / persen hadir
+
+from bisect import bisect_left, insort
+from math import inf, nextafter
+
+
+class IndeksTerurut:
+    """
+    List (kunci, nim) yang selalu terurut + dict nim -> kunci.
+    Cari rentang O(log n + k); ubah satu kunci O(log n) pencarian
+    ditambah pergeseran list (memmove di level C).
+    """
+    def __init__(self):
+        self._pasangan = []
+        self._kunci = {}
+
+    def __len__(self):
+        return len(self._pasangan)
+
+    def bangun(self, items):
+        """Bangun ulang seluruh indeks dari iterable (nim, kunci) dengan satu kali sort."""
+        self._kunci = dict(items)
+        self._pasangan = sorted((k, nim) for nim, k in self._kunci.items())
+
+    def set(self, nim, kunci):
+        """Pasang/ubah kunci untuk satu NIM."""
+        lama = self._kunci.get(nim)
+        if lama is not None:
+            if lama == kunci:
+                return
+            del self._pasangan[bisect_left(self._pasangan, (lama, nim))]
+        insort(self._pasangan, (kunci, nim))
+        self._kunci[nim] = kunci
+
+    def hapus(self, nim):
+        """Buang NIM dari indeks (tidak apa-apa jika tidak ada)."""
+        lama = self._kunci.pop(nim, None)
+        if lama is not None:
+            del self._pasangan[bisect_left(self._pasangan, (lama, nim))]
+
+    def _posisi(self, lo, hi, inklusif_hi):
+        a = 0 if lo is None else bisect_left(self._pasangan, (lo,))
+        if hi is None:
+            b = len(self._pasangan)
+        else:
+            # (x,) lebih kecil dari semua (x, nim), jadi untuk batas inklusif geser ke float berikutnya
+            b = bisect_left(self._pasangan, (nextafter(hi, inf) if inklusif_hi else hi,))
+        return a, b
+
+    def rentang(self, lo=None, hi=None, inklusif_hi=False):
+        """List (kunci, nim) dengan lo <= kunci < hi (atau <= hi jika inklusif_hi), urut naik."""
+        a, b = self._posisi(lo, hi, inklusif_hi)
+        return self._pasangan[a:b]
+
+    def hitung(self, lo=None, hi=None, inklusif_hi=False):
+        """Jumlah entri di rentang, O(log n)."""
+        a, b = self._posisi(lo, hi, inklusif_hi)
+        return max(0, b - a)
+
+    def terkecil(self, k):
+        """k entri dengan kunci terkecil, urut naik."""
+        return self._pasangan[:max(0, k)]
+
+    def terbesar(self, k):
+        """k entri dengan kunci terbesar, urut turun."""
+        if k <= 0:
+            return []
+        return self._pasangan[:-k - 1:-1]
+
+
+class KueriIndeksMixin:
+    """
+    Query di atas indeks nilai akhir dan persen hadir.
+
+    Indeks baru dibangun saat query pertama (rekap yang tidak pernah di-query
+    tidak membayar apa pun). Setelah itu setiap perubahan menandai kuncinya di
+    _kotor_idx, dan query berikutnya hanya memperbarui kunci-kunci tersebut.
+    Kelas pemakai wajib menyediakan atribut _idx_akhir, _idx_hadir, _kotor_idx, versi
+    (awal: None, None, set(), 0) dan skema, serta _segarkan(), _kunci_indeks(kunci) yang
+    menghasilkan (nim, akhir, hadir) (kunci None = semua), dan _baris_rekap(nim).
+    """
+    def _tandai_indeks(self, kunci):
+        """Dipanggil setiap kali hadir/nilai berubah; tidak ada biaya sebelum indeks dibangun."""
+        self.versi += 1
+        if self._idx_akhir is not None:
+            self._kotor_idx.add(kunci)
+
+    def _segarkan_indeks(self):
+        self._segarkan()
+        kotor = self._kotor_idx
+        # banyak perubahan sekaligus (misal setelah import) lebih murah dibangun ulang dengan sort
+        if self._idx_akhir is None or len(kotor) * 8 > len(self):
+            rows = list(self._kunci_indeks(None))
+            self._idx_akhir = IndeksTerurut()
+            self._idx_akhir.bangun((nim, akhir) for nim, akhir, _ in rows)
+            self._idx_hadir = IndeksTerurut()
+            self._idx_hadir.bangun((nim, hadir) for nim, _, hadir in rows)
+        elif kotor:
+            for nim, akhir, hadir in self._kunci_indeks(kotor):
+                self._idx_akhir.set(nim, akhir)
+                self._idx_hadir.set(nim, hadir)
+        kotor.clear()
+
+    def data_mahasiswa(self, nim):
+        """Satu baris rekap (nim, nama, hadir, akhir, predikat) untuk NIM tertentu."""
+        if nim not in self:
+            raise KeyError("NIM tidak ditemukan")
+        self._segarkan()
+        return self._baris_rekap(nim)
+
+    def _baris_dari(self, pasangan):
+        return [self._baris_rekap(nim) for _, nim in pasangan]
+
+    def rentang_akhir(self, lo=None, hi=None, inklusif_hi=False):
+        """Mahasiswa dengan lo <= nilai akhir < hi, urut dari nilai terkecil."""
+        self._segarkan_indeks()
+        return self._baris_dari(self._idx_akhir.rentang(lo, hi, inklusif_hi))
+
+    def rentang_hadir(self, lo=None, hi=None, inklusif_hi=False):
+        """Mahasiswa dengan lo <= persen hadir < hi, urut dari yang terkecil."""
+        self._segarkan_indeks()
+        return self._baris_dari(self._idx_hadir.rentang(lo, hi, inklusif_hi))
+
+    def per_predikat(self, huruf):
+        """Mahasiswa dengan predikat tertentu (A..E), lewat rentang nilai akhir."""
+        lo, hi = self.skema.rentang(huruf)
+        return self.rentang_akhir(lo, hi)
+
+    def distribusi_predikat(self):
+        """Jumlah mahasiswa per predikat, O(log n) per huruf."""
+        self._segarkan_indeks()
+        out = {}
+        for huruf in self.skema.huruf[::-1]:
+            lo, hi = self.skema.rentang(huruf)
+            out[huruf] = self._idx_akhir.hitung(lo, hi)
+        return out
+
+    def teratas(self, k):
+        """k mahasiswa dengan nilai akhir tertinggi."""
+        self._segarkan_indeks()
+        return self._baris_dari(self._idx_akhir.terbesar(k))
+
+    def terbawah(self, k):
+        """k mahasiswa dengan nilai akhir terendah."""
+        self._segarkan_indeks()
+        return self._baris_dari(self._idx_akhir.terkecil(k))
+
+    def berisiko(self, batas_akhir=70.0, batas_hadir=75.0):
+        """
+        Mahasiswa dengan nilai akhir < batas_akhir DAN hadir < batas_hadir.
+        Rentang yang lebih kecil dari kedua indeks dipakai sebagai kandidat, lalu
+        disaring dengan kunci di indeks lainnya (O(log n + min(k1, k2))).
+        """
+        self._segarkan_indeks()
+        ia, ih = self._idx_akhir, self._idx_hadir
+        if ia.hitung(None, batas_akhir) <= ih.hitung(None, batas_hadir):
+            kandidat = ia.rentang(None, batas_akhir)
+            hasil = [(k, nim) for k, nim in kandidat if ih._kunci[nim] < batas_hadir]
+        else:
+            kandidat = ih.rentang(None, batas_hadir)
+            hasil = sorted((ia._kunci[nim], nim) for _, nim in kandidat if ia._kunci[nim] < batas_akhir)
+        return self._baris_dari(hasil)
@@ -0,0 +1,180 @@
+# Muat CSV attendance/grades ke RekapKelas secara streaming (generator)
+
+import csv
+from array import array
+from itertools import compress, repeat
+from math import inf
+from operator import not_
+from pathlib import Path
+
+from . import instrumen
+from .mahasiswa import Mahasiswa
+from .presensi import kolom_sesi
+from .skema_csv import ATT_HEADERS, GRD_HEADERS, baca_blok, ke_angka, persen_hadir_kolom
+from .validasi import ValidasiImpor
+
+
+def iter_csv(path):
+    """
+    Baca CSV baris per baris sebagai dict (generator).
+    File hanya dibaca sekali dan tidak pernah ditampung utuh di memori.
+    Jika file tidak ada, generator langsung selesai.
+    """
+    p = Path(path)
+    if not p.exists():
+        return
+    with p.open(encoding="utf-8", newline="") as f:
+        for r in csv.DictReader(f):
+            yield r
+
+
+def calculate_attendance_percent_from_row(row):
+    """Hitung persen hadir dari kolom sesi (week1..weekN) satu baris (dict)."""
+    weeks = kolom_sesi(row)
+    if len(weeks) == 0:
+        return 0.0
+    present = 0
+    for w in weeks:
+        # kosong/tidak valid dianggap tidak hadir; '1.0' atau '1' dianggap hadir
+        v = ke_angka((row.get(w) or "").strip())
+        if 1.0 <= abs(v) < inf:
+            present += 1
+    return round(present / len(weeks) * 100.0, 2)
+
+
+def stream_attendance(path, on_row=None, laporan=None, validasi=None):
+    """
+    Generator (nim, nama, persen_hadir) dari attendance.csv.
+    Setiap blok divalidasi per kolom (ValidasiImpor); baris yang ditolak tidak di-yield.
+    """
+    if validasi is None:
+        validasi = ValidasiImpor(laporan)
+    for blok in baca_blok(path, ATT_HEADERS, validasi.laporan, on_row, tambahan=kolom_sesi):
+        pakai = validasi.attendance(blok)
+        baris = zip(blok["student_id"], blok["name"], persen_hadir_kolom(blok))
+        yield from baris if pakai is None else compress(baris, pakai)
+
+
+def stream_grades(path, on_row=None, laporan=None, validasi=None):
+    """Generator (nim, nama, quiz, assignment, mid, final) dari grades.csv (tervalidasi per kolom)."""
+    if validasi is None:
+        validasi = ValidasiImpor(laporan)
+    for blok in baca_blok(path, GRD_HEADERS, validasi.laporan, on_row):
+        pakai = validasi.grades(blok, GRD_HEADERS[2:])
+        kolom = [blok[h] if h in blok.kolom else repeat(0.0) for h in GRD_HEADERS[2:]]
+        baris = zip(blok["student_id"], blok["name"], *kolom)
+        yield from baris if pakai is None else compress(baris, pakai)
+
+
+def muat_attendance(rekap, path, on_row=None, hanya_baru=False, laporan=None, validasi=None):
+    """
+    Masukkan attendance.csv ke rekap dalam satu kali baca.
+    hanya_baru=True: setiap NIM dianggap baru (langsung tambah_mahasiswa), seperti saat
+    bootstrap; NIM ganda sudah dibuang oleh validasi. on_row dipanggil untuk setiap
+    baris mentah (misal untuk ditampilkan).
+    Sel yang bukan angka dianggap 0; semua masalah dicatat di laporan (LaporanGalat).
+    """
+    n = 0
+    for nim, nama, persen in stream_attendance(path, on_row, laporan, validasi):
+        if hanya_baru or nim not in rekap:
+            rekap.tambah_mahasiswa(Mahasiswa(nim, nama))
+        rekap.ubah_hadir(nim, persen)
+        n += 1
+    return n
+
+
+def muat_grades(rekap, path, on_row=None, tambah_baru=True, laporan=None, validasi=None):
+    """
+    Masukkan grades.csv ke rekap dalam satu kali baca.
+    NIM yang belum ada ditambahkan (tambah_baru=True) atau dilewati (False).
+    Rekap sendiri dipakai sebagai indeks join, jadi tidak ada dict perantara.
+    Nilai di luar 0..100 dianggap 0 dan dicatat di laporan, tidak menghentikan impor.
+    """
+    n = 0
+    for nim, nama, q, a, m, f in stream_grades(path, on_row, laporan, validasi):
+        if nim not in rekap:
+            if not tambah_baru:
+                continue
+            rekap.tambah_mahasiswa(Mahasiswa(nim, nama or nim))
+        rekap.ubah_penilaian(nim, quiz=q, tugas=a, uts=m, uas=f)
+        n += 1
+    return n
+
+
+def _hadir_kolom(path, validasi):
+    """Validasi attendance.csv per blok; kembalikan array persen hadir baris yang dipakai."""
+    hadir = array('d')
+    for blok in baca_blok(path, ATT_HEADERS, validasi.laporan, tambahan=kolom_sesi):
+        pakai = validasi.attendance(blok)
+        persen = persen_hadir_kolom(blok)
+        hadir.extend(persen if pakai is None else compress(persen, pakai))
+    return hadir
+
+
+def _bulat_2(sel):
+    """
+    Bulatkan kolom ke 2 desimal seperti setter Penilaian. Hanya sel yang bukan
+    bilangan bulat (float.is_integer, di level C) yang dibulatkan satu per satu.
+    """
+    for i in compress(range(len(sel)), map(not_, map(float.is_integer, sel))):
+        sel[i] = round(sel[i], 2)
+    return sel
+
+
+def _nilai_kolom(path, validasi, n):
+    """
+    Validasi grades.csv per blok dan gabungkan ke n baris attendance lewat
+    validasi.posisi (NIM asing dilewati, NIM ganda: baris terakhir menang).
+    Kembalikan 4 array (quiz, assignment, mid, final) yang sejajar dengan attendance.
+    """
+    hasil = [array('d', bytes(8 * n)) for _ in GRD_HEADERS[2:]]
+    for blok in baca_blok(path, GRD_HEADERS, validasi.laporan):
+        validasi.grades(blok, GRD_HEADERS[2:])
+        pos = validasi.posisi(blok["student_id"])
+        # kolom yang tidak ada di file tetap 0
+        pasangan = [(tujuan, _bulat_2(blok[h])) for tujuan, h in zip(hasil, GRD_HEADERS[2:]) if h in blok.kolom]
+        if -1 in pos:
+            # NIM asing / kosong (posisi -1) dilewati
+            ada = list(map((-1).__ne__, pos))
+            pos = list(compress(pos, ada))
+            pasangan = [(tujuan, array('d', compress(sel, ada))) for tujuan, sel in pasangan]
+        if not pos:
+            continue
+        a = pos[0]
+        if pos == list(range(a, a + len(pos))):
+            # urutan grades sama dengan attendance: salin per potongan di level C
+            for tujuan, sel in pasangan:
+                tujuan[a:a + len(pos)] = sel
+            continue
+        for tujuan, sel in pasangan:
+            for p, v in zip(pos, sel):
+                tujuan[p] = v
+    return hasil
+
+
+def bootstrap(rekap, att_path, grd_path, laporan=None):
+    """
+    Isi rekap dari attendance.csv lalu gabungkan grades.csv berdasarkan student_id.
+    Satu ValidasiImpor dipakai untuk kedua file, jadi nama di grades.csv ikut
+    dicocokkan dengan attendance.csv. Kembalikan laporan (LaporanGalat).
+
+    Rekap kosong tanpa jurnal (kasus biasa) diisi sekaligus lewat rekap.isi_kolom:
+    kolom sudah tervalidasi, jadi tidak ada setter/validasi per nilai. Selain itu
+    baris dimasukkan satu per satu lewat muat_attendance/muat_grades.
+    """
+    validasi = ValidasiImpor(laporan)
+    if len(rekap) > 0 or rekap.jurnal is not None:
+        with instrumen.tahap("muat.attendance"):
+            muat_attendance(rekap, att_path, hanya_baru=True, validasi=validasi)
+        # grades hanya untuk NIM yang sudah ada di attendance
+        with instrumen.tahap("muat.grades"):
+            muat_grades(rekap, grd_path, tambah_baru=False, validasi=validasi)
+        return validasi.laporan
+    with instrumen.tahap("muat.attendance"):
+        hadir = _hadir_kolom(att_path, validasi)
+        nim, nama = validasi.kolom_attendance()
+    with instrumen.tahap("muat.grades"):
+        quiz, tugas, uts, uas = _nilai_kolom(grd_path, validasi, len(nim))
+    with instrumen.tahap("muat.isi", len(nim)):
+        rekap.isi_kolom(nim, nama, hadir, quiz, tugas, uts, uas)
+    return validasi.laporan
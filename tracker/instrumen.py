@@ -0,0 +1,154 @@
+# Instrumentasi opsional: waktu per tahap, penghitung, laporan JSON, dan dump cProfile
+
+import os
+import sys
+import time
+
+# env: path laporan JSON ("-" = stderr) dan path dump cProfile (dibaca oleh dari_env)
+ENV_LAPORAN = "TRACKER_INSTRUMEN"
+ENV_PROFIL = "TRACKER_PROFIL"
+
+# False = mati (default). Pemanggil di jalur panas cukup cek `if instrumen.AKTIF:`
+# sekali per blok / tahap, jadi saat mati biayanya hanya satu pembacaan atribut.
+AKTIF = False
+
+_tahap = {}     # nama -> [jumlah panggilan, total detik, maks detik, jumlah item]
+_hitung = {}    # nama -> angka
+_laporan_path = None
+_profil_path = None
+_profiler = None
+_mulai = None
+
+
+class _TanpaUkur:
+    """Context manager kosong untuk tahap() saat instrumentasi mati (satu objek dipakai bersama)."""
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_KOSONG = _TanpaUkur()
+
+
+class _Ukur:
+    def __init__(self, nama, n):
+        self.nama = nama
+        self.n = n
+
+    def __enter__(self):
+        self._t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        catat(self.nama, time.perf_counter() - self._t0, self.n)
+        return False
+
+
+def tahap(nama, n=None):
+    """
+    Ukur satu tahap: `with instrumen.tahap("laporan.render", len(rekap)):`.
+    n (opsional) = jumlah item yang diproses, untuk throughput di laporan.
+    Tahap boleh bersarang; waktu tahap dalam ikut terhitung di tahap luar.
+    """
+    if not AKTIF:
+        return _KOSONG
+    return _Ukur(nama, n)
+
+
+def catat(nama, detik, n=None):
+    """Tambahkan satu pengukuran yang sudah diukur sendiri (misal dari cli.WaktuTahap)."""
+    t = _tahap.get(nama)
+    if t is None:
+        t = _tahap[nama] = [0, 0.0, 0.0, 0]
+    t[0] += 1
+    t[1] += detik
+    if detik > t[2]:
+        t[2] = detik
+    if n:
+        t[3] += n
+
+
+def hitung(nama, n=1):
+    """Tambah penghitung (baris dibaca, galat validasi, byte ditulis, ...). Panggil di dalam `if AKTIF:`."""
+    _hitung[nama] = _hitung.get(nama, 0) + n
+
+
+def aktifkan(laporan=None, profil=None):
+    """
+    Nyalakan instrumentasi. laporan: path JSON ("-" = stderr), profil: path dump
+    cProfile (buka dengan `python -m pstats <file>`). Keduanya ditulis oleh selesai(),
+    yang juga dipanggil otomatis saat program keluar.
+    """
+    global AKTIF, _laporan_path, _profil_path, _profiler, _mulai
+    if laporan is not None:
+        _laporan_path = laporan
+    if profil is not None and _profiler is None:
+        import cProfile
+        _profil_path = profil
+        _profiler = cProfile.Profile()
+        _profiler.enable()
+    if not AKTIF:
+        import atexit
+        atexit.register(selesai)
+        _mulai = time.perf_counter()
+        AKTIF = True
+
+
+def dari_env():
+    """Nyalakan instrumentasi jika TRACKER_INSTRUMEN / TRACKER_PROFIL diisi."""
+    laporan = os.environ.get(ENV_LAPORAN) or None
+    profil = os.environ.get(ENV_PROFIL) or None
+    if laporan or profil:
+        aktifkan(laporan, profil)
+
+
+def laporan():
+    """Isi pengukuran sebagai dict (siap di-json-kan)."""
+    tahap = {}
+    for nama, (kali, detik, maks, n) in _tahap.items():
+        t = {"kali": kali, "detik": round(detik, 6), "maks_detik": round(maks, 6)}
+        if n:
+            t["item"] = n
+            t["item_per_detik"] = round(n / detik) if detik > 0 else None
+        tahap[nama] = t
+    return {
+        "python": sys.version.split()[0],
+        "argv": sys.argv,
+        "total_detik": round(time.perf_counter() - _mulai, 6) if _mulai is not None else 0.0,
+        "tahap": tahap,
+        "hitung": dict(_hitung),
+    }
+
+
+def selesai():
+    """Hentikan profiler, tulis dump cProfile dan laporan JSON (aman dipanggil berkali-kali)."""
+    global AKTIF, _profiler, _laporan_path
+    if not AKTIF:
+        return
+    if _profiler is not None:
+        _profiler.disable()
+        _profiler.dump_stats(_profil_path)
+        _profiler = None
+    if _laporan_path is not None:
+        import json
+        teks = json.dumps(laporan(), indent=2)
+        if _laporan_path == "-":
+            print(teks, file=sys.stderr)
+        else:
+            from pathlib import Path
+            p = Path(_laporan_path)
+            p.parent.mkdir(parents=True, exist_ok=True)
+            p.write_text(teks + "\n", encoding="utf-8")
+        _laporan_path = None
+    AKTIF = False
+
+
+def reset():
+    """Kosongkan pengukuran (misal antar putaran benchmark di satu proses)."""
+    global _mulai
+    _tahap.clear()
+    _hitung.clear()
+    if AKTIF:
+        _mulai = time.perf_counter()
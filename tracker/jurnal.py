@@ -0,0 +1,244 @@
+# Jurnal tulis-dulu (write-ahead) + snapshot berkala untuk perubahan RekapKelas
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+from .mahasiswa import Mahasiswa
+
+# fsync dilakukan per kelompok: setelah sekian record atau sekian detik
+FSYNC_SETIAP = 64
+FSYNC_DETIK = 1.0
+# snapshot otomatis setelah sekian record sejak snapshot terakhir
+SNAPSHOT_SETIAP = 10000
+
+
+def _fsync_dir(folder):
+    """fsync direktori supaya rename/hapus file ikut tahan crash (diabaikan jika tidak didukung)."""
+    try:
+        fd = os.open(str(folder), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def terapkan(rekap, rec):
+    """Terapkan satu record jurnal ke rekap."""
+    op = rec.get("op")
+    nim = rec.get("nim")
+    if op == "tambah":
+        if nim not in rekap:
+            rekap.tambah_mahasiswa(Mahasiswa(nim, rec.get("nama")))
+        rekap.ubah_hadir(nim, rec.get("hadir", 0.0))
+    elif op == "hadir":
+        rekap.ubah_hadir(nim, rec["persen"])
+    elif op == "nilai":
+        rekap.ubah_penilaian(nim, quiz=rec.get("quiz"), tugas=rec.get("tugas"),
+                             uts=rec.get("uts"), uas=rec.get("uas"))
+    else:
+        raise ValueError("op jurnal tidak dikenal: " + str(op))
+
+
+class Jurnal:
+    """
+    Jurnal append-only di satu folder:
+      snapshot.json      -> isi rekap lengkap sampai nomor urut (seq) tertentu
+      jurnal-<seq>.log   -> segmen record JSON per baris, mulai dari seq tersebut
+
+    Setiap perubahan ditulis sebagai satu baris kecil; fsync dikelompokkan
+    (FSYNC_SETIAP record / FSYNC_DETIK detik). Saat start, pulihkan() memuat
+    snapshot lalu memutar ulang segmen jurnal sesudahnya. Snapshot baru ditulis
+    di thread latar, lalu segmen lama dihapus.
+    """
+    def __init__(self, folder, fsync_setiap=FSYNC_SETIAP, fsync_detik=FSYNC_DETIK,
+                 snapshot_setiap=SNAPSHOT_SETIAP):
+        self.folder = Path(folder)
+        self.folder.mkdir(parents=True, exist_ok=True)
+        self.fsync_setiap = fsync_setiap
+        self.fsync_detik = fsync_detik
+        self.snapshot_setiap = snapshot_setiap
+        self.rekap = None
+        self._seq = 0
+        self._seq_snapshot = 0
+        self._belum_fsync = 0
+        self._fsync_terakhir = time.monotonic()
+        self._f = None
+        self._lock = threading.Lock()
+        self._thread = None
+
+    # ---------- lokasi file ----------
+    def _path_snapshot(self):
+        return self.folder / "snapshot.json"
+
+    def _segmen(self):
+        """Daftar (seq_awal, path) semua segmen jurnal, urut naik."""
+        out = []
+        for p in self.folder.glob("jurnal-*.log"):
+            try:
+                out.append((int(p.stem.split("-", 1)[1]), p))
+            except ValueError:
+                continue
+        out.sort()
+        return out
+
+    def ada_data(self):
+        """True jika folder sudah berisi snapshot atau segmen jurnal."""
+        return self._path_snapshot().exists() or bool(self._segmen())
+
+    # ---------- pemulihan ----------
+    def pulihkan(self, rekap):
+        """
+        Isi rekap dari snapshot terakhir + jurnal sesudahnya, lalu pasang jurnal ini
+        ke rekap. Record yang terpotong (crash saat menulis) dilewati; ekor segmen
+        yang terpotong dipangkas dari file sebelum jurnal dibuka lagi untuk menulis.
+        Kembalikan jumlah record yang diputar ulang.
+        """
+        seq = 0
+        p = self._path_snapshot()
+        if p.exists():
+            with p.open(encoding="utf-8") as f:
+                snap = json.load(f)
+            seq = snap.get("seq", 0)
+            for nim, nama, hadir, quiz, tugas, uts, uas in snap.get("mahasiswa", []):
+                rekap.tambah_mahasiswa(Mahasiswa(nim, nama))
+                rekap.ubah_hadir(nim, hadir)
+                rekap.ubah_penilaian(nim, quiz=quiz, tugas=tugas, uts=uts, uas=uas)
+        self._seq_snapshot = seq
+        n = 0
+        for _, path in self._segmen():
+            # offset awal baris rusak yang belum diikuti record utuh (None = tidak ada)
+            rusak = None
+            pos = 0
+            with path.open("rb") as f:
+                for line in f:
+                    awal = pos
+                    pos += len(line)
+                    if not line.strip():
+                        continue
+                    try:
+                        rec = json.loads(line)
+                    except ValueError:
+                        # record terpotong oleh crash. Jika masih ada record utuh sesudahnya
+                        # (segmen yang dilanjutkan setelah crash), baris ini cukup dilewati.
+                        if rusak is None:
+                            rusak = awal
+                        continue
+                    rusak = None
+                    if rec.get("seq", 0) <= seq:
+                        continue
+                    terapkan(rekap, rec)
+                    seq = rec["seq"]
+                    n += 1
+            if rusak is not None:
+                # ekor terpotong dipangkas, supaya record baru tidak ditulis di belakangnya
+                with path.open("r+b") as f:
+                    f.truncate(rusak)
+                    f.flush()
+                    os.fsync(f.fileno())
+        self._seq = seq
+        self.pasang(rekap)
+        return n
+
+    def pasang(self, rekap):
+        """Hubungkan jurnal ke rekap: semua perubahan berikutnya akan dicatat."""
+        self.rekap = rekap
+        rekap.jurnal = self
+        self._buka_segmen()
+
+    def _buka_segmen(self):
+        if self._f is not None:
+            self._f.close()
+        path = self.folder / f"jurnal-{self._seq + 1:012d}.log"
+        self._f = path.open("a", encoding="utf-8")
+        if self._f.tell() > 0:
+            with path.open("rb") as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    # ekor record terpotong dari crash sebelumnya, mulai di baris baru
+                    self._f.write("\n")
+        _fsync_dir(self.folder)
+
+    # ---------- menulis ----------
+    def catat(self, op, nim, **data):
+        """Tambahkan satu record perubahan ke jurnal (dipanggil oleh RekapKelas)."""
+        with self._lock:
+            self._seq += 1
+            rec = {"seq": self._seq, "op": op, "nim": nim}
+            rec.update(data)
+            self._f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+            self._f.flush()
+            self._belum_fsync += 1
+            sekarang = time.monotonic()
+            if self._belum_fsync >= self.fsync_setiap or sekarang - self._fsync_terakhir >= self.fsync_detik:
+                self._fsync()
+            perlu_snapshot = self._seq - self._seq_snapshot >= self.snapshot_setiap
+        if perlu_snapshot:
+            self.snapshot(latar=True)
+
+    def _fsync(self):
+        os.fsync(self._f.fileno())
+        self._belum_fsync = 0
+        self._fsync_terakhir = time.monotonic()
+
+    def sinkron(self):
+        """Paksa fsync record yang belum tersimpan permanen."""
+        with self._lock:
+            if self._f is not None and self._belum_fsync:
+                self._fsync()
+
+    # ---------- snapshot / kompaksi ----------
+    def snapshot(self, latar=False):
+        """
+        Simpan isi rekap sebagai snapshot, lalu hapus segmen jurnal yang sudah tercakup.
+        Isi rekap disalin sekarang; penulisan file bisa di thread latar (latar=True).
+        """
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                # snapshot sebelumnya belum selesai, coba lagi nanti
+                return
+            if self._belum_fsync:
+                self._fsync()
+            seq = self._seq
+            isi = [list(row) for row in self.rekap.iter_komponen()]
+            self._seq_snapshot = seq
+            # record berikutnya masuk ke segmen baru
+            self._buka_segmen()
+        if latar:
+            self._thread = threading.Thread(target=self._tulis_snapshot, args=(seq, isi), daemon=True)
+            self._thread.start()
+        else:
+            self._tulis_snapshot(seq, isi)
+
+    def _tulis_snapshot(self, seq, isi):
+        p = self._path_snapshot()
+        tmp = p.with_name(p.name + ".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump({"seq": seq, "mahasiswa": isi}, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, p)
+        _fsync_dir(self.folder)
+        # segmen yang seluruh isinya <= seq sudah tidak dibutuhkan
+        segmen = self._segmen()
+        for i, (awal, path) in enumerate(segmen):
+            berikut = segmen[i + 1][0] if i + 1 < len(segmen) else None
+            if berikut is not None and berikut - 1 <= seq:
+                path.unlink()
+
+    def tutup(self):
+        """Tunggu snapshot latar selesai, fsync, dan tutup segmen aktif."""
+        if self._thread is not None:
+            self._thread.join()
+        with self._lock:
+            if self._f is not None:
+                if self._belum_fsync:
+                    self._fsync()
+                self._f.close()
+                self._f = None
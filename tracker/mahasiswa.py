@@ -1,5 +1,8 @@
 class Mahasiswa:
     """Kelas sederhana untuk menyimpan NIM, nama, dan persen hadir."""
+    # tanpa __dict__ per objek: lebih hemat memori untuk ribuan mahasiswa
+    __slots__ = ("nim", "nama", "_persen_hadir")
+
     def __init__(self, nim, nama):
         # simpan langsung NIM dan nama
         self.nim = nim
@@ -28,6 +31,24 @@ class Mahasiswa:
         # simpan 2 desimal agar rapi
         self._persen_hadir = round(n, 2)
 
+    @classmethod
+    def dari_tervalidasi(cls, nim, nama, hadir=0.0):
+        """
+        Buat objek tanpa lewat setter, untuk data yang sudah pernah divalidasi
+        (snapshot, database): hadir harus float 0..100 yang sudah dibulatkan 2 desimal.
+        Input dari pengguna tetap lewat Mahasiswa(nim, nama) + hadir_persen.
+        """
+        m = cls.__new__(cls)
+        m.nim = nim
+        m.nama = nama
+        m._persen_hadir = hadir
+        return m
+
+    @classmethod
+    def banyak_dari_kolom(cls, nim, nama, hadir):
+        """List Mahasiswa dari kolom NIM, nama, persen hadir yang sudah tervalidasi."""
+        return list(map(cls.dari_tervalidasi, nim, nama, hadir))
+
     def info(self):
         """Kembalikan string informasi singkat tentang mahasiswa."""
         return f"{self.nim} - {self.nama} (Hadir: {self._persen_hadir:.2f}%)"
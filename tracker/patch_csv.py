@@ -0,0 +1,334 @@
+# Ubah satu baris CSV langsung di tempat (tanpa menulis ulang seluruh file)
+
+import csv
+import io
+import json
+import os
+from pathlib import Path
+
+from . import instrumen
+
+# lebar minimal sel angka, supaya nilai baru (misal "72" -> "72.5") muat di tempat
+LEBAR_NILAI = 6
+# kolom teks (tidak pernah dipadding); kolom lain dianggap angka
+KOLOM_TEKS = ("student_id", "name")
+# ukuran baris meta di awal file .idx (dipatch di tempat, jadi harus tetap)
+LEBAR_META = 128
+# kompaksi otomatis jika change log sudah sebanyak ini
+MAKS_LOG = 1000
+
+
+def path_log(path):
+    """Lokasi change log untuk sebuah CSV (misal grades.csv.log)."""
+    p = Path(path)
+    return p.with_name(p.name + ".log")
+
+
+def path_indeks(path):
+    """Lokasi indeks NIM -> offset untuk sebuah CSV (misal grades.csv.idx)."""
+    p = Path(path)
+    return p.with_name(p.name + ".idx")
+
+
+def baca_log(path):
+    """
+    Baca change log sebuah CSV jadi dict nim -> baris (dict).
+    Entri yang lebih baru menimpa yang lama. Kosong jika log tidak ada.
+    """
+    p = path_log(path)
+    overlay = {}
+    if not p.exists():
+        return overlay
+    with p.open(encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError:
+                # baris terakhir bisa terpotong jika program mati saat menulis
+                continue
+            overlay[row.get("student_id", "")] = row
+    return overlay
+
+
+def _stat(p):
+    st = p.stat()
+    return st.st_size, st.st_mtime_ns
+
+
+class CSVPatcher:
+    """
+    Indeks persisten NIM -> (offset byte, panjang baris) untuk satu file CSV.
+    Kolom NIM dicari lewat nama "student_id" di header (tidak harus kolom pertama).
+
+    Sel angka ditulis dengan padding spasi (lebar_nilai) sehingga perubahan nilai
+    biasanya muat di baris yang sama dan bisa ditimpa langsung. Jika baris baru
+    lebih panjang, perubahan dicatat di change log (<file>.log) dan digabung lagi
+    ke file utama saat kompaksi().
+
+    Catatan format: file yang ditulis lewat CSVPatcher (baris baru, kompaksi,
+    perbarui_banyak) berisi sel angka dengan spasi di belakang, misal "80.0  ", dan
+    baris yang ditimpa di tempat bisa punya spasi tambahan di sel terakhir. Pembaca
+    di proyek ini (skema_csv, app.read_csv, CSVPatcher sendiri) membuang spasi itu;
+    float("80.0  ") juga tetap terbaca. Dengan lebar_nilai=1 (attendance.csv) tidak
+    ada padding karena sel 0/1 selalu muat.
+    Baris yang ada di change log belum tertulis di file utama: pembaca lain harus
+    menerapkan baca_log() (seperti skema_csv.baca_blok dan app.read_csv).
+    """
+    def __init__(self, path, headers, lebar_nilai=LEBAR_NILAI):
+        self.path = Path(path)
+        self.headers = list(headers)
+        self.lebar_nilai = lebar_nilai
+        self._offset = {}
+        self._log = {}
+        self._stat_terakhir = None
+        if not self.path.exists():
+            self._tulis_header()
+        self.segarkan()
+
+    def segarkan(self):
+        """Muat ulang indeks dan log jika file diubah pihak lain sejak operasi terakhir."""
+        if self._stat_terakhir == _stat(self.path):
+            return
+        # header file yang sudah ada menentukan urutan kolom
+        with self.path.open(encoding="utf-8", newline="") as f:
+            header = next(csv.reader(f), None)
+        if header:
+            self.headers = header
+        if "student_id" not in self.headers:
+            raise ValueError(f"{self.path.name}: header tidak punya kolom student_id")
+        self._kolom_nim = self.headers.index("student_id")
+        self._log = baca_log(self.path)
+        if not self._muat_indeks():
+            self._bangun_indeks()
+        self._stat_terakhir = _stat(self.path)
+
+    # ---------- indeks ----------
+    def _tulis_header(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("w", encoding="utf-8", newline="") as f:
+            f.write(",".join(self.headers) + "\n")
+
+    def _muat_indeks(self):
+        """Pakai indeks di disk jika ukuran dan mtime file CSV masih cocok."""
+        p = path_indeks(self.path)
+        if not p.exists():
+            return False
+        try:
+            with p.open(encoding="utf-8") as f:
+                meta = json.loads(f.read(LEBAR_META))
+                if [meta.get("size"), meta.get("mtime_ns")] != list(_stat(self.path)):
+                    return False
+                offset = {}
+                for line in f:
+                    nim, off, n = line.rstrip("\n").rsplit(" ", 2)
+                    offset[nim] = (int(off), int(n))
+        except (ValueError, OSError):
+            return False
+        self._offset = offset
+        return True
+
+    def _bangun_indeks(self):
+        """Scan file sekali untuk mencatat offset setiap baris, lalu simpan indeks."""
+        offset = {}
+        i = self._kolom_nim
+        with self.path.open("rb") as f:
+            pos = len(f.readline())
+            for raw in f:
+                line = raw.decode("utf-8").strip()
+                if line:
+                    if i == 0 and line[0] != '"':
+                        # NIM di kolom pertama tanpa tanda kutip (kasus umum): potong di koma pertama
+                        nim = line.split(",", 1)[0]
+                    else:
+                        vals = next(csv.reader([line]))
+                        nim = vals[i].strip() if i < len(vals) else ""
+                    offset[nim] = (pos, len(raw))
+                pos += len(raw)
+        self._offset = offset
+        p = path_indeks(self.path)
+        with p.open("w", encoding="utf-8") as f:
+            f.write(self._meta())
+            for nim, (off, n) in offset.items():
+                f.write(f"{nim} {off} {n}\n")
+
+    def _meta(self):
+        size, mtime_ns = self._stat_terakhir = _stat(self.path)
+        return json.dumps({"size": size, "mtime_ns": mtime_ns}).ljust(LEBAR_META - 1) + "\n"
+
+    def _perbarui_meta(self, baris_baru=None):
+        """Patch baris meta indeks (ukuran tetap) dan tambahkan entri baru jika ada."""
+        p = path_indeks(self.path)
+        with p.open("r+", encoding="utf-8") as f:
+            f.write(self._meta())
+            if baris_baru is not None:
+                f.seek(0, os.SEEK_END)
+                f.write(baris_baru)
+
+    # ---------- format baris ----------
+    def _sel(self, row):
+        """Nilai sel satu baris (list str) dengan sel angka dipadding."""
+        vals = ["" if v is None else str(v).strip() for v in map(row.get, self.headers)]
+        lebar = self.lebar_nilai
+        for j, h in enumerate(self.headers):
+            if h not in KOLOM_TEKS:
+                vals[j] = vals[j].ljust(lebar)
+        return vals
+
+    def _format(self, row, akhir="\n"):
+        """Ubah dict jadi satu baris CSV (bytes) dengan sel angka dipadding."""
+        buf = io.StringIO()
+        csv.writer(buf, lineterminator=akhir).writerow(self._sel(row))
+        return buf.getvalue().encode("utf-8")
+
+    def _parse(self, raw):
+        vals = next(csv.reader([raw.decode("utf-8").rstrip("\r\n")]))
+        vals = vals + [""] * (len(self.headers) - len(vals))
+        return {h: vals[i].strip() for i, h in enumerate(self.headers)}
+
+    # ---------- API ----------
+    def __contains__(self, nim):
+        self.segarkan()
+        return nim in self._log or nim in self._offset
+
+    def baris(self, nim):
+        """Ambil baris terbaru untuk NIM sebagai dict, atau None jika tidak ada."""
+        self.segarkan()
+        if nim in self._log:
+            return dict(self._log[nim])
+        if nim not in self._offset:
+            return None
+        off, n = self._offset[nim]
+        with self.path.open("rb") as f:
+            f.seek(off)
+            return self._parse(f.read(n))
+
+    def perbarui(self, nim, perubahan):
+        """
+        Terapkan perubahan (dict kolom -> nilai) ke baris NIM.
+        Kembalikan baris hasil (dict). KeyError jika NIM tidak ada.
+        """
+        row = self.baris(nim)
+        if row is None:
+            raise KeyError("NIM tidak ditemukan: " + str(nim))
+        row.update(perubahan)
+        if nim in self._log:
+            # baris ini sudah pindah ke log, lanjutkan di sana
+            self._tulis_log(row)
+            return row
+        off, n = self._offset[nim]
+        with self.path.open("r+b") as f:
+            f.seek(off)
+            lama = f.read(n)
+            akhir = "\r\n" if lama.endswith(b"\r\n") else "\n"
+            baru = self._format(row, akhir)
+            muat = len(baru) <= n
+            if muat:
+                # isi sisa dengan spasi di sel terakhir supaya panjang baris tetap
+                baru = baru[:len(baru) - len(akhir)] + b" " * (n - len(baru)) + akhir.encode()
+                f.seek(off)
+                f.write(baru)
+        if muat:
+            self._perbarui_meta()
+        else:
+            # baris tumbuh dan tidak muat di tempat -> catat di change log
+            self._tulis_log(row)
+        return row
+
+    def tambah(self, row):
+        """Tambahkan baris baru di akhir file (append) dan catat offsetnya."""
+        nim = row.get("student_id")
+        if nim in self:
+            raise KeyError("NIM sudah ada: " + str(nim))
+        with self.path.open("ab") as f:
+            off = f.tell()
+            if off > 0 and not self._diakhiri_newline():
+                f.write(b"\n")
+                off += 1
+            baru = self._format(row)
+            f.write(baru)
+        self._offset[nim] = (off, len(baru))
+        self._perbarui_meta(f"{nim} {off} {len(baru)}\n")
+        return dict(row)
+
+    def _diakhiri_newline(self):
+        with self.path.open("rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    def _tulis_log(self, row):
+        with path_log(self.path).open("a", encoding="utf-8") as f:
+            f.write(json.dumps(row, ensure_ascii=False) + "\n")
+        self._log[row.get("student_id", "")] = row
+        if len(self._log) >= MAKS_LOG:
+            self.kompaksi()
+
+    def semua_baris(self):
+        """Generator semua baris terbaru (file utama + change log) sebagai dict."""
+        headers = self.headers
+        kosong = [""] * len(headers)
+        log = self._log
+        with self.path.open(encoding="utf-8", newline="") as f:
+            reader = csv.reader(f)
+            next(reader, None)
+            for vals in reader:
+                if not "".join(vals).strip():
+                    continue
+                if len(vals) < len(headers):
+                    vals = vals + kosong[len(vals):]
+                row = {h: v.strip() for h, v in zip(headers, vals)}
+                nim = row.get("student_id")
+                yield dict(log[nim]) if nim in log else row
+
+    def perbarui_banyak(self, perubahan, baru=()):
+        """
+        Terapkan banyak perubahan sekaligus (dict nim -> dict kolom -> nilai) dan
+        tambahkan baris baru, dengan menulis ulang file satu kali (atomik lewat os.replace).
+        Semua NIM dicek dulu: KeyError tanpa menulis apa pun jika NIM perubahan tidak
+        ada atau NIM baris baru sudah ada. Kembalikan jumlah baris yang ditulis.
+        """
+        self.segarkan()
+        for nim in perubahan:
+            if nim not in self._log and nim not in self._offset:
+                raise KeyError("NIM tidak ditemukan: " + str(nim))
+        baru = list(baru)
+        for row in baru:
+            if row.get("student_id") in self:
+                raise KeyError("NIM sudah ada: " + str(row.get("student_id")))
+
+        def semua():
+            for row in self.semua_baris():
+                ubah = perubahan.get(row.get("student_id"))
+                if ubah:
+                    row.update(ubah)
+                yield row
+            yield from baru
+        return self._tulis_ulang(semua())
+
+    def kompaksi(self):
+        """Tulis ulang file utama (semua sel dipadding), kosongkan log, bangun ulang indeks."""
+        self._tulis_ulang(self.semua_baris())
+
+    def _tulis_ulang(self, rows):
+        n = 0
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with tmp.open("w", encoding="utf-8", newline="") as f:
+            f.write(",".join(self.headers) + "\n")
+            # satu csv.writer untuk seluruh file (bukan satu StringIO per baris)
+            writer = csv.writer(f, lineterminator="\n")
+            for row in rows:
+                writer.writerow(self._sel(row))
+                n += 1
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+        if instrumen.AKTIF:
+            instrumen.hitung("csv.byte_ditulis", self.path.stat().st_size)
+        log = path_log(self.path)
+        if log.exists():
+            log.unlink()
+        self._log = {}
+        self._bangun_indeks()
+        return n
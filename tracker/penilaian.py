@@ -1,5 +1,11 @@
+from .skor import BOBOT_DEFAULT
+
+
 class Penilaian:
     """Simpan quiz, tugas, uts, uas dan hitung nilai akhir."""
+    # tanpa __dict__ per objek (lihat Mahasiswa)
+    __slots__ = ("_quiz", "_tugas", "_uts", "_uas")
+
     def __init__(self, quiz=0, tugas=0, uts=0, uas=0):
         # inisialisasi private attribute
         self._quiz = 0.0
@@ -13,6 +19,24 @@ class Penilaian:
         self.uts = uts
         self.uas = uas
 
+    @classmethod
+    def dari_tervalidasi(cls, quiz=0.0, tugas=0.0, uts=0.0, uas=0.0):
+        """
+        Buat objek tanpa empat setter + _validate, untuk nilai yang sudah pernah
+        divalidasi (float 0..100, 2 desimal). Input pengguna tetap lewat Penilaian(...).
+        """
+        p = cls.__new__(cls)
+        p._quiz = quiz
+        p._tugas = tugas
+        p._uts = uts
+        p._uas = uas
+        return p
+
+    @classmethod
+    def banyak_dari_kolom(cls, quiz, tugas, uts, uas):
+        """List Penilaian dari empat kolom nilai yang sudah tervalidasi."""
+        return list(map(cls.dari_tervalidasi, quiz, tugas, uts, uas))
+
     def _validate(self, v):
         """Validasi nilai: harus angka dan 0..100."""
         if v is None:
@@ -57,10 +81,12 @@ class Penilaian:
     def uas(self, v):
         self._uas = self._validate(v)
 
-    def nilai_akhir(self, w_quiz=0.15, w_tugas=0.25, w_uts=0.25, w_uas=0.35):
+    def nilai_akhir(self, w_quiz=BOBOT_DEFAULT[0], w_tugas=BOBOT_DEFAULT[1],
+                    w_uts=BOBOT_DEFAULT[2], w_uas=BOBOT_DEFAULT[3]):
         """
         Hitung nilai akhir dengan bobot default:
         quiz 15%, tugas 25%, uts 25%, uas 35%.
+        (skema lain: lihat tracker.skema_nilai)
         """
         total = (self.quiz * w_quiz) + (self.tugas * w_tugas) + (self.uts * w_uts) + (self.uas * w_uas)
         return round(total, 2)
@@ -0,0 +1,198 @@
+# Lapisan penyimpanan data: CSV (attendance.csv + grades.csv) atau SQLite, dengan API yang sama
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+from .presensi import kolom_sesi
+from .skema_csv import ATT_HEADERS, GRD_HEADERS
+
+# kolom nilai di penyimpanan (nama kolom CSV = nama kolom tabel SQLite); kolom sesi
+# presensi tidak tetap (week1..weekN, week<N>_<k>), ambil lewat Penyimpanan.sesi()
+KOLOM_NILAI = tuple(GRD_HEADERS[2:])
+JENIS_PENYIMPANAN = ("csv", "sqlite")
+
+
+class Penyimpanan(ABC):
+    """
+    API bersama semua penyimpanan. app.py dan mode batch hanya memakai method di sini,
+    jadi CSV dan SQLite bisa saling ganti. Subkelas wajib mengisi semua method abstrak
+    (kalau ada yang terlewat, membuat objeknya langsung TypeError); simpan_cache dan
+    tutup boleh dibiarkan kosong.
+
+    Baris yang dikembalikan berbentuk dict teks seperti baris CSV
+    (student_id, name, label sesi / quiz, assignment, mid, final), supaya fungsi lama
+    seperti calculate_attendance_percent_from_row tetap bisa dipakai.
+    """
+    @abstractmethod
+    def ada_data(self):
+        """True jika penyimpanan sudah berisi data yang bisa dimuat."""
+
+    @abstractmethod
+    def sumber(self):
+        """Path file yang menentukan versi data (untuk snapshot_biner.sidik_sumber)."""
+
+    @abstractmethod
+    def muat(self, rekap_cls):
+        """Muat semua mahasiswa ke rekap_cls baru; kembalikan (rekap, laporan atau None)."""
+
+    @abstractmethod
+    def sesi(self):
+        """Label sesi presensi urut waktu (misal week1..week16, week3_2)."""
+
+    @abstractmethod
+    def muat_presensi(self):
+        """Presensi per sesi sebagai MatriksPresensi (bitset per mahasiswa)."""
+
+    @abstractmethod
+    def tambah_mahasiswa(self, nim, nama):
+        """Tambah mahasiswa (presensi dan nilai awal 0) jika belum ada."""
+
+    @abstractmethod
+    def ubah_presensi(self, nim, minggu):
+        """
+        minggu: dict label sesi -> '1' / '0' (None atau nilai lain = tidak diubah).
+        Label yang tidak ada di sesi() diabaikan, kecuali penyimpanan bisa menambah sesi.
+        Kembalikan baris presensi terbaru; KeyError jika NIM tidak ada.
+        """
+
+    @abstractmethod
+    def ubah_nilai(self, nim, quiz=None, assignment=None, mid=None, final=None, nama_cadangan=""):
+        """
+        Ubah nilai satu mahasiswa (None = tidak diubah); jika belum punya baris nilai,
+        baris baru dibuat (None -> 0). Kembalikan baris nilai terbaru.
+        """
+
+    @abstractmethod
+    def ubah_nilai_banyak(self, perubahan, nama=None):
+        """
+        Terapkan banyak perubahan nilai sekaligus dalam satu transaksi.
+        perubahan: dict nim -> dict kolom nilai (quiz/assignment/mid/final) -> angka.
+        nama: fungsi nim -> nama untuk NIM yang belum punya baris nilai.
+        Kembalikan jumlah baris nilai baru.
+        """
+
+    def simpan_cache(self, rekap):
+        """Simpan salinan cepat untuk start berikutnya (jika penyimpanan membutuhkannya)."""
+
+    def tutup(self):
+        """Lepas file / koneksi yang masih terbuka."""
+
+
+class PenyimpananCSV(Penyimpanan):
+    """
+    Penyimpanan lama: attendance.csv + grades.csv di satu folder. Baris diubah di
+    tempat lewat CSVPatcher, dan muat() memakai snapshot biner jika CSV belum berubah.
+    """
+    def __init__(self, folder):
+        self.folder = Path(folder)
+        self.att_path = self.folder / "attendance.csv"
+        self.grd_path = self.folder / "grades.csv"
+        self.snap_path = self.folder / "rekap.snap"
+        self._patchers = {}
+
+    def patcher(self, path, headers):
+        """Ambil CSVPatcher untuk path (dibuat sekali, indeks NIM -> offset disimpan di <file>.idx)."""
+        from .patch_csv import CSVPatcher, LEBAR_NILAI
+        key = str(path)
+        if key not in self._patchers:
+            # attendance hanya berisi 0/1, tidak perlu padding
+            lebar = 1 if headers is ATT_HEADERS else LEBAR_NILAI
+            self._patchers[key] = CSVPatcher(path, headers, lebar)
+        return self._patchers[key]
+
+    def ada_data(self):
+        return self.att_path.exists() and self.grd_path.exists()
+
+    def sumber(self):
+        from .snapshot_biner import sumber_csv
+        return sumber_csv(self.att_path, self.grd_path)
+
+    def muat(self, rekap_cls):
+        from .snapshot_biner import muat_atau_bootstrap
+        return muat_atau_bootstrap(self.att_path, self.grd_path, self.snap_path, rekap_cls)
+
+    def sesi(self):
+        if not self.att_path.exists():
+            return kolom_sesi(ATT_HEADERS)
+        return kolom_sesi(self.patcher(self.att_path, ATT_HEADERS).headers)
+
+    def muat_presensi(self):
+        from .presensi import MatriksPresensi
+        return MatriksPresensi.dari_csv(self.att_path)
+
+    def tambah_mahasiswa(self, nim, nama):
+        att = self.patcher(self.att_path, ATT_HEADERS)
+        if nim not in att:
+            # baris attendance default, ditambahkan di akhir file
+            row = {"student_id": nim, "name": nama}
+            row.update((k, "0") for k in kolom_sesi(att.headers))
+            att.tambah(row)
+        grd = self.patcher(self.grd_path, GRD_HEADERS)
+        if nim not in grd:
+            row = {"student_id": nim, "name": nama}
+            row.update((k, "0") for k in KOLOM_NILAI)
+            grd.tambah(row)
+
+    def ubah_presensi(self, nim, minggu):
+        if not self.att_path.exists():
+            raise FileNotFoundError("attendance.csv tidak ditemukan.")
+        att = self.patcher(self.att_path, ATT_HEADERS)
+        if nim not in att:
+            raise KeyError("NIM tidak ditemukan di attendance.csv.")
+        return att.perbarui(nim, _sesi_valid(minggu, kolom_sesi(att.headers)))
+
+    def ubah_nilai(self, nim, quiz=None, assignment=None, mid=None, final=None, nama_cadangan=""):
+        from .skema_csv import ke_angka
+        grd = self.patcher(self.grd_path, GRD_HEADERS)
+        nilai = dict(zip(KOLOM_NILAI, (quiz, assignment, mid, final)))
+        if nim not in grd:
+            # buat baris baru, nilai None -> 0
+            row = {"student_id": nim, "name": nama_cadangan}
+            row.update((k, str(float(v or 0))) for k, v in nilai.items())
+            return grd.tambah(row)
+        perubahan = {k: str(ke_angka(v)) for k, v in nilai.items() if v is not None}
+        if not grd.baris(nim).get("name"):
+            perubahan["name"] = nama_cadangan
+        return grd.perbarui(nim, perubahan)
+
+    def ubah_nilai_banyak(self, perubahan, nama=None):
+        # grades.csv ditulis ulang satu kali; NIM yang belum punya baris ditambahkan
+        grd = self.patcher(self.grd_path, GRD_HEADERS)
+        ubah = {}
+        baru = []
+        for nim, kolom in perubahan.items():
+            teks = {k: str(v) for k, v in kolom.items()}
+            if nim in grd:
+                ubah[nim] = teks
+            else:
+                row = {"student_id": nim, "name": nama(nim) if nama else ""}
+                row.update((k, "0.0") for k in KOLOM_NILAI)
+                row.update(teks)
+                baru.append(row)
+        grd.perbarui_banyak(ubah, baru)
+        return len(baru)
+
+    def simpan_cache(self, rekap):
+        # CSV sudah ikut diperbarui, simpan snapshot supaya start berikutnya cepat
+        from . import snapshot_biner
+        snapshot_biner.simpan(rekap, self.snap_path, self.sumber())
+
+
+def _sesi_valid(minggu, sesi):
+    """Ambil hanya label di sesi yang bernilai '1' atau '0' (string); lainnya berarti tidak diubah."""
+    perubahan = {}
+    for k in sesi:
+        v = minggu.get(k)
+        if v is not None and str(v).strip() in ("1", "0"):
+            perubahan[k] = str(v).strip()
+    return perubahan
+
+
+def buka_penyimpanan(folder, jenis="csv"):
+    """Buka penyimpanan di folder data: "csv" (attendance.csv + grades.csv) atau "sqlite" (tracker.db)."""
+    if jenis == "csv":
+        return PenyimpananCSV(folder)
+    if jenis == "sqlite":
+        from .penyimpanan_sqlite import NAMA_DB, PenyimpananSQLite
+        return PenyimpananSQLite(Path(folder) / NAMA_DB)
+    raise ValueError(f"jenis penyimpanan tidak dikenal: {jenis} (pilih {', '.join(JENIS_PENYIMPANAN)})")
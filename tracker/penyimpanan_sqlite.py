@@ -0,0 +1,319 @@
+# Penyimpanan SQLite (stdlib sqlite3, mode WAL): satu file database sebagai ganti dua CSV
+
+import sqlite3
+from itertools import compress, repeat
+from operator import itemgetter
+from pathlib import Path
+
+from . import instrumen
+from .penyimpanan import KOLOM_NILAI, Penyimpanan, _sesi_valid
+from .presensi import POLA_SESI, MatriksPresensi, bit_kolom, kolom_sesi, tabel_persen
+from .skema_csv import ATT_HEADERS
+
+NAMA_DB = "tracker.db"
+# dinaikkan jika struktur tabel berubah (disimpan di PRAGMA user_version)
+# 1: presensi week1..week5 sebagai kolom 0/1; 2: presensi sebagai bitset + tabel sesi
+VERSI_SKEMA = 2
+
+# nama disimpan sekali di tabel mahasiswa; presensi dan nilai merujuk ke student_id.
+# student_id adalah PRIMARY KEY (terindeks), rowid tabel mahasiswa menjaga urutan input.
+# presensi/nilai WITHOUT ROWID: baris disimpan langsung di b-tree student_id (tanpa indeks kedua).
+# presensi.hadir = bitset (bit ke-i = hadir di sesi urutan i) sebagai BLOB little-endian,
+# jadi jumlah sesi tidak dibatasi 64 bit INTEGER; label sesi ada di tabel sesi.
+SQL_PRESENSI_TABEL = """
+CREATE TABLE presensi (
+    student_id TEXT PRIMARY KEY REFERENCES mahasiswa (student_id),
+    hadir BLOB NOT NULL DEFAULT x''
+) WITHOUT ROWID;
+CREATE TABLE sesi (
+    urutan INTEGER PRIMARY KEY,
+    label TEXT NOT NULL UNIQUE
+);
+"""
+SKEMA_SQL = f"""
+CREATE TABLE IF NOT EXISTS mahasiswa (
+    student_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL DEFAULT ''
+);
+{SQL_PRESENSI_TABEL}
+CREATE TABLE IF NOT EXISTS nilai (
+    student_id TEXT PRIMARY KEY REFERENCES mahasiswa (student_id),
+    {', '.join(f"{k} REAL NOT NULL DEFAULT 0 CHECK ({k} BETWEEN 0 AND 100)" for k in KOLOM_NILAI)}
+) WITHOUT ROWID;
+PRAGMA user_version = {VERSI_SKEMA};
+"""
+
+# tambah mahasiswa; nama yang sudah ada ditimpa (sumber nama = attendance)
+SQL_MHS_GANTI = ("INSERT INTO mahasiswa (student_id, name) VALUES (?, ?) "
+                 "ON CONFLICT (student_id) DO UPDATE SET name = excluded.name")
+# tambah mahasiswa; nama yang sudah ada hanya diisi jika masih kosong
+SQL_MHS_ISI = ("INSERT INTO mahasiswa (student_id, name) VALUES (?, ?) "
+               "ON CONFLICT (student_id) DO UPDATE SET name = excluded.name WHERE mahasiswa.name = ''")
+SQL_PRESENSI_BARU = "INSERT INTO presensi (student_id) VALUES (?) ON CONFLICT (student_id) DO NOTHING"
+SQL_PRESENSI_GANTI = ("INSERT INTO presensi (student_id, hadir) VALUES (?, ?) "
+                      "ON CONFLICT (student_id) DO UPDATE SET hadir = excluded.hadir")
+SQL_NILAI_GANTI = (
+    f"INSERT INTO nilai (student_id, {', '.join(KOLOM_NILAI)}) "
+    f"VALUES (?{', ?' * len(KOLOM_NILAI)}) ON CONFLICT (student_id) DO UPDATE SET "
+    + ", ".join(f"{k} = excluded.{k}" for k in KOLOM_NILAI)
+)
+# upsert sebagian: baris baru -> None jadi 0, baris lama -> None tidak diubah
+SQL_NILAI_UBAH = (
+    f"INSERT INTO nilai (student_id, {', '.join(KOLOM_NILAI)}) "
+    f"VALUES (:nim, {', '.join(f'coalesce(:{k}, 0)' for k in KOLOM_NILAI)}) "
+    "ON CONFLICT (student_id) DO UPDATE SET "
+    + ", ".join(f"{k} = coalesce(:{k}, {k})" for k in KOLOM_NILAI)
+)
+# seperti bootstrap CSV: semua mahasiswa di presensi, nilai digabung jika ada
+SQL_MUAT = (
+    "SELECT m.student_id, m.name, p.hadir, "
+    + ", ".join(f"coalesce(n.{k}, 0.0)" for k in KOLOM_NILAI)
+    + " FROM presensi p JOIN mahasiswa m ON m.student_id = p.student_id"
+    " LEFT JOIN nilai n ON n.student_id = p.student_id ORDER BY m.rowid"
+)
+
+
+# baris migrasi (nim, nama, kolom...) -> parameter tabel mahasiswa / tabel data
+_AMBIL_MHS = itemgetter(0, 1)
+_AMBIL_PRESENSI = itemgetter(0, 2)
+_AMBIL_NILAI = itemgetter(0, *range(2, 2 + len(KOLOM_NILAI)))
+
+
+def _nilai_valid(v, label):
+    """Nilai komponen untuk disimpan: None tetap None, selain itu angka 0..100 dibulatkan 2 desimal."""
+    if v is None:
+        return None
+    try:
+        x = float(v)
+    except (TypeError, ValueError):
+        raise ValueError(label + " harus angka")
+    if x < 0 or x > 100:
+        raise ValueError(label + " harus antara 0 dan 100")
+    return round(x, 2)
+
+
+def _ke_blob(bits):
+    return bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+
+
+def _dari_blob(blobs):
+    """Kolom BLOB -> bitset int (map di level C)."""
+    return map(int.from_bytes, blobs, repeat("little"))
+
+
+def _naik_ke_2(conn):
+    """Skema 1 -> 2: kolom week1..week5 digabung jadi bitset, label sesi disimpan di tabel sesi."""
+    minggu = [f"week{i}" for i in range(1, 6)]
+    rows = conn.execute(f"SELECT student_id, {', '.join(minggu)} FROM presensi").fetchall()
+    with conn:
+        # DDL tidak memulai transaksi otomatis di sqlite3, jadi BEGIN eksplisit supaya
+        # kenaikan versi gagal/berhasil sekaligus
+        conn.execute("BEGIN")
+        conn.execute("ALTER TABLE presensi RENAME TO presensi_lama")
+        for sql in SQL_PRESENSI_TABEL.split(";"):
+            if sql.strip():
+                conn.execute(sql)
+        conn.executemany("INSERT INTO sesi (urutan, label) VALUES (?, ?)", enumerate(minggu))
+        conn.executemany(SQL_PRESENSI_GANTI, (
+            (r[0], _ke_blob(sum(w << s for s, w in enumerate(r[1:])))) for r in rows))
+        conn.execute("DROP TABLE presensi_lama")
+        conn.execute("PRAGMA user_version = 2")
+
+
+class PenyimpananSQLite(Penyimpanan):
+    """
+    Semua data di satu file SQLite (default data/tracker.db).
+
+    - Mode WAL: pembaca (misal layanan `serve`) tidak diblok penulis, dan satu
+      perubahan hanya menulis halaman yang berubah, bukan seluruh file.
+    - Perubahan satu NIM = satu UPDATE/upsert lewat indeks student_id.
+    - Perubahan banyak NIM = executemany dengan statement yang sama (disiapkan
+      sekali oleh sqlite3) dalam satu transaksi.
+    - Nilai disimpan sudah dibulatkan 2 desimal, sama seperti Penilaian, jadi
+      rekap bisa dibangun langsung dari kolom tanpa validasi ulang.
+
+    Koneksi dibuka saat pertama dipakai dan hanya boleh dipakai di thread yang
+    membukanya (aturan sqlite3); buat objek baru untuk thread lain.
+    """
+    def __init__(self, path):
+        self.path = Path(path)
+        self._conn = None
+
+    def _db(self):
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path)
+            conn.execute("PRAGMA journal_mode = WAL")
+            # aman untuk WAL: commit tidak menunggu fsync, database tetap konsisten
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute("PRAGMA foreign_keys = ON")
+            versi = conn.execute("PRAGMA user_version").fetchone()[0]
+            if versi > VERSI_SKEMA:
+                conn.close()
+                raise ValueError(f"{self.path}: versi skema database {versi} lebih baru dari program ini")
+            # hanya database baru / lama yang ditulis; membuka database versi sekarang tidak
+            # mengubah file (penting untuk `serve --pantau` yang memantau file database)
+            if versi == 0:
+                conn.executescript(SKEMA_SQL)
+                # sesi awal sama dengan header attendance.csv baru (week1..week5)
+                with conn:
+                    conn.executemany("INSERT INTO sesi (urutan, label) VALUES (?, ?)",
+                                     enumerate(kolom_sesi(ATT_HEADERS)))
+            elif versi == 1:
+                _naik_ke_2(conn)
+            self._conn = conn
+        return self._conn
+
+    def ada_data(self):
+        return self.path.exists()
+
+    def sumber(self):
+        # commit di mode WAL mengubah file -wal dulu, file utama baru berubah saat checkpoint
+        return (self.path, self.path.with_name(self.path.name + "-wal"))
+
+    def sesi(self):
+        return [r[0] for r in self._db().execute("SELECT label FROM sesi ORDER BY urutan")]
+
+    def jumlah(self):
+        """Jumlah mahasiswa yang punya baris presensi (yang ikut dimuat)."""
+        return self._db().execute("SELECT count(*) FROM presensi").fetchone()[0]
+
+    def muat(self, rekap_cls):
+        with instrumen.tahap("muat.sqlite.query"):
+            baris = self._db().execute(SQL_MUAT).fetchall()
+        if instrumen.AKTIF:
+            instrumen.hitung("sqlite.baris_dibaca", len(baris))
+        # persen hadir = popcount bitset / jumlah sesi
+        tabel = tabel_persen(len(self.sesi()))
+        if not baris:
+            return rekap_cls(), None
+        nim, nama, hadir, quiz, tugas, uts, uas = zip(*baris)
+        hadir = list(map(tabel.__getitem__, map(int.bit_count, _dari_blob(hadir))))
+        # CHECK di tabel + pembulatan saat menulis: nilai sudah valid, tidak perlu lewat setter
+        return rekap_cls.dari_kolom(nim, nama, hadir, quiz, tugas, uts, uas), None
+
+    def muat_presensi(self):
+        rows = self._db().execute(
+            "SELECT m.student_id, m.name, p.hadir FROM presensi p "
+            "JOIN mahasiswa m ON m.student_id = p.student_id ORDER BY m.rowid"
+        ).fetchall()
+        nim, nama, hadir = zip(*rows) if rows else ((), (), ())
+        return MatriksPresensi.dari_bit(self.sesi(), nim, nama, _dari_blob(hadir))
+
+    def tambah_mahasiswa(self, nim, nama):
+        db = self._db()
+        with db:
+            db.execute(SQL_MHS_ISI, (nim, nama))
+            db.execute(SQL_PRESENSI_BARU, (nim,))
+            db.execute("INSERT INTO nilai (student_id) VALUES (?) ON CONFLICT (student_id) DO NOTHING", (nim,))
+
+    def ubah_presensi(self, nim, minggu):
+        """
+        Seperti Penyimpanan.ubah_presensi. Label sesi baru yang cocok dengan pola
+        week<N> / week<N>_<k> menambah sesi di akhir (mahasiswa lain: tidak hadir).
+        """
+        db = self._db()
+        with db:
+            # baca-ubah-tulis bitset dalam satu transaksi tulis
+            db.execute("BEGIN IMMEDIATE")
+            row = db.execute("SELECT m.name, p.hadir FROM presensi p JOIN mahasiswa m "
+                             "ON m.student_id = p.student_id WHERE p.student_id = ?", (nim,)).fetchone()
+            if row is None:
+                raise KeyError("NIM tidak ditemukan di database.")
+            sesi = self.sesi()
+            baru = [k for k in minggu if k not in sesi and POLA_SESI.match(k)]
+            for label in kolom_sesi(baru):
+                if _sesi_valid(minggu, [label]):
+                    db.execute("INSERT INTO sesi (urutan, label) VALUES (?, ?)", (len(sesi), label))
+                    sesi.append(label)
+            bits = int.from_bytes(row[1], "little")
+            for label, v in _sesi_valid(minggu, sesi).items():
+                bit = 1 << sesi.index(label)
+                bits = (bits | bit) if v == "1" else (bits & ~bit)
+            db.execute("UPDATE presensi SET hadir = ? WHERE student_id = ?", (_ke_blob(bits), nim))
+        baris = {"student_id": nim, "name": row[0]}
+        baris.update((h, "1" if bits >> s & 1 else "0") for s, h in enumerate(sesi))
+        return baris
+
+    def ubah_nilai(self, nim, quiz=None, assignment=None, mid=None, final=None, nama_cadangan=""):
+        param = {k: _nilai_valid(v, k) for k, v in zip(KOLOM_NILAI, (quiz, assignment, mid, final))}
+        param["nim"] = nim
+        db = self._db()
+        with db:
+            db.execute(SQL_MHS_ISI, (nim, nama_cadangan or ""))
+            db.execute(SQL_NILAI_UBAH, param)
+        row = db.execute(
+            f"SELECT m.student_id, m.name, {', '.join('n.' + k for k in KOLOM_NILAI)} FROM nilai n "
+            "JOIN mahasiswa m ON m.student_id = n.student_id WHERE n.student_id = ?", (nim,)
+        ).fetchone()
+        return dict(zip(("student_id", "name") + KOLOM_NILAI, map(str, row)))
+
+    def ubah_nilai_banyak(self, perubahan, nama=None):
+        param = []
+        for nim, kolom in perubahan.items():
+            p = dict.fromkeys(KOLOM_NILAI)
+            for k, v in kolom.items():
+                if k not in p:
+                    raise ValueError("kolom nilai tidak dikenal: " + str(k))
+                p[k] = _nilai_valid(v, k)
+            p["nim"] = nim
+            param.append(p)
+        db = self._db()
+        # semua baris divalidasi sebelum transaksi dimulai; gagal di tengah = rollback semua
+        with db:
+            sebelum = db.execute("SELECT count(*) FROM nilai").fetchone()[0]
+            db.executemany(SQL_MHS_ISI, ((nim, nama(nim) if nama else "") for nim in perubahan))
+            db.executemany(SQL_NILAI_UBAH, param)
+            sesudah = db.execute("SELECT count(*) FROM nilai").fetchone()[0]
+        return sesudah - sebelum
+
+    def migrasi_dari_csv(self, att_path, grd_path, laporan=None):
+        """
+        Isi database dari attendance.csv + grades.csv (isi lama diganti) dalam satu
+        transaksi. Aturan sama dengan bootstrap CSV (tracker.validasi.ValidasiImpor):
+        baris tanpa NIM/nama dan NIM ganda di attendance dilewati, sel bukan angka dan
+        nilai di luar 0..100 dianggap 0; semuanya dicatat di laporan (LaporanGalat).
+        Kembalikan (baris presensi, baris nilai).
+        """
+        from .skema_csv import GRD_HEADERS, baca_blok
+        from .validasi import ValidasiImpor
+        validasi = ValidasiImpor(laporan)
+        laporan = validasi.laporan
+        db = self._db()
+        n_att = n_grd = 0
+        with db:
+            for tabel in ("nilai", "presensi", "sesi", "mahasiswa"):
+                db.execute("DELETE FROM " + tabel)
+            sesi = None
+            # baris dibangun per kolom (zip/map di level C), bukan per sel
+            for blok in baca_blok(att_path, ["student_id", "name"], laporan, tambahan=kolom_sesi):
+                if sesi is None:
+                    sesi = kolom_sesi(blok.kolom)
+                    db.executemany("INSERT INTO sesi (urutan, label) VALUES (?, ?)", enumerate(sesi))
+                pakai = validasi.attendance(blok)
+                bits = map(_ke_blob, bit_kolom([blok[h] for h in sesi], len(blok)))
+                rows = zip(blok["student_id"], blok["name"], bits)
+                rows = list(rows if pakai is None else compress(rows, pakai))
+                db.executemany(SQL_MHS_GANTI, map(_AMBIL_MHS, rows))
+                db.executemany(SQL_PRESENSI_GANTI, map(_AMBIL_PRESENSI, rows))
+                n_att += len(rows)
+            if sesi is None:
+                # attendance.csv kosong: pakai sesi awal
+                db.executemany("INSERT INTO sesi (urutan, label) VALUES (?, ?)", enumerate(kolom_sesi(ATT_HEADERS)))
+            for blok in baca_blok(grd_path, GRD_HEADERS, laporan):
+                pakai = validasi.grades(blok, KOLOM_NILAI)
+                kolom = [map(round, blok[k], repeat(2)) if k in blok.kolom else repeat(0.0) for k in KOLOM_NILAI]
+                rows = zip(blok["student_id"], blok["name"], *kolom)
+                rows = list(rows if pakai is None else compress(rows, pakai))
+                # NIM yang hanya ada di grades tetap disimpan, tetapi tidak ikut dimuat (seperti bootstrap)
+                db.executemany(SQL_MHS_ISI, map(_AMBIL_MHS, rows))
+                db.executemany(SQL_NILAI_GANTI, map(_AMBIL_NILAI, rows))
+                n_grd += len(rows)
+        # satu transaksi besar menumpuk di file -wal; pindahkan ke file utama dan kosongkan
+        db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return n_att, n_grd
+
+    def tutup(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
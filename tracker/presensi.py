@@ -0,0 +1,255 @@
+# Presensi per sesi sebagai bitset: satu int per mahasiswa, bit ke-i = hadir di sesi ke-i
+
+import re
+import sys
+from array import array
+from itertools import compress, repeat
+from math import inf
+from operator import and_, lshift, not_, or_, rshift, xor
+
+# kolom sesi di attendance.csv: week<N> (satu sesi per minggu) atau week<N>_<k> (sesi ke-k minggu N)
+POLA_SESI = re.compile(r"week(\d+)(?:_(\d+))?$")
+
+
+def kolom_sesi(header):
+    """Nama kolom sesi di header (list / dict / kolom Blok), urut minggu lalu sesi."""
+    cocok = []
+    for h in header:
+        m = POLA_SESI.match(h)
+        if m:
+            cocok.append((int(m.group(1)), int(m.group(2) or 1), h))
+    return [h for _, _, h in sorted(cocok)]
+
+
+def sel_hadir(sel):
+    """Kolom angka -> list 0/1. Aturan lama: 1 <= |v| < inf dihitung hadir (int(float(v)) != 0)."""
+    if set(sel) <= {0.0, 1.0}:
+        return list(map(int, sel))
+    return [1 if 1.0 <= abs(v) < inf else 0 for v in sel]
+
+
+def bit_kolom(kolom, n):
+    """
+    Gabungkan kolom sesi (list kolom angka, urut sesi) jadi list bitset per baris.
+    Satu map di level C per kolom: bit sesi ke-s digeser lalu di-OR ke semua baris.
+    Kolom yang hanya berisi 0/1 (kasus umum) langsung dipetakan ke 0 / 1 << s lewat dict.
+    """
+    bits = [0] * n
+    for s, sel in enumerate(kolom):
+        if set(sel) <= {0.0, 1.0}:
+            nilai = map({0.0: 0, 1.0: 1 << s}.__getitem__, sel)
+        else:
+            nilai = map(lshift, sel_hadir(sel), repeat(s))
+        bits = list(map(or_, bits, nilai))
+    return bits
+
+
+def tabel_persen(jumlah_sesi):
+    """Persen hadir untuk 0..jumlah_sesi kehadiran, dihitung sekali (index = popcount)."""
+    if jumlah_sesi == 0:
+        return [0.0]
+    return [round(k / jumlah_sesi * 100.0, 2) for k in range(jumlah_sesi + 1)]
+
+
+def _beruntun(absen, n):
+    """
+    Untuk setiap bitset absen: bit i tetap menyala jika sesi i..i+n-1 semuanya absen.
+    Penggandaan: setelah geser-AND dengan s <= k, run k menjadi run k+s, jadi cukup
+    O(log n) putaran map (level C) untuk seluruh kelas.
+    """
+    k = 1
+    while k < n:
+        s = min(k, n - k)
+        absen = list(map(and_, absen, map(rshift, absen, repeat(s))))
+        k += s
+    return absen
+
+
+class MatriksPresensi:
+    """
+    Presensi satu kelas: label sesi (urut waktu) dan satu bitset int per mahasiswa.
+    Jumlah sesi bebas (14-16 minggu, beberapa sesi per minggu); menambah sesi tidak
+    menyalin data karena int Python bisa tumbuh. Persen hadir = popcount / jumlah sesi.
+    """
+    def __init__(self, sesi=()):
+        self.sesi = list(sesi)
+        self._nim = []
+        self._nama = []
+        self._bit = []
+        self._indeks = {}
+
+    @classmethod
+    def dari_bit(cls, sesi, nim, nama, bits):
+        """Bangun langsung dari kolom NIM, nama, dan bitset (misal dari database)."""
+        m = cls(sesi)
+        m._nim = list(nim)
+        m._nama = list(nama)
+        m._bit = list(bits)
+        m._indeks = {x: i for i, x in enumerate(m._nim)}
+        if len(m._indeks) != len(m._nim):
+            raise KeyError("NIM ganda di data presensi")
+        return m
+
+    @classmethod
+    def dari_csv(cls, path, laporan=None):
+        """
+        Baca attendance.csv (kolom sesi dari header file) dengan aturan yang sama seperti
+        bootstrap (validasi.ValidasiImpor.attendance): baris tanpa NIM/nama dilewati, NIM
+        ganda memakai baris pertama; keduanya dicatat di laporan (LaporanGalat, opsional).
+        """
+        from .skema_csv import baca_blok
+        from .validasi import ValidasiImpor
+        validasi = ValidasiImpor(laporan)
+        m = None
+        for blok in baca_blok(path, ["student_id", "name"], validasi.laporan, tambahan=kolom_sesi):
+            if m is None:
+                m = cls(kolom_sesi(blok.kolom))
+            bits = bit_kolom([blok[h] for h in m.sesi], len(blok))
+            pakai = validasi.attendance(blok)
+            rows = zip(blok["student_id"], blok["name"], bits)
+            if pakai is not None:
+                rows = compress(rows, pakai)
+            rows = list(rows)
+            if rows:
+                m._tambah_banyak(*zip(*rows))
+        return m if m is not None else cls()
+
+    def __len__(self):
+        return len(self._nim)
+
+    def __contains__(self, nim):
+        return nim in self._indeks
+
+    @property
+    def jumlah_sesi(self):
+        return len(self.sesi)
+
+    def _tambah(self, nim, nama, bits):
+        if nim in self._indeks:
+            raise KeyError("NIM sudah terdaftar: " + str(nim))
+        self._indeks[nim] = len(self._nim)
+        self._nim.append(nim)
+        self._nama.append(nama)
+        self._bit.append(bits)
+
+    def _tambah_banyak(self, nim, nama, bits):
+        """Seperti _tambah untuk satu blok kolom sekaligus (indeks diisi lewat zip)."""
+        # cek NIM ganda sebelum mengubah apa pun, supaya indeks tidak rusak
+        if len(set(nim)) != len(nim) or not self._indeks.keys().isdisjoint(nim):
+            raise KeyError("NIM ganda di data presensi")
+        awal = len(self._nim)
+        self._indeks.update(zip(nim, range(awal, awal + len(nim))))
+        self._nim.extend(nim)
+        self._nama.extend(nama)
+        self._bit.extend(bits)
+
+    def _posisi(self, nim):
+        i = self._indeks.get(nim)
+        if i is None:
+            raise KeyError("NIM tidak ditemukan")
+        return i
+
+    def _sesi_ke(self, sesi):
+        """Nomor bit untuk label sesi (str) atau nomor sesi (int, mulai 0)."""
+        if isinstance(sesi, int):
+            if not 0 <= sesi < len(self.sesi):
+                raise IndexError("sesi di luar jangkauan: " + str(sesi))
+            return sesi
+        try:
+            return self.sesi.index(sesi)
+        except ValueError:
+            raise KeyError("sesi tidak dikenal: " + str(sesi))
+
+    # ---------- mengubah ----------
+    def tambah_mahasiswa(self, nim, nama=""):
+        """Mahasiswa baru, semua sesi yang sudah lewat dianggap tidak hadir."""
+        self._tambah(nim, nama, 0)
+
+    def tambah_sesi(self, label=None):
+        """Tambah satu sesi di akhir (semua mahasiswa belum hadir); kembalikan labelnya."""
+        if label is None:
+            label = f"week{len(self.sesi) + 1}"
+        if label in self.sesi:
+            raise KeyError("sesi sudah ada: " + label)
+        self.sesi.append(label)
+        return label
+
+    def atur(self, nim, sesi, hadir):
+        """Tandai hadir (True) / tidak hadir (False) satu mahasiswa di satu sesi."""
+        i = self._posisi(nim)
+        bit = 1 << self._sesi_ke(sesi)
+        self._bit[i] = (self._bit[i] | bit) if hadir else (self._bit[i] & ~bit)
+
+    def atur_sesi(self, sesi, nim_hadir):
+        """Isi satu sesi untuk seluruh kelas: NIM di nim_hadir hadir, lainnya tidak."""
+        s = self._sesi_ke(sesi)
+        hadir = set(nim_hadir)
+        bit = 1 << s
+        self._bit = [(b | bit) if nim in hadir else (b & ~bit) for nim, b in zip(self._nim, self._bit)]
+
+    # ---------- membaca satu mahasiswa ----------
+    def bitset(self, nim):
+        return self._bit[self._posisi(nim)]
+
+    def hadir(self, nim, sesi):
+        return bool(self._bit[self._posisi(nim)] >> self._sesi_ke(sesi) & 1)
+
+    def baris(self, nim):
+        """Dict label sesi -> '1' / '0', seperti baris attendance.csv."""
+        b = self._bit[self._posisi(nim)]
+        return {h: "1" if b >> s & 1 else "0" for s, h in enumerate(self.sesi)}
+
+    def jumlah_hadir(self, nim):
+        return self._bit[self._posisi(nim)].bit_count()
+
+    def persen(self, nim):
+        return tabel_persen(len(self.sesi))[self.jumlah_hadir(nim)]
+
+    def beruntun_terpanjang(self, nim):
+        """Jumlah sesi tidak hadir berturut-turut terpanjang satu mahasiswa."""
+        absen = ((1 << len(self.sesi)) - 1) & ~self._bit[self._posisi(nim)]
+        n = 0
+        while absen:
+            absen &= absen >> 1
+            n += 1
+        return n
+
+    # ---------- query seluruh kelas ----------
+    def iter_bit(self):
+        """Generator (nim, nama, bitset) urut input."""
+        return zip(self._nim, self._nama, self._bit)
+
+    def persen_kolom(self):
+        """Persen hadir semua mahasiswa (urut input) sebagai array('d'), lewat popcount."""
+        tabel = tabel_persen(len(self.sesi))
+        return array('d', map(tabel.__getitem__, map(int.bit_count, self._bit)))
+
+    def _absen(self):
+        penuh = (1 << len(self.sesi)) - 1
+        return list(map(xor, self._bit, repeat(penuh)))
+
+    def absen_beruntun(self, n):
+        """NIM yang pernah tidak hadir n sesi (atau lebih) berturut-turut, urut input."""
+        if n <= 0:
+            return list(self._nim)
+        if n > len(self.sesi):
+            return []
+        return list(compress(self._nim, _beruntun(self._absen(), n)))
+
+    def absen_terakhir(self, n):
+        """NIM yang tidak hadir di n sesi terakhir (peringatan dini), urut input."""
+        if n <= 0:
+            return list(self._nim)
+        if n > len(self.sesi):
+            return []
+        s = len(self.sesi)
+        masker = ((1 << n) - 1) << (s - n)
+        # absen & masker == masker  <=>  bit & masker == 0
+        return list(compress(self._nim, map(not_, map(and_, self._bit, repeat(masker)))))
+
+    def nama_mahasiswa(self, nim):
+        return self._nama[self._posisi(nim)]
+
+    def ukuran_byte(self):
+        """Memori list bitset beserta objek int-nya (sys.getsizeof), tanpa NIM/nama."""
+        return sys.getsizeof(self._bit) + sum(map(sys.getsizeof, self._bit))
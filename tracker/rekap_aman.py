@@ -0,0 +1,246 @@
+# RekapKelas yang aman diubah banyak thread sekaligus (kunci bergaris + salin-saat-tulis)
+
+import threading
+from collections import deque
+from itertools import count
+
+from .mahasiswa import Mahasiswa
+from .penilaian import Penilaian
+from .rekap_kelas import RekapKelas
+
+# jumlah kunci penulis; NIM dibagi ke kunci lewat hash, jadi penulis NIM berbeda jarang saling tunggu
+JUMLAH_KUNCI = 64
+
+
+class RekapKelasAman(RekapKelas):
+    """
+    Varian RekapKelas untuk banyak penulis bersamaan (misal beberapa asisten
+    mengisi nilai lewat satu layanan). API-nya sama dengan RekapKelas.
+
+    - Entri mahasiswa tidak pernah diubah di tempat. Setiap perubahan membuat entri
+      baru (Mahasiswa/Penilaian baru, nilai akhir + predikat langsung dihitung) lalu
+      menukarnya di dict dalam satu langkah. Pembaca selalu melihat entri lama atau
+      entri baru secara utuh, tidak pernah setengah jadi.
+    - Penulis untuk NIM yang sama diurutkan oleh satu dari JUMLAH_KUNCI kunci
+      (dipilih dari hash NIM), jadi baca-ubah-tulis (ubah_dengan) tidak kehilangan update.
+    - rekap(), iter_export(), iter_komponen() membaca salinan daftar entri, jadi tidak
+      menahan penulis nilai. Hanya tambah_mahasiswa yang menunggu selama salinan dibuat.
+    - Query indeks (rentang_akhir, berisiko, ...) memakai satu kunci indeks; penulis
+      hanya menitipkan NIM yang berubah di antrean tanpa kunci.
+    - pakai_skema menahan semua kunci sekaligus (jarang dipakai).
+    """
+    def __init__(self, jumlah_kunci=JUMLAH_KUNCI):
+        super().__init__()
+        self._kunci = [threading.Lock() for _ in range(jumlah_kunci)]
+        # melindungi penambahan NIM baru, salinan dict, dan ganti skema
+        self._kunci_struktur = threading.Lock()
+        # melindungi _idx_akhir/_idx_hadir/_kotor_idx selama query
+        self._kunci_idx = threading.Lock()
+        # NIM yang berubah sejak query terakhir; deque.append aman tanpa kunci
+        self._antre_idx = deque()
+        self._idx_aktif = False
+        # nomor versi unik per perubahan (next() pada count tidak bisa terpotong antar thread)
+        self._urut_versi = count(1)
+
+    def _isi_kolom(self, mhs, nilai, skor=None):
+        # entri langsung lengkap seperti _entri, tetapi nilai akhir dihitung sekali untuk seluruh kolom
+        if self._data_by_nim:
+            raise ValueError("isi_kolom hanya untuk rekap kosong")
+        if len({m.nim for m in mhs}) != len(mhs):
+            raise KeyError("NIM ganda di data kolom")
+        if skor is None:
+            skor = self.skema.hitung_kelas([p.quiz for p in nilai], [p.tugas for p in nilai],
+                                           [p.uts for p in nilai], [p.uas for p in nilai])
+        akhir, pred = skor
+        data = self._data_by_nim
+        data.update((m.nim, {'mhs': m, 'nilai': p, 'akhir': a, 'predikat': h})
+                    for m, p, a, h in zip(mhs, nilai, akhir, pred))
+        self.versi = next(self._urut_versi)
+
+    def _kunci_nim(self, nim):
+        return self._kunci[hash(nim) % len(self._kunci)]
+
+    def _entri(self, mhs, nilai):
+        akhir, pred = self.skema.hitung_satu(nilai.quiz, nilai.tugas, nilai.uts, nilai.uas)
+        return {'mhs': mhs, 'nilai': nilai, 'akhir': akhir, 'predikat': pred}
+
+    def _salinan(self):
+        """List (nim, entri) saat ini; entri tidak pernah diubah jadi aman dibaca tanpa kunci."""
+        with self._kunci_struktur:
+            return list(self._data_by_nim.items())
+
+    # ---------- menulis ----------
+    def tambah_mahasiswa(self, mhs):
+        """Tambah objek Mahasiswa baru (disalin, objek asli boleh diubah pemanggil)."""
+        if not isinstance(mhs, Mahasiswa):
+            raise TypeError("tambah_mahasiswa membutuhkan objek Mahasiswa")
+        salinan = Mahasiswa(mhs.nim, mhs.nama)
+        salinan.hadir_persen = mhs.hadir_persen
+        with self._kunci_struktur:
+            if mhs.nim in self._data_by_nim:
+                raise KeyError("NIM sudah terdaftar: " + str(mhs.nim))
+            self._data_by_nim[mhs.nim] = self._entri(salinan, Penilaian())
+            self._tandai_indeks(mhs.nim)
+        if self.jurnal is not None:
+            self.jurnal.catat("tambah", mhs.nim, nama=mhs.nama, hadir=salinan.hadir_persen)
+
+    def ubah_hadir(self, nim, persen):
+        """Ubah persen hadir mahasiswa berdasarkan NIM."""
+        self.ubah(nim, hadir=persen)
+
+    def ubah_penilaian(self, nim, quiz=None, tugas=None, uts=None, uas=None):
+        """Ubah komponen nilai (jika parameter None maka tidak diubah); semua atau tidak sama sekali."""
+        self.ubah(nim, quiz=quiz, tugas=tugas, uts=uts, uas=uas)
+
+    def ubah(self, nim, hadir=None, quiz=None, tugas=None, uts=None, uas=None):
+        """
+        Ubah persen hadir dan/atau komponen nilai satu mahasiswa dalam satu langkah.
+        Semua nilai divalidasi dulu; jika ada yang tidak valid tidak ada yang berubah.
+        """
+        with self._kunci_nim(nim):
+            self._ganti(nim, hadir, quiz, tugas, uts, uas)
+
+    def ubah_dengan(self, nim, fungsi):
+        """
+        Baca-ubah-tulis atomik untuk satu NIM. fungsi menerima dict
+        {'hadir', 'quiz', 'tugas', 'uts', 'uas'} nilai saat ini dan mengembalikan dict
+        perubahan (kunci yang sama, boleh sebagian). Penulis lain untuk NIM ini
+        menunggu sampai selesai, jadi tidak ada update yang hilang, misal:
+            rekap.ubah_dengan(nim, lambda k: {'quiz': k['quiz'] + 5})
+        fungsi dijalankan sambil memegang kunci NIM, jadi tidak boleh mengubah rekap ini.
+        Kembalikan baris rekap yang baru (seperti data_mahasiswa).
+        """
+        with self._kunci_nim(nim):
+            d = self._data_by_nim.get(nim)
+            if d is None:
+                raise KeyError("NIM tidak ditemukan")
+            p = d['nilai']
+            sekarang = {'hadir': d['mhs'].hadir_persen, 'quiz': p.quiz, 'tugas': p.tugas,
+                        'uts': p.uts, 'uas': p.uas}
+            perubahan = fungsi(dict(sekarang)) or {}
+            lebih = set(perubahan) - set(sekarang)
+            if lebih:
+                raise ValueError("kolom tidak dikenal: " + ", ".join(sorted(lebih)))
+            self._ganti(nim, **perubahan)
+            return self._baris_rekap(nim)
+
+    def _ganti(self, nim, hadir=None, quiz=None, tugas=None, uts=None, uas=None):
+        """Bangun entri baru untuk nim dan tukar (pemanggil memegang kunci NIM ini)."""
+        lama = self._data_by_nim.get(nim)
+        if lama is None:
+            raise KeyError("NIM tidak ditemukan")
+        m = lama['mhs']
+        p = lama['nilai']
+        # objek baru divalidasi lewat property-nya; objek lama tidak disentuh
+        if hadir is not None:
+            m = Mahasiswa(m.nim, m.nama)
+            m.hadir_persen = hadir
+        if quiz is not None or tugas is not None or uts is not None or uas is not None:
+            p = Penilaian(p.quiz if quiz is None else quiz, p.tugas if tugas is None else tugas,
+                          p.uts if uts is None else uts, p.uas if uas is None else uas)
+        if m is lama['mhs'] and p is lama['nilai']:
+            return
+        self._data_by_nim[nim] = self._entri(m, p)
+        self._tandai_indeks(nim)
+        if self.jurnal is not None:
+            if m is not lama['mhs']:
+                self.jurnal.catat("hadir", nim, persen=m.hadir_persen)
+            if p is not lama['nilai']:
+                self.jurnal.catat("nilai", nim, quiz=p.quiz, tugas=p.tugas, uts=p.uts, uas=p.uas)
+
+    def pakai_skema(self, skema):
+        """Ganti skema penilaian dan hitung ulang semua entri (menahan semua kunci), kecuali skemanya sama."""
+        if not skema.standar:
+            raise ValueError(f"skema {skema.nama}: RekapKelas hanya menyimpan quiz, tugas, uts, uas")
+        if skema.sama(self.skema):
+            # bobot dan batas sama: entri yang ada tidak perlu dibangun ulang
+            self.skema = skema
+            return
+        with self._kunci_struktur:
+            for k in self._kunci:
+                k.acquire()
+            try:
+                self.skema = skema
+                for nim, d in list(self._data_by_nim.items()):
+                    self._data_by_nim[nim] = self._entri(d['mhs'], d['nilai'])
+                with self._kunci_idx:
+                    self._idx_akhir = None
+                self.versi = next(self._urut_versi)
+            finally:
+                for k in reversed(self._kunci):
+                    k.release()
+
+    # ---------- cache + indeks ----------
+    def _segarkan(self):
+        # nilai akhir + predikat sudah dihitung saat entri dibuat
+        pass
+
+    def _tandai_indeks(self, kunci):
+        # tanpa kunci: versi unik dari count, antrean deque; diproses saat query berikutnya
+        self.versi = next(self._urut_versi)
+        if self._idx_aktif:
+            self._antre_idx.append(kunci)
+
+    def _segarkan_indeks(self):
+        # dipanggil dengan _kunci_idx dipegang. _idx_aktif dinyalakan sebelum entri dibaca,
+        # jadi perubahan yang tidak masuk antrean pasti sudah terlihat saat indeks dibangun
+        self._idx_aktif = True
+        antre = self._antre_idx
+        while antre:
+            self._kotor_idx.add(antre.popleft())
+        super()._segarkan_indeks()
+
+    def _kunci_indeks(self, kunci):
+        if kunci is None:
+            return ((nim, d['akhir'], d['mhs'].hadir_persen) for nim, d in self._salinan())
+        return super()._kunci_indeks(kunci)
+
+    def rentang_akhir(self, lo=None, hi=None, inklusif_hi=False):
+        with self._kunci_idx:
+            return super().rentang_akhir(lo, hi, inklusif_hi)
+
+    def rentang_hadir(self, lo=None, hi=None, inklusif_hi=False):
+        with self._kunci_idx:
+            return super().rentang_hadir(lo, hi, inklusif_hi)
+
+    def distribusi_predikat(self):
+        with self._kunci_idx:
+            return super().distribusi_predikat()
+
+    def teratas(self, k):
+        with self._kunci_idx:
+            return super().teratas(k)
+
+    def terbawah(self, k):
+        with self._kunci_idx:
+            return super().terbawah(k)
+
+    def berisiko(self, batas_akhir=70.0, batas_hadir=75.0):
+        with self._kunci_idx:
+            return super().berisiko(batas_akhir, batas_hadir)
+
+    # ---------- membaca (dari salinan, tanpa menahan penulis) ----------
+    def iter_komponen(self):
+        """Generator (nim, nama, hadir, quiz, tugas, uts, uas) dari salinan saat dipanggil."""
+        for nim, d in self._salinan():
+            p = d['nilai']
+            yield nim, d['mhs'].nama, d['mhs'].hadir_persen, p.quiz, p.tugas, p.uts, p.uas
+
+    def rekap(self):
+        """List of dict seperti RekapKelas.rekap(), dari salinan saat dipanggil."""
+        return [{'nim': nim, 'nama': d['mhs'].nama, 'hadir': d['mhs'].hadir_persen,
+                 'akhir': d['akhir'], 'predikat': d['predikat']} for nim, d in self._salinan()]
+
+    def kolom_akhir(self):
+        """List nilai akhir dari salinan saat dipanggil, urut seperti iter_komponen."""
+        return [d['akhir'] for _, d in self._salinan()]
+
+    def iter_export(self):
+        """Generator record untuk report builder, dari salinan saat dipanggil."""
+        for nim, d in self._salinan():
+            yield {
+                'student_id': nim,
+                'name': d['mhs'].nama,
+                'attendance_rate': d['mhs'].hadir_persen,
+                'final_score': d['akhir']
+            }
@@ -1,13 +1,71 @@
 # Pengelola daftar mahasiswa dan nilai
 
+from . import instrumen
 from .mahasiswa import Mahasiswa
+from .indeks import KueriIndeksMixin
 from .penilaian import Penilaian
+from .skema_nilai import SKEMA_STANDAR
 
-class RekapKelas:
+class RekapKelas(KueriIndeksMixin):
     """Kelas untuk menyimpan banyak mahasiswa beserta nilai mereka."""
     def __init__(self):
-        # struktur internal sederhana: nim -> {'mhs': Mahasiswa, 'nilai': Penilaian}
+        # struktur internal sederhana:
+        # nim -> {'mhs': Mahasiswa, 'nilai': Penilaian, 'akhir': float, 'predikat': str}
+        # 'akhir' dan 'predikat' adalah cache, dihitung ulang hanya untuk NIM di _kotor
         self._data_by_nim = {}
+        self._kotor = set()
+        # skema penilaian (bobot + batas predikat), lihat tracker.skema_nilai
+        self.skema = SKEMA_STANDAR
+        # indeks terurut nilai akhir / hadir (lihat tracker.indeks), dibangun saat query pertama
+        self._idx_akhir = None
+        self._idx_hadir = None
+        self._kotor_idx = set()
+        # naik setiap kali data berubah; dipakai sebagai kunci cache (misal tracker.server)
+        self.versi = 0
+        # jurnal opsional (lihat tracker.jurnal); None = perubahan tidak dicatat
+        self.jurnal = None
+
+    @classmethod
+    def dari_kolom(cls, nim, nama, hadir, quiz, tugas, uts, uas, akhir=None, pred=None):
+        """
+        Bangun rekap sekaligus dari kolom yang sudah tervalidasi (snapshot biner,
+        database): angka 0..100 dengan 2 desimal, NIM unik. Objek dibuat lewat
+        banyak_dari_kolom tanpa setter, nilai akhir dihitung sekali saat dibutuhkan.
+        Jika akhir dan pred (hasil skema.hitung_kelas) diberikan, dipakai apa adanya.
+        """
+        rekap = cls()
+        rekap.isi_kolom(nim, nama, hadir, quiz, tugas, uts, uas, akhir, pred)
+        return rekap
+
+    def isi_kolom(self, nim, nama, hadir, quiz, tugas, uts, uas, akhir=None, pred=None):
+        """Seperti dari_kolom, tetapi mengisi rekap ini (harus masih kosong, misal saat bootstrap)."""
+        skor = None if akhir is None or pred is None else (akhir, pred)
+        self._isi_kolom(Mahasiswa.banyak_dari_kolom(nim, nama, hadir),
+                        Penilaian.banyak_dari_kolom(quiz, tugas, uts, uas), skor)
+
+    def _isi_kolom(self, mhs, nilai, skor=None):
+        """Isi rekap kosong dari list Mahasiswa + Penilaian yang sejajar (skor: (akhir, pred) atau None)."""
+        # data.update di bawah akan menimpa entri lama tanpa membereskan indeks/_kotor
+        if self._data_by_nim:
+            raise ValueError("isi_kolom hanya untuk rekap kosong")
+        # cek NIM ganda sebelum mengubah apa pun, supaya rekap tidak terisi setengah
+        if len({m.nim for m in mhs}) != len(mhs):
+            raise KeyError("NIM ganda di data kolom")
+        data = self._data_by_nim
+        if skor is None:
+            data.update((m.nim, {'mhs': m, 'nilai': p, 'akhir': 0.0, 'predikat': "E"}) for m, p in zip(mhs, nilai))
+        else:
+            data.update((m.nim, {'mhs': m, 'nilai': p, 'akhir': a, 'predikat': h})
+                        for m, p, a, h in zip(mhs, nilai, *skor))
+        if skor is None:
+            self._kotor.update(data)
+        self.versi += 1
+
+    def __len__(self):
+        return len(self._data_by_nim)
+
+    def __contains__(self, nim):
+        return nim in self._data_by_nim
 
     def tambah_mahasiswa(self, mhs):
         """Tambah objek Mahasiswa baru. Validasi tipe sederhana."""
@@ -16,71 +74,144 @@ class RekapKelas:
         if mhs.nim in self._data_by_nim:
             raise KeyError("NIM sudah terdaftar: " + str(mhs.nim))
         # buat entry baru dengan objek Penilaian kosong
-        self._data_by_nim[mhs.nim] = {'mhs': mhs, 'nilai': Penilaian()}
+        self._data_by_nim[mhs.nim] = {'mhs': mhs, 'nilai': Penilaian(), 'akhir': 0.0, 'predikat': "E"}
+        self._kotor.add(mhs.nim)
+        self._tandai_indeks(mhs.nim)
+        if self.jurnal is not None:
+            self.jurnal.catat("tambah", mhs.nim, nama=mhs.nama, hadir=mhs.hadir_persen)
+
+    def nama_mahasiswa(self, nim):
+        """Kembalikan nama mahasiswa berdasarkan NIM."""
+        if nim not in self._data_by_nim:
+            raise KeyError("NIM tidak ditemukan")
+        return self._data_by_nim[nim]['mhs'].nama
 
     def ubah_hadir(self, nim, persen):
         """Ubah persen hadir mahasiswa berdasarkan NIM."""
         if nim not in self._data_by_nim:
             raise KeyError("NIM tidak ditemukan")
         # pakai property pada objek mahasiswa
-        self._data_by_nim[nim]['mhs'].hadir_persen = persen
+        m = self._data_by_nim[nim]['mhs']
+        m.hadir_persen = persen
+        self._tandai_indeks(nim)
+        if self.jurnal is not None:
+            self.jurnal.catat("hadir", nim, persen=m.hadir_persen)
 
     def ubah_penilaian(self, nim, quiz=None, tugas=None, uts=None, uas=None):
         """Ubah komponen nilai (jika parameter None maka tidak diubah)."""
         if nim not in self._data_by_nim:
             raise KeyError("NIM tidak ditemukan")
         p = self._data_by_nim[nim]['nilai']
-        if quiz is not None:
-            p.quiz = quiz
-        if tugas is not None:
-            p.tugas = tugas
-        if uts is not None:
-            p.uts = uts
-        if uas is not None:
-            p.uas = uas
+        # validasi semua dulu supaya nilai tidak berubah setengah jalan
+        # (memori dan jurnal harus selalu sama)
+        baru = []
+        for nama, v in (("quiz", quiz), ("tugas", tugas), ("uts", uts), ("uas", uas)):
+            if v is not None:
+                baru.append((nama, p._validate(v)))
+        if not baru:
+            return
+        for nama, x in baru:
+            setattr(p, nama, x)
+        self._kotor.add(nim)
+        self._tandai_indeks(nim)
+        if self.jurnal is not None:
+            self.jurnal.catat("nilai", nim, quiz=p.quiz, tugas=p.tugas, uts=p.uts, uas=p.uas)
 
     def predikat(self, skor):
-        """Konversi skor jadi huruf A..E (aturan tugas)."""
-        if skor >= 85:
-            return "A"
-        if skor >= 75:
-            return "B"
-        if skor >= 65:
-            return "C"
-        if skor >= 50:
-            return "D"
-        return "E"
+        """Konversi skor jadi huruf predikat menurut skema yang dipakai."""
+        return self.skema.predikat(skor)
+
+    def pakai_skema(self, skema):
+        """Ganti skema penilaian; semua nilai akhir dihitung ulang saat dibutuhkan (kecuali skemanya sama)."""
+        if not skema.standar:
+            raise ValueError(f"skema {skema.nama}: RekapKelas hanya menyimpan quiz, tugas, uts, uas")
+        if skema.sama(self.skema):
+            # bobot dan batas sama: nilai akhir yang sudah dihitung tetap berlaku
+            self.skema = skema
+            return
+        self.skema = skema
+        self.versi += 1
+        self._kotor.update(self._data_by_nim)
+        self._idx_akhir = None
+
+    def _kolom_nilai(self, entries):
+        """Kumpulkan komponen nilai dari entries jadi empat kolom."""
+        nilai = [d['nilai'] for d in entries]
+        return (
+            [p.quiz for p in nilai],
+            [p.tugas for p in nilai],
+            [p.uts for p in nilai],
+            [p.uas for p in nilai],
+        )
+
+    def _segarkan(self):
+        """Hitung ulang nilai akhir + predikat hanya untuk NIM yang kotor."""
+        if not self._kotor:
+            return
+        with instrumen.tahap("skor.hitung", len(self._kotor)):
+            entries = [self._data_by_nim[nim] for nim in self._kotor]
+            akhir, pred = self.skema.hitung_kelas(*self._kolom_nilai(entries))
+            for i, d in enumerate(entries):
+                d['akhir'] = akhir[i]
+                d['predikat'] = pred[i]
+        self._kotor.clear()
+
+    def _kunci_indeks(self, kunci):
+        """(nim, akhir, hadir) untuk NIM di kunci (None = semua), dipakai KueriIndeksMixin."""
+        data = self._data_by_nim
+        for nim in (data if kunci is None else kunci):
+            d = data[nim]
+            yield nim, d['akhir'], d['mhs'].hadir_persen
+
+    def _baris_rekap(self, nim):
+        d = self._data_by_nim[nim]
+        return {'nim': nim, 'nama': d['mhs'].nama, 'hadir': d['mhs'].hadir_persen,
+                'akhir': d['akhir'], 'predikat': d['predikat']}
+
+    def nilai_akhir(self, nim):
+        """Nilai akhir satu mahasiswa (dari cache)."""
+        if nim not in self._data_by_nim:
+            raise KeyError("NIM tidak ditemukan")
+        self._segarkan()
+        return self._data_by_nim[nim]['akhir']
+
+    def iter_komponen(self):
+        """Generator (nim, nama, hadir, quiz, tugas, uts, uas) untuk semua mahasiswa."""
+        for nim, d in self._data_by_nim.items():
+            p = d['nilai']
+            yield nim, d['mhs'].nama, d['mhs'].hadir_persen, p.quiz, p.tugas, p.uts, p.uas
 
     def rekap(self):
         """Kembalikan list of dict yang mudah dipakai untuk tampilkan di CLI."""
+        self._segarkan()
         out = []
-        # loop manual di semua mahasiswa
-        for nim in self._data_by_nim:
-            d = self._data_by_nim[nim]
-            m = d['mhs']
-            p = d['nilai']
-            akhir = p.nilai_akhir()
-            row = {
-                'nim': nim,
-                'nama': m.nama,
-                'hadir': m.hadir_persen,
-                'akhir': akhir,
-                'predikat': self.predikat(akhir)
-            }
-            out.append(row)
+        with instrumen.tahap("rekap.baris", len(self._data_by_nim)):
+            for nim, d in self._data_by_nim.items():
+                out.append({
+                    'nim': nim,
+                    'nama': d['mhs'].nama,
+                    'hadir': d['mhs'].hadir_persen,
+                    'akhir': d['akhir'],
+                    'predikat': d['predikat']
+                })
         return out
 
+    def kolom_akhir(self):
+        """List nilai akhir semua mahasiswa, urut seperti iter_komponen (tanpa dict per baris)."""
+        self._segarkan()
+        return [d['akhir'] for d in self._data_by_nim.values()]
+
+    def iter_export(self):
+        """Generator record untuk report builder, tanpa membuat list seluruh kelas."""
+        self._segarkan()
+        for nim, d in self._data_by_nim.items():
+            yield {
+                'student_id': nim,
+                'name': d['mhs'].nama,
+                'attendance_rate': d['mhs'].hadir_persen,
+                'final_score': d['akhir']
+            }
+
     def export_for_report(self):
         """Bentuk data yang cocok untuk report builder (markdown/html)."""
-        rows = []
-        for nim in self._data_by_nim:
-            d = self._data_by_nim[nim]
-            m = d['mhs']
-            p = d['nilai']
-            rows.append({
-                'student_id': nim,
-                'name': m.nama,
-                'attendance_rate': m.hadir_persen,
-                'final_score': p.nilai_akhir()
-            })
-        return rows
+        return list(self.iter_export())
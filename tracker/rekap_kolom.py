@@ -0,0 +1,255 @@
+# Versi kolumnar dari RekapKelas untuk data besar (satu fakultas / kampus)
+
+from array import array
+
+from . import instrumen
+from .indeks import KueriIndeksMixin
+from .mahasiswa import Mahasiswa
+from .skema_nilai import SKEMA_STANDAR
+
+
+def _validasi_angka(v, label):
+    """Validasi angka 0..100 (aturan sama dengan Mahasiswa/Penilaian)."""
+    if v is None:
+        raise ValueError(label + " tidak boleh None")
+    try:
+        x = float(v)
+    except Exception:
+        raise ValueError(label + " harus angka")
+    if x < 0 or x > 100:
+        raise ValueError(label + " harus antara 0 dan 100")
+    return round(x, 2)
+
+
+class RekapKelasKolom(KueriIndeksMixin):
+    """
+    Pengganti RekapKelas yang menyimpan data per kolom, bukan per objek.
+
+    NIM dipetakan ke nomor baris lewat satu dict, lalu hadir/quiz/tugas/uts/uas
+    disimpan di array('d') yang bersebelahan di memori. API-nya sama dengan
+    RekapKelas sehingga app.py bisa memakai salah satunya.
+    """
+    def __init__(self):
+        # nim -> nomor baris
+        self._indeks = {}
+        self._nim = []
+        self._nama = []
+        self._hadir = array('d')
+        self._quiz = array('d')
+        self._tugas = array('d')
+        self._uts = array('d')
+        self._uas = array('d')
+        # cache nilai akhir + predikat per baris; baris di _kotor perlu dihitung ulang
+        self._akhir = array('d')
+        self._pred = []
+        self._kotor = set()
+        # skema penilaian (bobot + batas predikat), lihat tracker.skema_nilai
+        self.skema = SKEMA_STANDAR
+        # indeks terurut nilai akhir / hadir per baris (lihat tracker.indeks)
+        self._idx_akhir = None
+        self._idx_hadir = None
+        self._kotor_idx = set()
+        # naik setiap kali data berubah; dipakai sebagai kunci cache (misal tracker.server)
+        self.versi = 0
+        # jurnal opsional (lihat tracker.jurnal); None = perubahan tidak dicatat
+        self.jurnal = None
+
+    @classmethod
+    def dari_kolom(cls, nim, nama, hadir, quiz, tugas, uts, uas, akhir=None, pred=None):
+        """
+        Bangun rekap langsung dari kolom yang sudah tervalidasi (misal dari snapshot).
+        Tidak ada validasi per nilai; NIM harus unik. Jika akhir dan pred (hasil
+        skema.hitung_kelas) diberikan, cache dipakai apa adanya tanpa hitung ulang.
+        """
+        rekap = cls()
+        rekap.isi_kolom(nim, nama, hadir, quiz, tugas, uts, uas, akhir, pred)
+        return rekap
+
+    def isi_kolom(self, nim, nama, hadir, quiz, tugas, uts, uas, akhir=None, pred=None):
+        """Seperti dari_kolom, tetapi mengisi rekap ini (harus masih kosong, misal saat bootstrap)."""
+        if len(self):
+            raise ValueError("isi_kolom hanya untuk rekap kosong")
+        nim = list(nim)
+        indeks = dict(zip(nim, range(len(nim))))
+        # cek NIM ganda sebelum mengubah apa pun, supaya rekap tidak terisi setengah
+        if len(indeks) != len(nim):
+            raise KeyError("NIM ganda di data kolom")
+        self._nim = nim
+        self._nama = list(nama)
+        self._indeks = indeks
+        self._hadir = array('d', hadir)
+        self._quiz = array('d', quiz)
+        self._tugas = array('d', tugas)
+        self._uts = array('d', uts)
+        self._uas = array('d', uas)
+        n = len(self._nim)
+        if akhir is not None and pred is not None:
+            self._akhir = array('d', akhir)
+            self._pred = list(pred)
+        else:
+            self._akhir = array('d', bytes(8 * n))
+            self._pred = ["E"] * n
+            self._kotor = set(range(n))
+        self.versi += 1
+
+    def __len__(self):
+        return len(self._nim)
+
+    def __contains__(self, nim):
+        return nim in self._indeks
+
+    def _baris(self, nim):
+        """Ambil nomor baris untuk NIM, atau KeyError jika tidak ada."""
+        i = self._indeks.get(nim)
+        if i is None:
+            raise KeyError("NIM tidak ditemukan")
+        return i
+
+    def tambah_mahasiswa(self, mhs):
+        """Tambah objek Mahasiswa baru (disalin ke kolom, objeknya tidak disimpan)."""
+        if not isinstance(mhs, Mahasiswa):
+            raise TypeError("tambah_mahasiswa membutuhkan objek Mahasiswa")
+        if mhs.nim in self._indeks:
+            raise KeyError("NIM sudah terdaftar: " + str(mhs.nim))
+        self._indeks[mhs.nim] = len(self._nim)
+        self._nim.append(mhs.nim)
+        self._nama.append(mhs.nama)
+        self._hadir.append(mhs.hadir_persen)
+        # nilai awal 0 seperti Penilaian() kosong
+        self._quiz.append(0.0)
+        self._tugas.append(0.0)
+        self._uts.append(0.0)
+        self._uas.append(0.0)
+        self._akhir.append(0.0)
+        self._pred.append("E")
+        self._kotor.add(len(self._nim) - 1)
+        self._tandai_indeks(len(self._nim) - 1)
+        if self.jurnal is not None:
+            self.jurnal.catat("tambah", mhs.nim, nama=mhs.nama, hadir=mhs.hadir_persen)
+
+    def nama_mahasiswa(self, nim):
+        """Kembalikan nama mahasiswa berdasarkan NIM."""
+        return self._nama[self._baris(nim)]
+
+    def ubah_hadir(self, nim, persen):
+        """Ubah persen hadir mahasiswa berdasarkan NIM."""
+        i = self._baris(nim)
+        self._hadir[i] = _validasi_angka(persen, "hadir_persen")
+        self._tandai_indeks(i)
+        if self.jurnal is not None:
+            self.jurnal.catat("hadir", nim, persen=self._hadir[i])
+
+    def ubah_penilaian(self, nim, quiz=None, tugas=None, uts=None, uas=None):
+        """Ubah komponen nilai (jika parameter None maka tidak diubah)."""
+        i = self._baris(nim)
+        # validasi semua dulu supaya baris tidak berubah setengah jalan
+        baru = []
+        for kolom, v in ((self._quiz, quiz), (self._tugas, tugas), (self._uts, uts), (self._uas, uas)):
+            if v is not None:
+                baru.append((kolom, _validasi_angka(v, "nilai")))
+        for kolom, x in baru:
+            kolom[i] = x
+        if baru:
+            self._kotor.add(i)
+            self._tandai_indeks(i)
+            if self.jurnal is not None:
+                self.jurnal.catat("nilai", nim, quiz=self._quiz[i], tugas=self._tugas[i],
+                                  uts=self._uts[i], uas=self._uas[i])
+
+    def predikat(self, skor):
+        """Konversi skor jadi huruf predikat menurut skema yang dipakai."""
+        return self.skema.predikat(skor)
+
+    def pakai_skema(self, skema):
+        """Ganti skema penilaian; semua nilai akhir dihitung ulang saat dibutuhkan (kecuali skemanya sama)."""
+        if not skema.standar:
+            raise ValueError(f"skema {skema.nama}: RekapKelasKolom hanya menyimpan quiz, tugas, uts, uas")
+        if skema.sama(self.skema):
+            # bobot dan batas sama: nilai akhir yang sudah dihitung tetap berlaku
+            self.skema = skema
+            return
+        self.skema = skema
+        self.versi += 1
+        self._kotor = set(range(len(self._nim)))
+        self._idx_akhir = None
+
+    def _segarkan(self):
+        """Hitung ulang nilai akhir + predikat hanya untuk baris yang kotor."""
+        if not self._kotor:
+            return
+        with instrumen.tahap("skor.hitung", len(self._kotor)):
+            self._hitung_kotor()
+        self._kotor.clear()
+
+    def _hitung_kotor(self):
+        """Isi _akhir/_pred untuk baris di _kotor (dipanggil _segarkan)."""
+        if len(self._kotor) == len(self._nim):
+            # semua baris kotor (misal setelah ganti skema): hitung langsung dari kolom utuh
+            self._akhir, self._pred = self.skema.hitung_kelas(self._quiz, self._tugas, self._uts, self._uas)
+            return
+        baris = list(self._kotor)
+        akhir, pred = self.skema.hitung_kelas(
+            [self._quiz[i] for i in baris],
+            [self._tugas[i] for i in baris],
+            [self._uts[i] for i in baris],
+            [self._uas[i] for i in baris],
+        )
+        for k, i in enumerate(baris):
+            self._akhir[i] = akhir[k]
+            self._pred[i] = pred[k]
+
+    def _kunci_indeks(self, kunci):
+        """(nim, akhir, hadir) untuk baris di kunci (None = semua), dipakai KueriIndeksMixin."""
+        if kunci is None:
+            return zip(self._nim, self._akhir, self._hadir)
+        return ((self._nim[i], self._akhir[i], self._hadir[i]) for i in kunci)
+
+    def _baris_rekap(self, nim):
+        i = self._indeks[nim]
+        return {'nim': nim, 'nama': self._nama[i], 'hadir': self._hadir[i],
+                'akhir': self._akhir[i], 'predikat': self._pred[i]}
+
+    def nilai_akhir(self, nim):
+        """Nilai akhir satu mahasiswa (dari cache)."""
+        i = self._baris(nim)
+        self._segarkan()
+        return self._akhir[i]
+
+    def iter_komponen(self):
+        """Generator (nim, nama, hadir, quiz, tugas, uts, uas) untuk semua mahasiswa."""
+        return zip(self._nim, self._nama, self._hadir, self._quiz, self._tugas, self._uts, self._uas)
+
+    def rekap(self):
+        """Kembalikan list of dict yang mudah dipakai untuk tampilkan di CLI."""
+        self._segarkan()
+        out = []
+        with instrumen.tahap("rekap.baris", len(self._nim)):
+            for i, nim in enumerate(self._nim):
+                out.append({
+                    'nim': nim,
+                    'nama': self._nama[i],
+                    'hadir': self._hadir[i],
+                    'akhir': self._akhir[i],
+                    'predikat': self._pred[i]
+                })
+        return out
+
+    def kolom_akhir(self):
+        """Array nilai akhir semua baris, urut seperti iter_komponen."""
+        self._segarkan()
+        return self._akhir
+
+    def iter_export(self):
+        """Generator record untuk report builder, tanpa membuat list seluruh kelas."""
+        self._segarkan()
+        for i, nim in enumerate(self._nim):
+            yield {
+                'student_id': nim,
+                'name': self._nama[i],
+                'attendance_rate': self._hadir[i],
+                'final_score': self._akhir[i]
+            }
+
+    def export_for_report(self):
+        """Bentuk data yang cocok untuk report builder (markdown/html)."""
+        return list(self.iter_export())
@@ -0,0 +1,202 @@
+# Mesin render laporan: kepala/ekor tetap + template baris yang dikompilasi sekali
+
+import time
+from itertools import islice
+
+from . import instrumen
+from .skema_nilai import SKEMA_STANDAR
+from .statistik import StatistikKelas, baris_distribusi, baris_ringkasan
+
+# jumlah baris yang diproses dan ditulis sekaligus
+UKURAN_POTONGAN = 4096
+
+# warna latar baris HTML per predikat
+WARNA_PREDIKAT = {
+    "A": "#e6ffe6",
+    "B": "#e6f0ff",
+    "C": "#fff4e6",
+    "D": "#ffe6e6",
+    "E": "#ffd6d6",
+}
+WARNA_DEFAULT = "#ffffff"
+
+
+def _angka(r, key):
+    """Ambil angka dari record, nilai kosong/tidak valid dianggap 0."""
+    v = r.get(key, 0.0)
+    if type(v) is float:
+        # jalur cepat: record dari RekapKelas sudah berupa float
+        return v
+    try:
+        return float(v or 0.0)
+    except Exception:
+        return 0.0
+
+
+def siapkan_baris(records, skema=SKEMA_STANDAR):
+    """
+    Ubah records jadi list (sid, name, att, score) dan hitung semua predikat
+    sekaligus dari kolom score (batas predikat dari skema).
+    """
+    rows = [(r.get("student_id", ""), r.get("name", ""), _angka(r, "attendance_rate"), _angka(r, "final_score"))
+            for r in records]
+    letters = skema.hitung_predikat([row[3] for row in rows])
+    return rows, letters
+
+
+def potongan(records, ukuran=UKURAN_POTONGAN, skema=SKEMA_STANDAR):
+    """
+    Generator (rows, letters) per potongan records, supaya memori tetap kecil
+    berapa pun jumlah record (records boleh berupa generator).
+    """
+    it = iter(records)
+    while True:
+        bagian = list(islice(it, ukuran))
+        if not bagian:
+            return
+        yield siapkan_baris(bagian, skema)
+
+
+def kompilasi_baris(template):
+    """
+    Ubah template baris (placeholder {sid} {name} {att} {score} {pred} {bg},
+    boleh dengan format spec seperti {att:.2f}) jadi fungsi f-string.
+    Template diparse sekali di sini; saat render tidak ada parsing format lagi.
+    """
+    return eval("lambda sid, name, att, score, pred, bg: f" + repr(template), {})
+
+
+def ringkasan_md(stat):
+    """Bagian ringkasan statistik laporan markdown."""
+    out = ["\n## Ringkasan\n\n",
+           "| Statistik | Nilai Akhir | Hadir (%) |\n",
+           "|---|---:|---:|\n"]
+    out += [f"| {label} | {akhir} | {hadir} |\n" for label, akhir, hadir in baris_ringkasan(stat)]
+    out += ["\n| Predikat | Jumlah | Persen |\n",
+            "|:---:|---:|---:|\n"]
+    out += [f"| {huruf} | {c} | {persen} |\n" for huruf, c, persen in baris_distribusi(stat)]
+    return "".join(out)
+
+
+def ringkasan_html(stat):
+    """Bagian ringkasan statistik laporan HTML."""
+    out = ["<h2>Ringkasan</h2>"
+           "<table><thead><tr><th>Statistik</th><th style=\"text-align:right\">Nilai Akhir</th>"
+           "<th style=\"text-align:right\">Hadir (%)</th></tr></thead><tbody>"]
+    out += [f"<tr><td>{label}</td><td style=\"text-align:right\">{akhir}</td>"
+            f"<td style=\"text-align:right\">{hadir}</td></tr>"
+            for label, akhir, hadir in baris_ringkasan(stat)]
+    out.append("</tbody></table>"
+               "<table style=\"margin-top:12px\"><thead><tr><th style=\"text-align:center\">Predikat</th>"
+               "<th style=\"text-align:right\">Jumlah</th><th style=\"text-align:right\">Persen</th></tr></thead><tbody>")
+    out += [f"<tr style=\"background:{WARNA_PREDIKAT.get(huruf, WARNA_DEFAULT)}\">"
+            f"<td style=\"text-align:center\">{huruf}</td><td style=\"text-align:right\">{c}</td>"
+            f"<td style=\"text-align:right\">{persen}</td></tr>"
+            for huruf, c, persen in baris_distribusi(stat)]
+    out.append("</tbody></table>")
+    return "".join(out)
+
+
+class FormatLaporan:
+    """
+    Satu format laporan: kepala, template baris terkompilasi, pemisah baris, dan ekor.
+    penutup_tabel: teks penutup tabel baris, ditulis langsung setelah baris terakhir.
+    ringkasan: fungsi StatistikKelas -> teks yang ditulis sesudah penutup_tabel dan
+    sebelum ekor (None = tanpa ringkasan).
+    """
+    def __init__(self, nama, kepala, baris, ekor, pemisah="", ringkasan=None, penutup_tabel=""):
+        self.nama = nama
+        self.kepala = kepala
+        self.template = baris
+        self.baris = kompilasi_baris(baris)
+        self.ekor = ekor
+        self.penutup_tabel = penutup_tabel
+        self.pemisah = pemisah
+        self.ringkasan = ringkasan
+
+
+FORMAT_MD = FormatLaporan(
+    "md",
+    "# Rekap Nilai Mahasiswa\n\n"
+    "| NIM | Nama | Hadir (%) | Nilai Akhir | Predikat |\n"
+    "|---|---|---:|---:|:---:|\n",
+    "| {sid} | {name} | {att:.2f} | {score:.2f} | {pred} |\n",
+    "\nGenerated by student_performance_tracker",
+    ringkasan=ringkasan_md,
+)
+
+FORMAT_HTML = FormatLaporan(
+    "html",
+    "<!doctype html><html lang=\"id\"><head><meta charset=\"utf-8\"/>"
+    "<meta name=\"viewport\" content=\"width=device-width,initial-scale=1\"/>"
+    "<title>Rekap Nilai Mahasiswa</title>"
+    "<style>body{font-family:Arial,Helvetica,sans-serif;padding:20px;}table{border-collapse:collapse;width:100%;}"
+    "th,td{border:1px solid #ccc;padding:8px 10px;}th{background:#f7f7f7;text-align:left;}</style>"
+    "</head><body>"
+    "<h1>Rekap Nilai Mahasiswa</h1>"
+    "<table><thead>"
+    "<tr><th>NIM</th><th>Nama</th><th style=\"text-align:right\">Hadir (%)</th><th style=\"text-align:right\">Nilai Akhir</th><th style=\"text-align:center\">Predikat</th></tr>"
+    "</thead><tbody>",
+    "<tr style=\"background:{bg}\"><td>{sid}</td><td>{name}</td>"
+    "<td style=\"text-align:right\">{att:.2f}</td>"
+    "<td style=\"text-align:right\">{score:.2f}</td>"
+    "<td style=\"text-align:center\">{pred}</td></tr>",
+    "<p style=\"margin-top:12px;color:#666\">Generated by student_performance_tracker</p>"
+    "</body></html>",
+    pemisah="\n",
+    ringkasan=ringkasan_html,
+    # tabel baris ditutup dulu, supaya ringkasan tidak masuk ke dalam <tbody>
+    penutup_tabel="</tbody></table>",
+)
+
+FORMAT_TEKS = FormatLaporan(
+    "txt",
+    "REKAP NILAI MAHASISWA\n\n"
+    "NIM          Nama                           Hadir (%)  Nilai Akhir  Predikat\n"
+    "------------ ------------------------------ ---------  -----------  --------\n",
+    "{sid!s:<12} {name!s:<30} {att:>9.2f}  {score:>11.2f}  {pred:^8}\n",
+    "\nGenerated by student_performance_tracker\n",
+)
+
+FORMAT = {f.nama: f for f in (FORMAT_MD, FORMAT_HTML, FORMAT_TEKS)}
+
+
+def render(records, fp, fmt, ringkasan=True, skema=None):
+    """
+    Tulis laporan ke stream fp dengan FormatLaporan fmt (atau namanya: md/html/txt).
+    skema: SkemaPenilaian untuk predikat (None = skema standar).
+    ringkasan=True: statistik kelas dihitung di lewat yang sama dan ditulis sebelum ekor
+    (hanya jika formatnya punya bagian ringkasan). Kembalikan StatistikKelas atau None.
+    """
+    if isinstance(fmt, str):
+        fmt = FORMAT[fmt]
+    baris = fmt.baris
+    pemisah = fmt.pemisah
+    warna = WARNA_PREDIKAT.get
+    if skema is None:
+        skema = SKEMA_STANDAR
+    stat = StatistikKelas(skema.huruf) if ringkasan and fmt.ringkasan is not None else None
+    ukur = instrumen.AKTIF
+    if ukur:
+        t0 = time.perf_counter()
+        n = 0
+    fp.write(fmt.kepala)
+    awal = ""
+    for rows, letters in potongan(records, skema=skema):
+        if ukur:
+            n += len(rows)
+        fp.write(awal + pemisah.join([
+            baris(sid, name, att, score, pred, warna(pred, WARNA_DEFAULT))
+            for (sid, name, att, score), pred in zip(rows, letters)
+        ]))
+        awal = pemisah
+        if stat is not None:
+            stat.tambah_potongan([r[3] for r in rows], [r[2] for r in rows], letters)
+    fp.write(fmt.penutup_tabel)
+    if stat is not None:
+        fp.write(fmt.ringkasan(stat))
+    fp.write(fmt.ekor)
+    if ukur:
+        # termasuk waktu pemberi records (misal iter_export) dan penulisan ke fp
+        instrumen.catat("laporan.render." + fmt.nama, time.perf_counter() - t0, n)
+    return stat
@@ -1,50 +1,34 @@
+import gzip
+import io
 from pathlib import Path
 
-def letter_grade(score):
-    """Konversi nilai numerik ke huruf A..E (aturan tugas)."""
+from . import instrumen
+from .render import FORMAT_HTML, FORMAT_MD, FORMAT_TEKS, render
+from .skema_nilai import SKEMA_STANDAR
+
+def letter_grade(score, skema=SKEMA_STANDAR):
+    """Konversi nilai numerik ke huruf A..E (aturan tugas, atau batas dari skema)."""
     try:
         s = float(score)
     except Exception:
         s = 0.0
-    if s >= 85:
-        return "A"
-    if s >= 75:
-        return "B"
-    if s >= 65:
-        return "C"
-    if s >= 50:
-        return "D"
-    return "E"
+    return skema.predikat(s)
 
-def build_markdown_report(records):
+def tulis_markdown_report(records, fp, skema=None):
+    """
+    Tulis laporan markdown langsung ke stream fp (file teks / StringIO), per potongan.
+    records: iterable dict dengan kunci student_id, name, attendance_rate, final_score
     """
-    Bangun konten markdown secara manual.
+    render(records, fp, FORMAT_MD, skema=skema)
+
+def build_markdown_report(records, skema=None):
+    """
+    Bangun konten markdown sebagai string.
     records harus list of dict dengan kunci: student_id, name, attendance_rate, final_score
     """
-    lines = []
-    lines.append("# Rekap Nilai Mahasiswa")
-    lines.append("")
-    lines.append("| NIM | Nama | Hadir (%) | Nilai Akhir | Predikat |")
-    lines.append("|---|---|---:|---:|:---:|")
-    # tambahkan baris untuk setiap record
-    for r in records:
-        sid = r.get("student_id", "")
-        name = r.get("name", "")
-        try:
-            att = float(r.get("attendance_rate", 0.0) or 0.0)
-        except Exception:
-            att = 0.0
-        try:
-            score = float(r.get("final_score", 0.0) or 0.0)
-        except Exception:
-            score = 0.0
-        pred = letter_grade(score)
-        lines.append("| {} | {} | {:.2f} | {:.2f} | {} |".format(sid, name, att, score, pred))
-    lines.append("")
-    lines.append("Generated by student_performance_tracker")
-    # gabungkan
-    md = "\n".join(lines)
-    return md
+    buf = io.StringIO()
+    tulis_markdown_report(records, buf, skema)
+    return buf.getvalue()
 
 def save_text(path, content):
     """Simpan content (string) ke file path (buat file jika belum ada)."""
@@ -52,61 +36,52 @@ def save_text(path, content):
     p.parent.mkdir(parents=True, exist_ok=True)
     p.write_text(content, encoding="utf-8")
 
-def build_html_report(records):
-    """Bangun HTML sederhana. Warna latar berdasarkan predikat (manual)."""
-    def color_for(letter):
-        if letter == "A":
-            return "#e6ffe6"
-        if letter == "B":
-            return "#e6f0ff"
-        if letter == "C":
-            return "#fff4e6"
-        if letter == "D":
-            return "#ffe6e6"
-        if letter == "E":
-            return "#ffd6d6"
-        return "#ffffff"
+def tulis_html_report(records, fp, skema=None):
+    """Tulis laporan HTML langsung ke stream fp, per potongan. Warna latar berdasarkan predikat."""
+    render(records, fp, FORMAT_HTML, skema=skema)
+
+def tulis_teks_report(records, fp, skema=None):
+    """Tulis laporan teks biasa (kolom lebar tetap) ke stream fp."""
+    render(records, fp, FORMAT_TEKS, skema=skema)
 
-    rows_html = []
-    for r in records:
-        sid = r.get("student_id", "")
-        name = r.get("name", "")
-        try:
-            att = float(r.get("attendance_rate", 0.0) or 0.0)
-        except Exception:
-            att = 0.0
-        try:
-            score = float(r.get("final_score", 0.0) or 0.0)
-        except Exception:
-            score = 0.0
-        letter = letter_grade(score)
-        bg = color_for(letter)
-        # buat baris HTML manual
-        row_html = (
-            "<tr style=\"background:{}\">".format(bg) +
-            "<td>{}</td>".format(sid) +
-            "<td>{}</td>".format(name) +
-            "<td style=\"text-align:right\">{:.2f}</td>".format(att) +
-            "<td style=\"text-align:right\">{:.2f}</td>".format(score) +
-            "<td style=\"text-align:center\">{}</td>".format(letter) +
-            "</tr>"
-        )
-        rows_html.append(row_html)
+def build_html_report(records, skema=None):
+    """Bangun HTML sederhana sebagai string. Warna latar berdasarkan predikat (manual)."""
+    buf = io.StringIO()
+    tulis_html_report(records, buf, skema)
+    return buf.getvalue()
 
-    html = (
-        "<!doctype html><html lang=\"id\"><head><meta charset=\"utf-8\"/>"
-        "<meta name=\"viewport\" content=\"width=device-width,initial-scale=1\"/>"
-        "<title>Rekap Nilai Mahasiswa</title>"
-        "<style>body{font-family:Arial,Helvetica,sans-serif;padding:20px;}table{border-collapse:collapse;width:100%;}"
-        "th,td{border:1px solid #ccc;padding:8px 10px;}th{background:#f7f7f7;text-align:left;}</style>"
-        "</head><body>"
-        "<h1>Rekap Nilai Mahasiswa</h1>"
-        "<table><thead>"
-        "<tr><th>NIM</th><th>Nama</th><th style=\"text-align:right\">Hadir (%)</th><th style=\"text-align:right\">Nilai Akhir</th><th style=\"text-align:center\">Predikat</th></tr>"
-        "</thead><tbody>"
-        + "\n".join(rows_html) +
-        "</tbody></table>"
-        "<p style=\"margin-top:12px;color:#666\">Generated by student_performance_tracker</p>"
-        "</body></html>"
-    )
-    return html
+def build_text_report(records, skema=None):
+    """Bangun laporan teks biasa sebagai string."""
+    buf = io.StringIO()
+    tulis_teks_report(records, buf, skema)
+    return buf.getvalue()
+
+def simpan_report(path, records, fmt=None, gz=None, skema=None):
+    """
+    Tulis laporan langsung ke file tanpa membangun string utuh di memori.
+    fmt: "md", "html", atau "txt" (default dari ekstensi path). gz: tulis terkompres gzip
+    (default True jika path berakhiran .gz). skema: SkemaPenilaian untuk predikat.
+    """
+    p = Path(path)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    suffixes = p.suffixes
+    if gz is None:
+        gz = bool(suffixes) and suffixes[-1] == ".gz"
+    if fmt is None:
+        ext = [s for s in suffixes if s != ".gz"]
+        if ext and ext[-1] in (".html", ".htm"):
+            fmt = "html"
+        elif ext and ext[-1] == ".txt":
+            fmt = "txt"
+        else:
+            fmt = "md"
+    if gz:
+        with gzip.open(p, "wt", encoding="utf-8") as f:
+            render(records, f, fmt, skema=skema)
+    else:
+        # buffer 1 MB supaya penulisan per potongan tidak jadi banyak syscall kecil
+        with p.open("w", encoding="utf-8", buffering=1 << 20) as f:
+            render(records, f, fmt, skema=skema)
+    if instrumen.AKTIF:
+        instrumen.hitung("laporan.byte_ditulis", p.stat().st_size)
+    return p
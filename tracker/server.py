@@ -0,0 +1,344 @@
+# Layanan HTTP/JSON lokal di atas rekap di memori (asyncio, tanpa dependensi luar)
+
+import asyncio
+import json
+import sys
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+ALASAN = {200: "OK", 304: "Not Modified", 400: "Bad Request", 404: "Not Found",
+          405: "Method Not Allowed", 500: "Internal Server Error", 503: "Service Unavailable"}
+# batas default jumlah baris per halaman untuk endpoint yang mengembalikan daftar
+LIMIT_DEFAULT = 100
+# jumlah maksimum hasil kueri utuh di memo (setiap entri bisa sebesar seluruh kelas)
+MAKS_MEMO = 32
+
+
+def _angka(q, nama, default=None):
+    """Parameter query sebagai float (None jika tidak ada), ValueError jika bukan angka."""
+    v = q.get(nama)
+    if v is None or v == "":
+        return default
+    try:
+        return float(v)
+    except ValueError:
+        raise ValueError(f"parameter {nama} harus angka")
+
+
+def _bulat(q, nama, default):
+    v = _angka(q, nama)
+    if v is None:
+        return default
+    if v < 0 or v != int(v):
+        raise ValueError(f"parameter {nama} harus bilangan bulat >= 0")
+    return int(v)
+
+
+# kueri berat yang dihitung lebih dulu (di thread pemuat) sebelum rekap mulai melayani:
+# (nama method rekap, argumen...), "statistik" = hitung_statistik(rekap)
+KUERI_AWAL = (
+    ("rekap",),
+    ("statistik",),
+    ("rentang_akhir", None, 70.0),
+    ("berisiko", 70.0, 75.0),
+)
+
+
+def _hitung(rekap, kunci):
+    """Jalankan satu kueri dengan kunci (nama method, argumen...) terhadap rekap."""
+    if kunci[0] == "statistik":
+        from .statistik import hitung_statistik
+        return hitung_statistik(rekap)
+    return getattr(rekap, kunci[0])(*kunci[1:])
+
+
+def hangatkan(rekap):
+    """Hitung KUERI_AWAL untuk rekap; kembalikan dict kunci -> hasil (isi awal memo Layanan)."""
+    return {kunci: _hitung(rekap, kunci) for kunci in KUERI_AWAL}
+
+
+def _halaman(baris, q):
+    """Potong daftar sesuai ?offset=&limit= dan bungkus dengan jumlah totalnya."""
+    offset = _bulat(q, "offset", 0)
+    limit = _bulat(q, "limit", LIMIT_DEFAULT)
+    return {"jumlah": len(baris), "offset": offset, "data": baris[offset:offset + limit]}
+
+
+class Layanan:
+    """
+    Rekap dimuat sekali, lalu setiap permintaan dijawab dari memori.
+
+    Ada dua cache, keduanya berlaku untuk satu versi data "<generasi>.<rekap.versi>":
+    jawaban JSON yang sudah di-encode (kunci path + query) dan hasil kueri utuh
+    sebelum dipotong per halaman (memo, kunci method + argumen), supaya halaman lain
+    dari kueri yang sama tidak menghitung ulang. Keduanya dibatasi (maks_cache jawaban,
+    maks_memo kueri); jika penuh, entri tertua dibuang, kecuali hasil KUERI_AWAL di memo
+    yang tetap disimpan sampai versi berganti. Generasi naik setiap rekap dimuat
+    ulang, rekap.versi naik setiap rekap diubah, jadi cache lama tidak pernah terbaca
+    setelah data berubah. Versi yang sama dikirim sebagai ETag.
+
+    Server berjalan di satu thread (event loop), jadi kueri yang belum ada di cache
+    menahan permintaan lain selama dihitung. Karena itu kueri berat (KUERI_AWAL)
+    dihitung sebelum rekap mulai melayani.
+
+    muat: fungsi tanpa argumen yang mengembalikan rekap baru (untuk POST /muat-ulang
+    dan pemantauan file). Dijalankan di thread lain; rekap lama tetap melayani
+    permintaan sampai rekap baru siap, lalu ditukar sekaligus.
+    sidik: fungsi tanpa argumen yang mengembalikan sidik file sumber (lihat pantau()).
+    """
+    def __init__(self, rekap, muat=None, sidik=None, maks_cache=4096, maks_memo=MAKS_MEMO):
+        self.rekap = rekap
+        self.generasi = 0
+        self.maks_cache = maks_cache
+        self.maks_memo = maks_memo
+        self._muat = muat
+        self._sidik = sidik
+        self._cache = {}
+        self._memo = {}
+        self._cache_versi = self.versi
+        self._kunci_muat = None
+        self.hit = 0
+        self.miss = 0
+        # endpoint tanpa parameter path: path -> fungsi(q); /versi dijawab tanpa cache
+        self._rute = {
+            "/rekap": self._rekap,
+            "/rekap/rentang": self._rentang,
+            "/rekap/hadir": self._hadir,
+            "/rekap/berisiko": self._berisiko,
+            "/rekap/teratas": self._teratas,
+            "/rekap/terbawah": self._terbawah,
+            "/statistik": self._statistik,
+        }
+        # endpoint dengan satu parameter di akhir path: prefix -> fungsi(nilai, q)
+        self._rute_param = {
+            "/mahasiswa/": self._mahasiswa,
+            "/rekap/predikat/": self._predikat,
+        }
+
+    @property
+    def versi(self):
+        return f"{self.generasi}.{self.rekap.versi}"
+
+    # ---------- endpoint ----------
+    def _versi(self, q):
+        return {"versi": self.versi, "jumlah": len(self.rekap), "skema": self.rekap.skema.nama,
+                "cache": {"hit": self.hit, "miss": self.miss, "isi": len(self._cache)}}
+
+    def _kueri(self, *kunci):
+        """Hasil kueri utuh dari memo versi ini, dihitung jika belum ada."""
+        hasil = self._memo.get(kunci)
+        if hasil is None:
+            hasil = _hitung(self.rekap, kunci)
+            if len(self._memo) >= self.maks_memo:
+                # buang kueri tertua selain KUERI_AWAL (dict menyimpan urutan sisip)
+                for lama in self._memo:
+                    if lama not in KUERI_AWAL:
+                        del self._memo[lama]
+                        break
+            self._memo[kunci] = hasil
+        return hasil
+
+    def _mahasiswa(self, nim, q):
+        return self.rekap.data_mahasiswa(nim)
+
+    def _rekap(self, q):
+        return _halaman(self._kueri("rekap"), q)
+
+    def _rentang(self, q):
+        # sama dengan menu 5 pilihan 2 (nilai akhir < 70) jika tanpa parameter
+        return _halaman(self._kueri("rentang_akhir", _angka(q, "lo"), _angka(q, "hi", 70.0)), q)
+
+    def _hadir(self, q):
+        return _halaman(self._kueri("rentang_hadir", _angka(q, "lo"), _angka(q, "hi", 75.0)), q)
+
+    def _berisiko(self, q):
+        return _halaman(self._kueri("berisiko", _angka(q, "akhir", 70.0), _angka(q, "hadir", 75.0)), q)
+
+    def _predikat(self, huruf, q):
+        if huruf not in self.rekap.skema.huruf:
+            raise KeyError("predikat tidak dikenal: " + huruf)
+        return _halaman(self._kueri("per_predikat", huruf), q)
+
+    def _teratas(self, q):
+        return self.rekap.teratas(_bulat(q, "k", 10))
+
+    def _terbawah(self, q):
+        return self.rekap.terbawah(_bulat(q, "k", 10))
+
+    def _statistik(self, q):
+        lebar = _angka(q, "lebar", 10.0)
+        if lebar <= 0:
+            raise ValueError("parameter lebar harus > 0")
+        stat = self._kueri("statistik")
+        hasil = stat.ringkasan()
+        hasil["histogram_akhir"] = stat.akhir.sketsa.histogram(lebar)
+        return hasil
+
+    # ---------- cache + routing ----------
+    def _cari_rute(self, path):
+        fungsi = self._rute.get(path)
+        if fungsi is not None:
+            return fungsi
+        for prefix, f in self._rute_param.items():
+            if path.startswith(prefix) and len(path) > len(prefix):
+                nilai = unquote(path[len(prefix):])
+                return lambda q: f(nilai, q)
+        return None
+
+    def jawab_get(self, target):
+        """(status, body JSON dalam bytes, versi) untuk satu GET; hasil sukses disimpan di cache."""
+        versi = self.versi
+        if target == "/versi":
+            return 200, _encode(self._versi({})), versi
+        if versi != self._cache_versi:
+            # rekap diubah langsung (bukan dimuat ulang): semua cache versi lama dibuang
+            self._cache = {}
+            self._memo = {}
+            self._cache_versi = versi
+        body = self._cache.get(target)
+        if body is not None:
+            self.hit += 1
+            return 200, body, versi
+        self.miss += 1
+        url = urlsplit(target)
+        fungsi = self._cari_rute(url.path.rstrip("/") or "/")
+        if fungsi is None:
+            return 404, _encode({"galat": "endpoint tidak ada: " + url.path}), versi
+        try:
+            data = fungsi(dict(parse_qsl(url.query)))
+        except KeyError as e:
+            return 404, _encode({"galat": e.args[0] if e.args else "tidak ditemukan"}), versi
+        except ValueError as e:
+            return 400, _encode({"galat": str(e)}), versi
+        except Exception as e:
+            # satu permintaan yang gagal tidak boleh menjatuhkan server
+            return 500, _encode({"galat": f"{type(e).__name__}: {e}"}), versi
+        body = _encode(data)
+        if len(self._cache) >= self.maks_cache:
+            # buang entri tertua (dict menyimpan urutan sisip)
+            del self._cache[next(iter(self._cache))]
+        self._cache[target] = body
+        return 200, body, versi
+
+    async def muat_ulang(self):
+        """Muat rekap baru di thread lain lalu tukar; permintaan lain tetap dilayani selama memuat."""
+        if self._muat is None:
+            raise ValueError("muat ulang tidak tersedia")
+        if self._kunci_muat is None:
+            self._kunci_muat = asyncio.Lock()
+        async with self._kunci_muat:
+            loop = asyncio.get_running_loop()
+            rekap, memo = await loop.run_in_executor(None, self._muat_dan_hangatkan)
+            self.pasang(rekap, memo)
+        return self.versi
+
+    def _muat_dan_hangatkan(self):
+        # kueri awal dihitung di thread pemuat, selagi rekap baru belum dipakai siapa pun
+        rekap = self._muat()
+        return rekap, hangatkan(rekap)
+
+    def pasang(self, rekap, memo=None):
+        """Tukar rekap yang dilayani (generasi baru), beserta memo hasil hangatkan(rekap)."""
+        self.rekap = rekap
+        self.generasi += 1
+        self._cache = {}
+        self._memo = dict(memo or {})
+        self._cache_versi = self.versi
+
+    async def pantau(self, interval):
+        """Cek sidik file sumber setiap interval detik; muat ulang jika berubah."""
+        loop = asyncio.get_running_loop()
+        terakhir = await loop.run_in_executor(None, self._sidik)
+        while True:
+            await asyncio.sleep(interval)
+            sidik = await loop.run_in_executor(None, self._sidik)
+            if sidik != terakhir:
+                terakhir = sidik
+                try:
+                    await self.muat_ulang()
+                except (OSError, KeyError, ValueError) as e:
+                    # misal CSV sedang ditulis; rekap lama tetap dipakai sampai perubahan berikutnya
+                    print(f"! muat ulang gagal: {e}", file=sys.stderr)
+
+    # ---------- HTTP ----------
+    async def tangani(self, reader, writer):
+        """Satu koneksi: baca permintaan satu per satu (keep-alive) sampai klien menutup."""
+        try:
+            while True:
+                try:
+                    kepala = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+                baris = kepala.decode("latin-1").split("\r\n")
+                bagian = baris[0].split(" ")
+                if len(bagian) != 3:
+                    _tulis(writer, 400, _encode({"galat": "baris permintaan tidak valid"}), None, False)
+                    break
+                metode, target, protokol = bagian
+                header = {}
+                for b in baris[1:]:
+                    k, _, v = b.partition(":")
+                    if v:
+                        header[k.strip().lower()] = v.strip()
+                panjang = header.get("content-length", "0")
+                if panjang.isdigit() and int(panjang) > 0:
+                    await reader.readexactly(int(panjang))
+                koneksi = header.get("connection", "").lower()
+                tetap = koneksi == "keep-alive" if protokol == "HTTP/1.0" else koneksi != "close"
+
+                if metode == "GET":
+                    status, body, versi = self.jawab_get(target)
+                    if status == 200 and header.get("if-none-match") == f'"{versi}"':
+                        status, body = 304, b""
+                elif metode == "POST" and urlsplit(target).path == "/muat-ulang":
+                    try:
+                        versi = await self.muat_ulang()
+                        status, body = 200, _encode({"versi": versi, "jumlah": len(self.rekap)})
+                    except (OSError, KeyError, ValueError) as e:
+                        status, body, versi = 503, _encode({"galat": str(e)}), None
+                else:
+                    status, body, versi = 405, _encode({"galat": "metode tidak didukung"}), None
+                _tulis(writer, status, body, versi, tetap)
+                await writer.drain()
+                if not tetap:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+def _encode(data):
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _tulis(writer, status, body, versi, tetap):
+    """Tulis satu respons HTTP/1.1."""
+    kepala = [f"HTTP/1.1 {status} {ALASAN.get(status, '')}"]
+    if status != 304:
+        kepala.append("Content-Type: application/json; charset=utf-8")
+    kepala.append(f"Content-Length: {len(body)}")
+    if versi is not None:
+        kepala.append(f'ETag: "{versi}"')
+        kepala.append("Cache-Control: no-cache")
+    kepala.append("Connection: keep-alive" if tetap else "Connection: close")
+    writer.write(("\r\n".join(kepala) + "\r\n\r\n").encode("latin-1") + body)
+
+
+async def layani(layanan, host="127.0.0.1", port=8080, pantau=None):
+    """
+    Jalankan server sampai dihentikan (Ctrl+C). Alamat dicetak ke stdout satu baris
+    ("Melayani di http://host:port"), port 0 = pilih port bebas.
+    pantau: interval detik untuk cek perubahan file sumber (None = tidak dipantau).
+    """
+    server = await asyncio.start_server(layanan.tangani, host, port)
+    alamat = server.sockets[0].getsockname()
+    print(f"Melayani di http://{alamat[0]}:{alamat[1]}", flush=True)
+    tugas = None
+    if pantau and layanan._sidik is not None and layanan._muat is not None:
+        tugas = asyncio.create_task(layanan.pantau(pantau))
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        if tugas is not None:
+            tugas.cancel()
@@ -0,0 +1,306 @@
+# Pembaca CSV bertipe: tahu kolom attendance/grades dan konversi per kolom sekaligus
+
+import csv
+import time
+from array import array
+from itertools import compress, islice
+from operator import add, not_
+from pathlib import Path
+
+from . import instrumen
+from .patch_csv import KOLOM_TEKS, baca_log
+from .presensi import kolom_sesi, sel_hadir, tabel_persen
+
+# header yang dipakai untuk CSV attendance dan grades (file baru); attendance.csv
+# boleh punya kolom sesi lain (week1..weekN, week<N>_<k>), lihat presensi.kolom_sesi
+ATT_HEADERS = ["student_id", "name", "week1", "week2", "week3", "week4", "week5"]
+GRD_HEADERS = ["student_id", "name", "quiz", "assignment", "mid", "final"]
+
+UKURAN_BLOK = 65536
+
+
+def ke_angka(nilai, default=0.0):
+    """Konversi satu nilai ke float; kosong/tidak valid -> default."""
+    try:
+        return float(nilai or 0)
+    except Exception:
+        return default
+
+
+class LaporanGalat:
+    """
+    Kumpulan sel yang gagal divalidasi: (baris, kolom, nilai mentah, pesan).
+    Galat disimpan berurutan per file; mulai_berkas() menandai file asal galat berikutnya.
+    """
+    def __init__(self):
+        self.galat = []
+        # (indeks galat pertama, nama file), diisi oleh mulai_berkas()
+        self.berkas = []
+
+    def mulai_berkas(self, nama):
+        """Galat yang ditambahkan setelah ini berasal dari file nama."""
+        if self.berkas and self.berkas[-1][0] == len(self.galat):
+            self.berkas[-1] = (len(self.galat), nama)
+        else:
+            self.berkas.append((len(self.galat), nama))
+
+    def tambah(self, baris, kolom, nilai, pesan):
+        if instrumen.AKTIF:
+            instrumen.hitung("validasi.gagal")
+        self.galat.append((baris, kolom, nilai, pesan))
+
+    def __len__(self):
+        return len(self.galat)
+
+    def __iter__(self):
+        return iter(self.galat)
+
+    def iter_berkas(self):
+        """Generator (nama file, baris, kolom, nilai, pesan); nama file "" jika tidak diketahui."""
+        batas = self.berkas + [(len(self.galat), "")]
+        nama = ""
+        awal = 0
+        for akhir, berikut in batas:
+            for g in islice(self.galat, awal, akhir):
+                yield (nama,) + g
+            nama = berikut
+            awal = akhir
+
+    def per_jenis(self, contoh=5):
+        """
+        Tabel ringkas: satu dict per (file, kolom, pesan) dengan jumlah galat dan
+        beberapa nomor baris pertama sebagai contoh, urut dari yang paling banyak.
+        """
+        grup = {}
+        for nama, baris, kolom, _, pesan in self.iter_berkas():
+            # pesan nama beda menyertakan nama asli; dikelompokkan tanpa bagian itu
+            kunci = (nama, kolom, pesan.split(" (", 1)[0])
+            g = grup.get(kunci)
+            if g is None:
+                g = grup[kunci] = {"file": nama, "kolom": kolom, "pesan": kunci[2], "jumlah": 0, "baris": []}
+            g["jumlah"] += 1
+            if len(g["baris"]) < contoh:
+                g["baris"].append(baris)
+        return sorted(grup.values(), key=lambda g: -g["jumlah"])
+
+    def tabel(self, contoh=5):
+        """Teks per_jenis() sebagai tabel lebar tetap untuk CLI."""
+        if not self.galat:
+            return "(tidak ada sel bermasalah)"
+        grup = self.per_jenis(contoh)
+        lebar_file = max(len("file"), *(len(g["file"]) for g in grup))
+        lebar_kolom = max(len("kolom"), *(len(g["kolom"]) for g in grup))
+        lebar_pesan = max(len("masalah"), *(len(g["pesan"]) for g in grup))
+        lines = [f"{'file':<{lebar_file}}  {'kolom':<{lebar_kolom}}  {'masalah':<{lebar_pesan}}  {'jumlah':>7}  baris"]
+        for g in grup:
+            baris = ", ".join(map(str, g["baris"]))
+            if g["jumlah"] > len(g["baris"]):
+                baris += ", ..."
+            lines.append(f"{g['file']:<{lebar_file}}  {g['kolom']:<{lebar_kolom}}  "
+                         f"{g['pesan']:<{lebar_pesan}}  {g['jumlah']:>7}  {baris}")
+        return "\n".join(lines)
+
+    def tulis_csv(self, path):
+        """Tulis semua galat ke CSV (file, baris, kolom, nilai, pesan)."""
+        p = Path(path)
+        p.parent.mkdir(parents=True, exist_ok=True)
+        with p.open("w", encoding="utf-8", newline="") as f:
+            w = csv.writer(f)
+            w.writerow(["file", "baris", "kolom", "nilai", "pesan"])
+            w.writerows(self.iter_berkas())
+        return p
+
+    def ringkas(self, maks=10):
+        """Teks singkat untuk ditampilkan di CLI."""
+        if not self.galat:
+            return "(tidak ada sel bermasalah)"
+        lines = []
+        for nama, baris, kolom, nilai, pesan in islice(self.iter_berkas(), maks):
+            lokasi = f"{nama} baris {baris}" if nama else f"baris {baris}"
+            lines.append(f"{lokasi}, kolom {kolom}: {nilai!r} ({pesan})")
+        if len(self.galat) > maks:
+            lines.append(f"... dan {len(self.galat) - maks} sel lainnya")
+        return "\n".join(lines)
+
+
+def _kolom_angka(kolom, sel, no_baris, laporan):
+    """
+    Konversi satu kolom (list string) ke array('d') sekaligus.
+    Jalur cepat: satu map(float) untuk seluruh kolom. Jika ada sel kosong/rusak,
+    hanya sel yang bukan digit murni (str.isdecimal, dicek di level C) yang diperiksa
+    satu per satu; sel kosong atau rusak dianggap 0 dan dicatat di laporan (nomor
+    baris di file lewat no_baris(i)), lalu kolom dikonversi lagi sekaligus.
+    """
+    try:
+        return array('d', map(float, sel))
+    except ValueError:
+        # ada sel kosong atau rusak -> periksa sel yang mencurigakan saja
+        pass
+    sel = list(sel)
+    for i in compress(range(len(sel)), map(not_, map(str.isdecimal, sel))):
+        s = sel[i]
+        if not s.strip():
+            sel[i] = "0"
+            if laporan is not None:
+                laporan.tambah(no_baris(i), kolom, s, "kosong, dianggap 0")
+            continue
+        try:
+            float(s)
+        except ValueError:
+            sel[i] = "0"
+            if laporan is not None:
+                laporan.tambah(no_baris(i), kolom, s, "bukan angka")
+    return array('d', map(float, sel))
+
+
+class Blok:
+    """
+    Potongan CSV dalam bentuk kolom: teks sebagai list, angka sebagai array('d').
+    awal = jumlah baris data di file sebelum blok ini (termasuk baris kosong);
+    asal = None jika tidak ada baris kosong yang dibuang di blok ini, atau list
+    posisi asli setiap baris di dalam blok (lihat _rapikan).
+    """
+    def __init__(self, awal, kolom, asal=None):
+        self.awal = awal
+        self.kolom = kolom
+        self.asal = asal
+
+    def no_baris(self, i):
+        """Nomor baris di file untuk baris ke-i blok (baris 1 adalah header)."""
+        # +2: baris 1 adalah header, data mulai di baris 2
+        if self.asal is None:
+            return self.awal + i + 2
+        return self.awal + self.asal[i] + 2
+
+    def __len__(self):
+        return len(self.kolom["student_id"])
+
+    def __getitem__(self, nama):
+        return self.kolom[nama]
+
+
+def baca_blok(path, headers, laporan=None, on_row=None, ukuran_blok=UKURAN_BLOK, tambahan=None):
+    """
+    Baca CSV sebagai tuple (csv.reader) dan kembalikan Blok per ukuran_blok baris.
+    Kolom yang dikenal diambil berdasarkan posisinya di header file; kolom yang
+    tidak ada di file dilewati. on_row (opsional) menerima dict per baris mentah.
+    tambahan (opsional): fungsi header file -> kolom angka lain yang ikut dibaca
+    (misal presensi.kolom_sesi untuk week1..weekN).
+    Perubahan di change log CSVPatcher (<file>.log) ikut diterapkan.
+    """
+    p = Path(path)
+    if not p.exists():
+        return
+    if instrumen.AKTIF:
+        instrumen.hitung("csv.byte_dibaca", p.stat().st_size)
+    if laporan is not None:
+        laporan.mulai_berkas(p.name)
+    with p.open(encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        if tambahan is not None:
+            headers = list(headers) + [h for h in tambahan(header) if h not in headers]
+        posisi = {}
+        for h in headers:
+            if h in header:
+                posisi[h] = header.index(h)
+        lebar = len(header)
+        # baris yang diubah lewat CSVPatcher tapi belum dikompaksi ada di change log
+        overlay = baca_log(p)
+        awal = 0
+        # dibaca sekali per file: saat mati, loop blok tidak menyentuh instrumen sama sekali
+        ukur = instrumen.AKTIF
+        while True:
+            if ukur:
+                t0 = time.perf_counter()
+            # ambil satu blok baris sekaligus (di level C, tanpa loop Python)
+            buf = list(islice(reader, ukuran_blok))
+            if not buf:
+                break
+            mentah = len(buf)
+            asal = None
+            if set(map(len, buf)) != {lebar}:
+                buf, asal = _rapikan(buf, lebar)
+                if not buf:
+                    awal += mentah
+                    continue
+            if overlay:
+                buf = _terapkan_log(buf, header, overlay)
+            if on_row is not None:
+                for row in buf:
+                    on_row(dict(zip(header, row)))
+            blok = _ke_blok(buf, posisi, awal, asal, laporan)
+            if ukur:
+                # waktu parse saja; waktu pemakai blok (misal isi rekap) tidak ikut
+                instrumen.catat("csv.parse", time.perf_counter() - t0, len(buf))
+                instrumen.hitung("csv.baris_dibaca", len(buf))
+            yield blok
+            awal += mentah
+
+
+def _terapkan_log(buf, header, overlay):
+    """Ganti baris yang punya versi lebih baru di change log."""
+    if "student_id" not in header:
+        return buf
+    i = header.index("student_id")
+    return [[str(overlay[row[i]].get(h, "")) for h in header] if row[i] in overlay else row for row in buf]
+
+
+def _rapikan(buf, lebar):
+    """
+    Buang baris kosong (seperti DictReader) dan lengkapi baris yang terlalu pendek.
+    Kembalikan (baris, asal): asal = None jika tidak ada yang dibuang, atau list
+    posisi asli setiap baris di buf supaya nomor baris galat tetap sesuai file.
+    """
+    hasil = []
+    asal = []
+    for i, row in enumerate(buf):
+        if not row:
+            continue
+        if len(row) < lebar:
+            row = row + [""] * (lebar - len(row))
+        hasil.append(row)
+        asal.append(i)
+    if len(hasil) == len(buf):
+        asal = None
+    return hasil, asal
+
+
+def _ke_blok(buf, posisi, awal, asal, laporan):
+    """Pecah list tuple baris jadi kolom bertipe."""
+    # transpose sekali: baris -> kolom (baris lebih panjang dari header dipotong)
+    semua = list(zip(*buf))
+    kolom = {}
+    blok = Blok(awal, kolom, asal)
+    for nama, i in posisi.items():
+        sel = semua[i]
+        if nama in KOLOM_TEKS:
+            kolom[nama] = sel
+        else:
+            kolom[nama] = _kolom_angka(nama, sel, blok.no_baris, laporan)
+    for nama in KOLOM_TEKS:
+        if nama not in kolom:
+            kolom[nama] = [""] * len(buf)
+    return blok
+
+
+def persen_hadir_kolom(blok):
+    """
+    Hitung persen hadir semua baris di blok dari kolom sesi yang ada (week1..weekN).
+    Sel bernilai 1 (atau angka lain dengan bagian bulat != 0) dihitung hadir.
+    Rekap hanya butuh jumlah hadir, jadi kolom 0/1 cukup dijumlahkan (hasilnya sama
+    dengan popcount bitset di presensi.MatriksPresensi, tanpa membangun bitset).
+    """
+    minggu = [blok[h] for h in kolom_sesi(blok.kolom)]
+    if not minggu:
+        return array('d', bytes(8 * len(blok)))
+    jumlah = None
+    for sel in minggu:
+        if not set(sel) <= {0.0, 1.0}:
+            sel = sel_hadir(sel)
+        jumlah = sel if jumlah is None else list(map(add, jumlah, sel))
+    # persen untuk 0..jumlah sesi cukup dihitung sekali
+    tabel = tabel_persen(len(minggu))
+    return array('d', map(tabel.__getitem__, map(int, jumlah)))
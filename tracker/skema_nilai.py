@@ -0,0 +1,203 @@
+# Skema penilaian (bobot + batas predikat) dari file konfigurasi, dikompilasi jadi fungsi skor
+
+import math
+from array import array
+from bisect import bisect_right
+
+from .skor import BATAS_PREDIKAT, BOBOT_DEFAULT, HURUF_PREDIKAT
+
+# komponen yang disimpan RekapKelas / RekapKelasKolom, urut sesuai kolomnya
+KOMPONEN_STANDAR = ("quiz", "tugas", "uts", "uas")
+
+
+def _angka(v, label):
+    if isinstance(v, bool) or not isinstance(v, (int, float)):
+        raise ValueError(label + " harus angka")
+    # json.load menerima NaN/Infinity; keduanya lolos cek < 0 dan jumlah bobot
+    if not math.isfinite(v):
+        raise ValueError(label + " harus angka terhingga")
+    return float(v)
+
+
+def _kompilasi(jumlah, bobot):
+    """
+    Buat dua fungsi dari bobot: skor satu mahasiswa (argumen posisi per komponen)
+    dan skor satu kelas (argumen berupa kolom). Bobot ditulis sebagai konstanta di
+    kode yang di-eval, jadi tidak ada lookup dict/loop per komponen saat menghitung.
+    Urutan penjumlahan sama dengan Penilaian.nilai_akhir supaya hasilnya identik.
+
+    Catatan: tanpa numpy tidak ada dot product per kolom yang benar-benar di level C.
+    Rantai map(mul/add/round) per kolom sudah dicoba, tetapi lebih lambat (1 juta baris:
+    ~1,1 s vs ~0,8 s) karena setiap langkah membuat float sementara; list comprehension
+    dengan bobot sebagai konstanta ini tetap satu lewat per kolom dan yang tercepat.
+    """
+    arg = [f"k{i}" for i in range(jumlah)]
+    ekspr = " + ".join(f"({a} * {w!r})" for a, w in zip(arg, bobot))
+    satu = eval(f"lambda {', '.join(arg)}: round({ekspr}, 2)", {})
+    kolom = eval(
+        f"lambda {', '.join('c' + a for a in arg)}: array('d', [round({ekspr}, 2) "
+        f"for {', '.join(arg)}, in zip({', '.join('c' + a for a in arg)})])",
+        {"array": array},
+    )
+    return satu, kolom
+
+
+class SkemaPenilaian:
+    """
+    Satu skema penilaian: bobot per komponen dan skor minimal per predikat.
+    Divalidasi sekali saat dibuat, lalu dikompilasi jadi fungsi skor khusus.
+
+    bobot: dict komponen -> bobot (jumlah bobot harus 1). Komponen di luar
+    quiz/tugas/uts/uas boleh dipakai lewat hitung_kolom(), tetapi RekapKelas
+    hanya bisa memakai skema yang komponennya ada di KOMPONEN_STANDAR.
+    batas: dict huruf -> skor minimal. Skor di bawah semua batas mendapat huruf_terendah.
+    """
+    def __init__(self, nama, bobot, batas, huruf_terendah="E"):
+        if not bobot:
+            raise ValueError(f"skema {nama}: bobot tidak boleh kosong")
+        for k in bobot:
+            if not isinstance(k, str) or not k.isidentifier():
+                raise ValueError(f"skema {nama}: nama komponen tidak valid: {k!r}")
+        nilai_bobot = [_angka(w, f"skema {nama}: bobot {k}") for k, w in bobot.items()]
+        if any(w < 0 for w in nilai_bobot):
+            raise ValueError(f"skema {nama}: bobot tidak boleh negatif")
+        if abs(sum(nilai_bobot) - 1.0) > 1e-6:
+            raise ValueError(f"skema {nama}: jumlah bobot harus 1 (sekarang {sum(nilai_bobot):g})")
+        pasangan = sorted(((_angka(v, f"skema {nama}: batas {h}"), h) for h, v in batas.items()))
+        huruf = [huruf_terendah] + [h for _, h in pasangan]
+        if any(not isinstance(h, str) or not h for h in huruf) or len(set(huruf)) != len(huruf):
+            raise ValueError(f"skema {nama}: huruf predikat harus teks unik")
+        nilai_batas = [v for v, _ in pasangan]
+        if any(v < 0 or v > 100 for v in nilai_batas):
+            raise ValueError(f"skema {nama}: batas predikat harus antara 0 dan 100")
+        if len(set(nilai_batas)) != len(nilai_batas):
+            raise ValueError(f"skema {nama}: batas predikat tidak boleh sama")
+
+        self.nama = nama
+        self.komponen = tuple(bobot)
+        self.bobot = tuple(nilai_bobot)
+        self.batas = tuple(nilai_batas)
+        self.huruf = tuple(huruf)
+        self.nilai_satu, self._kolom = _kompilasi(len(self.komponen), self.bobot)
+        # posisi komponen skema di KOMPONEN_STANDAR (None jika ada komponen tambahan)
+        if set(self.komponen) <= set(KOMPONEN_STANDAR):
+            self._posisi_standar = tuple(KOMPONEN_STANDAR.index(k) for k in self.komponen)
+            # skor satu mahasiswa langsung dari argumen (quiz, tugas, uts, uas), untuk hitung_satu
+            ekspr = " + ".join(f"({k} * {w!r})" for k, w in zip(self.komponen, self.bobot))
+            self._satu_standar = eval(f"lambda {', '.join(KOMPONEN_STANDAR)}: round({ekspr}, 2)", {})
+        else:
+            self._posisi_standar = None
+            self._satu_standar = None
+
+    def __repr__(self):
+        return f"<SkemaPenilaian {self.nama} komponen={','.join(self.komponen)}>"
+
+    def __reduce__(self):
+        # fungsi hasil eval tidak bisa di-pickle; kirim definisinya saja (dipakai worker fakultas)
+        return (SkemaPenilaian, (self.nama, dict(zip(self.komponen, self.bobot)),
+                                 dict(zip(self.huruf[1:], self.batas)), self.huruf[0]))
+
+    def sama(self, lain):
+        """True jika lain memberi skor dan predikat yang persis sama (nama boleh beda)."""
+        return (self.komponen, self.bobot, self.batas, self.huruf) == \
+            (lain.komponen, lain.bobot, lain.batas, lain.huruf)
+
+    @property
+    def standar(self):
+        """True jika semua komponen skema disimpan oleh RekapKelas."""
+        return self._posisi_standar is not None
+
+    def predikat(self, skor):
+        """Konversi satu skor jadi huruf predikat."""
+        return self.huruf[bisect_right(self.batas, skor)]
+
+    def hitung_predikat(self, skor):
+        """Konversi seluruh kolom skor jadi list huruf predikat."""
+        # bisect per elemen; map(bisect_right, repeat(batas), skor) diukur lebih lambat
+        batas = self.batas
+        huruf = self.huruf
+        return [huruf[bisect_right(batas, s)] for s in skor]
+
+    def rentang(self, huruf):
+        """Rentang skor [lo, hi) untuk satu huruf predikat (None = tanpa batas)."""
+        i = self.huruf.index(huruf)
+        lo = self.batas[i - 1] if i > 0 else None
+        hi = self.batas[i] if i < len(self.batas) else None
+        return lo, hi
+
+    def hitung_kolom(self, kolom):
+        """Nilai akhir dari dict komponen -> kolom angka (boleh komponen tambahan)."""
+        try:
+            return self._kolom(*[kolom[k] for k in self.komponen])
+        except KeyError as e:
+            raise ValueError(f"skema {self.nama}: kolom komponen {e.args[0]} tidak ada")
+
+    def hitung_satu(self, quiz, tugas, uts, uas):
+        """(nilai akhir, predikat) satu mahasiswa dari empat komponen standar."""
+        if self._satu_standar is None:
+            raise ValueError(f"skema {self.nama}: punya komponen di luar {', '.join(KOMPONEN_STANDAR)}")
+        akhir = self._satu_standar(quiz, tugas, uts, uas)
+        return akhir, self.huruf[bisect_right(self.batas, akhir)]
+
+    def hitung_kelas(self, quiz, tugas, uts, uas):
+        """(array nilai akhir, list predikat) dari empat kolom standar."""
+        if self._posisi_standar is None:
+            raise ValueError(f"skema {self.nama}: punya komponen di luar {', '.join(KOMPONEN_STANDAR)}")
+        semua = (quiz, tugas, uts, uas)
+        akhir = self._kolom(*[semua[i] for i in self._posisi_standar])
+        return akhir, self.hitung_predikat(akhir)
+
+    @classmethod
+    def dari_dict(cls, nama, d):
+        """Bangun skema dari satu entri konfigurasi {"bobot": {...}, "batas": {...}, "huruf_terendah": "E"}."""
+        if not isinstance(d, dict):
+            raise ValueError(f"skema {nama}: harus berupa objek")
+        lebih = set(d) - {"bobot", "batas", "huruf_terendah"}
+        if lebih:
+            raise ValueError(f"skema {nama}: kunci tidak dikenal: {', '.join(sorted(lebih))}")
+        bobot = d.get("bobot")
+        batas = d.get("batas", dict(zip(HURUF_PREDIKAT[1:], BATAS_PREDIKAT)))
+        if not isinstance(bobot, dict) or not isinstance(batas, dict):
+            raise ValueError(f"skema {nama}: bobot dan batas harus berupa objek")
+        return cls(nama, bobot, batas, d.get("huruf_terendah", HURUF_PREDIKAT[0]))
+
+
+SKEMA_STANDAR = SkemaPenilaian(
+    "standar",
+    dict(zip(KOMPONEN_STANDAR, BOBOT_DEFAULT)),
+    dict(zip(HURUF_PREDIKAT[1:], BATAS_PREDIKAT)),
+    HURUF_PREDIKAT[0],
+)
+
+
+def muat_skema(path):
+    """
+    Baca file konfigurasi JSON berisi banyak skema:
+        {"default": "standar", "skema": {"nama": {"bobot": {...}, "batas": {...}}, ...}}
+    Kembalikan (dict nama -> SkemaPenilaian, nama skema default).
+    Skema "standar" selalu tersedia kecuali ditimpa di file.
+    """
+    import json
+    with open(path, "r", encoding="utf-8") as f:
+        try:
+            cfg = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"{path}: bukan JSON yang valid ({e})")
+    if not isinstance(cfg, dict) or not isinstance(cfg.get("skema", {}), dict):
+        raise ValueError(f"{path}: harus berisi objek 'skema'")
+    daftar = {SKEMA_STANDAR.nama: SKEMA_STANDAR}
+    for nama, d in cfg.get("skema", {}).items():
+        daftar[nama] = SkemaPenilaian.dari_dict(nama, d)
+    default = cfg.get("default", SKEMA_STANDAR.nama)
+    if default not in daftar:
+        raise ValueError(f"{path}: skema default tidak ada: {default}")
+    return daftar, default
+
+
+def pilih_skema(path, nama=None):
+    """Ambil satu skema dari file konfigurasi (nama None = skema default di file)."""
+    daftar, default = muat_skema(path)
+    nama = nama or default
+    if nama not in daftar:
+        raise KeyError("skema tidak ditemukan: " + str(nama))
+    return daftar[nama]
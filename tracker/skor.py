@@ -0,0 +1,9 @@
+# Konstanta skor standar: bobot komponen dan batas predikat
+# (perhitungannya ada di skema_nilai.SkemaPenilaian)
+
+# bobot default (sama dengan Penilaian.nilai_akhir): quiz, tugas, uts, uas
+BOBOT_DEFAULT = (0.15, 0.25, 0.25, 0.35)
+
+# batas bawah tiap predikat, urut naik; HURUF[i] dipakai jika skor >= BATAS[i-1]
+BATAS_PREDIKAT = (50, 65, 75, 85)
+HURUF_PREDIKAT = "EDCBA"
@@ -0,0 +1,328 @@
+# Snapshot biner RekapKelas: kolom angka per kolom + tabel string, dibuka lewat mmap
+
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from itertools import accumulate
+from operator import itemgetter
+from pathlib import Path
+
+from . import instrumen
+from .jurnal import _fsync_dir
+from .mahasiswa import Mahasiswa
+from .rekap_kolom import RekapKelasKolom
+from .skema_nilai import SKEMA_STANDAR
+
+MAGIC = b"SPTSNAP1"
+VERSI = 2
+# magic, versi, ada skor (1 = kolom akhir berlaku untuk SKEMA_STANDAR), jumlah record,
+# offset referensi string, offset urutan NIM, offset kolom angka, offset tabel string,
+# offset blok nama (di dalam tabel string), sidik sumber (sha256)
+HEADER = struct.Struct("<8sIIQQQQQQ32s")
+# referensi string per baris, disimpan per kolom (n uint32 little-endian berturut-turut):
+# offset NIM, panjang NIM, offset nama, panjang nama (offset relatif ke awal tabel string)
+REF = ("off_nim", "n_nim", "off_nama", "n_nama")
+# urutan NIM: n uint32 (nomor baris), urut berdasarkan NIM
+# kolom angka disimpan per kolom (n double little-endian berturut-turut), urut seperti ini
+KOLOM = ("hadir", "quiz", "tugas", "uts", "uas", "akhir")
+# pemisah NIM/nama di tabel string, supaya satu blok bisa di-decode + split sekaligus
+PEMISAH = "\0"
+
+
+def sidik_sumber(paths, cek_isi=False):
+    """
+    Sidik (sha256) file sumber berdasarkan nama, ukuran, dan mtime.
+    cek_isi=True ikut meng-hash isi file (lebih lambat, tapi tahan mtime yang dipalsukan).
+    """
+    h = hashlib.sha256()
+    for path in paths:
+        p = Path(path)
+        h.update(p.name.encode("utf-8"))
+        if not p.exists():
+            h.update(b"-")
+            continue
+        st = p.stat()
+        h.update(struct.pack("<QQ", st.st_size, st.st_mtime_ns))
+        if cek_isi:
+            with p.open("rb") as f:
+                for blok in iter(lambda: f.read(1 << 20), b""):
+                    h.update(blok)
+    return h.digest()
+
+
+def _kolom_bytes(kode, nilai):
+    kolom = array(kode, nilai)
+    if sys.byteorder == "big":
+        kolom.byteswap()
+    return kolom.tobytes()
+
+
+def _blok(teks, awal):
+    """
+    Gabung list string jadi satu blok bytes (dipisah PEMISAH) mulai di offset awal.
+    Kembalikan (blok, kolom offset, kolom panjang byte).
+    """
+    gabung = PEMISAH.join(teks) + PEMISAH if teks else ""
+    if gabung.count(PEMISAH) != len(teks):
+        raise ValueError("NIM/nama tidak boleh berisi karakter NUL")
+    blok = gabung.encode("utf-8")
+    # panjang byte = panjang karakter jika semuanya ASCII (kasus biasa)
+    panjang = list(map(len, teks)) if len(blok) == len(gabung) else [len(t.encode("utf-8")) for t in teks]
+    offset = list(accumulate(map((1).__add__, panjang), initial=awal))[:-1]
+    return blok, offset, panjang
+
+
+def simpan(rekap, path, sumber=(), cek_isi=False):
+    """
+    Tulis snapshot biner dari rekap (RekapKelas atau RekapKelasKolom).
+    Nilai akhir ikut disimpan jika rekap memakai skema standar, supaya rekap yang
+    dimuat dari snapshot tidak perlu menghitung ulang skor seluruh kelas.
+    """
+    baris = list(rekap.iter_komponen())
+    # dipecah per kolom lewat map(itemgetter) di level C; zip(*baris) jauh lebih lambat
+    # karena GC berkali-kali menelusuri ratusan ribu tuple yang masih hidup
+    nims, namas, *angka = [list(map(itemgetter(k), baris)) for k in range(7)]
+    del baris
+    n = len(nims)
+    if None in namas:
+        namas = [t or "" for t in namas]
+    ada_skor = rekap.skema.sama(SKEMA_STANDAR)
+    akhir = rekap.kolom_akhir() if ada_skor else ()
+    # panjang beda hanya jika rekap berubah di antara dua panggilan (RekapKelasAman
+    # dipakai beberapa thread); skor tidak disimpan dan dihitung ulang saat dimuat
+    ada_skor = ada_skor and len(akhir) == n
+    angka.append(akhir if ada_skor else bytes(8 * n))
+    # tabel string: blok NIM lalu blok nama
+    b_nim, off_nim, n_nim = _blok(nims, 0)
+    b_nama, off_nama, n_nama = _blok(namas, len(b_nim))
+    # permutasi baris yang urut berdasarkan NIM, untuk pencarian biner tanpa indeks di memori
+    urutan = sorted(range(n), key=nims.__getitem__)
+    off_ref = HEADER.size
+    off_urutan = off_ref + 4 * n * len(REF)
+    off_kolom = off_urutan + 4 * n
+    off_string = off_kolom + 8 * n * len(KOLOM)
+    header = HEADER.pack(MAGIC, VERSI, int(ada_skor), n, off_ref, off_urutan, off_kolom, off_string,
+                         len(b_nim), sidik_sumber(sumber, cek_isi))
+    p = Path(path)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    tmp = p.with_name(p.name + ".tmp")
+    with tmp.open("wb") as f:
+        f.write(header)
+        for k in (off_nim, n_nim, off_nama, n_nama, urutan):
+            f.write(_kolom_bytes('I', k))
+        for k in angka:
+            f.write(k if isinstance(k, bytes) else _kolom_bytes('d', k))
+        f.write(b_nim)
+        f.write(b_nama)
+        # isi harus sudah di disk sebelum rename, kalau tidak crash bisa meninggalkan
+        # snapshot terpotong dengan nama final (sama seperti jurnal dan patch_csv)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, p)
+    _fsync_dir(p.parent)
+    if instrumen.AKTIF:
+        instrumen.hitung("snapshot.byte_ditulis", off_string + len(b_nim) + len(b_nama))
+
+
+class SnapshotBiner:
+    """
+    Snapshot yang dibuka lewat mmap. Membuka file hanya membaca header;
+    kolom dan string baru dibaca (page fault) saat diakses. ke_rekap menyalin
+    setiap kolom angka sekaligus (array.frombytes) dan men-decode blok NIM/nama
+    dengan satu decode + split per blok, bukan per record.
+    """
+    def __init__(self, path):
+        self.path = Path(path)
+        self._f = self.path.open("rb")
+        try:
+            self._mm = mmap.mmap(self._f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._f.close()
+            raise ValueError("snapshot kosong: " + str(path))
+        try:
+            (magic, versi, ada_skor, self._n, self._off_ref, self._off_urutan, self._off_kolom,
+             self._off_string, self._blok_nama, self.sidik) = HEADER.unpack_from(self._mm, 0)
+        except struct.error:
+            magic = versi = None
+        if magic != MAGIC or versi != VERSI:
+            self.tutup()
+            raise ValueError("bukan snapshot yang didukung: " + str(path))
+        # tata letak harus cocok dengan jumlah record di header; file terpotong
+        # (misal crash saat menulis) ditolak di sini, bukan jadi kolom yang kependekan
+        n = self._n
+        if (self._off_ref != HEADER.size
+                or self._off_urutan != self._off_ref + 4 * n * len(REF)
+                or self._off_kolom != self._off_urutan + 4 * n
+                or self._off_string != self._off_kolom + 8 * n * len(KOLOM)
+                or not self._off_string + self._blok_nama <= len(self._mm)
+                or n and (self._mm[-1] != 0 or self._mm[self._off_string + self._blok_nama - 1] != 0)):
+            self.tutup()
+            raise ValueError("snapshot rusak atau terpotong: " + str(path))
+        # True jika kolom akhir berisi nilai akhir menurut SKEMA_STANDAR
+        self.ada_skor = bool(ada_skor)
+
+    def __len__(self):
+        return self._n
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.tutup()
+
+    def tutup(self):
+        self._mm.close()
+        self._f.close()
+
+    def cocok(self, sumber, cek_isi=False):
+        """True jika snapshot dibuat dari file sumber yang sama (belum berubah)."""
+        return self.sidik == sidik_sumber(sumber, cek_isi)
+
+    def _string(self, off, n):
+        a = self._off_string + off
+        return self._mm[a:a + n].decode("utf-8")
+
+    def _ref(self, k, i):
+        return struct.unpack_from("<I", self._mm, self._off_ref + 4 * (k * self._n + i))[0]
+
+    def _nim(self, i):
+        return self._string(self._ref(0, i), self._ref(1, i))
+
+    def _angka(self, k, i):
+        return struct.unpack_from("<d", self._mm, self._off_kolom + 8 * (k * self._n + i))[0]
+
+    def kolom(self, nama):
+        """Satu kolom angka (hadir, quiz, ..., akhir) sebagai array('d'), disalin sekaligus dari mmap."""
+        k = KOLOM.index(nama)
+        a = self._off_kolom + 8 * self._n * k
+        hasil = array('d')
+        data = memoryview(self._mm)[a:a + 8 * self._n]
+        try:
+            hasil.frombytes(data)
+        finally:
+            data.release()
+        if sys.byteorder == "big":
+            hasil.byteswap()
+        return hasil
+
+    def _blok_string(self, awal, akhir):
+        """Semua string di satu blok tabel string sebagai list (satu decode + split)."""
+        if not self._n:
+            return []
+        a = self._off_string
+        # -1: PEMISAH terakhir di ujung blok
+        return self._mm[a + awal:a + akhir - 1].decode("utf-8").split(PEMISAH)
+
+    def __getitem__(self, i):
+        """Record ke-i sebagai (nim, nama, hadir, quiz, tugas, uts, uas)."""
+        if i < 0:
+            i += self._n
+        if not 0 <= i < self._n:
+            raise IndexError("indeks snapshot di luar jangkauan")
+        off_nim, n_nim, off_nama, n_nama = [self._ref(k, i) for k in range(len(REF))]
+        angka = [self._angka(k, i) for k in range(len(KOLOM) - 1)]
+        return (self._string(off_nim, n_nim), self._string(off_nama, n_nama), *angka)
+
+    def cari(self, nim):
+        """Cari record berdasarkan NIM dengan pencarian biner (O(log n)), None jika tidak ada."""
+        urutan = memoryview(self._mm)[self._off_urutan:self._off_kolom].cast("I")
+        try:
+            # bisect di atas "list" NIM virtual yang dibaca langsung dari mmap
+            kunci = _DaftarNim(self, urutan)
+            k = bisect_left(kunci, nim)
+            if k < self._n and kunci[k] == nim:
+                return self[urutan[k]]
+            return None
+        finally:
+            urutan.release()
+
+    def ke_rekap(self, rekap_cls=RekapKelasKolom):
+        """
+        Bangun rekap_cls (RekapKelasKolom, RekapKelas, ...) dari seluruh isi snapshot lewat
+        dari_kolom, tanpa validasi ulang per nilai (snapshot hanya ditulis dari rekap).
+        Jika snapshot menyimpan nilai akhir (skema standar), skor tidak dihitung ulang;
+        hanya predikat yang diturunkan dari kolom nilai akhir.
+        """
+        if not self._n:
+            return rekap_cls()
+        nim = self._blok_string(0, self._blok_nama)
+        nama = self._blok_string(self._blok_nama, len(self._mm) - self._off_string)
+        if len(nim) != self._n or len(nama) != self._n:
+            raise ValueError("snapshot rusak atau terpotong: " + str(self.path))
+        angka = [self.kolom(k) for k in KOLOM[:-1]]
+        if self.ada_skor:
+            akhir = self.kolom("akhir")
+            return rekap_cls.dari_kolom(nim, nama, *angka, akhir=akhir,
+                                        pred=SKEMA_STANDAR.hitung_predikat(akhir))
+        return rekap_cls.dari_kolom(nim, nama, *angka)
+
+    def isi_rekap(self, rekap):
+        """Isi rekap yang sudah ada (misal RekapKelas) lewat API biasa."""
+        for i in range(self._n):
+            nim, nama, hadir, quiz, tugas, uts, uas = self[i]
+            rekap.tambah_mahasiswa(Mahasiswa(nim, nama))
+            rekap.ubah_hadir(nim, hadir)
+            rekap.ubah_penilaian(nim, quiz=quiz, tugas=tugas, uts=uts, uas=uas)
+        return rekap
+
+
+class _DaftarNim:
+    """Urutan NIM (terurut) yang dibaca lazy dari snapshot, cukup untuk bisect."""
+    def __init__(self, snap, urutan):
+        self._snap = snap
+        self._urutan = urutan
+
+    def __len__(self):
+        return len(self._urutan)
+
+    def __getitem__(self, k):
+        return self._snap._nim(self._urutan[k])
+
+
+def muat_jika_valid(path, sumber, rekap_cls=RekapKelasKolom, cek_isi=False):
+    """
+    Buka snapshot dan kembalikan rekap (rekap_cls) jika sidiknya cocok dengan file sumber.
+    Kembalikan None jika snapshot tidak ada, rusak, atau sumbernya sudah berubah.
+    """
+    p = Path(path)
+    if not p.exists():
+        return None
+    try:
+        with SnapshotBiner(p) as snap:
+            if not snap.cocok(sumber, cek_isi):
+                return None
+            return snap.ke_rekap(rekap_cls)
+    except (ValueError, struct.error):
+        return None
+
+
+def sumber_csv(att_path, grd_path):
+    """File yang menentukan validitas snapshot: kedua CSV beserta change log-nya."""
+    from .patch_csv import path_log
+    return (att_path, grd_path, path_log(att_path), path_log(grd_path))
+
+
+def muat_atau_bootstrap(att_path, grd_path, snap_path, rekap_cls=RekapKelasKolom):
+    """
+    Pakai snapshot biner jika CSV belum berubah sejak snapshot dibuat;
+    jika tidak, bootstrap dari CSV lalu tulis snapshot baru.
+    Kembalikan (rekap, laporan); laporan None jika dari snapshot.
+    """
+    sumber = sumber_csv(att_path, grd_path)
+    with instrumen.tahap("muat.snapshot"):
+        rekap = muat_jika_valid(snap_path, sumber, rekap_cls)
+    if rekap is not None:
+        return rekap, None
+    # parser CSV hanya dimuat jika snapshot tidak bisa dipakai
+    from .ingest import bootstrap
+    from .skema_csv import LaporanGalat
+    rekap = rekap_cls()
+    laporan = LaporanGalat()
+    bootstrap(rekap, att_path, grd_path, laporan)
+    with instrumen.tahap("snapshot.simpan", len(rekap)):
+        simpan(rekap, snap_path, sumber)
+    return rekap, laporan
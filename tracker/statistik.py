@@ -0,0 +1,274 @@
+# Statistik kelas dalam satu kali lewat: Welford (rata-rata/varians) + sketsa kuantil yang bisa digabung
+
+from collections import Counter
+from math import ceil, floor, fsum, sqrt
+
+from .skema_nilai import SKEMA_STANDAR
+
+# banyaknya nilai berbeda 0..100 dengan 2 desimal
+JUMLAH_BIN = 10001
+# jumlah record per potongan di hitung_statistik
+UKURAN_POTONGAN = 4096
+
+
+class Welford:
+    """Rata-rata, varians, min, max secara streaming (algoritma Welford, digabung ala Chan)."""
+    def __init__(self):
+        self.n = 0
+        self.rata = 0.0
+        self._m2 = 0.0
+        self.minimum = None
+        self.maksimum = None
+
+    def tambah(self, x):
+        self.n += 1
+        d = x - self.rata
+        self.rata += d / self.n
+        self._m2 += d * (x - self.rata)
+        if self.minimum is None or x < self.minimum:
+            self.minimum = x
+        if self.maksimum is None or x > self.maksimum:
+            self.maksimum = x
+
+    def tambah_banyak(self, xs):
+        """Tambah satu potongan nilai: statistik potongan dihitung dulu lalu digabung."""
+        xs = list(xs)
+        if not xs:
+            return
+        bagian = Welford()
+        bagian.n = len(xs)
+        bagian.rata = rata = fsum(xs) / bagian.n
+        bagian._m2 = fsum([(x - rata) * (x - rata) for x in xs])
+        bagian.minimum = min(xs)
+        bagian.maksimum = max(xs)
+        self.gabung(bagian)
+
+    def gabung(self, lain):
+        """Gabungkan statistik lain (misal dari shard kelas lain) ke sini."""
+        if lain.n == 0:
+            return self
+        if self.n == 0:
+            self.n, self.rata, self._m2 = lain.n, lain.rata, lain._m2
+            self.minimum, self.maksimum = lain.minimum, lain.maksimum
+            return self
+        n = self.n + lain.n
+        d = lain.rata - self.rata
+        self.rata += d * lain.n / n
+        self._m2 += lain._m2 + d * d * self.n * lain.n / n
+        self.n = n
+        self.minimum = min(self.minimum, lain.minimum)
+        self.maksimum = max(self.maksimum, lain.maksimum)
+        return self
+
+    @property
+    def varians(self):
+        """Varians sampel (n - 1); 0.0 jika data kurang dari 2."""
+        return self._m2 / (self.n - 1) if self.n > 1 else 0.0
+
+    @property
+    def simpangan_baku(self):
+        return sqrt(self.varians)
+
+
+class SketsaKuantil:
+    """
+    Sketsa kuantil berupa hitungan {nilai: jumlah}. Nilai di tracker 0..100
+    dengan 2 desimal, jadi paling banyak 10001 kunci berapa pun jumlah datanya;
+    dua sketsa digabung cukup dengan menjumlahkan hitungan, dan kuantilnya eksak.
+    Data dengan desimal lebih banyak dipadatkan (dibulatkan ke 0.01) saat kunci
+    sudah terlalu banyak.
+    """
+    def __init__(self):
+        self.n = 0
+        self._hitung = Counter()
+
+    def _padatkan(self):
+        if len(self._hitung) > 2 * JUMLAH_BIN:
+            padat = Counter()
+            for x, c in self._hitung.items():
+                padat[round(x, 2)] += c
+            self._hitung = padat
+
+    def tambah(self, x):
+        self._hitung[x] += 1
+        self.n += 1
+
+    def tambah_banyak(self, xs):
+        """Tambah satu potongan nilai (list); penghitungan dilakukan di C oleh Counter."""
+        self._hitung.update(xs)
+        self.n += len(xs)
+        self._padatkan()
+
+    def gabung(self, lain):
+        self._hitung.update(lain._hitung)
+        self.n += lain.n
+        self._padatkan()
+        return self
+
+    def _nilai_ke(self, posisi):
+        """Nilai-nilai pada posisi terurut (list posisi naik, 0-based)."""
+        out = []
+        kumulatif = 0
+        i = 0
+        for x, c in sorted(self._hitung.items()):
+            kumulatif += c
+            while i < len(posisi) and posisi[i] < kumulatif:
+                out.append(x)
+                i += 1
+            if i == len(posisi):
+                break
+        return out
+
+    def kuantil(self, *qs):
+        """
+        Kuantil untuk setiap q (0..1) dengan interpolasi linear antar peringkat
+        (sama dengan statistics.median untuk q=0.5). None jika sketsa kosong.
+        """
+        if self.n == 0:
+            return [None] * len(qs)
+        pos = []
+        for q in qs:
+            h = (self.n - 1) * q
+            pos.append((h, floor(h), ceil(h)))
+        kunci = sorted({p for _, lo, hi in pos for p in (lo, hi)})
+        nilai = dict(zip(kunci, self._nilai_ke(kunci)))
+        return [round(nilai[lo] + (h - lo) * (nilai[hi] - nilai[lo]), 2) for h, lo, hi in pos]
+
+    def histogram(self, lebar=10):
+        """Jumlah data per kelompok [0, lebar), [lebar, 2*lebar), ... (kelompok terakhir termasuk 100)."""
+        jumlah = ceil(100 / lebar)
+        out = [0] * jumlah
+        for x, c in self._hitung.items():
+            out[max(0, min(int(x // lebar), jumlah - 1))] += c
+        return [(i * lebar, min((i + 1) * lebar, 100), c) for i, c in enumerate(out)]
+
+
+class StatistikKolom:
+    """Welford + sketsa kuantil untuk satu kolom angka."""
+    def __init__(self):
+        self.momen = Welford()
+        self.sketsa = SketsaKuantil()
+
+    def tambah_banyak(self, xs):
+        xs = list(xs)
+        self.momen.tambah_banyak(xs)
+        self.sketsa.tambah_banyak(xs)
+
+    def gabung(self, lain):
+        self.momen.gabung(lain.momen)
+        self.sketsa.gabung(lain.sketsa)
+        return self
+
+    def ringkasan(self):
+        m = self.momen
+        p10, p25, p50, p75, p90 = self.sketsa.kuantil(0.1, 0.25, 0.5, 0.75, 0.9)
+        return {
+            'n': m.n,
+            'rata': m.rata if m.n else None,
+            'simpangan_baku': m.simpangan_baku if m.n else None,
+            'min': m.minimum,
+            'p10': p10,
+            'p25': p25,
+            'median': p50,
+            'p75': p75,
+            'p90': p90,
+            'max': m.maksimum,
+        }
+
+
+class StatistikKelas:
+    """
+    Statistik nilai akhir, persen hadir, dan distribusi predikat A..E.
+    Diisi per potongan (lihat render) atau lewat hitung_statistik(), dan
+    statistik beberapa kelas bisa digabung tanpa membaca ulang barisnya.
+    huruf: huruf predikat urut naik (default dari skema standar, E..A).
+    """
+    def __init__(self, huruf=SKEMA_STANDAR.huruf):
+        self.akhir = StatistikKolom()
+        self.hadir = StatistikKolom()
+        self.predikat = dict.fromkeys(huruf[::-1], 0)
+
+    def __len__(self):
+        return self.akhir.momen.n
+
+    def tambah_potongan(self, akhir, hadir, predikat):
+        """Tambah satu potongan kolom (list nilai akhir, list hadir, list huruf predikat)."""
+        self.akhir.tambah_banyak(akhir)
+        self.hadir.tambah_banyak(hadir)
+        for huruf, c in Counter(predikat).items():
+            self.predikat[huruf] = self.predikat.get(huruf, 0) + c
+
+    def gabung(self, lain):
+        self.akhir.gabung(lain.akhir)
+        self.hadir.gabung(lain.hadir)
+        for huruf, c in lain.predikat.items():
+            self.predikat[huruf] = self.predikat.get(huruf, 0) + c
+        return self
+
+    def ringkasan(self):
+        """Dict ringkasan: 'akhir' dan 'hadir' (lihat StatistikKolom.ringkasan) + 'predikat'."""
+        return {
+            'akhir': self.akhir.ringkasan(),
+            'hadir': self.hadir.ringkasan(),
+            'predikat': dict(self.predikat),
+        }
+
+
+# urutan baris tabel ringkasan di laporan: (label, kunci di StatistikKolom.ringkasan)
+BARIS_RINGKASAN = (
+    ("Jumlah", 'n'),
+    ("Rata-rata", 'rata'),
+    ("Simpangan baku", 'simpangan_baku'),
+    ("Minimum", 'min'),
+    ("P25", 'p25'),
+    ("Median", 'median'),
+    ("P75", 'p75'),
+    ("P90", 'p90'),
+    ("Maksimum", 'max'),
+)
+
+
+def baris_ringkasan(stat):
+    """List (label, teks nilai akhir, teks hadir) siap ditulis ke tabel laporan."""
+    ra = stat.akhir.ringkasan()
+    rh = stat.hadir.ringkasan()
+    out = []
+    for label, kunci in BARIS_RINGKASAN:
+        teks = []
+        for r in (ra, rh):
+            v = r[kunci]
+            if v is None:
+                teks.append("-")
+            elif kunci == 'n':
+                teks.append(str(v))
+            else:
+                teks.append(f"{v:.2f}")
+        out.append((label, teks[0], teks[1]))
+    return out
+
+
+def baris_distribusi(stat):
+    """List (huruf, jumlah, teks persen) untuk tabel distribusi predikat."""
+    n = len(stat)
+    return [(huruf, c, f"{c * 100 / n:.2f}" if n else "-") for huruf, c in stat.predikat.items()]
+
+
+def hitung_statistik(rekap, skema=None):
+    """
+    Statistik satu rekap (RekapKelas / RekapKelasKolom / apa pun dengan iter_export) dalam satu lewat.
+    Predikat memakai skema (default: skema milik rekap, atau skema standar).
+    """
+    if skema is None:
+        skema = getattr(rekap, 'skema', SKEMA_STANDAR)
+    stat = StatistikKelas(skema.huruf)
+    akhir, hadir, pred = [], [], []
+    for rec in rekap.iter_export():
+        skor = rec['final_score']
+        akhir.append(skor)
+        hadir.append(rec['attendance_rate'])
+        pred.append(skema.predikat(skor))
+        if len(akhir) >= UKURAN_POTONGAN:
+            stat.tambah_potongan(akhir, hadir, pred)
+            akhir, hadir, pred = [], [], []
+    stat.tambah_potongan(akhir, hadir, pred)
+    return stat
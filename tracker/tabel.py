@@ -0,0 +1,253 @@
+# Tabel teks untuk terminal: lebar kolom dari sampel terbatas, baris dibangun per halaman
+
+import sys
+from itertools import islice
+
+BARIS_PER_HALAMAN = 20
+# jumlah baris yang dibaca untuk menaksir lebar kolom (awal tampilan + sebaran merata)
+UKURAN_SAMPEL = 200
+
+
+def angka(v):
+    """Format angka 2 desimal (hadir, nilai akhir)."""
+    return f"{float(v):.2f}"
+
+
+class Kolom:
+    """Satu kolom tabel: judul, fungsi ambil(baris) -> nilai, fmt(nilai) -> teks, rata kanan."""
+    def __init__(self, judul, ambil, fmt=str, kanan=False, min_lebar=0):
+        self.judul = judul
+        self.ambil = ambil
+        self.fmt = fmt
+        self.kanan = kanan
+        self.min_lebar = min_lebar
+
+    def teks(self, row):
+        return self.fmt(self.ambil(row))
+
+
+class TabelHalaman:
+    """
+    Tampilan tabel per halaman di atas list baris milik pemanggil (tidak disalin).
+
+    - Lebar kolom ditaksir dari paling banyak UKURAN_SAMPEL baris (awal tampilan +
+      sebaran merata), atau diberikan langsung lewat lebar (indeks lebar yang sudah
+      dihitung). Halaman yang selnya lebih panjang melebarkan kolom; lebar tidak
+      pernah menyempit, jadi kolom tetap stabil saat berpindah halaman.
+    - Halaman dibangun saat diminta. Posisi awal setiap halaman yang sudah dilewati
+      dicatat, jadi halaman berikutnya melanjutkan dari sana, bukan dari awal.
+    - urutkan() hanya membangun list posisi baris; saring() hanya menyimpan predikat
+      yang dicek saat halaman dibangun. Baris aslinya tidak pernah disalin.
+    """
+    def __init__(self, rows, kolom, per_halaman=BARIS_PER_HALAMAN, saring=None, lebar=None):
+        self.rows = rows
+        self.kolom = list(kolom)
+        self.per_halaman = max(1, per_halaman)
+        # None = urutan asli; list posisi baris setelah urutkan()
+        self._urutan = None
+        self._saring = saring
+        self._lebar_tetap = lebar
+        self._mulai_ulang()
+
+    def _posisi(self):
+        return range(len(self.rows)) if self._urutan is None else self._urutan
+
+    def _mulai_ulang(self):
+        # _awal[k] = posisi (di _posisi()) tempat halaman k dimulai
+        self._awal = [0]
+        # True jika akhir data sudah tercapai (jumlah halaman diketahui)
+        self._selesai = False
+        if self._lebar_tetap is not None:
+            self.lebar = list(self._lebar_tetap)
+        else:
+            self.lebar = self._taksir_lebar()
+
+    def _taksir_lebar(self):
+        lebar = [max(len(k.judul), k.min_lebar) for k in self.kolom]
+        pos = self._posisi()
+        setengah = UKURAN_SAMPEL // 2
+        langkah = max(1, len(pos) // setengah)
+        # awal tampilan pasti dilihat; sisanya diambil merata dari seluruh data
+        for i in list(pos[:setengah]) + list(pos[::langkah][:setengah]):
+            row = self.rows[i]
+            if self._saring is not None and not self._saring(row):
+                continue
+            for j, k in enumerate(self.kolom):
+                n = len(k.teks(row))
+                if n > lebar[j]:
+                    lebar[j] = n
+        return lebar
+
+    def urutkan(self, kunci, turun=False):
+        """Urutkan tampilan dengan kunci(baris); kembali ke halaman pertama."""
+        # kunci dihitung sekali per baris, lalu sort di level C lewat list.__getitem__
+        nilai = list(map(kunci, self.rows))
+        self._urutan = sorted(range(len(self.rows)), key=nilai.__getitem__, reverse=turun)
+        self._mulai_ulang()
+
+    def saring(self, predikat=None):
+        """Tampilkan hanya baris dengan predikat(baris) benar (None = semua); kembali ke halaman pertama."""
+        self._saring = predikat
+        self._mulai_ulang()
+
+    def cari(self, teks):
+        """Saring baris yang salah satu selnya memuat teks (tanpa beda huruf besar/kecil)."""
+        teks = teks.lower()
+        if not teks:
+            self.saring(None)
+            return
+        kolom = self.kolom
+        self.saring(lambda row: any(teks in k.teks(row).lower() for k in kolom))
+
+    def _pindai(self, mulai):
+        """Ambil satu halaman mulai dari posisi mulai; kembalikan (baris, posisi sesudahnya)."""
+        pos = self._posisi()
+        rows = self.rows
+        if self._saring is None:
+            akhir = min(len(pos), mulai + self.per_halaman)
+            return [rows[i] for i in pos[mulai:akhir]], akhir
+        saring = self._saring
+        hasil = []
+        j = mulai
+        for i in islice(pos, mulai, None):
+            j += 1
+            row = rows[i]
+            if saring(row):
+                hasil.append(row)
+                if len(hasil) == self.per_halaman:
+                    break
+        return hasil, j
+
+    def halaman(self, no):
+        """Baris (objek asli) di halaman no (mulai 0); list kosong jika di luar data."""
+        if no < 0:
+            return []
+        while True:
+            if no < len(self._awal) - 1 or (no == len(self._awal) - 1 and self._selesai):
+                return self._pindai(self._awal[no])[0]
+            if self._selesai:
+                return []
+            # halaman terakhir yang diketahui dipindai untuk mencari awal halaman berikutnya
+            k = len(self._awal) - 1
+            hasil, j = self._pindai(self._awal[k])
+            if not hasil and k > 0:
+                # sisa baris tersaring semua: halaman k ternyata kosong
+                self._awal.pop()
+                self._selesai = True
+            elif j >= len(self._posisi()):
+                self._selesai = True
+            else:
+                self._awal.append(j)
+            if k == no and hasil:
+                return hasil
+
+    def jumlah_halaman(self):
+        """Jumlah halaman, atau None jika belum diketahui (ada saringan dan akhir data belum dicapai)."""
+        if self._saring is None:
+            n = len(self._posisi())
+            return max(1, -(-n // self.per_halaman))
+        return len(self._awal) if self._selesai else None
+
+    def _baris_teks(self, sel):
+        parts = []
+        for s, k, w in zip(sel, self.kolom, self.lebar):
+            parts.append(s.rjust(w) if k.kanan else s.ljust(w))
+        return " | ".join(parts)
+
+    def kepala(self):
+        """Dua baris teks: judul kolom dan garis pemisah."""
+        return [self._baris_teks([k.judul for k in self.kolom]), "-+-".join("-" * w for w in self.lebar)]
+
+    def teks_baris(self, rows):
+        """Baris teks untuk rows (satu halaman); kolom dilebarkan jika ada sel yang lebih panjang."""
+        sel = [[k.teks(r) for k in self.kolom] for r in rows]
+        lebar = self.lebar
+        for baris in sel:
+            for j, s in enumerate(baris):
+                if len(s) > lebar[j]:
+                    lebar[j] = len(s)
+        return [self._baris_teks(baris) for baris in sel]
+
+    def teks_halaman(self, no):
+        """Kepala + isi halaman no sebagai list baris teks."""
+        isi = self.teks_baris(self.halaman(no))
+        return self.kepala() + isi
+
+    def cari_kolom(self, nama):
+        """Kolom yang judulnya diawali nama (tanpa beda huruf besar/kecil), atau None."""
+        nama = nama.lower()
+        for k in self.kolom:
+            if k.judul.lower().startswith(nama):
+                return k
+        return None
+
+
+PETUNJUK = "Enter=berikut, p=sebelumnya, <nomor>=ke halaman, u <kolom> [-]=urutkan, c <teks>=cari, q=selesai"
+
+
+def tampilkan(tabel, masuk=input, keluar=print, interaktif=None):
+    """
+    Cetak tabel halaman demi halaman.
+    interaktif (default: stdin adalah terminal): setelah setiap halaman tanya perintah
+    (lihat PETUNJUK); tabel satu halaman langsung dicetak tanpa bertanya.
+    Tidak interaktif (pipe/skrip): semua halaman dicetak berurutan di bawah satu kepala,
+    tanpa membaca input, jadi skrip yang menyuapi menu lewat stdin tetap berjalan.
+    """
+    if interaktif is None:
+        interaktif = sys.stdin.isatty()
+    if not tabel.halaman(0):
+        keluar("(tidak ada data untuk ditampilkan)")
+        return
+    if not interaktif:
+        for baris in tabel.kepala():
+            keluar(baris)
+        no = 0
+        while True:
+            rows = tabel.halaman(no)
+            if not rows:
+                break
+            for baris in tabel.teks_baris(rows):
+                keluar(baris)
+            no += 1
+        return
+    no = 0
+    while True:
+        for baris in tabel.teks_halaman(no):
+            keluar(baris)
+        total = tabel.jumlah_halaman()
+        if total == 1:
+            return
+        try:
+            perintah = masuk(f"Halaman {no + 1}/{total or '?'} - {PETUNJUK}: ").strip()
+        except EOFError:
+            return
+        if perintah == "":
+            if not tabel.halaman(no + 1):
+                return
+            no += 1
+        elif perintah == "q":
+            return
+        elif perintah == "p":
+            no = max(0, no - 1)
+        elif perintah.isdigit():
+            tujuan = int(perintah) - 1
+            if tabel.halaman(tujuan):
+                no = tujuan
+            else:
+                keluar("(halaman tidak ada)")
+        elif perintah.startswith("u "):
+            bagian = perintah[2:].split()
+            k = tabel.cari_kolom(bagian[0]) if bagian else None
+            if k is None:
+                keluar("(kolom tidak dikenal)")
+                continue
+            tabel.urutkan(k.ambil, turun=bagian[-1] == "-")
+            no = 0
+        elif perintah == "c" or perintah.startswith("c "):
+            tabel.cari(perintah[2:].strip())
+            if not tabel.halaman(0):
+                keluar("(tidak ada baris yang cocok, saringan dihapus)")
+                tabel.saring(None)
+            no = 0
+        else:
+            keluar("(perintah tidak dikenal)")
@@ -0,0 +1,192 @@
+# Validasi impor per kolom: NIM kosong/ganda, nama beda antar CSV, nilai di luar 0..100
+
+from array import array
+from itertools import compress, count, repeat
+from operator import ne
+
+from .skema_csv import LaporanGalat
+
+
+def _indeks(sel, nilai):
+    """Posisi semua sel == nilai (dipanggil hanya jika `nilai in sel`)."""
+    return [i for i, s in enumerate(sel) if s == nilai]
+
+
+def nilai_kolom(kolom, sel, no_baris, laporan):
+    """
+    Cek rentang satu kolom nilai (array/list float) sekaligus: di luar 0..100
+    (termasuk nan/inf) jadi 0 dan dicatat di laporan (nomor baris lewat no_baris(i)).
+    Jalur cepat: min, max dan sum di level C; kolom hanya diulang per sel jika ada
+    yang keluar rentang.
+    """
+    if not sel:
+        return sel
+    # sum - sum bukan 0 jika ada nan/inf (min/max tidak bisa diandalkan untuk nan)
+    s = sum(sel)
+    if 0.0 <= min(sel) and max(sel) <= 100.0 and s - s == 0.0:
+        return sel
+    sel = array('d', sel)
+    for i, v in enumerate(sel):
+        if not 0.0 <= v <= 100.0:
+            if laporan is not None:
+                laporan.tambah(no_baris(i), kolom, v, "di luar 0..100")
+            sel[i] = 0.0
+    return sel
+
+
+class ValidasiImpor:
+    """
+    Validasi satu kali impor attendance.csv + grades.csv, satu blok kolom setiap kali
+    (semua blok attendance dulu, baru grades).
+
+    Tidak ada exception per sel: setiap masalah dicatat di laporan (LaporanGalat)
+    dengan nomor baris dan kolomnya, lalu pemuat memakai hasil validasi:
+    - attendance(blok): baris tanpa NIM/nama dan NIM ganda (baris pertama yang
+      dipakai) dibuang; kembalikan mask (list bool) atau None jika semua dipakai.
+    - grades(blok, kolom): nilai di luar 0..100 jadi 0; NIM kosong dibuang; NIM ganda
+      dicatat (baris terakhir menang, seperti sebelumnya); NIM yang tidak ada di
+      attendance.csv dan nama yang beda dengan attendance.csv dicatat.
+    Setiap cek memakai operasi satu kolom (`in`, dict, map, min/max) di level C;
+    loop Python per baris hanya berjalan untuk blok yang memang bermasalah.
+    """
+    def __init__(self, laporan=None):
+        self.laporan = laporan if laporan is not None else LaporanGalat()
+        # NIM attendance yang dipakai -> nomor urutnya (0, 1, ...), sekaligus indeks NIM
+        # ganda dan indeks join grades -> attendance (lihat posisi). Sengaja dict, bukan
+        # set: dict yang hanya berisi str/int tidak dilacak GC, jadi tidak ikut ditelusuri
+        # di setiap koleksi penuh selama impor besar.
+        self._baris = {}
+        # nama per nomor urut; saat grades mulai diberi None di akhir (posisi -1 = NIM asing)
+        self._nama_att = []
+        # NIM yang sudah dilihat di grades.csv -> True (dict, alasan sama)
+        self._nim_grades = {}
+        # (kolom NIM, posisi) blok grades terakhir, dipakai ulang oleh posisi()
+        self._posisi = (None, None)
+
+    def _buang_kosong(self, blok, kolom, pesan, buang):
+        sel = blok[kolom]
+        if "" in sel:
+            for i in _indeks(sel, ""):
+                if i not in buang:
+                    self.laporan.tambah(blok.no_baris(i), kolom, "", pesan)
+                    buang.add(i)
+
+    @staticmethod
+    def _ganda(nim, dilihat):
+        """
+        Posisi baris (urut) yang NIM-nya sudah muncul di blok sebelumnya (ada di dilihat)
+        atau lebih awal di blok ini. Semua lewat dict/map di level C; list kosong jika
+        tidak ada yang ganda (kasus biasa).
+        """
+        n = len(nim)
+        # NIM -> posisi pertamanya di blok (dibangun dari belakang, jadi yang pertama menang)
+        pertama = dict(zip(reversed(nim), range(n - 1, -1, -1)))
+        antar_blok = not dilihat.keys().isdisjoint(pertama)
+        if len(pertama) == n and not antar_blok:
+            return []
+        ganda = set(compress(range(n), map(ne, map(pertama.__getitem__, nim), range(n))))
+        if antar_blok:
+            ganda.update(compress(range(n), map(dilihat.__contains__, nim)))
+        return sorted(ganda)
+
+    def attendance(self, blok):
+        nim = blok["student_id"]
+        nama = blok["name"]
+        buang = set()
+        self._buang_kosong(blok, "student_id", "NIM kosong", buang)
+        self._buang_kosong(blok, "name", "nama kosong", buang)
+        dilihat = self._baris
+        cek = nim
+        if buang:
+            # baris yang sudah dibuang diberi kunci unik (int) supaya tidak dianggap
+            # kemunculan pertama NIM-nya
+            cek = list(nim)
+            for i in buang:
+                cek[i] = i
+        for i in self._ganda(cek, dilihat):
+            self.laporan.tambah(blok.no_baris(i), "student_id", nim[i], "NIM ganda, baris pertama yang dipakai")
+            buang.add(i)
+        if buang:
+            pakai = [i not in buang for i in range(len(nim))]
+            nim, nama = compress(nim, pakai), compress(nama, pakai)
+        else:
+            pakai = None
+        awal = len(dilihat)
+        dilihat.update(zip(nim, count(awal)))
+        self._nama_att.extend(nama)
+        return pakai
+
+    def kolom_attendance(self):
+        """(list NIM, list nama) semua baris attendance yang dipakai, urut seperti di file."""
+        return list(self._baris), self._nama_att[:len(self._baris)]
+
+    def posisi(self, nim):
+        """
+        Nomor urut attendance untuk setiap NIM (satu map untuk seluruh kolom);
+        -1 untuk NIM yang tidak ada di attendance.csv.
+        """
+        kolom, pos = self._posisi
+        if kolom is not nim:
+            pos = list(map(self._baris.get, nim, repeat(-1)))
+            self._posisi = (nim, pos)
+        return pos
+
+    def grades(self, blok, kolom_nilai):
+        """kolom_nilai: nama kolom nilai; kolom yang ada di blok diganti hasil cek rentang."""
+        for k in kolom_nilai:
+            if k in blok.kolom:
+                blok.kolom[k] = nilai_kolom(k, blok[k], blok.no_baris, self.laporan)
+        nim = blok["student_id"]
+        buang = set()
+        self._buang_kosong(blok, "student_id", "NIM kosong", buang)
+        dilihat = self._nim_grades
+        for i in self._ganda(nim, dilihat):
+            if i not in buang:
+                self.laporan.tambah(blok.no_baris(i), "student_id", nim[i], "NIM ganda, baris terakhir yang dipakai")
+        dilihat.update(zip(nim, repeat(True)))
+        dilihat.pop("", None)
+        if self._baris:
+            self._banding_nama(blok, buang)
+        if buang:
+            return [i not in buang for i in range(len(nim))]
+        return None
+
+    def _banding_nama(self, blok, buang):
+        """Cocokkan NIM + nama grades.csv dengan attendance.csv (satu map untuk seluruh blok)."""
+        nama_att = self._nama_att
+        if len(nama_att) == len(self._baris):
+            # penanda NIM asing: posisi -1 menunjuk ke None ini
+            nama_att.append(None)
+        nim = blok["student_id"]
+        asli = list(map(nama_att.__getitem__, self.posisi(nim)))
+        nama = blok["name"]
+        beda = list(map(ne, asli, nama))
+        if not any(beda):
+            return
+        for i in compress(range(len(beda)), beda):
+            if i in buang:
+                continue
+            if asli[i] is None:
+                self.laporan.tambah(blok.no_baris(i), "student_id", nim[i], "NIM tidak ada di attendance.csv")
+            elif nama[i]:
+                # nama kosong di grades.csv boleh (nama diambil dari attendance.csv)
+                self.laporan.tambah(blok.no_baris(i), "name", nama[i],
+                                    f"nama beda dengan attendance.csv ({asli[i]})")
+
+
+def validasi_csv(att_path, grd_path, laporan=None):
+    """
+    Validasi attendance.csv + grades.csv tanpa membangun rekap (aturan sama dengan
+    bootstrap). Kembalikan (laporan, jumlah baris attendance, jumlah baris grades).
+    """
+    from .presensi import kolom_sesi
+    from .skema_csv import ATT_HEADERS, GRD_HEADERS, baca_blok
+    validasi = ValidasiImpor(laporan)
+    n_att = n_grd = 0
+    for blok in baca_blok(att_path, ATT_HEADERS, validasi.laporan, tambahan=kolom_sesi):
+        validasi.attendance(blok)
+        n_att += len(blok)
+    for blok in baca_blok(grd_path, GRD_HEADERS, validasi.laporan):
+        validasi.grades(blok, GRD_HEADERS[2:])
+        n_grd += len(blok)
+    return validasi.laporan, n_att, n_grd